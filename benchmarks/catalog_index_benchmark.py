@@ -0,0 +1,165 @@
+"""Catalog lookup benchmark: per-request list scans vs the prebuilt CocktailCatalogIndex.
+
+Builds a synthetic catalog of cocktails (50k by default) and times the lookups
+that the free text and typeahead handlers perform on every request, first with
+the previous list-scan implementations (lower-casing every title and re-sorting
+the catalog per call) and then through ``CocktailCatalogIndex``. The one-off
+index build time is reported separately; it is paid once per catalog load.
+
+Usage:
+    poetry run python benchmarks/catalog_index_benchmark.py [--cocktails 50000] [--iterations 50]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from rapidfuzz import fuzz
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.queries.free_text_query import (
+    FreeTextQueryHandler,
+)
+
+_WORDS = ["mai", "tai", "smoky", "sour", "royal", "spritz", "negroni", "fizz", "julep", "mule", "punch", "flip"]
+_SPIRITS = ["gin", "dark rum", "white rum", "blanco tequila", "mezcal", "rye whiskey", "bourbon", "vodka", "cognac"]
+_MODIFIERS = ["lime juice", "lemon juice", "campari", "sweet vermouth", "orgeat", "simple syrup", "mint", "bitters"]
+
+
+def build_catalog(count: int) -> list[CocktailSearchModel]:
+    rng = random.Random(42)
+    cocktails = []
+    for i in range(count):
+        title = f"{' '.join(rng.sample(_WORDS, 2)).title()} {i}"
+        ingredients = [SimpleNamespace(name=name) for name in (rng.choice(_SPIRITS), *rng.sample(_MODIFIERS, 2))]
+        cocktails.append(
+            CocktailSearchModel.model_construct(
+                id=f"cocktail-{i}",
+                title=title,
+                descriptive_title=f"The {title}: a house favourite",
+                ingredients=ingredients,
+            )
+        )
+    return cocktails
+
+
+# Previous per-request implementations, kept here for comparison
+
+
+def _legacy_exact_name_match(text: str, cocktails: list[CocktailSearchModel]) -> list[CocktailSearchModel]:
+    exact = [c for c in cocktails if c.title.lower() == text]
+    partial = [c for c in cocktails if text in c.title.lower() and c not in exact]
+    return exact + sorted(partial, key=lambda c: c.title)
+
+
+def _legacy_short_query(text: str, cocktails: list[CocktailSearchModel]) -> list[CocktailSearchModel]:
+    def matches(c: CocktailSearchModel) -> bool:
+        return (
+            text in c.title.lower()
+            or text in c.descriptive_title.lower()
+            or any(text in i.name.lower() for i in c.ingredients)
+        )
+
+    return sorted([c for c in cocktails if matches(c)], key=lambda c: c.title or "")[:10]
+
+
+def _legacy_browse(ids: list[str], cocktails: list[CocktailSearchModel]) -> list[CocktailSearchModel]:
+    return [c for c in sorted(cocktails, key=lambda c: c.title or "") if c.id in ids][:10]
+
+
+def _legacy_typeahead(text: str, cocktails: list[CocktailSearchModel]) -> list[CocktailSearchModel]:
+    ordered = sorted(cocktails, key=lambda c: c.title or "")
+    starts = [c for c in ordered if c.title.lower().startswith(text) or c.descriptive_title.lower().startswith(text)]
+    return starts[:10]
+
+
+def _legacy_fuzzy_name_match(text: str, cocktails: list[CocktailSearchModel]) -> list[CocktailSearchModel] | None:
+    scored = []
+    for cocktail in cocktails:
+        title = (cocktail.title or "").lower()
+        score = max(fuzz.ratio(text, title), fuzz.partial_ratio(text, title))
+        if score >= FreeTextQueryHandler._FUZZY_MATCH_THRESHOLD:
+            scored.append((cocktail, score))
+    scored.sort(key=lambda x: (-x[1], x[0].title))
+    return [c for c, _ in scored] or None
+
+
+def _index_exact_name_match(text: str, catalog: CocktailCatalogIndex) -> list[CocktailSearchModel]:
+    exact = catalog.with_title(text)
+    return exact + [c for c in catalog.titles_containing(text) if c.title.lower() != text]
+
+
+def _index_typeahead(text: str, catalog: CocktailCatalogIndex) -> list[CocktailSearchModel]:
+    return [
+        catalog.sorted_by_title[p]
+        for p, (t, d) in enumerate(zip(catalog.sorted_lower_titles, catalog.sorted_lower_descriptive_titles))
+        if t.startswith(text) or d.startswith(text)
+    ][:10]
+
+
+def _time(fn: Callable[[], object], iterations: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cocktails", type=int, default=50_000, help="Synthetic catalog size")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed calls per lookup")
+    args = parser.parse_args()
+
+    cocktails = build_catalog(args.cocktails)
+    build_start = time.perf_counter()
+    catalog = CocktailCatalogIndex(cocktails)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    exact_title = cocktails[len(cocktails) // 2].title.lower()
+    browse_ids = [c.id for c in random.Random(7).sample(cocktails, 25)]
+    # The fuzzy matcher only reads class constants, so skip the DI-heavy constructor
+    handler = FreeTextQueryHandler.__new__(FreeTextQueryHandler)
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+        (
+            "exact name match",
+            lambda: _legacy_exact_name_match(exact_title, cocktails),
+            lambda: _index_exact_name_match(exact_title, catalog),
+        ),
+        ("short query 'gin'", lambda: _legacy_short_query("gin", cocktails), lambda: catalog.text_matches("gin")[:10]),
+        (
+            "browse 25 matches",
+            lambda: _legacy_browse(browse_ids, cocktails),
+            lambda: catalog.in_title_order(browse_ids),
+        ),
+        (
+            "fuzzy 'negorni sour'",
+            lambda: _legacy_fuzzy_name_match("negorni sour", cocktails),
+            lambda: handler._find_fuzzy_name_match("negorni sour", catalog),
+        ),
+        ("typeahead 'smo'", lambda: _legacy_typeahead("smo", cocktails), lambda: _index_typeahead("smo", catalog)),
+        ("hydrate by id", lambda: {c.id: c for c in cocktails}.get(browse_ids[0]), lambda: catalog.get(browse_ids[0])),
+    ]
+
+    print(f"Catalog: {args.cocktails} cocktails, index build {build_ms:.1f} ms (once per catalog load)")
+    print(f"  {'lookup':<20} {'list scan p50/p99 ms':>22} {'index p50/p99 ms':>20} {'speedup':>9}")
+    for name, legacy, indexed in cases:
+        legacy_p50, legacy_p99 = _time(legacy, args.iterations)
+        index_p50, index_p99 = _time(indexed, args.iterations)
+        print(
+            f"  {name:<20} {legacy_p50:10.3f} /{legacy_p99:9.3f} {index_p50:9.3f} /{index_p99:9.3f}"
+            f" {legacy_p50 / max(index_p50, 1e-6):8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
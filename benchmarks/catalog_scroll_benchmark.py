@@ -0,0 +1,252 @@
+"""Cold catalog load benchmark: sequential full-payload scroll vs projected, larger and parallel scrolls.
+
+Starts a local Qdrant stand-in (an aiohttp server in its own process that answers
+``POST /collections/{name}/points/scroll`` with real scroll pages after a fixed
+per-request delay, honouring ``offset``, ``limit`` and payload ``include``
+projections) holding synthetic chunk points, several per cocktail, with the
+full payload ``store_vectors`` writes. It then times a cold ``get_all_cocktails``
+through ``AsyncQdrantClient`` for 10k and 100k points: first with the previous
+loader (pages of 100 with the whole payload), then through the repository with
+the projected scroll at larger page sizes and with parallel id-range scrolls.
+
+Usage:
+    poetry run python benchmarks/catalog_scroll_benchmark.py [--points 10000 100000] [--latency-ms 2]
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import logging
+import multiprocessing
+import random
+import time
+import uuid
+from types import SimpleNamespace
+
+from aiohttp import web
+from qdrant_client import AsyncQdrantClient
+
+# Load the application package first so the repository module resolves its imports the way main.py does
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.infrastructure.caching.decoded_model_cache import DecodedModelCache
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository import (
+    CocktailVectorSearchRepository,
+)
+
+COLLECTION_NAME = "benchmark-cocktails"
+
+_CHUNKS_PER_COCKTAIL = 6
+_SPIRITS = ["Gin", "Dark Rum", "Blanco Tequila", "Mezcal", "Rye Whiskey", "Bourbon", "Vodka", "Cognac"]
+_MODIFIERS = ["Lime Juice", "Lemon Juice", "Campari", "Sweet Vermouth", "Orgeat", "Simple Syrup", "Mint", "Bitters"]
+_FLAVOURS = ["citrus", "bitter", "herbal", "smoky", "sweet", "sour", "spicy", "fruity"]
+
+
+def _model(index: int, rng: random.Random) -> CocktailSearchModel:
+    ingredients = [
+        {
+            "name": name,
+            "uoM": "ounces",
+            "requirement": "required",
+            "display": f"1 oz {name}",
+            "units": 1.0,
+            "preparation": "none",
+            "suggestions": "",
+            "types": ["spirit"],
+            "applications": ["base"],
+        }
+        for name in (rng.choice(_SPIRITS), *rng.sample(_MODIFIERS, 5))
+    ]
+    return CocktailSearchModel.model_validate(
+        {
+            "id": f"cocktail-{index}",
+            "title": f"House Cocktail {index}",
+            "descriptiveTitle": f"House Cocktail {index}: a bartender favourite",
+            "rating": 4.5,
+            "ingredients": ingredients,
+            "isIba": False,
+            "serves": 1,
+            "prepTimeMinutes": 5,
+            "searchTiles": [f"https://cdn.example.com/images/house-cocktail-{index}-300x300.webp"],
+            "glassware": ["coupe"],
+        }
+    )
+
+
+def _points(count: int) -> list[tuple[int, str, dict]]:
+    """Chunk points as (UUID int, id, payload) sorted by id, with the payload ``store_vectors`` writes."""
+    rng = random.Random(count)
+    points = []
+    for cocktail_index in range(max(count // _CHUNKS_PER_COCKTAIL, 1)):
+        model = _model(cocktail_index, rng)
+        model_json = model.model_dump_json()
+        for chunk in range(_CHUNKS_PER_COCKTAIL):
+            if len(points) == count:
+                break
+            point_id = uuid.uuid5(uuid.NAMESPACE_URL, f"{model.id}/{chunk}")
+            flavours = rng.sample(_FLAVOURS, 3)
+            metadata = {
+                "cocktail_id": model.id,
+                "category": "description",
+                "description": " ".join(rng.choice(_FLAVOURS + _MODIFIERS) for _ in range(80)),
+                "model": model_json,
+                "indexed_at": 1_700_000_000.0 + cocktail_index,
+                "title": model.title.lower(),
+                "ingredient_names": [i.name.lower() for i in model.ingredients],
+                "keywords_flavor_profile": flavours,
+                "keywords_occasion": ["date night", "brunch"],
+                "keywords_search_terms": [f"{flavour} {model.ingredients[0].name.lower()}" for flavour in flavours],
+            }
+            points.append((point_id.int, str(point_id), {"metadata": metadata}))
+    points.sort(key=lambda p: p[0])
+    return points
+
+
+def _serve_fake_qdrant(point_count: int, latency_seconds: float, ports: multiprocessing.Queue) -> None:
+    """Serve the Qdrant stand-in until terminated, reporting the bound port through ``ports``.
+
+    Runs in its own process so serving pages does not compete with the client for the
+    GIL, and point JSON is serialised once per payload projection before any load is timed.
+    """
+    points = _points(point_count)
+    keys = [p[0] for p in points]
+    positions = {point_id: i for i, (_, point_id, _) in enumerate(points)}
+    encoded: dict[tuple[str, ...] | None, list[str]] = {}
+
+    def point_json(position: int, with_payload: object) -> str:
+        include = tuple(with_payload["include"]) if isinstance(with_payload, dict) else None
+        if include not in encoded:
+            fields = [key.split(".", 1)[1] for key in include] if include else None
+            encoded[include] = [
+                json.dumps(
+                    {
+                        "id": point_id,
+                        "payload": payload
+                        if fields is None
+                        else {"metadata": {f: payload["metadata"][f] for f in fields if f in payload["metadata"]}},
+                    }
+                )
+                for _, point_id, payload in points
+            ]
+        return encoded[include][position]
+
+    # Encode the payload selectors the loaders send before any load is timed
+    for with_payload in (
+        True,
+        {"include": ["metadata.cocktail_id", "metadata.indexed_at"]},
+        {"include": ["metadata.cocktail_id", "metadata.model"]},
+    ):
+        point_json(0, with_payload)
+
+    def respond(result: str) -> web.Response:
+        return web.Response(text=f'{{"result":{result},"status":"ok","time":0.0}}', content_type="application/json")
+
+    async def scroll(request: web.Request) -> web.Response:
+        body = await request.json()
+        await asyncio.sleep(latency_seconds)
+        offset = body.get("offset")
+        start = 0 if offset is None else bisect.bisect_left(keys, uuid.UUID(str(offset)).int)
+        end = min(start + body["limit"], len(points))
+        page = ",".join(point_json(i, body.get("with_payload")) for i in range(start, end))
+        next_page_offset = json.dumps(points[end][1] if end < len(points) else None)
+        return respond(f'{{"points":[{page}],"next_page_offset":{next_page_offset}}}')
+
+    async def retrieve(request: web.Request) -> web.Response:
+        body = await request.json()
+        await asyncio.sleep(latency_seconds)
+        found = ",".join(point_json(positions[i], body.get("with_payload")) for i in body["ids"] if i in positions)
+        return respond(f"[{found}]")
+
+    async def serve() -> None:
+        app = web.Application(client_max_size=0)
+        app.router.add_post("/collections/{name}/points/scroll", scroll)
+        app.router.add_post("/collections/{name}/points", retrieve)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        ports.put(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+# Previous implementation, kept here for comparison
+async def _legacy_load(client: AsyncQdrantClient) -> list[CocktailSearchModel]:
+    decoded_models = DecodedModelCache(1_000_000)
+    cocktails_dict = {}
+    next_offset = None
+    while True:
+        points, next_offset = await client.scroll(
+            collection_name=COLLECTION_NAME, limit=100, offset=next_offset, with_payload=True
+        )
+        for point in points:
+            metadata = (point.payload or {}).get("metadata")
+            if metadata:
+                id = metadata.get("cocktail_id")
+                if id and id not in cocktails_dict:
+                    cocktails_dict[id] = decoded_models.decode(id, metadata.get("model"))
+        if next_offset is None:
+            break
+    return list(cocktails_dict.values())
+
+
+async def _repository_load(client: AsyncQdrantClient, page_size: int, parallelism: int) -> list[CocktailSearchModel]:
+    # Only the catalog load is exercised, so skip the DI-heavy constructor
+    repository = CocktailVectorSearchRepository.__new__(CocktailVectorSearchRepository)
+    repository.qdrant_client = client
+    repository.qdrant_options = SimpleNamespace(
+        collection_name=COLLECTION_NAME, catalog_scroll_page_size=page_size, catalog_scroll_parallelism=parallelism
+    )
+    repository.logger = logging.getLogger("catalog_scroll_benchmark")
+    repository._decoded_models = DecodedModelCache(1_000_000)
+    cocktails, _ = await repository._load_catalog()
+    return cocktails
+
+
+async def _run(port: int, point_count: int) -> None:
+    client = AsyncQdrantClient(
+        url="http://127.0.0.1", port=port, https=False, prefer_grpc=False, timeout=120, check_compatibility=False
+    )
+    rows = [
+        ("previous: 100/page, full payload", lambda: _legacy_load(client)),
+        ("projected, 1000/page", lambda: _repository_load(client, 1000, 1)),
+        ("projected, 1000/page, 4 scrolls", lambda: _repository_load(client, 1000, 4)),
+        ("projected, 2000/page, 8 scrolls", lambda: _repository_load(client, 2000, 8)),
+    ]
+
+    expected: list[str] | None = None
+    for name, load in rows:
+        start = time.perf_counter()
+        cocktails = await load()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        ids = [c.id for c in cocktails]
+        expected = expected or ids
+        assert ids == expected
+        print(f"  {point_count:7d} {len(cocktails):9d}  {name:<34} {elapsed_ms:10.1f}")
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, nargs="+", default=[10_000, 100_000], help="Catalog sizes in points")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Stand-in delay per scroll request")
+    args = parser.parse_args()
+
+    print(f"  {'points':>7} {'cocktails':>9}  {'loader':<34} {'load ms':>10}")
+    for point_count in args.points:
+        ports: multiprocessing.Queue = multiprocessing.Queue()
+        server = multiprocessing.Process(
+            target=_serve_fake_qdrant, args=(point_count, args.latency_ms / 1000, ports), daemon=True
+        )
+        server.start()
+        try:
+            asyncio.run(_run(ports.get(timeout=600), point_count))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
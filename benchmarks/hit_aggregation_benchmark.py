@@ -0,0 +1,136 @@
+"""Chunk hit aggregation benchmark: linear duplicate scans vs the dict + numpy accumulator.
+
+Builds Qdrant-style chunk hits (several chunks per cocktail) for result limits
+from the default 30 up to a few thousand and times the per-cocktail statistics
+aggregation ``search_vectors`` performs after every query: first with the
+previous loop, which scanned the result list for every duplicate cocktail id
+(O(n^2) in the number of hits), then through ``_aggregate_hits``, which groups
+hits through a dict and computes the statistics over the score array.
+
+Usage:
+    poetry run python benchmarks/hit_aggregation_benchmark.py [--iterations 50]
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+# Load the application package first so the repository module resolves its imports the way main.py does
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_search_statistics import (
+    CocktailSearchStatistics,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_vector_search_result import (
+    CocktailVectorSearchResult,
+)
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository import (
+    CocktailVectorSearchRepository,
+)
+
+_CHUNKS_PER_COCKTAIL = 6
+
+
+def _hits(count: int, models: dict[str, CocktailSearchModel]) -> list[SimpleNamespace]:
+    rng = random.Random(count)
+    ids = list(models)
+    hits = [
+        SimpleNamespace(
+            score=rng.random(),
+            payload={"metadata": {"cocktail_id": rng.choice(ids), "keywords_search_terms": ["brunch"]}},
+        )
+        for _ in range(count)
+    ]
+    return sorted(hits, key=lambda p: p.score, reverse=True)
+
+
+# Previous implementation, kept here for comparison
+def _legacy_aggregate(
+    points: list[SimpleNamespace], hit_models: dict[str, CocktailSearchModel]
+) -> list[CocktailSearchModel]:
+    cocktails: list[CocktailSearchModel] = []
+    seen_ids = set()
+    for point in points:
+        metadata = point.payload["metadata"]
+        id = metadata["cocktail_id"]
+        score = point.score
+        if id not in seen_ids:
+            cocktails.append(
+                hit_models[id].model_copy(
+                    update={
+                        "keywords_search_terms": metadata.get("keywords_search_terms", []),
+                        "search_statistics": CocktailSearchStatistics(
+                            total_score=score,
+                            max_score=score,
+                            avg_score=score,
+                            weighted_score=score,
+                            reranker_score=0.0,
+                            hit_count=1,
+                            hit_results=[CocktailVectorSearchResult(score=score)],
+                        ),
+                    }
+                )
+            )
+            seen_ids.add(id)
+        else:
+            for existing_cocktail in cocktails:
+                if existing_cocktail.id == id:
+                    stats = existing_cocktail.search_statistics
+                    stats.total_score += score
+                    stats.max_score = max(stats.max_score, score)
+                    stats.hit_count += 1
+                    stats.hit_results.append(CocktailVectorSearchResult(score=score))
+                    break
+    for cocktail in cocktails:
+        stats = cocktail.search_statistics
+        stats.avg_score = stats.total_score / stats.hit_count
+        stats.weighted_score = stats.max_score * 0.6 + stats.avg_score * 0.3 + math.log(stats.hit_count + 1) * 0.1
+    return cocktails
+
+
+def _time(fn: Callable[[], object], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="Timed aggregations per hit count")
+    args = parser.parse_args()
+
+    # Only the aggregation is exercised, so skip the DI-heavy constructor
+    repository = CocktailVectorSearchRepository.__new__(CocktailVectorSearchRepository)
+
+    print(f"  {'hits':>6} {'cocktails':>9} {'legacy p50 us':>14} {'accumulator p50 us':>19} {'speedup':>8}")
+    for count in (30, 300, 3_000):
+        models = {
+            f"cocktail-{i}": CocktailSearchModel.model_construct(id=f"cocktail-{i}", title=f"Cocktail {i}")
+            for i in range(max(count // _CHUNKS_PER_COCKTAIL, 1))
+        }
+        points = _hits(count, models)
+
+        legacy = _legacy_aggregate(points, models)
+        aggregated = repository._aggregate_hits(points, models)
+        assert [c.id for c in legacy] == [c.id for c in aggregated]
+        for old, new in zip(legacy, aggregated):
+            assert old.search_statistics.hit_count == new.search_statistics.hit_count
+            assert math.isclose(old.search_statistics.weighted_score, new.search_statistics.weighted_score)
+
+        legacy_p50 = _time(lambda: _legacy_aggregate(points, models), args.iterations)
+        accumulator_p50 = _time(lambda: repository._aggregate_hits(points, models), args.iterations)
+        print(
+            f"  {count:6d} {len(aggregated):9d} {legacy_p50:14.1f} {accumulator_p50:19.1f}"
+            f" {legacy_p50 / max(accumulator_p50, 1e-6):7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Search hit payload benchmark: full ``metadata.model`` payloads vs id-only hits hydrated from the catalog.
+
+Builds a synthetic catalog of cocktails with realistic ingredient lists and a
+Qdrant query response of chunk hits (100 by default, several chunks per
+cocktail). For each mode it reports the response size on the wire and the
+client-side cost of one search: parsing the response JSON into ``QueryResponse``
+(what the Qdrant client does) plus resolving every hit's cocktail model through
+the repository, with a cold and a warm ``DecodedModelCache`` for full payloads.
+
+Usage:
+    poetry run python benchmarks/payload_hydration_benchmark.py [--points 100] [--iterations 500]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from qdrant_client.http.models import QueryResponse
+
+# Load the application package first so the repository module resolves its imports the way main.py does
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.infrastructure.caching.decoded_model_cache import DecodedModelCache
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository import (
+    CocktailVectorSearchRepository,
+)
+
+_SPIRITS = ["Gin", "Dark Rum", "Blanco Tequila", "Mezcal", "Rye Whiskey", "Bourbon", "Vodka", "Cognac"]
+_MODIFIERS = ["Lime Juice", "Lemon Juice", "Campari", "Sweet Vermouth", "Orgeat", "Simple Syrup", "Mint", "Bitters"]
+
+
+def _model_json(index: int, rng: random.Random) -> str:
+    ingredients = [
+        {
+            "name": name,
+            "uoM": "ounces",
+            "requirement": "required",
+            "display": f"1 oz {name}",
+            "units": 1.0,
+            "preparation": "none",
+            "suggestions": "",
+            "types": ["spirit"],
+            "applications": ["base"],
+        }
+        for name in (rng.choice(_SPIRITS), *rng.sample(_MODIFIERS, 6))
+    ]
+    return json.dumps(
+        {
+            "id": f"cocktail-{index}",
+            "title": f"House Cocktail {index}",
+            "descriptiveTitle": f"House Cocktail {index}: a bartender favourite",
+            "rating": 4.5,
+            "ingredients": ingredients,
+            "isIba": False,
+            "serves": 1,
+            "prepTimeMinutes": 5,
+            "searchTiles": [f"https://cdn.example.com/images/house-cocktail-{index}-300x300.webp"],
+            "glassware": ["coupe"],
+        }
+    )
+
+
+def _response_json(model_jsons: list[str], points: int, include_model: bool) -> bytes:
+    hits = []
+    for i in range(points):
+        cocktail = i % len(model_jsons)
+        metadata = {"cocktail_id": f"cocktail-{cocktail}", "keywords_search_terms": ["date night", "brunch"]}
+        if include_model:
+            metadata["model"] = model_jsons[cocktail]
+        hits.append({"id": i, "version": 1, "score": 1.0 - i / points, "payload": {"metadata": metadata}})
+    return json.dumps({"points": hits}).encode()
+
+
+def _repository(catalog: CocktailCatalogIndex, hydrate_from_catalog: bool) -> CocktailVectorSearchRepository:
+    # Only the hit resolution is exercised, so skip the DI-heavy constructor
+    repository = CocktailVectorSearchRepository.__new__(CocktailVectorSearchRepository)
+    repository.qdrant_options = SimpleNamespace(semantic_search_hydrate_from_catalog=hydrate_from_catalog)
+    repository._decoded_models = DecodedModelCache(4096)
+
+    async def get_catalog_index() -> CocktailCatalogIndex:
+        return catalog
+
+    repository.get_catalog_index = get_catalog_index
+    return repository
+
+
+def _time(fn: Callable[[], object], iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100, help="Chunk hits per query response")
+    parser.add_argument("--iterations", type=int, default=500, help="Timed searches per mode")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    distinct = max(args.points // 4, 1)
+    model_jsons = [_model_json(i, rng) for i in range(distinct)]
+    catalog = CocktailCatalogIndex([CocktailSearchModel.model_validate_json(m) for m in model_jsons])
+    full_response = _response_json(model_jsons, args.points, include_model=True)
+    id_only_response = _response_json(model_jsons, args.points, include_model=False)
+    loop = asyncio.new_event_loop()
+
+    def search(response: bytes, repository: CocktailVectorSearchRepository, cold: bool) -> None:
+        if cold:
+            repository._decoded_models = DecodedModelCache(4096)
+        points = QueryResponse.model_validate_json(response).points
+        loop.run_until_complete(repository._load_hit_models(points))
+
+    full_repository = _repository(catalog, hydrate_from_catalog=False)
+    catalog_repository = _repository(catalog, hydrate_from_catalog=True)
+    rows = [
+        ("full payload, cold decode", full_response, lambda: search(full_response, full_repository, True)),
+        ("full payload, warm decode", full_response, lambda: search(full_response, full_repository, False)),
+        ("id-only, catalog", id_only_response, lambda: search(id_only_response, catalog_repository, False)),
+    ]
+
+    print(f"{args.points} hits over {distinct} cocktails")
+    print(f"  {'mode':<28} {'response KB':>12} {'p50 us':>9}")
+    for name, response, fn in rows:
+        fn()
+        print(f"  {name:<28} {len(response) / 1024:12.1f} {_time(fn, args.iterations):9.1f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Concurrency benchmark for the Qdrant query path.
+
+Starts a local Qdrant stand-in (an aiohttp server that answers
+``POST /collections/{name}/points/query`` after a fixed delay) and fires a burst
+of concurrent searches at it from a single event loop, first through the
+blocking ``QdrantClient`` called inside ``async def`` (the old repository
+behaviour) and then through ``AsyncQdrantClient``.
+
+Usage:
+    poetry run python benchmarks/qdrant_concurrency_benchmark.py [--requests 64] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+COLLECTION_NAME = "benchmark-cocktails"
+
+
+def _start_fake_qdrant(latency_seconds: float) -> tuple[int, asyncio.AbstractEventLoop]:
+    """Run the Qdrant stand-in on its own thread and event loop, returning the bound port."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    port_holder: list[int] = []
+
+    async def query_points(_request: web.Request) -> web.Response:
+        await asyncio.sleep(latency_seconds)
+        return web.json_response({"result": {"points": []}, "status": "ok", "time": latency_seconds})
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post("/collections/{name}/points/query", query_points)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_holder.append(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        started.set()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return port_holder[0], loop
+
+
+async def _run_sync_client(port: int, request_count: int) -> float:
+    client = QdrantClient(
+        url="http://127.0.0.1", port=port, https=False, prefer_grpc=False, timeout=60, check_compatibility=False
+    )
+
+    async def search() -> None:
+        client.query_points(collection_name=COLLECTION_NAME, query=[0.1, 0.2, 0.3], using="dense", limit=10)
+
+    await search()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(search() for _ in range(request_count)))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+async def _run_async_client(port: int, request_count: int) -> float:
+    client = AsyncQdrantClient(
+        url="http://127.0.0.1", port=port, https=False, prefer_grpc=False, timeout=60, check_compatibility=False
+    )
+
+    async def search() -> None:
+        await client.query_points(collection_name=COLLECTION_NAME, query=[0.1, 0.2, 0.3], using="dense", limit=10)
+
+    # Warm the connection pool so both runs measure steady-state throughput
+    await search()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(search() for _ in range(request_count)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64, help="Concurrent searches per run")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated Qdrant round-trip latency")
+    args = parser.parse_args()
+
+    port, server_loop = _start_fake_qdrant(args.latency_ms / 1000.0)
+
+    sync_elapsed = asyncio.run(_run_sync_client(port, args.requests))
+    async_elapsed = asyncio.run(_run_async_client(port, args.requests))
+
+    server_loop.call_soon_threadsafe(server_loop.stop)
+
+    print(f"Qdrant stand-in latency: {args.latency_ms:.1f} ms, concurrent searches: {args.requests}")
+    print(f"  QdrantClient (blocking):   {sync_elapsed:8.3f} s  {args.requests / sync_elapsed:8.1f} req/s")
+    print(f"  AsyncQdrantClient:         {async_elapsed:8.3f} s  {args.requests / async_elapsed:8.1f} req/s")
+    print(f"  Throughput gain:           {sync_elapsed / async_elapsed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Query parsing benchmark: per-keyword fuzzy scans vs the compiled IntentMatcher.
+
+Times the keyword detection that ``_build_query_filter`` performs for every free
+text search, over a mix of clean and misspelled queries. The baseline is the
+previous approach, one ``_fuzzy_keyword_in_text`` call per table keyword, each
+re-splitting the query and running ``fuzz.ratio`` on every word pair. The
+compiled run tokenises the query once through ``IntentMatcher`` and answers every
+keyword from the resolved words. The full ``_build_query_filter`` call (which
+also runs the regexes and exclusion extraction) is reported for reference, as is
+``_parse_query`` answered from a warm ``ParsedQueryCache`` (the head-query path).
+
+Usage:
+    poetry run python benchmarks/query_parsing_benchmark.py [--iterations 2000]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+# Load the application package first so the handler module resolves its imports the way main.py does
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.queries.free_text_query import (
+    FreeTextQuery,
+    FreeTextQueryHandler,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQueryCache,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    QueryDictionaryBundle,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import QueryParsingOptions
+
+_QUERIES = [
+    "refreshing gin cocktails for summer",
+    "smoky mezcal drinks without honey",
+    "top rated bourbn cocktails served in a rocks glass",
+    "easy shaken tequila sour for a party",
+    "non-iba modern cocktail with campari",
+    "strong stirred whisky nightcap for winter",
+    "quick frozen tropical rum drinks",
+    "romantic date night champagne flute spritz",
+    "something warm and cozy with cognac no cream",
+    "what should i drink tonight",
+]
+
+
+def _keyword_groups(dictionaries: QueryDictionaryBundle) -> list[list[str]]:
+    return [
+        dictionaries.non_iba_terms,
+        dictionaries.iba_terms,
+        dictionaries.simple_terms,
+        dictionaries.complex_terms,
+        dictionaries.quick_prep_terms,
+        dictionaries.ten_minute_prep_terms,
+        dictionaries.rating_sort_terms,
+        list(dictionaries.glassware_mapping),
+        list(dictionaries.base_spirit_mapping),
+        dictionaries.flavor_profile_keywords,
+        dictionaries.cocktail_family_keywords,
+        list(dictionaries.technique_mapping),
+        list(dictionaries.strength_keywords),
+        list(dictionaries.temperature_keywords),
+        dictionaries.season_keywords,
+        dictionaries.occasion_keywords,
+        dictionaries.mood_keywords,
+    ]
+
+
+def _per_keyword_scan(handler: FreeTextQueryHandler, groups: list[list[str]], text: str) -> list[list[str]]:
+    return [[keyword for keyword in group if handler._fuzzy_keyword_in_text(text, keyword)] for group in groups]
+
+
+def _compiled_scan(dictionaries: QueryDictionaryBundle, groups: list[list[str]], text: str) -> list[list[str]]:
+    intent = dictionaries.intent_matcher.match(text)
+    return [intent.all_matches(group) for group in groups]
+
+
+def _time(fn: Callable[[str], object], iterations: int) -> tuple[float, float]:
+    samples = []
+    for i in range(iterations):
+        text = _QUERIES[i % len(_QUERIES)]
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Timed parses per run")
+    args = parser.parse_args()
+
+    build_start = time.perf_counter()
+    options = QueryParsingOptions(QUERY_DICTIONARY_DIR="")
+    store = QueryDictionaryStore(query_parsing_options=options)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    dictionaries = store.current
+    groups = _keyword_groups(dictionaries)
+
+    # The parsing helpers only need the dictionaries, so skip the DI-heavy constructor
+    handler = FreeTextQueryHandler.__new__(FreeTextQueryHandler)
+    handler.query_dictionary_store = store
+    handler.parsed_query_cache = ParsedQueryCache(query_parsing_options=options)
+    commands = {text: FreeTextQuery(free_text=text) for text in _QUERIES}
+
+    for text in _QUERIES:
+        assert _per_keyword_scan(handler, groups, text) == _compiled_scan(dictionaries, groups, text), text
+
+    keyword_count = sum(len(group) for group in groups)
+    legacy_p50, legacy_p99 = _time(lambda text: _per_keyword_scan(handler, groups, text), args.iterations)
+    compiled_p50, compiled_p99 = _time(lambda text: _compiled_scan(dictionaries, groups, text), args.iterations)
+    filter_p50, filter_p99 = _time(lambda text: handler._build_query_filter(text, {}), args.iterations)
+    cached_p50, cached_p99 = _time(lambda text: handler._parse_query(commands[text], text), args.iterations)
+
+    print(f"{keyword_count} keywords, {len(_QUERIES)} queries, dictionary load {build_ms:.1f} ms (once per reload)")
+    print(f"  {'keyword detection':<26} {'p50 us':>9} {'p99 us':>9}")
+    print(f"  {'per-keyword fuzzy scan':<26} {legacy_p50:9.1f} {legacy_p99:9.1f}")
+    print(f"  {'compiled IntentMatcher':<26} {compiled_p50:9.1f} {compiled_p99:9.1f}")
+    print(f"  {'full _build_query_filter':<26} {filter_p50:9.1f} {filter_p99:9.1f}")
+    print(f"  {'cached _parse_query':<26} {cached_p50:9.1f} {cached_p99:9.1f}")
+    print(f"  speedup (p50):             {legacy_p50 / max(compiled_p50, 1e-6):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
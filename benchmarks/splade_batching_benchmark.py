@@ -0,0 +1,105 @@
+"""Micro-batching benchmark for SPLADE query encoding.
+
+Starts a local TEI stand-in that answers ``POST /embed_sparse`` the way a single
+GPU worker does: requests are served one at a time, each costing a fixed
+per-request overhead plus a small per-input cost. A burst of concurrent
+``SpladeService.encode`` calls is then issued with micro-batching disabled
+(one TEI request per query) and enabled (queries coalesced per batch window).
+
+Usage:
+    poetry run python benchmarks/splade_batching_benchmark.py [--requests 128] [--request-ms 4] [--window-ms 2]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+
+# Load the application package first; importing infrastructure.services on its own trips the
+# services <-> semantic_search import cycle that the app normally resolves via main.py
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions
+from cezzis_com_cocktails_aisearch.domain.config.splade_options import SpladeOptions
+from cezzis_com_cocktails_aisearch.infrastructure.services.http_client import create_http_client
+from cezzis_com_cocktails_aisearch.infrastructure.services.splade_service import SpladeService
+
+PER_INPUT_SECONDS = 0.0002
+
+
+def _start_fake_tei(request_seconds: float, request_counter: list[int]) -> tuple[int, asyncio.AbstractEventLoop]:
+    """Run the TEI stand-in on its own thread and event loop, returning the bound port."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    port_holder: list[int] = []
+
+    async def serve() -> None:
+        worker = asyncio.Lock()
+
+        async def embed_sparse(request: web.Request) -> web.Response:
+            inputs = (await request.json())["inputs"]
+            request_counter[0] += 1
+            async with worker:
+                await asyncio.sleep(request_seconds + PER_INPUT_SECONDS * len(inputs))
+            return web.json_response([[{"index": i, "value": 0.5}] for i, _ in enumerate(inputs)])
+
+        app = web.Application()
+        app.router.add_post("/embed_sparse", embed_sparse)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_holder.append(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        started.set()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return port_holder[0], loop
+
+
+async def _run(port: int, request_count: int, window_ms: float) -> float:
+    options = SpladeOptions(
+        SPLADE_ENDPOINT=f"http://127.0.0.1:{port}",
+        SPLADE_BATCH_WINDOW_MS=window_ms,
+    )
+    http_client = create_http_client(HttpClientOptions())
+    service = SpladeService(splade_options=options, http_client=http_client)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(service.encode(f"cocktail query {i}") for i in range(request_count)))
+    elapsed = time.perf_counter() - start
+    await http_client.aclose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=128, help="Concurrent encodes in the burst")
+    parser.add_argument("--request-ms", type=float, default=4.0, help="Simulated per-request TEI inference cost")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="Batch window for the batched run")
+    args = parser.parse_args()
+
+    request_counter = [0]
+    port, server_loop = _start_fake_tei(args.request_ms / 1000.0, request_counter)
+
+    unbatched_elapsed = asyncio.run(_run(port, args.requests, 0.0))
+    unbatched_calls, request_counter[0] = request_counter[0], 0
+    batched_elapsed = asyncio.run(_run(port, args.requests, args.window_ms))
+    batched_calls = request_counter[0]
+
+    server_loop.call_soon_threadsafe(server_loop.stop)
+
+    print(f"TEI stand-in cost: {args.request_ms:.1f} ms/request, burst of {args.requests} encodes")
+    print(f"  unbatched:              {unbatched_elapsed:8.3f} s  {unbatched_calls:5d} TEI requests")
+    print(f"  batched ({args.window_ms:.1f} ms window): {batched_elapsed:8.3f} s  {batched_calls:5d} TEI requests")
+    print(f"  speedup:                {unbatched_elapsed / batched_elapsed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
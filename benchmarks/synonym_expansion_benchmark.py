@@ -0,0 +1,93 @@
+"""Synonym expansion benchmark: per-trigger substring checks vs the Aho–Corasick SynonymIndex.
+
+Grows the shipped ``query_synonym_expansions.json`` with synthetic triggers (to
+roughly 100, 1,000 and 10,000 triggers) and times trigger matching for a set of
+free text queries, first with the previous loop (one ``trigger in text`` check
+per trigger of every category) and then through ``SynonymIndex``, which scans
+each query once regardless of how many triggers there are.
+
+Usage:
+    poetry run python benchmarks/synonym_expansion_benchmark.py [--iterations 2000]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from importlib import resources
+from typing import Callable
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.synonym_index import (
+    SynonymIndex,
+)
+
+_QUERIES = [
+    "refreshing gin cocktails for summer",
+    "smoky mezcal nightcap",
+    "tiki drinks with spiced rum and orgeat",
+    "something bitter and herbal after dinner",
+    "hangover cure with tomato juice",
+    "what should i drink tonight",
+]
+
+_SYNTHETIC_WORDS = ["alpine", "velvet", "ember", "harbor", "orchard", "saffron", "midnight", "copper", "garden", "cask"]
+
+
+def _load_expansions() -> dict[str, dict[str, list[str]]]:
+    ref = resources.files("cezzis_com_cocktails_aisearch.static").joinpath("query_synonym_expansions.json")
+    data = json.loads(ref.read_text(encoding="utf-8"))
+    return {k: v for k, v in data.items() if isinstance(v, dict) and not k.startswith("_")}
+
+
+def _grow(expansions: dict[str, dict[str, list[str]]], trigger_count: int) -> dict[str, dict[str, list[str]]]:
+    grown = {category: dict(mappings) for category, mappings in expansions.items()}
+    existing = sum(len(mappings) for mappings in grown.values())
+    synthetic: dict[str, list[str]] = {}
+    for i in range(max(trigger_count - existing, 0)):
+        first = _SYNTHETIC_WORDS[i % len(_SYNTHETIC_WORDS)]
+        second = _SYNTHETIC_WORDS[(i // len(_SYNTHETIC_WORDS)) % len(_SYNTHETIC_WORDS)]
+        synthetic[f"{first} {second} {i}"] = [f"term{i}"]
+    grown["synthetic_expansions"] = synthetic
+    return grown
+
+
+def _per_trigger_scan(expansions: dict[str, dict[str, list[str]]], text: str) -> list[str]:
+    return [trigger for mappings in expansions.values() for trigger in mappings if trigger in text]
+
+
+def _time(fn: Callable[[str], object], iterations: int) -> float:
+    samples = []
+    for i in range(iterations):
+        text = _QUERIES[i % len(_QUERIES)]
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Timed matches per run")
+    args = parser.parse_args()
+
+    base = _load_expansions()
+    print(f"  {'triggers':>9} {'build ms':>9} {'per-trigger p50 us':>19} {'automaton p50 us':>17} {'speedup':>8}")
+    for trigger_count in (sum(len(m) for m in base.values()), 1_000, 10_000):
+        expansions = _grow(base, trigger_count)
+        build_start = time.perf_counter()
+        index = SynonymIndex(expansions)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        for text in _QUERIES:
+            assert [trigger for trigger, _ in index.matches(text)] == _per_trigger_scan(expansions, text), text
+
+        legacy_p50 = _time(lambda text: _per_trigger_scan(expansions, text), args.iterations)
+        index_p50 = _time(index.matches, args.iterations)
+        print(
+            f"  {len(index):9d} {build_ms:9.1f} {legacy_p50:19.1f} {index_p50:17.1f}"
+            f" {legacy_p50 / max(index_p50, 1e-6):7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
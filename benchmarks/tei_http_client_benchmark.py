@@ -0,0 +1,122 @@
+"""Connection reuse benchmark for the TEI (SPLADE / reranker) HTTP calls.
+
+Starts a local TEI stand-in (an aiohttp server that answers
+``POST /embed_sparse`` after a fixed delay) and issues SPLADE-style requests,
+first through a brand-new ``httpx.AsyncClient`` per call (the old service
+behaviour) and then through the shared, pooled client built by
+``create_http_client``. Runs are timed both sequentially (per-call latency)
+and as a concurrent burst (throughput).
+
+The stand-in speaks plain HTTP on localhost, so the numbers only show TCP
+connect and client construction overhead; against a remote TLS endpoint the
+per-call handshake makes the gap considerably wider.
+
+Usage:
+    poetry run python benchmarks/tei_http_client_benchmark.py [--requests 200] [--latency-ms 2]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+import httpx
+from aiohttp import web
+
+# Load the application package first; importing infrastructure.services on its own trips the
+# services <-> semantic_search import cycle that the app normally resolves via main.py
+from cezzis_com_cocktails_aisearch.application.concerns import semantic_search  # noqa: F401
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions
+from cezzis_com_cocktails_aisearch.infrastructure.services.http_client import create_http_client
+
+PAYLOAD = {"inputs": "smoky mezcal cocktail with lime"}
+RESPONSE = [[{"index": 1012, "value": 0.8}, {"index": 2034, "value": 0.4}]]
+
+
+def _start_fake_tei(latency_seconds: float) -> tuple[int, asyncio.AbstractEventLoop]:
+    """Run the TEI stand-in on its own thread and event loop, returning the bound port."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    port_holder: list[int] = []
+
+    async def embed_sparse(_request: web.Request) -> web.Response:
+        await asyncio.sleep(latency_seconds)
+        return web.json_response(RESPONSE)
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post("/embed_sparse", embed_sparse)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_holder.append(site._server.sockets[0].getsockname()[1])  # type: ignore[union-attr]
+        started.set()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return port_holder[0], loop
+
+
+async def _client_per_call(url: str, request_count: int, concurrent: bool) -> float:
+    async def encode() -> None:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(url, json=PAYLOAD)
+            response.raise_for_status()
+
+    return await _time_calls(encode, request_count, concurrent)
+
+
+async def _shared_client(url: str, request_count: int, concurrent: bool) -> float:
+    client = create_http_client(HttpClientOptions())
+
+    async def encode() -> None:
+        response = await client.post(url, json=PAYLOAD)
+        response.raise_for_status()
+
+    # Warm the pool so the run measures steady-state reuse
+    await encode()
+    elapsed = await _time_calls(encode, request_count, concurrent)
+    await client.aclose()
+    return elapsed
+
+
+async def _time_calls(encode, request_count: int, concurrent: bool) -> float:
+    start = time.perf_counter()
+    if concurrent:
+        await asyncio.gather(*(encode() for _ in range(request_count)))
+    else:
+        for _ in range(request_count):
+            await encode()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per run")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated TEI inference latency")
+    args = parser.parse_args()
+
+    port, server_loop = _start_fake_tei(args.latency_ms / 1000.0)
+    url = f"http://127.0.0.1:{port}/embed_sparse"
+
+    print(f"TEI stand-in latency: {args.latency_ms:.1f} ms, requests per run: {args.requests}")
+    for concurrent in (False, True):
+        per_call = asyncio.run(_client_per_call(url, args.requests, concurrent))
+        shared = asyncio.run(_shared_client(url, args.requests, concurrent))
+        label = "concurrent" if concurrent else "sequential"
+        print(f"  [{label}]")
+        print(f"    client per call:  {per_call:8.3f} s  {per_call / args.requests * 1000:8.2f} ms/req")
+        print(f"    shared client:    {shared:8.3f} s  {shared / args.requests * 1000:8.2f} ms/req")
+        print(f"    speedup:          {per_call / shared:8.1f}x")
+
+    server_loop.call_soon_threadsafe(server_loop.stop)
+
+
+if __name__ == "__main__":
+    main()
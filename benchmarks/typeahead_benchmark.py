@@ -0,0 +1,111 @@
+"""Typeahead latency benchmark: per-keystroke sort-and-scan vs the prebuilt prefix index.
+
+Simulates users typing cocktail names one keystroke at a time against a synthetic
+catalog (50k by default) and reports p50/p99/max latency per keystroke for the
+previous handler logic (sort the catalog, then ``startswith`` / substring scans)
+and for ``TypeaheadPrefixIndex`` (bisect over sorted title keys, no sorting per
+request). A second run types misspelled words (two adjacent letters swapped)
+against a smaller catalog (10k by default) to time the typo-tolerant trigram
+fallback, which is only reached when the prefix stages return too few matches.
+
+Usage:
+    poetry run python benchmarks/typeahead_benchmark.py [--cocktails 50000] [--queries 40] [--typo-cocktails 10000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable
+
+from catalog_index_benchmark import build_catalog
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+
+
+def _legacy_typeahead(text: str, cocktails: list[CocktailSearchModel], take: int = 10) -> list[CocktailSearchModel]:
+    """The previous handler body: sort every request, prefix scan, then an O(n^2) contains scan."""
+    sorted_cocktails = sorted(cocktails, key=lambda p: p.title or "")
+    starts = [
+        c
+        for c in sorted_cocktails
+        if c.title.lower().startswith(text.lower()) or c.descriptive_title.lower().startswith(text.lower())
+    ]
+    if len(starts) < take:
+        contains = [c for c in sorted_cocktails if text.lower() in c.title.lower() and c not in starts]
+        starts = starts + contains
+    return starts[:take]
+
+
+def _keystrokes(cocktails: list[CocktailSearchModel], count: int) -> list[str]:
+    rng = random.Random(11)
+    prefixes = []
+    for cocktail in rng.sample(cocktails, count):
+        word = cocktail.title.split()[rng.randrange(2)].lower()
+        prefixes.extend(word[:length] for length in range(1, len(word) + 1))
+    return prefixes
+
+
+def _typo_keystrokes(cocktails: list[CocktailSearchModel], count: int) -> list[str]:
+    rng = random.Random(13)
+    prefixes = []
+    for cocktail in rng.sample(cocktails, count):
+        word = max(cocktail.title.split()[:2], key=len).lower()
+        if len(word) < 4:
+            continue
+        swap = rng.randrange(1, len(word) - 1)
+        typo = word[:swap] + word[swap + 1] + word[swap] + word[swap + 2 :]
+        prefixes.extend(typo[:length] for length in range(swap + 2, len(typo) + 1))
+    return prefixes
+
+
+def _latencies(fn: Callable[[str], object], prefixes: list[str]) -> list[float]:
+    samples = []
+    for prefix in prefixes:
+        start = time.perf_counter()
+        fn(prefix)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return sorted(samples)
+
+
+def _report(label: str, samples: list[float]) -> None:
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"  {label:<22} p50 {statistics.median(samples):12.1f} us   p99 {p99:12.1f} us   max {samples[-1]:12.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cocktails", type=int, default=50_000, help="Synthetic catalog size")
+    parser.add_argument("--typo-cocktails", type=int, default=10_000, help="Catalog size for the misspelling run")
+    parser.add_argument(
+        "--queries", type=int, default=40, help="Typed words (each contributes one lookup per keystroke)"
+    )
+    parser.add_argument(
+        "--legacy-queries", type=int, default=5, help="Typed words for the (slow) previous implementation"
+    )
+    args = parser.parse_args()
+
+    cocktails = build_catalog(args.cocktails)
+    build_start = time.perf_counter()
+    catalog = CocktailCatalogIndex(cocktails)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    prefixes = _keystrokes(cocktails, args.queries)
+    legacy_prefixes = prefixes[: max(1, args.legacy_queries * len(prefixes) // args.queries)]
+
+    print(f"Catalog: {args.cocktails} cocktails, catalog index build {build_ms:.1f} ms (once per catalog load)")
+    print(f"Keystrokes: {len(prefixes)} indexed, {len(legacy_prefixes)} legacy")
+    _report("sort + scan (previous)", _latencies(lambda p: _legacy_typeahead(p, cocktails), legacy_prefixes))
+    _report("prefix index", _latencies(lambda p: catalog.typeahead.search(p, 0, 10), prefixes))
+
+    typo_catalog = CocktailCatalogIndex(build_catalog(args.typo_cocktails))
+    typo_prefixes = _typo_keystrokes(typo_catalog.cocktails, args.queries)
+    print(f"Misspelled keystrokes: {len(typo_prefixes)} against {args.typo_cocktails} cocktails")
+    _report("prefix + trigram fuzzy", _latencies(lambda p: typo_catalog.typeahead.search(p, 0, 10), typo_prefixes))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ from cezzis_com_cocktails_aisearch.apis.embedding import (
 from cezzis_com_cocktails_aisearch.apis.health_check import (
     HealthCheckRouter,
 )
+from cezzis_com_cocktails_aisearch.apis.query_dictionaries import (
+    QueryDictionariesRouter,
+)
 from cezzis_com_cocktails_aisearch.apis.scalar_docs import (
     ScalarDocsRouter,
 )
@@ -16,4 +19,5 @@ __all__ = [
     "EmbeddingRouter",
     "ScalarDocsRouter",
     "HealthCheckRouter",
+    "QueryDictionariesRouter",
 ]
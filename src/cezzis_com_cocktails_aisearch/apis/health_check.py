@@ -41,7 +41,7 @@ class HealthCheckRouter(APIRouter):
 
     async def readiness_check(self, response: Response) -> HealthCheckRs:
         """
-        Performs a readiness check verifying connectivity to Qdrant.
+        Performs a readiness check verifying connectivity to Qdrant and that the startup warm-up has finished.
         """
 
         result = cast(HealthCheckRs, await self.mediator.send_async(ReadinessCheckQuery()))
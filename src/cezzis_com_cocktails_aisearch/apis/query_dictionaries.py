@@ -0,0 +1,48 @@
+from typing import cast
+
+from cezzis_oauth_fastapi import (
+    oauth_authorization,
+)
+from fastapi import APIRouter, Request
+from injector import inject
+from mediatr import Mediator
+
+from cezzis_com_cocktails_aisearch.application.behaviors.apim_host_key_authorization.apim_host_key_authorization import (
+    apim_host_key_authorization,
+)
+from cezzis_com_cocktails_aisearch.application.behaviors.openapi import create_openapi_extra
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.reload_query_dictionaries_command import (
+    ReloadQueryDictionariesCommand,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.query_dictionary_reload_rs import (
+    QueryDictionaryReloadRs,
+)
+from cezzis_com_cocktails_aisearch.domain.config.oauth_options import get_oauth_options
+
+
+class QueryDictionariesRouter(APIRouter):
+    @inject
+    def __init__(self, mediator: Mediator):
+        super().__init__(prefix="/v1/admin", tags=["Administration"])
+        self.mediator = mediator
+        self.add_api_route(
+            path="/query-dictionaries/reload",
+            operation_id="postV1AdminQueryDictionariesReload",
+            endpoint=self.reload,
+            methods=["POST"],
+            responses={
+                200: {"model": QueryDictionaryReloadRs, "description": "The query dictionary version now in use"},
+            },
+            openapi_extra=create_openapi_extra(
+                security=[{"auth0": ["write:query-dictionaries"]}],
+            ),
+        )
+
+    @apim_host_key_authorization
+    @oauth_authorization(scopes=["write:query-dictionaries"], config_provider=get_oauth_options)
+    async def reload(self, _rq: Request) -> QueryDictionaryReloadRs:
+        """
+        Reloads the query intent keyword and synonym dictionaries from disk without a restart.
+        """
+
+        return cast(QueryDictionaryReloadRs, await self.mediator.send_async(ReloadQueryDictionariesCommand()))
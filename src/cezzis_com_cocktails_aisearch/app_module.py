@@ -1,6 +1,7 @@
+import httpx
 from injector import Binder, Injector, Module, singleton
 from mediatr import Mediator
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 
 from cezzis_com_cocktails_aisearch.application.concerns.health.queries.health_check_query import HealthCheckQueryHandler
 from cezzis_com_cocktails_aisearch.application.concerns.health.queries.readiness_check_query import (
@@ -9,18 +10,40 @@ from cezzis_com_cocktails_aisearch.application.concerns.health.queries.readiness
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.cocktail_embedding_command import (
     CocktailEmbeddingCommandHandler,
 )
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.reload_query_dictionaries_command import (
+    ReloadQueryDictionariesCommandHandler,
+)
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.queries import FreeTextQueryHandler
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQueryCache,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup.search_warmup import SearchWarmup
 from cezzis_com_cocktails_aisearch.domain.config import QdrantOptions, get_qdrant_options
 from cezzis_com_cocktails_aisearch.domain.config.app_options import AppOptions, get_app_options
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions, get_cache_options
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions, get_http_client_options
 from cezzis_com_cocktails_aisearch.domain.config.hugging_face_options import HuggingFaceOptions, get_huggingface_options
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import (
+    QueryParsingOptions,
+    get_query_parsing_options,
+)
 from cezzis_com_cocktails_aisearch.domain.config.reranker_options import RerankerOptions, get_reranker_options
 from cezzis_com_cocktails_aisearch.domain.config.splade_options import SpladeOptions, get_splade_options
+from cezzis_com_cocktails_aisearch.domain.config.warmup_options import WarmupOptions, get_warmup_options
+from cezzis_com_cocktails_aisearch.infrastructure.caching.cache_backend_factory import create_cache_backend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_cache_snapshot import EmbeddingCacheSnapshot
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
 from cezzis_com_cocktails_aisearch.infrastructure.repositories import (
     CocktailVectorEmbeddingRepository,
     CocktailVectorSearchRepository,
     ICocktailVectorEmbeddingRepository,
     ICocktailVectorSearchRepository,
 )
+from cezzis_com_cocktails_aisearch.infrastructure.services.http_client import create_http_client
 from cezzis_com_cocktails_aisearch.infrastructure.services.ireranker_service import IRerankerService
 from cezzis_com_cocktails_aisearch.infrastructure.services.isplade_service import ISpladeService
 from cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service import RerankerService
@@ -46,6 +69,22 @@ class AppModule(Module):
             prefer_grpc=False,
             timeout=60,
         )
+        # Non-blocking client used on the request path so concurrent searches
+        # can overlap their Qdrant I/O on a single event loop
+        async_qdrant_client = AsyncQdrantClient(
+            url=qdrant_options.host,
+            api_key=qdrant_options.api_key if qdrant_options.api_key else None,
+            port=qdrant_options.port,
+            https=qdrant_options.use_https,
+            prefer_grpc=False,
+            timeout=60,
+        )
+        # One pooled, keep-alive HTTP client shared by the TEI services (closed on app shutdown)
+        http_client_options = get_http_client_options()
+        http_client = create_http_client(http_client_options)
+        # Embedding, SPLADE and search result caches share one backend: per-process memory or a Redis-protocol server
+        cache_options = get_cache_options()
+        cache_backend = create_cache_backend(cache_options)
 
         binder.bind(Mediator, Mediator(handler_class_manager=mediator_manager), scope=singleton)
         binder.bind(ICocktailVectorEmbeddingRepository, CocktailVectorEmbeddingRepository, scope=singleton)
@@ -56,10 +95,23 @@ class AppModule(Module):
         binder.bind(HuggingFaceOptions, get_huggingface_options(), scope=singleton)
         binder.bind(RerankerOptions, get_reranker_options(), scope=singleton)
         binder.bind(SpladeOptions, get_splade_options(), scope=singleton)
+        binder.bind(HttpClientOptions, http_client_options, scope=singleton)
+        binder.bind(httpx.AsyncClient, http_client, scope=singleton)
+        binder.bind(CacheOptions, cache_options, scope=singleton)
+        binder.bind(ICacheBackend, cache_backend, scope=singleton)
+        binder.bind(SearchResultCache, SearchResultCache, scope=singleton)
+        binder.bind(EmbeddingCacheSnapshot, EmbeddingCacheSnapshot, scope=singleton)
+        binder.bind(QueryParsingOptions, get_query_parsing_options(), scope=singleton)
+        binder.bind(QueryDictionaryStore, QueryDictionaryStore, scope=singleton)
+        binder.bind(ParsedQueryCache, ParsedQueryCache, scope=singleton)
+        binder.bind(WarmupOptions, get_warmup_options(), scope=singleton)
+        binder.bind(SearchWarmup, SearchWarmup, scope=singleton)
         binder.bind(QdrantOptions, get_qdrant_options(), scope=singleton)
         binder.bind(QdrantClient, qdrant_client, scope=singleton)
+        binder.bind(AsyncQdrantClient, async_qdrant_client, scope=singleton)
         binder.bind(FreeTextQueryHandler, FreeTextQueryHandler, scope=singleton)
         binder.bind(CocktailEmbeddingCommandHandler, CocktailEmbeddingCommandHandler, scope=singleton)
+        binder.bind(ReloadQueryDictionariesCommandHandler, ReloadQueryDictionariesCommandHandler, scope=singleton)
         binder.bind(HealthCheckQueryHandler, HealthCheckQueryHandler, scope=singleton)
         binder.bind(ReadinessCheckQueryHandler, ReadinessCheckQueryHandler, scope=singleton)
 
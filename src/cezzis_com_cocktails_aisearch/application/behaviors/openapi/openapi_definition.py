@@ -78,7 +78,10 @@ def openapi_definition(app: FastAPI, oauth_options: OAuthOptions) -> dict:
         client_id=oauth_options.client_id or "",
         domain=oauth_options.domain,
         audience=oauth_options.audience,
-        scopes={"write:embeddings": "Create and update cocktail embeddings"},
+        scopes={
+            "write:embeddings": "Create and update cocktail embeddings",
+            "write:query-dictionaries": "Reload the query intent keyword and synonym dictionaries",
+        },
         pkce=oauth_options.pkce or None,
     )
 
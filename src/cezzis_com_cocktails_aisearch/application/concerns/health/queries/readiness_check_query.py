@@ -6,6 +6,7 @@ from mediatr import GenericQuery, Mediator
 from qdrant_client import QdrantClient
 
 from cezzis_com_cocktails_aisearch.application.concerns.health.models.health_check_rs import HealthCheckRs
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup.search_warmup import SearchWarmup
 
 
 class ReadinessCheckQuery(GenericQuery[HealthCheckRs]):
@@ -16,9 +17,10 @@ class ReadinessCheckQuery(GenericQuery[HealthCheckRs]):
 @Mediator.handler
 class ReadinessCheckQueryHandler:
     @inject
-    def __init__(self, qdrant_client: QdrantClient):
+    def __init__(self, qdrant_client: QdrantClient, search_warmup: SearchWarmup):
         self.logger = logging.getLogger("readiness_check_query_handler")
         self._qdrant_client = qdrant_client
+        self._search_warmup = search_warmup
 
     async def handle(self, command: ReadinessCheckQuery) -> HealthCheckRs:
         details = {}
@@ -33,9 +35,20 @@ class ReadinessCheckQueryHandler:
             details["qdrant"] = "unhealthy"
             overall_healthy = False
 
+        # Hold traffic back until the catalog and search caches are warm
+        warmed_up = self._search_warmup.is_complete
+        details["warmup"] = "complete" if warmed_up else "in_progress"
+
+        if not overall_healthy:
+            output = "One or more dependencies are unreachable"
+        elif not warmed_up:
+            output = "Startup warm-up is in progress"
+        else:
+            output = "All dependencies are reachable"
+
         return HealthCheckRs(
-            status="healthy" if overall_healthy else "unhealthy",
+            status="healthy" if overall_healthy and warmed_up else "unhealthy",
             version=version("cezzis_com_cocktails_aisearch"),
-            output="All dependencies are reachable" if overall_healthy else "One or more dependencies are unreachable",
+            output=output,
             details=details,
         )
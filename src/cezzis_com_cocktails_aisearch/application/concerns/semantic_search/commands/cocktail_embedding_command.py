@@ -12,9 +12,13 @@ from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.c
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_keywords import (
     CocktailSearchKeywords,
 )
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
 from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_embedding_repository import (
     ICocktailVectorEmbeddingRepository,
 )
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
+    ICocktailVectorSearchRepository,
+)
 
 
 class CocktailEmbeddingCommand(GenericQuery[bool]):
@@ -50,8 +54,15 @@ class CocktailEmbeddingCommandValidator:
 @Mediator.handler
 class CocktailEmbeddingCommandHandler:
     @inject
-    def __init__(self, cocktail_vector_repository: ICocktailVectorEmbeddingRepository):
+    def __init__(
+        self,
+        cocktail_vector_repository: ICocktailVectorEmbeddingRepository,
+        cocktail_search_repository: ICocktailVectorSearchRepository,
+        search_result_cache: SearchResultCache,
+    ):
         self.cocktail_vector_repository = cocktail_vector_repository
+        self.cocktail_search_repository = cocktail_search_repository
+        self.search_result_cache = search_result_cache
         self.logger = logging.getLogger("cocktail_embedding_command_handler")
 
     async def handle(self, command: CocktailEmbeddingCommand) -> bool:
@@ -65,14 +76,28 @@ class CocktailEmbeddingCommandHandler:
             },
         )
 
+        cocktail_model = command.cocktail_embedding_model.to_cocktail_model()
+
         await self.cocktail_vector_repository.delete_vectors(command.cocktail_embedding_model.id)
 
-        await self.cocktail_vector_repository.store_vectors(
-            cocktail_id=command.cocktail_embedding_model.id,
-            chunks=[chunk for chunk in command.chunks if chunk.content.strip() != ""],
-            cocktail_model=command.cocktail_embedding_model.to_cocktail_model(),
-            cocktail_keywords=command.cocktail_keywords,
-        )
+        try:
+            await self.cocktail_vector_repository.store_vectors(
+                cocktail_id=command.cocktail_embedding_model.id,
+                chunks=[chunk for chunk in command.chunks if chunk.content.strip() != ""],
+                cocktail_model=cocktail_model,
+                cocktail_keywords=command.cocktail_keywords,
+            )
+        except Exception:
+            # The previous vectors are already gone, so stop serving the cocktail from the catalog
+            await self.cocktail_search_repository.remove_catalog_cocktail(command.cocktail_embedding_model.id)
+            await self.search_result_cache.invalidate()
+            raise
+
+        # Exact-match, browse and typeahead see the new version without a catalog reload
+        await self.cocktail_search_repository.upsert_catalog_cocktail(cocktail_model)
+
+        # Cached rankings may include (or miss) this cocktail, so drop them all
+        await self.search_result_cache.invalidate()
 
         self.logger.info(
             msg="Cocktail embedding stored in qdrant successfully",
@@ -0,0 +1,48 @@
+import logging
+
+from injector import inject
+from mediatr import GenericQuery, Mediator
+
+from cezzis_com_cocktails_aisearch.application.behaviors.error_handling.exception_types import (
+    InternalServerErrorException,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.query_dictionary_reload_rs import (
+    QueryDictionaryReloadRs,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+
+
+class ReloadQueryDictionariesCommand(GenericQuery[QueryDictionaryReloadRs]):
+    def __init__(self):
+        pass
+
+
+@Mediator.handler
+class ReloadQueryDictionariesCommandHandler:
+    @inject
+    def __init__(self, query_dictionary_store: QueryDictionaryStore):
+        self.query_dictionary_store = query_dictionary_store
+        self.logger = logging.getLogger("reload_query_dictionaries_command_handler")
+
+    async def handle(self, command: ReloadQueryDictionariesCommand) -> QueryDictionaryReloadRs:
+        previous_version = self.query_dictionary_store.current.version
+
+        try:
+            bundle = await self.query_dictionary_store.reload()
+        except Exception as e:
+            self.logger.exception(
+                "Failed to reload query dictionaries", exc_info=e, extra={"query_dictionary_version": previous_version}
+            )
+            raise InternalServerErrorException(
+                detail=f"Failed to reload query dictionaries, version {previous_version} is still in use: {e}"
+            ) from e
+
+        return QueryDictionaryReloadRs(
+            version=bundle.version,
+            fingerprint=bundle.fingerprint,
+            reloaded=bundle.version != previous_version,
+            keyword_word_count=len(bundle.intent_matcher.vocabulary),
+            synonym_trigger_count=len(bundle.synonym_index),
+        )
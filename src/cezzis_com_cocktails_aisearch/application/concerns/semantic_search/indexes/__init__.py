@@ -0,0 +1,13 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.trigram_index import TrigramIndex
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.typeahead_prefix_index import (
+    TypeaheadPrefixIndex,
+)
+
+__all__ = [
+    "CocktailCatalogIndex",
+    "TrigramIndex",
+    "TypeaheadPrefixIndex",
+]
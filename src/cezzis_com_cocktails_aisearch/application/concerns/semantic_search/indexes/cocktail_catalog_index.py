@@ -0,0 +1,89 @@
+from typing import Iterable
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.typeahead_prefix_index import (
+    TypeaheadPrefixIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+
+
+class CocktailCatalogIndex:
+    """Lookup structures over the cached cocktail catalog, built once per catalog load.
+
+    Replaces the per-request list scans (lower-casing every title, re-sorting the
+    whole catalog) with precomputed structures:
+
+    - ``by_id``: cocktail id -> cocktail
+    - ``by_title``: lower-cased title -> cocktails with that title, in catalog order
+    - ``sorted_by_title``: the catalog sorted by title, with lower-cased titles and
+      descriptive titles aligned to it for scans that must stay substring-based
+    - ``by_ingredient``: lower-cased ingredient name -> title-order positions of the
+      cocktails using it
+    - ``typeahead``: a prefix index over titles and descriptive titles
+    """
+
+    def __init__(self, cocktails: list[CocktailSearchModel]):
+        self.cocktails = cocktails
+        self.lower_titles = [(cocktail.title or "").lower() for cocktail in cocktails]
+
+        self.by_id: dict[str, CocktailSearchModel] = {}
+        self.by_title: dict[str, list[CocktailSearchModel]] = {}
+        for cocktail, lower_title in zip(cocktails, self.lower_titles):
+            self.by_id.setdefault(cocktail.id, cocktail)
+            self.by_title.setdefault(lower_title, []).append(cocktail)
+
+        self.sorted_by_title = sorted(cocktails, key=lambda c: c.title or "")
+        self.sorted_lower_titles = [(cocktail.title or "").lower() for cocktail in self.sorted_by_title]
+        self.sorted_lower_descriptive_titles = [
+            (cocktail.descriptive_title or "").lower() for cocktail in self.sorted_by_title
+        ]
+        self._title_rank = {cocktail.id: position for position, cocktail in enumerate(self.sorted_by_title)}
+
+        self.typeahead = TypeaheadPrefixIndex(self.sorted_lower_titles, self.sorted_lower_descriptive_titles)
+
+        self.by_ingredient: dict[str, list[int]] = {}
+        for position, cocktail in enumerate(self.sorted_by_title):
+            for ingredient in cocktail.ingredients or []:
+                if ingredient.name:
+                    self.by_ingredient.setdefault(ingredient.name.lower(), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.cocktails)
+
+    def get(self, cocktail_id: str) -> CocktailSearchModel | None:
+        """Return the cocktail with ``cocktail_id``, or None if it is not in the catalog."""
+        return self.by_id.get(cocktail_id)
+
+    def with_title(self, lower_title: str) -> list[CocktailSearchModel]:
+        """Return the cocktails whose lower-cased title equals ``lower_title``."""
+        return self.by_title.get(lower_title, [])
+
+    def titles_containing(self, text: str) -> list[CocktailSearchModel]:
+        """Return the cocktails whose lower-cased title contains ``text``, in title order."""
+        return [
+            cocktail
+            for cocktail, lower_title in zip(self.sorted_by_title, self.sorted_lower_titles)
+            if text in lower_title
+        ]
+
+    def text_matches(self, text: str) -> list[CocktailSearchModel]:
+        """Return the cocktails whose title, descriptive title or an ingredient name contains ``text``, in title order."""
+        # Ingredient names repeat across the catalog, so scan the distinct names once
+        positions: set[int] = set()
+        for ingredient_name, ingredient_positions in self.by_ingredient.items():
+            if text in ingredient_name:
+                positions.update(ingredient_positions)
+
+        return [
+            cocktail
+            for position, (cocktail, lower_title, lower_descriptive_title) in enumerate(
+                zip(self.sorted_by_title, self.sorted_lower_titles, self.sorted_lower_descriptive_titles)
+            )
+            if text in lower_title or text in lower_descriptive_title or position in positions
+        ]
+
+    def in_title_order(self, cocktail_ids: Iterable[str]) -> list[CocktailSearchModel]:
+        """Return the catalog cocktails among ``cocktail_ids``, each once, in title order."""
+        positions = sorted(
+            {self._title_rank[cocktail_id] for cocktail_id in cocktail_ids if cocktail_id in self._title_rank}
+        )
+        return [self.sorted_by_title[position] for position in positions]
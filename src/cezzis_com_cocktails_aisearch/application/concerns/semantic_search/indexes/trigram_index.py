@@ -0,0 +1,67 @@
+import numpy as np
+from rapidfuzz import fuzz
+
+
+def _word_trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded at the word start so that prefixes share the leading trigrams."""
+    trigrams: set[str] = set()
+    for word in text.split():
+        padded = f"  {word}"
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class TrigramIndex:
+    """Character-trigram index for typo-tolerant prefix suggestions.
+
+    Every normalised text is broken into word-start-padded trigrams with a posting
+    array of positions per trigram. A lookup counts trigram overlaps for the query's
+    postings in one ``np.bincount`` call, keeps the best-overlapping few candidates and
+    only scores those with rapidfuzz, comparing the query against the same-length
+    prefix of each word-start suffix of the text. No per-text Python loop runs over
+    the whole catalog.
+    """
+
+    _MAX_CANDIDATES: int = 32
+    _MIN_TRIGRAM_OVERLAP: float = 0.3
+
+    def __init__(self, texts: list[str]):
+        self._texts = texts
+        self._suffixes = [self._word_suffixes(text) for text in texts]
+
+        postings: dict[str, list[int]] = {}
+        for position, text in enumerate(texts):
+            for trigram in _word_trigrams(text):
+                postings.setdefault(trigram, []).append(position)
+        self._postings = {trigram: np.asarray(positions, dtype=np.int32) for trigram, positions in postings.items()}
+
+    @staticmethod
+    def _word_suffixes(text: str) -> list[str]:
+        tokens = text.split()
+        return [" ".join(tokens[i:]) for i in range(len(tokens))]
+
+    def search(self, query: str, limit: int, min_score: float, exclude: set[int] | None = None) -> list[int]:
+        """Return up to ``limit`` positions whose text fuzzy-matches ``query`` as a prefix, best first."""
+        query_trigrams = _word_trigrams(query)
+        arrays = [self._postings[trigram] for trigram in query_trigrams if trigram in self._postings]
+        if limit <= 0 or not arrays:
+            return []
+
+        overlaps = np.bincount(np.concatenate(arrays), minlength=len(self._texts))
+        if exclude:
+            # Drop excluded positions before the candidate cut, so they cannot crowd out the ones still wanted
+            overlaps[np.fromiter(exclude, dtype=np.int64, count=len(exclude))] = 0
+        min_overlap = max(1, int(len(query_trigrams) * self._MIN_TRIGRAM_OVERLAP))
+        candidates = np.flatnonzero(overlaps >= min_overlap)
+        if len(candidates) > self._MAX_CANDIDATES:
+            best = np.argpartition(overlaps[candidates], -self._MAX_CANDIDATES)[-self._MAX_CANDIDATES :]
+            candidates = candidates[best]
+
+        scored: list[tuple[float, int]] = []
+        for position in candidates.tolist():
+            score = max(fuzz.ratio(query, suffix[: len(query)]) for suffix in self._suffixes[position])
+            if score >= min_score:
+                scored.append((-score, position))
+
+        scored.sort()
+        return [position for _, position in scored[:limit]]
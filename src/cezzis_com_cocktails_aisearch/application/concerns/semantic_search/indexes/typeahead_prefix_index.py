@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from heapq import heappop, heappush
+from typing import Iterator
+
+import numpy as np
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.trigram_index import TrigramIndex
+
+
+def normalize_typeahead_text(text: str) -> str:
+    """Lower-case ``text`` and collapse runs of whitespace."""
+    return " ".join(text.lower().split())
+
+
+class _AscendingRange:
+    """Sparse table over an int array that yields the values of any slice in ascending order.
+
+    Each level stores, for every start index, the index of the minimum value over a
+    window of 2**level entries, so the minimum of any slice is two table lookups.
+    ``ascending`` repeatedly takes the minimum and splits the slice around it, which
+    costs O(log m) per yielded value, independent of the slice length.
+    """
+
+    def __init__(self, values: np.ndarray):
+        self._values = values
+        self._levels = [np.arange(len(values), dtype=np.int32)]
+        width = 1
+        while width * 2 <= len(values):
+            previous = self._levels[-1]
+            left, right = previous[:-width], previous[width:]
+            self._levels.append(np.where(values[left] <= values[right], left, right))
+            width *= 2
+
+    def _argmin(self, lo: int, hi: int) -> int:
+        level = (hi - lo).bit_length() - 1
+        table = self._levels[level]
+        a, b = int(table[lo]), int(table[hi - (1 << level)])
+        return a if self._values[a] <= self._values[b] else b
+
+    def ascending(self, lo: int, hi: int) -> Iterator[int]:
+        heap: list[tuple[int, int, int, int]] = []
+        if lo < hi:
+            i = self._argmin(lo, hi)
+            heap.append((int(self._values[i]), i, lo, hi))
+
+        while heap:
+            value, i, lo, hi = heappop(heap)
+            yield value
+            if lo < i:
+                j = self._argmin(lo, i)
+                heappush(heap, (int(self._values[j]), j, lo, i))
+            if i + 1 < hi:
+                j = self._argmin(i + 1, hi)
+                heappush(heap, (int(self._values[j]), j, i + 1, hi))
+
+
+class _PrefixArray:
+    """Sorted (key, position) pairs searched by prefix with bisect."""
+
+    def __init__(self, entries: list[tuple[str, int]]):
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._positions = _AscendingRange(np.fromiter((position for _, position in entries), dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def positions(self, prefix: str) -> Iterator[int]:
+        """Yield the positions of every key starting with ``prefix``, smallest first (repeats possible)."""
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + "\uffff", lo)
+        return self._positions.ascending(lo, hi)
+
+
+class TypeaheadPrefixIndex:
+    """Prefix index answering typeahead lookups without scanning or sorting the catalog.
+
+    Positions refer to the catalog in title order. Two sorted arrays are kept:
+
+    - full normalised titles and descriptive titles, for "starts with" matches
+    - every later word-start suffix of those titles (``"bitter mai tai"`` ->
+      ``"mai tai"``, ``"tai"``), for matches on a word inside the title
+
+    A lookup bisects each array for the prefix range and pulls positions out of it
+    in ascending (title) order, stopping as soon as the requested page is filled.
+    If the page is still short, typo-tolerant suggestions from a trigram index over
+    the titles fill the rest ("margr" -> "Margarita", "negorni" -> "Negroni").
+    """
+
+    # Fuzzy suggestions need a few characters to be meaningful
+    _MIN_FUZZY_LENGTH: int = 3
+    _FUZZY_MIN_SCORE: float = 75.0
+
+    def __init__(self, lower_titles: list[str], lower_descriptive_titles: list[str]):
+        starts: list[tuple[str, int]] = []
+        words: list[tuple[str, int]] = []
+        for position, texts in enumerate(zip(lower_titles, lower_descriptive_titles)):
+            for text in texts:
+                tokens = text.split()
+                if not tokens:
+                    continue
+                starts.append((" ".join(tokens), position))
+                words.extend((" ".join(tokens[i:]), position) for i in range(1, len(tokens)))
+
+        self._starts = _PrefixArray(starts)
+        self._words = _PrefixArray(words)
+        self._fuzzy = TrigramIndex([normalize_typeahead_text(title) for title in lower_titles])
+
+    def search(self, text: str, skip: int, take: int) -> list[int]:
+        """Return a page of positions: title/descriptive-title prefix matches, then word matches, then fuzzy matches.
+
+        Each later stage is only consulted while there are fewer than ``take`` matches.
+        Prefix and word matches are in title order; fuzzy matches are best first.
+        """
+        prefix = normalize_typeahead_text(text)
+        needed = skip + take
+
+        matches = self._distinct(self._starts.positions(prefix), needed, set())
+        if len(matches) < take:
+            matches += self._distinct(self._words.positions(prefix), needed - len(matches), set(matches))
+        if len(matches) < take and len(prefix) >= self._MIN_FUZZY_LENGTH:
+            matches += self._fuzzy.search(prefix, needed - len(matches), self._FUZZY_MIN_SCORE, set(matches))
+
+        return matches[skip:needed]
+
+    @staticmethod
+    def _distinct(positions: Iterator[int], limit: int, seen: set[int]) -> list[int]:
+        found: list[int] = []
+        for position in positions:
+            if len(found) >= limit:
+                break
+            if position not in seen:
+                seen.add(position)
+                found.append(position)
+        return found
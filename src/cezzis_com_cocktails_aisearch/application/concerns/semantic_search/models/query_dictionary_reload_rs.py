@@ -0,0 +1,26 @@
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class QueryDictionaryReloadRs(BaseModel):
+    """Model representing the query dictionary version in use after a reload request."""
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+        json_schema_extra={
+            "example": {
+                "version": 3,
+                "fingerprint": "4f1c2b9a7d3e",
+                "reloaded": True,
+                "keywordWordCount": 152,
+                "synonymTriggerCount": 109,
+            }
+        },
+    )
+
+    version: int = Field(..., description="Version of the query dictionaries now in use")
+    fingerprint: str = Field(..., description="Content hash of the dictionary files behind this version")
+    reloaded: bool = Field(..., description="Whether a new version was swapped in (false if the files were unchanged)")
+    keyword_word_count: int = Field(..., description="Number of distinct words across the intent keyword tables")
+    synonym_trigger_count: int = Field(..., description="Number of synonym expansion triggers")
@@ -1,16 +1,33 @@
-import json
 import logging
 import re
-from importlib import resources
 from typing import Optional
 
+import numpy as np
 from injector import inject
 from mediatr import GenericQuery, Mediator
 from qdrant_client.http.models import Condition, FieldCondition, Filter, MatchAny, MatchValue, Range
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_search_statistics import (
+    CocktailSearchStatistics,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.intent_matcher import IntentMatch
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQuery,
+    ParsedQueryCache,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    QueryDictionaryBundle,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
 from cezzis_com_cocktails_aisearch.domain.config.qdrant_options import QdrantOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import RankedResult, SearchResultCache
 from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
     ICocktailVectorSearchRepository,
 )
@@ -64,178 +81,11 @@ class FreeTextQueryHandler:
     # Minimum query length for semantic search (embeddings struggle with very short text)
     _MIN_SEMANTIC_LENGTH: int = 4
 
-    # Patterns that indicate ingredient exclusion
-    _EXCLUSION_PATTERNS: list[str] = [
-        "without ",
-        "not containing ",
-        "not featuring ",
-        "that exclude ",
-        "no ",
-        "excluding ",
-        "exclude ",
-    ]
-
     # Fuzzy matching threshold (0-100) for cocktail name matching
     _FUZZY_MATCH_THRESHOLD: int = 82
 
-    # Glassware keyword to Qdrant payload value mapping
-    _GLASSWARE_MAPPING: dict[str, str] = {
-        "coupe": "coupe",
-        "rocks glass": "rocks",
-        "rocks": "rocks",
-        "lowball": "lowball",
-        "highball": "highball",
-        "collins": "collins",
-        "martini glass": "cocktailGlass",
-        "cocktail glass": "cocktailGlass",
-        "copper mug": "copperMug",
-        "moscow mule mug": "copperMug",
-        "wine glass": "wineGlass",
-        "flute": "flute",
-        "champagne flute": "flute",
-        "tiki mug": "tikiMug",
-        "hurricane": "hurricane",
-        "snifter": "snifter",
-        "shot glass": "shotGlass",
-        "pint glass": "pintGlass",
-    }
-
-    # Base spirit keywords to Qdrant metadata values
-    _BASE_SPIRIT_MAPPING: dict[str, str] = {
-        "gin": "gin",
-        "rum": "rum",
-        "vodka": "vodka",
-        "tequila": "tequila",
-        "mezcal": "mezcal",
-        "whiskey": "whiskey",
-        "whisky": "whiskey",
-        "bourbon": "bourbon",
-        "rye": "rye",
-        "scotch": "scotch",
-        "brandy": "brandy",
-        "cognac": "cognac",
-        "pisco": "pisco",
-        "absinthe": "absinthe",
-        "cachaça": "cachaça",
-        "cachaca": "cachaça",
-    }
-
-    # Flavor profile keywords
-    _FLAVOR_PROFILE_KEYWORDS: list[str] = [
-        "bitter",
-        "sweet",
-        "sour",
-        "citrus",
-        "fruity",
-        "herbal",
-        "spicy",
-        "smoky",
-        "floral",
-        "savory",
-        "tropical",
-        "dry",
-        "creamy",
-        "nutty",
-        "tart",
-        "minty",
-        "boozy",
-    ]
-
-    # Cocktail family keywords
-    _COCKTAIL_FAMILY_KEYWORDS: list[str] = [
-        "sour",
-        "fizz",
-        "tiki",
-        "negroni",
-        "martini",
-        "highball",
-        "julep",
-        "smash",
-        "flip",
-        "punch",
-        "spritz",
-        "cobbler",
-        "daisy",
-        "mule",
-        "toddy",
-        "collins",
-        "swizzle",
-    ]
-
-    # Technique keywords
-    _TECHNIQUE_MAPPING: dict[str, str] = {
-        "shaken": "shaken",
-        "shake": "shaken",
-        "stirred": "stirred",
-        "stir": "stirred",
-        "built": "built",
-        "build": "built",
-        "muddled": "muddled",
-        "muddle": "muddled",
-        "blended": "blended",
-        "blend": "blended",
-        "layered": "layered",
-        "layer": "layered",
-    }
-
-    # Strength keywords
-    _STRENGTH_KEYWORDS: dict[str, str] = {
-        "light": "light",
-        "mild": "light",
-        "low abv": "light",
-        "low-abv": "light",
-        "sessionable": "light",
-        "medium": "medium",
-        "strong": "strong",
-        "boozy": "strong",
-        "stiff": "strong",
-    }
-
-    # Temperature keywords
-    _TEMPERATURE_KEYWORDS: dict[str, str] = {
-        "cold": "cold",
-        "chilled": "cold",
-        "frozen": "frozen",
-        "blended": "frozen",
-        "warm": "warm",
-        "hot": "warm",
-    }
-
-    # Season keywords
-    _SEASON_KEYWORDS: list[str] = [
-        "summer",
-        "winter",
-        "spring",
-        "fall",
-        "autumn",
-        "all-season",
-    ]
-
-    # Occasion keywords
-    _OCCASION_KEYWORDS: list[str] = [
-        "aperitif",
-        "digestif",
-        "party",
-        "brunch",
-        "dinner",
-        "date night",
-        "celebration",
-        "nightcap",
-        "after dinner",
-    ]
-
-    # Mood keywords
-    _MOOD_KEYWORDS: list[str] = [
-        "refreshing",
-        "sophisticated",
-        "fun",
-        "relaxing",
-        "cozy",
-        "elegant",
-        "festive",
-        "adventurous",
-        "romantic",
-    ]
+    # Threads used by rapidfuzz to score the catalog titles (-1 = all cores)
+    _FUZZY_MATCH_WORKERS: int = -1
 
     # Words that are generic descriptors and should be stripped from vector search queries.
     # These add no semantic value for embeddings and cause false matches with cocktails
@@ -245,19 +95,22 @@ class FreeTextQueryHandler:
     # Maximum number of synonym terms to append to a query
     _MAX_EXPANSION_TERMS: int = 8
 
-    # Loaded once from static/query_synonym_expansions.json
-    _synonym_expansions: dict[str, dict[str, list[str]]] | None = None
-
     @inject
     def __init__(
         self,
         cocktail_vector_repository: ICocktailVectorSearchRepository,
         qdrant_opotions: QdrantOptions,
         reranker_service: IRerankerService,
+        search_result_cache: SearchResultCache,
+        query_dictionary_store: QueryDictionaryStore,
+        parsed_query_cache: ParsedQueryCache,
     ):
         self.cocktail_vector_repository = cocktail_vector_repository
         self.qdrant_options = qdrant_opotions
         self.reranker_service = reranker_service
+        self.search_result_cache = search_result_cache
+        self.query_dictionary_store = query_dictionary_store
+        self.parsed_query_cache = parsed_query_cache
         self.logger = logging.getLogger("free_text_query_handler")
 
     async def handle(self, command: FreeTextQuery) -> list[CocktailSearchModel]:
@@ -265,36 +118,60 @@ class FreeTextQueryHandler:
             return await self._handle_browse(command)
 
         search_text = command.free_text.strip().lower()
+        catalog = await self.cocktail_vector_repository.get_catalog_index()
+
+        # Take one dictionary version for the whole query, even if a reload swaps in a new one meanwhile
+        dictionaries = self.query_dictionary_store.current
+
+        # Repeated searches are served from the ranked result cache, skipping
+        # embedding, SPLADE, the Qdrant query and reranking entirely
+        cache_key = SearchResultCache.make_key(
+            command.free_text,
+            command.filters,
+            command.matches,
+            command.match_exclusive,
+            command.skip,
+            command.take,
+            dictionaries.fingerprint,
+        )
+        cached_results = await self.search_result_cache.get(cache_key)
+        if cached_results is not None:
+            hydrated = self._hydrate_cached_results(cached_results, catalog)
+            if hydrated is not None:
+                return hydrated
+
+        generation = self.search_result_cache.generation
+        results = await self._handle_search(command, search_text, catalog, dictionaries)
+        await self.search_result_cache.set(
+            cache_key, [(cocktail.id, cocktail.search_statistics.model_dump()) for cocktail in results], generation
+        )
+        return results
 
+    async def _handle_search(
+        self,
+        command: FreeTextQuery,
+        search_text: str,
+        catalog: CocktailCatalogIndex,
+        dictionaries: QueryDictionaryBundle,
+    ) -> list[CocktailSearchModel]:
+        """Run the full free text search pipeline for a non-empty query."""
         # Fast path: exact cocktail name match (uses cached data)
-        all_cocktails = await self.cocktail_vector_repository.get_all_cocktails()
-        exact_match = self._find_exact_name_match(search_text, all_cocktails)
+        exact_match = self._find_exact_name_match(search_text, catalog)
         if exact_match:
             take = command.take or 10
             return exact_match[:take]
 
         # Short queries: text-based fallback on cached data (embeddings struggle with < 4 chars)
         if len(search_text) < self._MIN_SEMANTIC_LENGTH:
-            return self._handle_short_query(search_text, all_cocktails, command)
-
-        # Build Qdrant payload filter from structured query elements
-        query_filter = self._build_query_filter(search_text, command.ingredient_groups)
-
-        # Strip generic descriptor words ("cocktail", "cocktails", etc.) from the
-        # vector search query. These add no semantic value for embeddings and cause
-        # false similarity with cocktails that have these words in their name
-        # (e.g., "Millionaire Cocktail", "Champagne Cocktail").
-        vector_search_text = self._strip_generic_descriptors(command.free_text)
+            return self._handle_short_query(search_text, catalog, command)
 
-        # Expand query with domain-specific synonyms to broaden embedding recall.
-        # The expanded text is only used for the vector search (dense + SPLADE);
-        # the reranker always sees the original cleaned text for precise ranking.
-        expanded_search_text = self._expand_query_synonyms(vector_search_text)
+        # Filter, vector text and rating intent depend only on the query, so head queries reuse them
+        parsed_query = self._parse_query(command, search_text, dictionaries)
 
         # Semantic search with Qdrant-native filtering
         cocktails = await self.cocktail_vector_repository.search_vectors(
-            free_text=expanded_search_text,
-            query_filter=query_filter,
+            free_text=parsed_query.expanded_search_text,
+            query_filter=parsed_query.query_filter,
         )
 
         # Sort by weighted_score (combines avg score with hit count boost)
@@ -309,23 +186,74 @@ class FreeTextQueryHandler:
 
         # Cross-encoder reranking: refine relevance ordering using TEI /rerank
         sorted_cocktails = await self.reranker_service.rerank(
-            query=vector_search_text,
+            query=parsed_query.vector_search_text,
             cocktails=sorted_cocktails,
             top_k=skip + take,
         )
 
         # Apply rating-based sort override for rating queries
-        if any(
-            self._fuzzy_keyword_in_text(search_text, term)
-            for term in ["top rated", "best rated", "highest rated", "popular"]
-        ):
+        if parsed_query.rating_sort:
             sorted_cocktails = sorted(sorted_cocktails, key=lambda c: c.rating, reverse=True)
 
         return sorted_cocktails[skip : skip + take]
 
+    def _parse_query(
+        self, command: FreeTextQuery, search_text: str, dictionaries: QueryDictionaryBundle
+    ) -> ParsedQuery:
+        """Parse the query text into its filter, vector search text and rating intent, memoised per query."""
+        cache_key = ParsedQueryCache.make_key(command.free_text or "", command.ingredient_groups, dictionaries.version)
+        parsed_query = self.parsed_query_cache.get(cache_key)
+        if parsed_query is not None:
+            return parsed_query
+
+        # Tokenise and resolve the query against every keyword table once
+        intent = dictionaries.intent_matcher.match(search_text)
+
+        # Build Qdrant payload filter from structured query elements
+        exclusion_terms = self._extract_exclusion_terms(search_text, dictionaries)
+        query_filter = self._build_query_filter(
+            search_text, command.ingredient_groups, dictionaries, intent, exclusion_terms
+        )
+
+        # Strip generic descriptor words ("cocktail", "cocktails", etc.) from the
+        # vector search query. These add no semantic value for embeddings and cause
+        # false similarity with cocktails that have these words in their name
+        # (e.g., "Millionaire Cocktail", "Champagne Cocktail").
+        vector_search_text = self._strip_generic_descriptors((command.free_text or "").strip())
+
+        # Expand query with domain-specific synonyms to broaden embedding recall.
+        # The expanded text is only used for the vector search (dense + SPLADE);
+        # the reranker always sees the original cleaned text for precise ranking.
+        expanded_search_text = self._expand_query_synonyms(vector_search_text, dictionaries)
+
+        parsed_query = ParsedQuery(
+            query_filter=query_filter,
+            vector_search_text=vector_search_text,
+            expanded_search_text=expanded_search_text,
+            exclusion_terms=exclusion_terms,
+            rating_sort=intent.contains_any(dictionaries.rating_sort_terms),
+        )
+        self.parsed_query_cache.set(cache_key, parsed_query)
+        return parsed_query
+
+    @staticmethod
+    def _hydrate_cached_results(
+        cached_results: list[RankedResult], catalog: CocktailCatalogIndex
+    ) -> list[CocktailSearchModel] | None:
+        """Rebuild cached ranked results from the catalog; None if a cocktail is no longer present."""
+        hydrated: list[CocktailSearchModel] = []
+        for cocktail_id, statistics in cached_results:
+            cocktail = catalog.get(cocktail_id)
+            if cocktail is None:
+                return None
+            hydrated.append(
+                cocktail.model_copy(update={"search_statistics": CocktailSearchStatistics.model_validate(statistics)})
+            )
+        return hydrated
+
     async def _handle_browse(self, command: FreeTextQuery) -> list[CocktailSearchModel]:
         """Handle browsing when no free text is provided."""
-        cocktails = await self.cocktail_vector_repository.get_all_cocktails()
+        catalog = await self.cocktail_vector_repository.get_catalog_index()
         use_matches = command.matches
 
         if command.match_exclusive and use_matches is None:
@@ -333,15 +261,14 @@ class FreeTextQueryHandler:
         elif not command.match_exclusive and command.matches is not None and len(command.matches) == 0:
             use_matches = None
 
-        sorted_cocktails = sorted(cocktails, key=lambda p: p.title or "", reverse=False)
-        filtered_cocktails = [c for c in sorted_cocktails if use_matches is None or (c.id in use_matches)]
+        filtered_cocktails = catalog.sorted_by_title if use_matches is None else catalog.in_title_order(use_matches)
 
         skip = command.skip or 0
         take = command.take or 10
         return filtered_cocktails[skip : skip + take]
 
     def _find_exact_name_match(
-        self, search_text: str, all_cocktails: list[CocktailSearchModel]
+        self, search_text: str, catalog: CocktailCatalogIndex
     ) -> list[CocktailSearchModel] | None:
         """
         Check if the search text matches cocktail names.
@@ -377,73 +304,69 @@ class FreeTextQueryHandler:
             return None
 
         # Find exact matches (highest priority)
-        exact_matches = [c for c in all_cocktails if c.title.lower() == search_normalized]
+        exact_matches = catalog.with_title(search_normalized)
 
-        # Find partial matches (title contains the search term)
-        partial_matches = [c for c in all_cocktails if search_normalized in c.title.lower() and c not in exact_matches]
+        # Find partial matches (title contains the search term), already in alphabetical order
+        partial_matches = [
+            c for c in catalog.titles_containing(search_normalized) if c.title.lower() != search_normalized
+        ]
 
         # Combine: exact matches first, then partial matches sorted alphabetically
         if exact_matches or partial_matches:
-            partial_matches_sorted = sorted(partial_matches, key=lambda c: c.title)
-            return exact_matches + partial_matches_sorted
+            return exact_matches + partial_matches
 
         # Fuzzy matching fallback for typo tolerance (e.g., "Margerita" → "Margarita")
-        fuzzy_matches = self._find_fuzzy_name_match(search_normalized, all_cocktails)
+        fuzzy_matches = self._find_fuzzy_name_match(search_normalized, catalog)
         if fuzzy_matches:
             return fuzzy_matches
 
         return None
 
     def _find_fuzzy_name_match(
-        self, search_text: str, all_cocktails: list[CocktailSearchModel]
+        self, search_text: str, catalog: CocktailCatalogIndex
     ) -> list[CocktailSearchModel] | None:
         """
         Find cocktails whose names fuzzy-match the search text using rapidfuzz.
         Handles common misspellings like "Margerita", "Mohito", "Daiquri".
         Returns matches sorted by fuzzy score descending, or None if no good matches.
         """
-        scored_matches: list[tuple[CocktailSearchModel, float]] = []
-
-        for cocktail in all_cocktails:
-            title_lower = cocktail.title.lower()
-            # Use ratio for overall similarity and partial_ratio for substring similarity
-            ratio_score = fuzz.ratio(search_text, title_lower)
-            partial_score = fuzz.partial_ratio(search_text, title_lower)
-            best_score = max(ratio_score, partial_score)
-
-            if best_score >= self._FUZZY_MATCH_THRESHOLD:
-                scored_matches.append((cocktail, best_score))
-
-        if not scored_matches:
+        # Score every title in one native call per scorer: ratio for overall similarity and
+        # partial_ratio for substring similarity. Scores below the cutoff come back as 0.
+        titles = catalog.sorted_lower_titles
+        ratio_scores = process.cdist(
+            [search_text],
+            titles,
+            scorer=fuzz.ratio,
+            score_cutoff=self._FUZZY_MATCH_THRESHOLD,
+            workers=self._FUZZY_MATCH_WORKERS,
+        )[0]
+        partial_scores = process.cdist(
+            [search_text],
+            titles,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=self._FUZZY_MATCH_THRESHOLD,
+            workers=self._FUZZY_MATCH_WORKERS,
+        )[0]
+        best_scores = np.maximum(ratio_scores, partial_scores)
+
+        positions = np.flatnonzero(best_scores >= self._FUZZY_MATCH_THRESHOLD)
+        if positions.size == 0:
             return None
 
-        # Sort by score descending, then alphabetically for ties
-        scored_matches.sort(key=lambda x: (-x[1], x[0].title))
-        return [match[0] for match in scored_matches]
+        # Sort by score descending; the stable sort keeps title order (alphabetical) for ties
+        ordered = positions[np.argsort(-best_scores[positions], kind="stable")]
+        return [catalog.sorted_by_title[position] for position in ordered.tolist()]
 
     def _handle_short_query(
-        self, search_text: str, all_cocktails: list[CocktailSearchModel], command: FreeTextQuery
+        self, search_text: str, catalog: CocktailCatalogIndex, command: FreeTextQuery
     ) -> list[CocktailSearchModel]:
-        """Handle queries too short for meaningful semantic search."""
-        filtered = [c for c in all_cocktails if self._matches_text_search(c, search_text)]
-        sorted_cocktails = sorted(filtered, key=lambda p: p.title or "")
+        """Handle queries too short for meaningful semantic search (title, descriptive title, ingredients)."""
+        sorted_cocktails = catalog.text_matches(search_text)
 
         skip = command.skip or 0
         take = command.take or 10
         return sorted_cocktails[skip : skip + take]
 
-    def _matches_text_search(self, cocktail: CocktailSearchModel, search_text: str) -> bool:
-        """Check if cocktail matches a text-based search (title, descriptive title, ingredients)."""
-        if cocktail.title and search_text in cocktail.title.lower():
-            return True
-        if cocktail.descriptive_title and search_text in cocktail.descriptive_title.lower():
-            return True
-        if cocktail.ingredients:
-            for ingredient in cocktail.ingredients:
-                if ingredient.name and search_text in ingredient.name.lower():
-                    return True
-        return False
-
     @staticmethod
     def _strip_generic_descriptors(text: str) -> str:
         """Remove generic descriptor words ('cocktail', 'cocktails', 'drink', etc.) from search text.
@@ -457,50 +380,25 @@ class FreeTextQueryHandler:
         result = " ".join(cleaned).strip()
         return result if result else text
 
-    @classmethod
-    def _load_synonym_expansions(cls) -> dict[str, dict[str, list[str]]]:
-        """Load synonym expansions from static/query_synonym_expansions.json.
-
-        Loaded once and cached as a class-level attribute.
-        """
-        if cls._synonym_expansions is not None:
-            return cls._synonym_expansions
-
-        try:
-            ref = resources.files("cezzis_com_cocktails_aisearch.static").joinpath("query_synonym_expansions.json")
-            data = json.loads(ref.read_text(encoding="utf-8"))
-            # Strip metadata keys
-            cls._synonym_expansions = {k: v for k, v in data.items() if isinstance(v, dict) and not k.startswith("_")}
-        except Exception:
-            logging.getLogger("free_text_query_handler").warning(
-                "Failed to load query_synonym_expansions.json, query expansion disabled",
-                exc_info=True,
-            )
-            cls._synonym_expansions = {}
-
-        return cls._synonym_expansions
-
-    @classmethod
-    def _expand_query_synonyms(cls, text: str) -> str:
+    def _expand_query_synonyms(self, text: str, dictionaries: QueryDictionaryBundle | None = None) -> str:
         """Expand the search query with domain-specific synonyms to broaden recall.
 
         Appends relevant synonym terms to the query text so the embedding model
         generates a vector in a richer neighborhood. Only appends terms — never
         removes or replaces the original query words.
         """
-        expansions_data = cls._load_synonym_expansions()
-        if not expansions_data:
+        synonym_index = (dictionaries or self.query_dictionary_store.current).synonym_index
+        if not synonym_index:
             return text
 
         text_lower = text.strip().lower()
         query_words = set(text_lower.split())
         all_expansions: list[str] = []
 
-        for _category, mappings in expansions_data.items():
-            for trigger, synonyms in mappings.items():
-                if trigger in text_lower:
-                    new_terms = [s for s in synonyms if s not in text_lower]
-                    all_expansions.extend(new_terms)
+        # One pass over the query finds every trigger it contains, in file order
+        for _trigger, synonyms in synonym_index.matches(text_lower):
+            new_terms = [s for s in synonyms if s not in text_lower]
+            all_expansions.extend(new_terms)
 
         if not all_expansions:
             return text
@@ -515,15 +413,16 @@ class FreeTextQueryHandler:
                 seen.add(term_lower)
 
         # Cap to avoid diluting the embedding vector
-        unique_expansions = unique_expansions[: cls._MAX_EXPANSION_TERMS]
+        unique_expansions = unique_expansions[: self._MAX_EXPANSION_TERMS]
 
         if not unique_expansions:
             return text
 
         return f"{text} {' '.join(unique_expansions)}"
 
-    @classmethod
-    def _extract_search_term_words(cls, search_text: str) -> list[str]:
+    def _extract_search_term_words(
+        self, search_text: str, dictionaries: QueryDictionaryBundle | None = None
+    ) -> list[str]:
         """Extract query words that match synonym expansion triggers.
 
         Returns words suitable for matching against the keywords_search_words
@@ -531,20 +430,18 @@ class FreeTextQueryHandler:
         triggers in the synonym expansion map — this avoids false positives
         on generic words like 'delicious' or 'amazing'.
         """
-        expansions_data = cls._load_synonym_expansions()
-        if not expansions_data:
+        synonym_index = (dictionaries or self.query_dictionary_store.current).synonym_index
+        if not synonym_index:
             return []
 
         text_lower = search_text.strip().lower()
         matched_words: list[str] = []
 
-        for _category, mappings in expansions_data.items():
-            for trigger in mappings:
-                if trigger in text_lower:
-                    # Add individual words from the trigger phrase
-                    for word in trigger.split():
-                        if len(word) >= 3 and word not in matched_words:
-                            matched_words.append(word)
+        for trigger, _synonyms in synonym_index.matches(text_lower):
+            # Add individual words from the trigger phrase
+            for word in trigger.split():
+                if len(word) >= 3 and word not in matched_words:
+                    matched_words.append(word)
 
         return matched_words
 
@@ -589,13 +486,28 @@ class FreeTextQueryHandler:
             return False
         return all(self._fuzzy_word_match(text_words[j], prefix_words[j], threshold) for j in range(len(prefix_words)))
 
-    def _build_query_filter(self, search_text: str, ingredient_filters: dict[str, list[str]]) -> Filter | None:
+    def _build_query_filter(
+        self,
+        search_text: str,
+        ingredient_filters: dict[str, list[str]],
+        dictionaries: QueryDictionaryBundle | None = None,
+        intent: IntentMatch | None = None,
+        excluded_terms: list[str] | None = None,
+    ) -> Filter | None:
         """
         Build Qdrant payload filter from structured query elements.
 
         Pushes filtering to the vector DB level for better performance and accuracy.
         Handles: IBA status, glassware, ingredient count, prep time, serves, and ingredient exclusion.
+        Keywords come from ``dictionaries`` (the current bundle by default) and are detected
+        against ``intent``, the query already resolved by that bundle's intent matcher.
+        ``excluded_terms`` takes the already extracted exclusion terms, if any.
         """
+        if dictionaries is None:
+            dictionaries = self.query_dictionary_store.current
+        if intent is None:
+            intent = dictionaries.intent_matcher.match(search_text)
+
         must_conditions: list[Condition] = []
         must_not_conditions: list[Condition] = []
         should_conditions: list[Condition] = []
@@ -604,24 +516,20 @@ class FreeTextQueryHandler:
             must_conditions.append(self._build_ingredient_group_filter(ingredient_filters))
 
         # IBA filter (check non-IBA first since "non-iba" contains "iba")
-        if any(
-            self._fuzzy_keyword_in_text(search_text, term)
-            for term in ["non-iba", "non iba", "modern cocktail", "contemporary"]
-        ):
+        if intent.contains_any(dictionaries.non_iba_terms):
             must_conditions.append(FieldCondition(key="metadata.is_iba", match=MatchValue(value=False)))
-        elif any(
-            self._fuzzy_keyword_in_text(search_text, term)
-            for term in ["iba", "iba cocktail", "official cocktail", "classic iba"]
-        ):
+        elif intent.contains_any(dictionaries.iba_terms):
             must_conditions.append(FieldCondition(key="metadata.is_iba", match=MatchValue(value=True)))
 
         # Glassware filter
-        for term, glassware_value in self._GLASSWARE_MAPPING.items():
-            if self._fuzzy_keyword_in_text(search_text, term):
-                must_conditions.append(
-                    FieldCondition(key="metadata.glassware_values", match=MatchValue(value=glassware_value))
+        glassware_term = intent.first_match(dictionaries.glassware_mapping)
+        if glassware_term is not None:
+            must_conditions.append(
+                FieldCondition(
+                    key="metadata.glassware_values",
+                    match=MatchValue(value=dictionaries.glassware_mapping[glassware_term]),
                 )
-                break
+            )
 
         # Ingredient count filters
         ingredient_count_match = re.search(r"(\d+)\s*ingredient", search_text)
@@ -630,19 +538,15 @@ class FreeTextQueryHandler:
             must_conditions.append(
                 FieldCondition(key="metadata.ingredient_count", range=Range(gte=target_count, lte=target_count))
             )
-        elif any(
-            self._fuzzy_keyword_in_text(search_text, term) for term in ["simple", "easy", "few ingredients", "basic"]
-        ):
+        elif intent.contains_any(dictionaries.simple_terms):
             must_conditions.append(FieldCondition(key="metadata.ingredient_count", range=Range(lte=4)))
-        elif any(
-            self._fuzzy_keyword_in_text(search_text, term) for term in ["complex", "many ingredients", "elaborate"]
-        ):
+        elif intent.contains_any(dictionaries.complex_terms):
             must_conditions.append(FieldCondition(key="metadata.ingredient_count", range=Range(gte=6)))
 
         # Prep time filters
-        if any(self._fuzzy_keyword_in_text(search_text, term) for term in ["quick", "fast", "5 minute", "5-minute"]):
+        if intent.contains_any(dictionaries.quick_prep_terms):
             must_conditions.append(FieldCondition(key="metadata.prep_time_minutes", range=Range(lte=5)))
-        elif any(self._fuzzy_keyword_in_text(search_text, term) for term in ["10 minute", "10-minute"]):
+        elif intent.contains_any(dictionaries.ten_minute_prep_terms):
             must_conditions.append(FieldCondition(key="metadata.prep_time_minutes", range=Range(lte=10)))
 
         # Serves filter
@@ -652,58 +556,63 @@ class FreeTextQueryHandler:
             must_conditions.append(FieldCondition(key="metadata.serves", match=MatchValue(value=target_serves)))
 
         # Base spirit filter
-        for term, spirit_value in self._BASE_SPIRIT_MAPPING.items():
-            if self._fuzzy_keyword_in_text(search_text, term):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_base_spirit", match=MatchValue(value=spirit_value))
+        spirit_term = intent.first_match(
+            dictionaries.base_spirit_mapping
+        )  # Only the first spirit, to avoid over-filtering
+        if spirit_term is not None:
+            must_conditions.append(
+                FieldCondition(
+                    key="metadata.keywords_base_spirit",
+                    match=MatchValue(value=dictionaries.base_spirit_mapping[spirit_term]),
                 )
-                break  # Only match the first spirit to avoid over-filtering
+            )
 
         # Flavor profile filter
-        matched_flavors = [
-            flavor for flavor in self._FLAVOR_PROFILE_KEYWORDS if self._fuzzy_keyword_in_text(search_text, flavor)
-        ]
+        matched_flavors = intent.all_matches(dictionaries.flavor_profile_keywords)
         for flavor in matched_flavors[:2]:  # Limit to 2 flavor filters to avoid over-constraining
             must_conditions.append(
                 FieldCondition(key="metadata.keywords_flavor_profile", match=MatchValue(value=flavor))
             )
 
         # Cocktail family filter
-        for family in self._COCKTAIL_FAMILY_KEYWORDS:
-            if self._fuzzy_keyword_in_text(search_text, family):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_cocktail_family", match=MatchValue(value=family))
-                )
-                break
+        family = intent.first_match(dictionaries.cocktail_family_keywords)
+        if family is not None:
+            must_conditions.append(
+                FieldCondition(key="metadata.keywords_cocktail_family", match=MatchValue(value=family))
+            )
 
         # Technique filter
-        for term, technique_value in self._TECHNIQUE_MAPPING.items():
-            if self._fuzzy_keyword_in_text(search_text, term):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_technique", match=MatchValue(value=technique_value))
+        technique_term = intent.first_match(dictionaries.technique_mapping)
+        if technique_term is not None:
+            must_conditions.append(
+                FieldCondition(
+                    key="metadata.keywords_technique",
+                    match=MatchValue(value=dictionaries.technique_mapping[technique_term]),
                 )
-                break
+            )
 
         # Strength filter
-        for term, strength_value in self._STRENGTH_KEYWORDS.items():
-            if self._fuzzy_keyword_in_text(search_text, term):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_strength", match=MatchValue(value=strength_value))
+        strength_term = intent.first_match(dictionaries.strength_keywords)
+        if strength_term is not None:
+            must_conditions.append(
+                FieldCondition(
+                    key="metadata.keywords_strength",
+                    match=MatchValue(value=dictionaries.strength_keywords[strength_term]),
                 )
-                break
+            )
 
         # Temperature filter
-        for term, temp_value in self._TEMPERATURE_KEYWORDS.items():
-            if self._fuzzy_keyword_in_text(search_text, term):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_temperature", match=MatchValue(value=temp_value))
+        temperature_term = intent.first_match(dictionaries.temperature_keywords)
+        if temperature_term is not None:
+            must_conditions.append(
+                FieldCondition(
+                    key="metadata.keywords_temperature",
+                    match=MatchValue(value=dictionaries.temperature_keywords[temperature_term]),
                 )
-                break
+            )
 
         # Season filter
-        matched_seasons = [
-            season for season in self._SEASON_KEYWORDS if self._fuzzy_keyword_in_text(search_text, season)
-        ]
+        matched_seasons = intent.all_matches(dictionaries.season_keywords)
         if matched_seasons:
             # Map "autumn" to "fall" for consistency
             normalized_seasons = ["fall" if s == "autumn" else s for s in matched_seasons]
@@ -715,20 +624,18 @@ class FreeTextQueryHandler:
             )
 
         # Occasion filter
-        for occasion in self._OCCASION_KEYWORDS:
-            if self._fuzzy_keyword_in_text(search_text, occasion):
-                must_conditions.append(
-                    FieldCondition(key="metadata.keywords_occasion", match=MatchValue(value=occasion))
-                )
-                break
+        occasion = intent.first_match(dictionaries.occasion_keywords)
+        if occasion is not None:
+            must_conditions.append(FieldCondition(key="metadata.keywords_occasion", match=MatchValue(value=occasion)))
 
         # Mood filter
-        matched_moods = [mood for mood in self._MOOD_KEYWORDS if self._fuzzy_keyword_in_text(search_text, mood)]
+        matched_moods = intent.all_matches(dictionaries.mood_keywords)
         for mood in matched_moods[:2]:  # Limit to 2 mood filters
             must_conditions.append(FieldCondition(key="metadata.keywords_mood", match=MatchValue(value=mood)))
 
         # Ingredient exclusion (e.g., "without honey", "no rum", "without blue curacao")
-        excluded_terms = self._extract_exclusion_terms(search_text)
+        if excluded_terms is None:
+            excluded_terms = self._extract_exclusion_terms(search_text, dictionaries)
         for term in excluded_terms:
             must_not_conditions.append(FieldCondition(key="metadata.ingredient_words", match=MatchValue(value=term)))
 
@@ -740,7 +647,7 @@ class FreeTextQueryHandler:
         # Only triggers for words that match synonym expansion triggers to avoid
         # false positives on generic words like "delicious".
         if not must_conditions:
-            intent_words = self._extract_search_term_words(search_text)
+            intent_words = self._extract_search_term_words(search_text, dictionaries)
             if intent_words:
                 should_conditions.append(
                     FieldCondition(key="metadata.keywords_search_words", match=MatchAny(any=intent_words))
@@ -758,7 +665,9 @@ class FreeTextQueryHandler:
             )
         return None
 
-    def _extract_exclusion_terms(self, search_text: str) -> list[str]:
+    def _extract_exclusion_terms(
+        self, search_text: str, dictionaries: QueryDictionaryBundle | None = None
+    ) -> list[str]:
         """
         Extract ingredient terms that should be excluded from results.
         Handles multi-word ingredients like "blue curacao", "orange juice", "lime juice".
@@ -789,18 +698,25 @@ class FreeTextQueryHandler:
         }
 
         # Pre-compute first words of exclusion patterns for stop detection
-        _EXCLUSION_FIRST_WORDS = [p.strip().split()[0] for p in self._EXCLUSION_PATTERNS]
-
+        if dictionaries is None:
+            dictionaries = self.query_dictionary_store.current
+        exclusion_patterns = dictionaries.exclusion_patterns
+        _EXCLUSION_FIRST_WORDS = [p.strip().split()[0] for p in exclusion_patterns]
+
+        # The exclusion pattern words are part of the intent matcher vocabulary, so each query
+        # word is resolved once and the pattern checks below are set lookups
+        matcher = dictionaries.intent_matcher
         terms: list[str] = []
         text_words = search_text.split()
+        text_word_matches = [matcher.matches_for(word) for word in text_words]
 
-        for pattern in self._EXCLUSION_PATTERNS:
+        for pattern in exclusion_patterns:
             pattern_words = pattern.strip().split()
             pat_len = len(pattern_words)
 
             i = 0
             while i <= len(text_words) - pat_len:
-                if all(self._fuzzy_word_match(text_words[i + j], pattern_words[j]) for j in range(pat_len)):
+                if all(pattern_words[j] in text_word_matches[i + j] for j in range(pat_len)):
                     # Pattern matched at word index i; extract words after it
                     after_start = i + pat_len
                     phrase_words: list[str] = []
@@ -809,7 +725,8 @@ class FreeTextQueryHandler:
                         if cleaned in _STOP_WORDS or len(cleaned) < 2:
                             break
                         # Check if this word starts another exclusion pattern
-                        if any(self._fuzzy_word_match(cleaned, fw) for fw in _EXCLUSION_FIRST_WORDS):
+                        cleaned_matches = matcher.matches_for(cleaned)
+                        if any(fw in cleaned_matches for fw in _EXCLUSION_FIRST_WORDS):
                             break
                         phrase_words.append(cleaned)
                         # Limit to 3-word phrases to avoid runaway matching
@@ -44,37 +44,13 @@ class TypeAheadQueryHandler:
         self.logger = logging.getLogger("type_ahead_query_handler")
 
     async def handle(self, command: TypeAheadQuery) -> list[CocktailSearchModel]:
-        cocktails = await self.cocktail_vector_repository.get_all_cocktails()
-
-        sorted_cocktails = sorted(
-            cocktails,
-            key=lambda p: p.title or "",
-            reverse=False,
-        )
-
-        filtered_start_cocktails = [
-            c
-            for c in sorted_cocktails
-            if not command.free_text
-            or c.title.lower().startswith(command.free_text.lower())
-            or c.descriptive_title.lower().startswith(command.free_text.lower())
-        ]
-
-        filtered_cocktails = filtered_start_cocktails
-
-        if len(filtered_start_cocktails) < (command.take or 10):
-            filtered_contains = [
-                c
-                for c in sorted_cocktails
-                if command.free_text
-                and not filtered_start_cocktails.__contains__(c)
-                and command.free_text.lower()
-                in (c.title.lower() if c.title else "" or c.descriptive_title.lower() if c.descriptive_title else "")
-                and c not in filtered_start_cocktails
-            ]
-
-            filtered_cocktails = filtered_start_cocktails + filtered_contains
-
+        catalog = await self.cocktail_vector_repository.get_catalog_index()
         skip = command.skip or 0
         take = command.take or 10
-        return filtered_cocktails[skip : skip + take]
+
+        if not (command.free_text or "").strip():
+            return catalog.sorted_by_title[skip : skip + take]
+
+        # Prefix matches on the title or descriptive title first, then matches on a later word in either
+        positions = catalog.typeahead.search(command.free_text or "", skip, take)
+        return [catalog.sorted_by_title[position] for position in positions]
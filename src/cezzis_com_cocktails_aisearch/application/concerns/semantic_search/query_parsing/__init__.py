@@ -0,0 +1,29 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.intent_matcher import (
+    IntentMatch,
+    IntentMatcher,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQuery,
+    ParsedQueryCache,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    QueryDictionaryBundle,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.synonym_index import (
+    AhoCorasickAutomaton,
+    SynonymIndex,
+)
+
+__all__ = [
+    "AhoCorasickAutomaton",
+    "IntentMatch",
+    "IntentMatcher",
+    "ParsedQuery",
+    "ParsedQueryCache",
+    "QueryDictionaryBundle",
+    "QueryDictionaryStore",
+    "SynonymIndex",
+]
@@ -0,0 +1,100 @@
+from typing import Iterable
+
+from rapidfuzz import fuzz, process
+
+# Punctuation stripped from the ends of query words before keyword matching
+_PUNCTUATION = ",.!?;:"
+
+
+class IntentMatcher:
+    """Fuzzy keyword matcher compiled once from the query-intent keyword tables.
+
+    The vocabulary is every word of every keyword phrase. Each vocabulary word's fuzzy
+    neighbours are scored up front, so a query word that is itself a keyword word is
+    resolved with a single dict lookup; only unknown words are scored, in one native
+    rapidfuzz call against the vocabulary. Matching follows the handler's per-word rule:
+    words shorter than ``min_fuzzy_length`` must match exactly, longer ones need a
+    ``fuzz.ratio`` of at least ``threshold``.
+    """
+
+    def __init__(self, keywords: Iterable[str], threshold: int = 80, min_fuzzy_length: int = 5):
+        self.threshold = threshold
+        self.min_fuzzy_length = min_fuzzy_length
+        self._keyword_words = {keyword: tuple(keyword.strip().split()) for keyword in keywords}
+        self.vocabulary = frozenset(word for words in self._keyword_words.values() for word in words)
+        self._fuzzy_vocabulary = sorted(word for word in self.vocabulary if len(word) >= min_fuzzy_length)
+        self._neighbours = {word: self._score(word) for word in self.vocabulary}
+
+    def _score(self, token: str) -> frozenset[str]:
+        matched = process.extract(
+            token, self._fuzzy_vocabulary, scorer=fuzz.ratio, score_cutoff=self.threshold, limit=None
+        )
+        words = {word for word, _, _ in matched}
+        if token in self.vocabulary:
+            words.add(token)
+        return frozenset(words)
+
+    def matches_for(self, token: str) -> frozenset[str]:
+        """Return the vocabulary words that ``token`` matches."""
+        neighbours = self._neighbours.get(token)
+        return neighbours if neighbours is not None else self._score(token)
+
+    def keyword_words(self, keyword: str) -> tuple[str, ...]:
+        """Return the words of a keyword phrase, pre-split for the keywords the matcher was built from."""
+        words = self._keyword_words.get(keyword)
+        return words if words is not None else tuple(keyword.strip().split())
+
+    def word_matches(self, token: str, word: str) -> bool:
+        """Check a single query word against any keyword word, in or out of the vocabulary."""
+        if word in self.vocabulary:
+            return word in self.matches_for(token)
+        if len(word) < self.min_fuzzy_length:
+            return token == word
+        return fuzz.ratio(token, word) >= self.threshold
+
+    def match(self, search_text: str) -> "IntentMatch":
+        """Tokenise ``search_text`` once and resolve every word against the vocabulary."""
+        tokens = [word.strip(_PUNCTUATION) for word in search_text.split()]
+        return IntentMatch(self, tokens, [self.matches_for(token) for token in tokens])
+
+
+class IntentMatch:
+    """The words of one query, each resolved to the keyword words it matches."""
+
+    def __init__(self, matcher: IntentMatcher, tokens: list[str], token_matches: list[frozenset[str]]):
+        self.tokens = tokens
+        self._matcher = matcher
+        self._token_matches = token_matches
+        self._matched_words = frozenset().union(*token_matches)
+
+    def _matches_at(self, position: int, word: str) -> bool:
+        if word in self._matcher.vocabulary:
+            return word in self._token_matches[position]
+        return self._matcher.word_matches(self.tokens[position], word)
+
+    def contains(self, keyword: str) -> bool:
+        """Check if a keyword (single or multi-word) appears in the query as consecutive words."""
+        keyword_words = self._matcher.keyword_words(keyword)
+        vocabulary = self._matcher.vocabulary
+        if len(keyword_words) == 1 and keyword_words[0] in vocabulary:
+            return keyword_words[0] in self._matched_words
+        if any(word in vocabulary and word not in self._matched_words for word in keyword_words):
+            return False
+
+        span = len(keyword_words)
+        return any(
+            all(self._matches_at(start + offset, word) for offset, word in enumerate(keyword_words))
+            for start in range(len(self.tokens) - span + 1)
+        )
+
+    def contains_any(self, keywords: Iterable[str]) -> bool:
+        """Check if any of the keywords appears in the query."""
+        return any(self.contains(keyword) for keyword in keywords)
+
+    def first_match(self, keywords: Iterable[str]) -> str | None:
+        """Return the first keyword, in iteration order, that appears in the query."""
+        return next((keyword for keyword in keywords if self.contains(keyword)), None)
+
+    def all_matches(self, keywords: Iterable[str]) -> list[str]:
+        """Return every keyword, in iteration order, that appears in the query."""
+        return [keyword for keyword in keywords if self.contains(keyword)]
@@ -0,0 +1,120 @@
+import weakref
+from collections import OrderedDict
+from typing import Iterable
+
+from injector import inject
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from qdrant_client.http.models import Filter
+
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import QueryParsingOptions
+
+# Key of a parsed query: trimmed free text, ingredient groups and the dictionary version it was parsed with
+ParsedQueryKey = tuple[str, tuple[tuple[str, tuple[str, ...]], ...], int]
+
+_meter = metrics.get_meter("parsed_query_cache")
+
+_cache_hits = _meter.create_counter(
+    "parsed_query_cache.hits",
+    unit="{request}",
+    description="Free text searches that reused an already parsed query",
+)
+_cache_misses = _meter.create_counter(
+    "parsed_query_cache.misses",
+    unit="{request}",
+    description="Free text searches that parsed the query text",
+)
+
+_caches: "weakref.WeakSet[ParsedQueryCache]" = weakref.WeakSet()
+
+
+def _observe_hit_ratio(options: CallbackOptions) -> Iterable[Observation]:
+    return [Observation(cache.hit_ratio) for cache in _caches if cache.hits + cache.misses]
+
+
+_meter.create_observable_gauge(
+    "parsed_query_cache.hit_ratio",
+    callbacks=[_observe_hit_ratio],
+    unit="1",
+    description="Share of free text searches that reused an already parsed query",
+)
+
+
+class ParsedQuery:
+    """Everything the search pipeline derives from the query text alone, computed once per distinct query.
+
+    Instances are shared between requests through ``ParsedQueryCache`` and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        query_filter: Filter | None,
+        vector_search_text: str,
+        expanded_search_text: str,
+        exclusion_terms: list[str],
+        rating_sort: bool,
+    ):
+        self.query_filter = query_filter
+        self.vector_search_text = vector_search_text
+        self.expanded_search_text = expanded_search_text
+        self.exclusion_terms = exclusion_terms
+        self.rating_sort = rating_sort
+
+
+class ParsedQueryCache:
+    """Bounded in-process LRU of ``ParsedQuery`` objects for repeated (head) queries.
+
+    The key includes the query dictionary version, so a dictionary reload never serves
+    a query parsed with the previous keywords; those entries simply age out. A
+    ``max_entries`` of 0 disables the cache.
+    """
+
+    @inject
+    def __init__(self, query_parsing_options: QueryParsingOptions):
+        self.max_entries = query_parsing_options.parsed_query_cache_max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[ParsedQueryKey, ParsedQuery] = OrderedDict()
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from the cache since startup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def make_key(free_text: str, ingredient_groups: dict[str, list[str]], dictionary_version: int) -> ParsedQueryKey:
+        """Build a cache key from the trimmed query text, the ingredient groups and the dictionary version."""
+        groups = tuple((group, tuple(names)) for group, names in ingredient_groups.items())
+        return (free_text.strip(), groups, dictionary_version)
+
+    def get(self, key: ParsedQueryKey) -> ParsedQuery | None:
+        """Return the parsed query for ``key`` and mark it most recently used, or None on a miss."""
+        if self.max_entries <= 0:
+            return None
+
+        parsed = self._entries.get(key)
+        if parsed is None:
+            self.misses += 1
+            _cache_misses.add(1)
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        _cache_hits.add(1)
+        return parsed
+
+    def set(self, key: ParsedQueryKey, parsed: ParsedQuery) -> None:
+        """Store ``parsed``, evicting the least recently used entry when the cache is full."""
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = parsed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
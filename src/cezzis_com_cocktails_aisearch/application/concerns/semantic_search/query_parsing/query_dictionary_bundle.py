@@ -0,0 +1,103 @@
+import hashlib
+import json
+from typing import Any
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.intent_matcher import (
+    IntentMatcher,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.synonym_index import SynonymIndex
+
+KEYWORDS_FILE_NAME = "query_intent_keywords.json"
+SYNONYMS_FILE_NAME = "query_synonym_expansions.json"
+
+_KEYWORD_LISTS = (
+    "non_iba_terms",
+    "iba_terms",
+    "simple_terms",
+    "complex_terms",
+    "quick_prep_terms",
+    "ten_minute_prep_terms",
+    "rating_sort_terms",
+    "exclusion_patterns",
+    "flavor_profile_keywords",
+    "cocktail_family_keywords",
+    "season_keywords",
+    "occasion_keywords",
+    "mood_keywords",
+)
+
+_KEYWORD_MAPPINGS = (
+    "glassware_mapping",
+    "base_spirit_mapping",
+    "technique_mapping",
+    "strength_keywords",
+    "temperature_keywords",
+)
+
+
+class QueryDictionaryBundle:
+    """One immutable version of the query intent keywords and synonym expansions, fully compiled.
+
+    A bundle is built from the raw JSON of ``query_intent_keywords.json`` and
+    ``query_synonym_expansions.json``. Construction validates every table and compiles
+    the ``IntentMatcher`` and ``SynonymIndex`` before the bundle is handed out, so a
+    bundle that exists is always complete; reloads build a new bundle and swap the
+    reference rather than mutating this one.
+    """
+
+    non_iba_terms: list[str]
+    iba_terms: list[str]
+    simple_terms: list[str]
+    complex_terms: list[str]
+    quick_prep_terms: list[str]
+    ten_minute_prep_terms: list[str]
+    rating_sort_terms: list[str]
+    exclusion_patterns: list[str]
+    flavor_profile_keywords: list[str]
+    cocktail_family_keywords: list[str]
+    season_keywords: list[str]
+    occasion_keywords: list[str]
+    mood_keywords: list[str]
+    glassware_mapping: dict[str, str]
+    base_spirit_mapping: dict[str, str]
+    technique_mapping: dict[str, str]
+    strength_keywords: dict[str, str]
+    temperature_keywords: dict[str, str]
+
+    def __init__(self, keywords_json: bytes, synonyms_json: bytes, version: int = 1):
+        self.version = version
+        self.fingerprint = hashlib.sha256(keywords_json + b"\0" + synonyms_json).hexdigest()[:12]
+
+        keywords = json.loads(keywords_json)
+        for name in _KEYWORD_LISTS:
+            setattr(self, name, self._keyword_list(keywords, name))
+        for name in _KEYWORD_MAPPINGS:
+            setattr(self, name, self._keyword_mapping(keywords, name))
+
+        synonyms = json.loads(synonyms_json)
+        if not isinstance(synonyms, dict):
+            raise ValueError(f"{SYNONYMS_FILE_NAME} must contain a JSON object")
+        # Strip metadata keys
+        self.synonym_expansions: dict[str, dict[str, list[str]]] = {
+            k: v for k, v in synonyms.items() if isinstance(v, dict) and not k.startswith("_")
+        }
+
+        self.intent_matcher = IntentMatcher(
+            [keyword for name in _KEYWORD_LISTS for keyword in getattr(self, name)]
+            + [keyword for name in _KEYWORD_MAPPINGS for keyword in getattr(self, name)]
+        )
+        self.synonym_index = SynonymIndex(self.synonym_expansions)
+
+    @staticmethod
+    def _keyword_list(keywords: dict[str, Any], name: str) -> list[str]:
+        value = keywords.get(name)
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"{KEYWORDS_FILE_NAME}: '{name}' must be a list of strings")
+        return value
+
+    @staticmethod
+    def _keyword_mapping(keywords: dict[str, Any], name: str) -> dict[str, str]:
+        value = keywords.get(name)
+        if not isinstance(value, dict) or not all(isinstance(item, str) for item in value.values()):
+            raise ValueError(f"{KEYWORDS_FILE_NAME}: '{name}' must be an object of string values")
+        return value
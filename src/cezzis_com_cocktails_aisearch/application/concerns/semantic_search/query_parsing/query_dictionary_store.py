@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import os
+from importlib import resources
+
+from injector import inject
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    KEYWORDS_FILE_NAME,
+    SYNONYMS_FILE_NAME,
+    QueryDictionaryBundle,
+)
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import QueryParsingOptions
+
+
+class QueryDictionaryStore:
+    """Holds the active ``QueryDictionaryBundle`` and swaps in rebuilt bundles without a restart.
+
+    The dictionaries are read from ``QUERY_DICTIONARY_DIR`` when it is set, otherwise from
+    the files packaged in ``cezzis_com_cocktails_aisearch.static``. ``reload`` builds the
+    next bundle on a worker thread and publishes it with a single reference assignment
+    (copy-on-write): a query that has already taken ``current`` keeps using that
+    complete bundle, and a new bundle is never visible until it is fully compiled. A
+    reload that fails (e.g. invalid JSON) keeps the current bundle.
+
+    ``watch`` polls the file modification times every ``QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS``
+    and reloads on change; it runs as a background task for the lifetime of the app.
+    """
+
+    @inject
+    def __init__(self, query_parsing_options: QueryParsingOptions):
+        self.dictionary_dir = query_parsing_options.dictionary_dir
+        self.reload_interval_seconds = query_parsing_options.reload_interval_seconds
+        self.logger = logging.getLogger("query_dictionary_store")
+        self._reload_lock = asyncio.Lock()
+        self._source_mtimes = self._read_source_mtimes()
+        self._current = self._build(version=1)
+
+    @property
+    def current(self) -> QueryDictionaryBundle:
+        """The bundle to use for a query; take it once per query so every stage sees the same version."""
+        return self._current
+
+    def _source_path(self, file_name: str) -> str:
+        if self.dictionary_dir:
+            return os.path.join(self.dictionary_dir, file_name)
+        return str(resources.files("cezzis_com_cocktails_aisearch.static").joinpath(file_name))
+
+    def _read_source_mtimes(self) -> tuple[int, int]:
+        try:
+            return (
+                os.stat(self._source_path(KEYWORDS_FILE_NAME)).st_mtime_ns,
+                os.stat(self._source_path(SYNONYMS_FILE_NAME)).st_mtime_ns,
+            )
+        except OSError:
+            return (0, 0)
+
+    def _build(self, version: int) -> QueryDictionaryBundle:
+        with open(self._source_path(KEYWORDS_FILE_NAME), "rb") as keywords_file:
+            keywords_json = keywords_file.read()
+        with open(self._source_path(SYNONYMS_FILE_NAME), "rb") as synonyms_file:
+            synonyms_json = synonyms_file.read()
+        return QueryDictionaryBundle(keywords_json, synonyms_json, version=version)
+
+    def has_changed(self) -> bool:
+        """Check whether either dictionary file was modified since it was last loaded."""
+        return self._read_source_mtimes() != self._source_mtimes
+
+    async def reload(self, force: bool = True) -> QueryDictionaryBundle:
+        """Rebuild the bundle from the dictionary files and swap it in.
+
+        Without ``force`` the files are only re-read when their modification time changed.
+        A rebuild whose content is identical to the current bundle keeps the current one.
+        """
+        async with self._reload_lock:
+            if not force and not self.has_changed():
+                return self._current
+
+            # Record the mtimes before reading so a write during the rebuild triggers another reload
+            source_mtimes = self._read_source_mtimes()
+            bundle = await asyncio.to_thread(self._build, self._current.version + 1)
+            self._source_mtimes = source_mtimes
+
+            if bundle.fingerprint == self._current.fingerprint:
+                return self._current
+
+            self._current = bundle
+            self.logger.info(
+                "Query dictionaries reloaded",
+                extra={"query_dictionary_version": bundle.version, "query_dictionary_fingerprint": bundle.fingerprint},
+            )
+            return bundle
+
+    async def watch(self) -> None:
+        """Reload the dictionaries whenever their files change; runs until cancelled."""
+        if self.reload_interval_seconds <= 0.0:
+            return
+
+        while True:
+            await asyncio.sleep(self.reload_interval_seconds)
+            try:
+                await self.reload(force=False)
+            except Exception:
+                self.logger.warning(
+                    "Failed to reload query dictionaries, keeping the current version",
+                    exc_info=True,
+                    extra={"query_dictionary_version": self._current.version},
+                )
@@ -0,0 +1,77 @@
+from collections import deque
+
+
+class AhoCorasickAutomaton:
+    """Multi-pattern substring matcher: finds every pattern occurring in a text in one pass.
+
+    Patterns are stored in a trie with failure links, so scanning a text costs one
+    transition per character plus the matches reported, independent of the number of
+    patterns.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        outputs: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = child
+            outputs[node].append(index)
+
+        # Breadth-first so every failure target (a shorter suffix) is complete before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._output = [tuple(indexes) for indexes in outputs]
+
+    def find(self, text: str) -> set[int]:
+        """Return the indexes of every pattern that occurs in ``text``."""
+        found = set(self._output[0])
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                found.update(self._output[node])
+        return found
+
+
+class SynonymIndex:
+    """Query synonym expansions compiled into one Aho–Corasick automaton over every trigger.
+
+    ``matches`` returns the same entries as checking ``trigger in text`` for every
+    trigger of every category, in the same (file) order, from a single scan of the text.
+    """
+
+    def __init__(self, expansions: dict[str, dict[str, list[str]]]):
+        self.expansions = expansions
+        self._entries = [
+            (trigger, synonyms) for mappings in expansions.values() for trigger, synonyms in mappings.items()
+        ]
+        self._automaton = AhoCorasickAutomaton([trigger for trigger, _ in self._entries])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def matches(self, text: str) -> list[tuple[str, list[str]]]:
+        """Return the ``(trigger, synonyms)`` entries whose trigger occurs in ``text``, in file order."""
+        return [self._entries[index] for index in sorted(self._automaton.find(text))]
@@ -0,0 +1,5 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup.search_warmup import SearchWarmup
+
+__all__ = [
+    "SearchWarmup",
+]
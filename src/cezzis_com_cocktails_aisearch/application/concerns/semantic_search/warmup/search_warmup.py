@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import time
+
+from injector import inject
+from mediatr import Mediator
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.queries.free_text_query import FreeTextQuery
+from cezzis_com_cocktails_aisearch.domain.config.warmup_options import WarmupOptions
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
+    ICocktailVectorSearchRepository,
+)
+
+
+class SearchWarmup:
+    """Preloads the cocktail catalog and warms the search caches before the replica takes traffic.
+
+    Without it the first request after a deploy pays for the full catalog scroll and index
+    build, and the first search for each popular phrase for its embedding, SPLADE encoding
+    and reranking. ``run`` loads the catalog, then sends every configured head query through
+    the mediator so the regular search path fills its caches. Readiness reports not-ready
+    until ``run`` finishes; a failed or timed-out warm-up still finishes, so the replica
+    serves cold rather than never becoming ready.
+    """
+
+    @inject
+    def __init__(
+        self,
+        mediator: Mediator,
+        cocktail_search_repository: ICocktailVectorSearchRepository,
+        warmup_options: WarmupOptions,
+    ):
+        self.logger = logging.getLogger("search_warmup")
+        self.mediator = mediator
+        self.cocktail_search_repository = cocktail_search_repository
+        self.warmup_options = warmup_options
+        self.queries = [query.strip() for query in warmup_options.queries.split(",") if query.strip()]
+        self._complete = not warmup_options.enabled
+
+    @property
+    def is_complete(self) -> bool:
+        return self._complete
+
+    async def run(self) -> None:
+        """Warm the catalog and the head queries, then mark the warm-up complete."""
+        if self._complete:
+            return
+
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._warm(), timeout=self.warmup_options.timeout_seconds)
+        except Exception:
+            self.logger.warning("Startup warm-up did not finish, serving with cold caches", exc_info=True)
+        finally:
+            self._complete = True
+            self.logger.info(
+                "Startup warm-up complete",
+                extra={"warmup_ms": (time.perf_counter() - start) * 1000, "warmup_query_count": len(self.queries)},
+            )
+
+    async def _warm(self) -> None:
+        catalog = await self.cocktail_search_repository.get_catalog_index()
+        self.logger.info("Cocktail catalog preloaded", extra={"catalog_size": len(catalog.cocktails)})
+
+        results = await asyncio.gather(
+            *(self.mediator.send_async(FreeTextQuery(free_text=query)) for query in self.queries),
+            return_exceptions=True,
+        )
+        failed = [query for query, result in zip(self.queries, results) if isinstance(result, Exception)]
+        if failed:
+            self.logger.warning("Some warm-up queries failed", extra={"warmup_failed_queries": failed})
@@ -1,9 +1,16 @@
 from cezzis_com_cocktails_aisearch.domain.config.app_options import AppOptions, get_app_options
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions, get_cache_options
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions, get_http_client_options
 from cezzis_com_cocktails_aisearch.domain.config.hugging_face_options import HuggingFaceOptions, get_huggingface_options
 from cezzis_com_cocktails_aisearch.domain.config.otel_options import OTelOptions, get_otel_options
 from cezzis_com_cocktails_aisearch.domain.config.qdrant_options import QdrantOptions, get_qdrant_options
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import (
+    QueryParsingOptions,
+    get_query_parsing_options,
+)
 from cezzis_com_cocktails_aisearch.domain.config.reranker_options import RerankerOptions, get_reranker_options
 from cezzis_com_cocktails_aisearch.domain.config.splade_options import SpladeOptions, get_splade_options
+from cezzis_com_cocktails_aisearch.domain.config.warmup_options import WarmupOptions, get_warmup_options
 
 __all__ = [
     "OTelOptions",
@@ -18,4 +25,12 @@ __all__ = [
     "get_reranker_options",
     "SpladeOptions",
     "get_splade_options",
+    "HttpClientOptions",
+    "get_http_client_options",
+    "CacheOptions",
+    "get_cache_options",
+    "QueryParsingOptions",
+    "get_query_parsing_options",
+    "WarmupOptions",
+    "get_warmup_options",
 ]
@@ -0,0 +1,80 @@
+import logging
+import os
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheOptions(BaseSettings):
+    """Settings for the cache backend, the embedding, search result and decoded model caches, and catalog refresh."""
+
+    model_config = SettingsConfigDict(
+        env_file=(".env", f".env.{os.environ.get('ENV')}"), env_file_encoding="utf-8", extra="allow"
+    )
+
+    backend: str = Field(default="memory", validation_alias="CACHE_BACKEND")
+    key_prefix: str = Field(default="cezzis-aisearch:", validation_alias="CACHE_KEY_PREFIX")
+    memory_max_entries: int = Field(default=8192, validation_alias="CACHE_MEMORY_MAX_ENTRIES")
+    redis_host: str = Field(default="", validation_alias="CACHE_REDIS_HOST")
+    redis_port: int = Field(default=6379, validation_alias="CACHE_REDIS_PORT")
+    redis_password: str = Field(default="", validation_alias="CACHE_REDIS_PASSWORD")
+    redis_db: int = Field(default=0, validation_alias="CACHE_REDIS_DB")
+    redis_use_tls: bool = Field(default=False, validation_alias="CACHE_REDIS_USE_TLS")
+    redis_pool_size: int = Field(default=8, validation_alias="CACHE_REDIS_POOL_SIZE")
+    redis_timeout_seconds: float = Field(default=1.0, validation_alias="CACHE_REDIS_TIMEOUT_SECONDS")
+    embedding_cache_ttl_seconds: float = Field(default=86400.0, validation_alias="EMBEDDING_CACHE_TTL_SECONDS")
+    embedding_cache_snapshot_path: str = Field(default="", validation_alias="EMBEDDING_CACHE_SNAPSHOT_PATH")
+    search_result_cache_enabled: bool = Field(default=True, validation_alias="SEARCH_RESULT_CACHE_ENABLED")
+    search_result_cache_ttl_seconds: float = Field(default=300.0, validation_alias="SEARCH_RESULT_CACHE_TTL_SECONDS")
+    decoded_model_cache_max_entries: int = Field(default=4096, validation_alias="DECODED_MODEL_CACHE_MAX_ENTRIES")
+    catalog_refresh_interval_seconds: float = Field(default=60.0, validation_alias="CATALOG_REFRESH_INTERVAL_SECONDS")
+    catalog_removal_scan_interval_seconds: float = Field(
+        default=600.0, validation_alias="CATALOG_REMOVAL_SCAN_INTERVAL_SECONDS"
+    )
+
+
+_logger: logging.Logger = logging.getLogger("cache_options")
+
+_cache_options: CacheOptions | None = None
+
+
+def get_cache_options() -> CacheOptions:
+    """Get the singleton instance of CacheOptions.
+
+    Returns:
+        CacheOptions: The cache options instance.
+    """
+    global _cache_options
+    if _cache_options is None:
+        _cache_options = CacheOptions()
+
+        if _cache_options.backend not in ("memory", "redis"):
+            raise ValueError("CACHE_BACKEND must be either 'memory' or 'redis'")
+        if _cache_options.backend == "redis" and not _cache_options.redis_host:
+            raise ValueError("CACHE_REDIS_HOST environment variable is required when CACHE_BACKEND is 'redis'")
+        if _cache_options.memory_max_entries <= 0:
+            raise ValueError("CACHE_MEMORY_MAX_ENTRIES must be greater than 0")
+        if _cache_options.redis_pool_size <= 0:
+            raise ValueError("CACHE_REDIS_POOL_SIZE must be greater than 0")
+        if _cache_options.redis_timeout_seconds <= 0.0:
+            raise ValueError("CACHE_REDIS_TIMEOUT_SECONDS must be greater than 0")
+        if _cache_options.embedding_cache_ttl_seconds <= 0.0:
+            raise ValueError("EMBEDDING_CACHE_TTL_SECONDS must be greater than 0")
+        if _cache_options.search_result_cache_ttl_seconds <= 0.0:
+            raise ValueError("SEARCH_RESULT_CACHE_TTL_SECONDS must be greater than 0")
+        if _cache_options.decoded_model_cache_max_entries <= 0:
+            raise ValueError("DECODED_MODEL_CACHE_MAX_ENTRIES must be greater than 0")
+        if _cache_options.catalog_refresh_interval_seconds < 0.0:
+            raise ValueError("CATALOG_REFRESH_INTERVAL_SECONDS must be non-negative")
+        if _cache_options.catalog_removal_scan_interval_seconds < 0.0:
+            raise ValueError("CATALOG_REMOVAL_SCAN_INTERVAL_SECONDS must be non-negative")
+
+        _logger.info("Cache options loaded successfully.")
+
+    return _cache_options
+
+
+def clear_cache_options_cache() -> None:
+    """Clear the cached options instance. Useful for testing."""
+    global _cache_options
+    _cache_options = None
@@ -0,0 +1,54 @@
+import logging
+import os
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HttpClientOptions(BaseSettings):
+    """Connection pool settings for the shared HTTP client used to call the TEI services."""
+
+    model_config = SettingsConfigDict(
+        env_file=(".env", f".env.{os.environ.get('ENV')}"), env_file_encoding="utf-8", extra="allow"
+    )
+
+    max_connections: int = Field(default=100, validation_alias="HTTP_CLIENT_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(default=20, validation_alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS")
+    keepalive_expiry_seconds: float = Field(default=30.0, validation_alias="HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS")
+    connect_timeout_seconds: float = Field(default=5.0, validation_alias="HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS")
+    http2: bool = Field(default=True, validation_alias="HTTP_CLIENT_HTTP2")
+
+
+_logger: logging.Logger = logging.getLogger("http_client_options")
+
+_http_client_options: HttpClientOptions | None = None
+
+
+def get_http_client_options() -> HttpClientOptions:
+    """Get the singleton instance of HttpClientOptions.
+
+    Returns:
+        HttpClientOptions: The HTTP client options instance.
+    """
+    global _http_client_options
+    if _http_client_options is None:
+        _http_client_options = HttpClientOptions()
+
+        if _http_client_options.max_connections <= 0:
+            raise ValueError("HTTP_CLIENT_MAX_CONNECTIONS must be greater than 0")
+        if _http_client_options.max_keepalive_connections < 0:
+            raise ValueError("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS must be non-negative")
+        if _http_client_options.max_keepalive_connections > _http_client_options.max_connections:
+            raise ValueError("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS must not exceed HTTP_CLIENT_MAX_CONNECTIONS")
+        if _http_client_options.connect_timeout_seconds <= 0.0:
+            raise ValueError("HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS must be greater than 0")
+
+        _logger.info("HTTP client options loaded successfully.")
+
+    return _http_client_options
+
+
+def clear_http_client_options_cache() -> None:
+    """Clear the cached options instance. Useful for testing."""
+    global _http_client_options
+    _http_client_options = None
@@ -12,6 +12,9 @@ class HuggingFaceOptions(BaseSettings):
 
     inference_model: str = Field(default="", validation_alias="HUGGINGFACE_INFERENCE_MODEL")
     api_token: str = Field(default="", validation_alias="HUGGINGFACE_API_TOKEN")
+    batch_window_ms: float = Field(default=2.0, validation_alias="HUGGINGFACE_BATCH_WINDOW_MS")
+    batch_max_size: int = Field(default=32, validation_alias="HUGGINGFACE_BATCH_MAX_SIZE")
+    embedding_cache_max_entries: int = Field(default=1024, validation_alias="HUGGINGFACE_EMBEDDING_CACHE_MAX_ENTRIES")
 
 
 _logger: logging.Logger = logging.getLogger("hugging_face_options")
@@ -34,6 +37,12 @@ def get_huggingface_options() -> HuggingFaceOptions:
             raise ValueError("HUGGINGFACE_INFERENCE_MODEL environment variable is required")
         if not _hf_options.api_token:
             raise ValueError("HUGGINGFACE_API_TOKEN environment variable is required")
+        if _hf_options.batch_window_ms < 0.0:
+            raise ValueError("HUGGINGFACE_BATCH_WINDOW_MS must be non-negative")
+        if _hf_options.batch_max_size <= 0:
+            raise ValueError("HUGGINGFACE_BATCH_MAX_SIZE must be greater than 0")
+        if _hf_options.embedding_cache_max_entries < 0:
+            raise ValueError("HUGGINGFACE_EMBEDDING_CACHE_MAX_ENTRIES must be non-negative")
 
         _logger.info("HuggingFace options loaded successfully.")
 
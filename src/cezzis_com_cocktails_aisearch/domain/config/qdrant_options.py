@@ -24,6 +24,12 @@ class QdrantOptions(BaseSettings):
     semantic_search_total_score_threshold: float = Field(
         default=0.0, validation_alias="QDRANT_SEMANTIC_SEARCH_TOTAL_SCORE_THRESHOLD"
     )
+    semantic_search_hydrate_from_catalog: bool = Field(
+        default=True, validation_alias="QDRANT_SEMANTIC_SEARCH_HYDRATE_FROM_CATALOG"
+    )
+    semantic_search_group_size: int = Field(default=0, validation_alias="QDRANT_SEMANTIC_SEARCH_GROUP_SIZE")
+    catalog_scroll_page_size: int = Field(default=1000, validation_alias="QDRANT_CATALOG_SCROLL_PAGE_SIZE")
+    catalog_scroll_parallelism: int = Field(default=1, validation_alias="QDRANT_CATALOG_SCROLL_PARALLELISM")
 
 
 _logger: logging.Logger = logging.getLogger("qdrant_options")
@@ -58,6 +64,12 @@ def get_qdrant_options() -> QdrantOptions:
             raise ValueError("QDRANT_SEMANTIC_SEARCH_SCORE_THRESHOLD must be non-negative")
         if _qdrant_options.semantic_search_total_score_threshold < 0.0:
             raise ValueError("QDRANT_SEMANTIC_SEARCH_TOTAL_SCORE_THRESHOLD must be non-negative")
+        if _qdrant_options.semantic_search_group_size < 0:
+            raise ValueError("QDRANT_SEMANTIC_SEARCH_GROUP_SIZE must be non-negative")
+        if _qdrant_options.catalog_scroll_page_size <= 0:
+            raise ValueError("QDRANT_CATALOG_SCROLL_PAGE_SIZE must be greater than 0")
+        if _qdrant_options.catalog_scroll_parallelism <= 0:
+            raise ValueError("QDRANT_CATALOG_SCROLL_PARALLELISM must be greater than 0")
 
         _logger.info("Qdrant options loaded successfully.")
 
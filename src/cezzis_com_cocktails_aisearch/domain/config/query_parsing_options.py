@@ -0,0 +1,50 @@
+import logging
+import os
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class QueryParsingOptions(BaseSettings):
+    """Settings for the query intent keyword and synonym dictionaries used to parse free text searches."""
+
+    model_config = SettingsConfigDict(
+        env_file=(".env", f".env.{os.environ.get('ENV')}"), env_file_encoding="utf-8", extra="allow"
+    )
+
+    dictionary_dir: str = Field(default="", validation_alias="QUERY_DICTIONARY_DIR")
+    reload_interval_seconds: float = Field(default=30.0, validation_alias="QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS")
+    parsed_query_cache_max_entries: int = Field(default=1024, validation_alias="PARSED_QUERY_CACHE_MAX_ENTRIES")
+
+
+_logger: logging.Logger = logging.getLogger("query_parsing_options")
+
+_query_parsing_options: QueryParsingOptions | None = None
+
+
+def get_query_parsing_options() -> QueryParsingOptions:
+    """Get the singleton instance of QueryParsingOptions.
+
+    Returns:
+        QueryParsingOptions: The query parsing options instance.
+    """
+    global _query_parsing_options
+    if _query_parsing_options is None:
+        _query_parsing_options = QueryParsingOptions()
+
+        if _query_parsing_options.dictionary_dir and not os.path.isdir(_query_parsing_options.dictionary_dir):
+            raise ValueError("QUERY_DICTIONARY_DIR must be an existing directory")
+        if _query_parsing_options.reload_interval_seconds < 0.0:
+            raise ValueError("QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS must be non-negative")
+        if _query_parsing_options.parsed_query_cache_max_entries < 0:
+            raise ValueError("PARSED_QUERY_CACHE_MAX_ENTRIES must be non-negative")
+
+        _logger.info("Query parsing options loaded successfully.")
+
+    return _query_parsing_options
+
+
+def clear_query_parsing_options_cache() -> None:
+    """Clear the cached options instance. Useful for testing."""
+    global _query_parsing_options
+    _query_parsing_options = None
@@ -12,6 +12,9 @@ class SpladeOptions(BaseSettings):
 
     endpoint: str = Field(default="", validation_alias="SPLADE_ENDPOINT")
     api_key: str = Field(default="", validation_alias="SPLADE_API_KEY")
+    timeout_seconds: float = Field(default=30.0, validation_alias="SPLADE_TIMEOUT_SECONDS")
+    batch_window_ms: float = Field(default=2.0, validation_alias="SPLADE_BATCH_WINDOW_MS")
+    batch_max_size: int = Field(default=32, validation_alias="SPLADE_BATCH_MAX_SIZE")
 
 
 _logger: logging.Logger = logging.getLogger("splade_options")
@@ -31,6 +34,12 @@ def get_splade_options() -> SpladeOptions:
 
         if not _splade_options.endpoint:
             raise ValueError("SPLADE_ENDPOINT environment variable is required")
+        if _splade_options.timeout_seconds <= 0.0:
+            raise ValueError("SPLADE_TIMEOUT_SECONDS must be greater than 0")
+        if _splade_options.batch_window_ms < 0.0:
+            raise ValueError("SPLADE_BATCH_WINDOW_MS must be non-negative")
+        if _splade_options.batch_max_size <= 0:
+            raise ValueError("SPLADE_BATCH_MAX_SIZE must be greater than 0")
 
         _logger.info(
             "SPLADE options loaded successfully.",
@@ -0,0 +1,46 @@
+import logging
+import os
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class WarmupOptions(BaseSettings):
+    """Settings for the startup warm-up of the cocktail catalog and search caches that gates readiness."""
+
+    model_config = SettingsConfigDict(
+        env_file=(".env", f".env.{os.environ.get('ENV')}"), env_file_encoding="utf-8", extra="allow"
+    )
+
+    enabled: bool = Field(default=True, validation_alias="WARMUP_ENABLED")
+    queries: str = Field(default="", validation_alias="WARMUP_QUERIES")
+    timeout_seconds: float = Field(default=120.0, validation_alias="WARMUP_TIMEOUT_SECONDS")
+
+
+_logger: logging.Logger = logging.getLogger("warmup_options")
+
+_warmup_options: WarmupOptions | None = None
+
+
+def get_warmup_options() -> WarmupOptions:
+    """Get the singleton instance of WarmupOptions.
+
+    Returns:
+        WarmupOptions: The warm-up options instance.
+    """
+    global _warmup_options
+    if _warmup_options is None:
+        _warmup_options = WarmupOptions()
+
+        if _warmup_options.timeout_seconds <= 0.0:
+            raise ValueError("WARMUP_TIMEOUT_SECONDS must be greater than 0")
+
+        _logger.info("Warm-up options loaded successfully.")
+
+    return _warmup_options
+
+
+def clear_warmup_options_cache() -> None:
+    """Clear the cached options instance. Useful for testing."""
+    global _warmup_options
+    _warmup_options = None
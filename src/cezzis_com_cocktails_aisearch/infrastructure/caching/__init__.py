@@ -0,0 +1,19 @@
+from cezzis_com_cocktails_aisearch.infrastructure.caching.cache_backend_factory import create_cache_backend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.decoded_model_cache import DecodedModelCache
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_cache_snapshot import EmbeddingCacheSnapshot
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_slab_cache import EmbeddingSlabCache
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.resp_cache_backend import RespCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
+
+__all__ = [
+    "DecodedModelCache",
+    "EmbeddingCacheSnapshot",
+    "EmbeddingSlabCache",
+    "ICacheBackend",
+    "InMemoryCacheBackend",
+    "RespCacheBackend",
+    "SearchResultCache",
+    "create_cache_backend",
+]
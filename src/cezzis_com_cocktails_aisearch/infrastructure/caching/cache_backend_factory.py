@@ -0,0 +1,25 @@
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.resp_cache_backend import RespCacheBackend
+
+
+def create_cache_backend(options: CacheOptions) -> ICacheBackend:
+    """Create the cache backend selected by ``CACHE_BACKEND``.
+
+    ``memory`` keeps a per-process LRU; ``redis`` shares one cache across every worker
+    and replica through a Redis-protocol server.
+    """
+    if options.backend == "redis":
+        return RespCacheBackend(
+            host=options.redis_host,
+            port=options.redis_port,
+            password=options.redis_password,
+            db=options.redis_db,
+            use_tls=options.redis_use_tls,
+            key_prefix=options.key_prefix,
+            pool_size=options.redis_pool_size,
+            timeout_seconds=options.redis_timeout_seconds,
+        )
+
+    return InMemoryCacheBackend(max_entries=options.memory_max_entries)
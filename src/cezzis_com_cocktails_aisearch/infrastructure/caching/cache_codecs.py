@@ -0,0 +1,45 @@
+"""Compact binary encodings for cached vectors.
+
+Dense vectors are stored as little-endian float32 (4 bytes per dimension, e.g. 3 KB
+for a 768-dim embedding) instead of pickled or JSON Python floats. Sparse vectors are
+stored as a uint32 count followed by the int32 indices and the float32 values.
+"""
+
+import struct
+
+import numpy as np
+
+_DENSE_DTYPE = np.dtype("<f4")
+_SPARSE_INDEX_DTYPE = np.dtype("<i4")
+_SPARSE_HEADER = struct.Struct("<I")
+
+
+def encode_dense(vector: list[float]) -> bytes:
+    """Encode a dense vector as float32 bytes."""
+    return np.asarray(vector, dtype=_DENSE_DTYPE).tobytes()
+
+
+def decode_dense(data: bytes) -> list[float]:
+    """Decode float32 bytes back into a dense vector."""
+    return np.frombuffer(data, dtype=_DENSE_DTYPE).tolist()
+
+
+def encode_sparse(indices: list[int], values: list[float]) -> bytes:
+    """Encode a sparse vector as a count header plus int32 indices and float32 values."""
+    if len(indices) != len(values):
+        raise ValueError("Sparse vector indices and values must have the same length")
+
+    return (
+        _SPARSE_HEADER.pack(len(indices))
+        + np.asarray(indices, dtype=_SPARSE_INDEX_DTYPE).tobytes()
+        + np.asarray(values, dtype=_DENSE_DTYPE).tobytes()
+    )
+
+
+def decode_sparse(data: bytes) -> tuple[list[int], list[float]]:
+    """Decode bytes produced by ``encode_sparse``."""
+    (count,) = _SPARSE_HEADER.unpack_from(data)
+    offset = _SPARSE_HEADER.size
+    indices = np.frombuffer(data, dtype=_SPARSE_INDEX_DTYPE, count=count, offset=offset)
+    values = np.frombuffer(data, dtype=_DENSE_DTYPE, count=count, offset=offset + count * _SPARSE_INDEX_DTYPE.itemsize)
+    return indices.tolist(), values.tolist()
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+
+
+class DecodedModelCache:
+    """Process-local LRU of validated ``CocktailSearchModel`` objects decoded from Qdrant payloads.
+
+    Every chunk point of a cocktail carries the same ``model`` JSON in its payload, and
+    every search returns mostly the same cocktails. Entries are keyed by cocktail id and
+    remember the exact JSON they were decoded from: a lookup only hits when the payload
+    is unchanged, so a re-embedded cocktail is decoded again and replaces its entry.
+    Cached models are shared and must not be mutated; callers take a ``model_copy``.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, CocktailSearchModel]] = OrderedDict()
+
+    def decode(self, cocktail_id: str, model_json: str) -> CocktailSearchModel:
+        """Return the validated model for ``model_json``, decoding it only if it is not cached yet."""
+        entry = self._entries.get(cocktail_id)
+        # Comparing the payload string is a length check plus a memcmp, far cheaper than validating it
+        if entry is not None and entry[0] == model_json:
+            self._entries.move_to_end(cocktail_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        model = CocktailSearchModel.model_validate_json(model_json)
+        self._entries[cocktail_id] = (model_json, model)
+        self._entries.move_to_end(cocktail_id)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return model
+
+    def __len__(self) -> int:
+        return len(self._entries)
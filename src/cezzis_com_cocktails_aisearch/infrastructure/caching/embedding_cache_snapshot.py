@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import mmap
+import os
+import struct
+
+from injector import inject
+
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions
+from cezzis_com_cocktails_aisearch.domain.config.hugging_face_options import HuggingFaceOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
+    ICocktailVectorSearchRepository,
+)
+
+# Key namespaces written by CocktailVectorSearchRepository for dense and SPLADE query vectors
+DENSE_KEY_PREFIX = "emb:"
+SNAPSHOT_KEY_PREFIXES = (DENSE_KEY_PREFIX, "splade:")
+
+_MAGIC = b"CZEMB"
+_VERSION = 1
+# magic, format version, model name length, entry count
+_HEADER = struct.Struct("<5sHHI")
+# key length, value length
+_ENTRY = struct.Struct("<HI")
+
+
+class EmbeddingCacheSnapshot:
+    """Saves the hot query-vector cache to a local file on shutdown and reloads it on startup.
+
+    The file is a flat binary layout read through ``mmap``: a header carrying a magic
+    marker, the format version and the embedding model name, then one length-prefixed
+    (key, value) record per cached vector, least recently used first so that reloading
+    preserves recency. A snapshot written by another model or format version is ignored.
+
+    Only the ``memory`` backend is snapshotted; a shared Redis-protocol backend already
+    survives restarts. Dense vectors then live only in the repository's in-process slab,
+    so they are read from and restored to the slab; SPLADE vectors go through the backend.
+    """
+
+    @inject
+    def __init__(
+        self,
+        cache_options: CacheOptions,
+        hugging_face_options: HuggingFaceOptions,
+        cache_backend: ICacheBackend,
+        cocktail_search_repository: ICocktailVectorSearchRepository,
+    ):
+        self.path = cache_options.embedding_cache_snapshot_path
+        self.ttl_seconds = cache_options.embedding_cache_ttl_seconds
+        self.model_name = hugging_face_options.inference_model
+        self.cache_backend = cache_backend
+        self.cocktail_search_repository = cocktail_search_repository
+        self.logger = logging.getLogger("embedding_cache_snapshot")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and isinstance(self.cache_backend, InMemoryCacheBackend)
+
+    async def save(self) -> int:
+        """Write the cached query vectors to the snapshot file; returns the number of entries saved."""
+        if not self.enabled:
+            return 0
+
+        assert isinstance(self.cache_backend, InMemoryCacheBackend)
+        entries = self.cache_backend.items(SNAPSHOT_KEY_PREFIXES)
+        entries += self.cocktail_search_repository.export_query_embeddings()
+        try:
+            await asyncio.to_thread(write_snapshot, self.path, self.model_name, entries)
+        except OSError as e:
+            self.logger.warning("Failed to save embedding cache snapshot", extra={"error": str(e), "path": self.path})
+            return 0
+
+        self.logger.info("Embedding cache snapshot saved", extra={"entries": len(entries), "path": self.path})
+        return len(entries)
+
+    async def load(self) -> int:
+        """Load a snapshot written for the current model into the cache; returns the number of entries loaded."""
+        if not self.enabled or not os.path.exists(self.path):
+            return 0
+
+        try:
+            entries = await asyncio.to_thread(read_snapshot, self.path, self.model_name)
+        except (OSError, ValueError, struct.error) as e:
+            self.logger.warning(
+                "Ignoring unreadable embedding cache snapshot", extra={"error": str(e), "path": self.path}
+            )
+            return 0
+
+        dense = [(key, value) for key, value in entries if key.startswith(DENSE_KEY_PREFIX)]
+        backend_entries = [(key, value) for key, value in entries if not key.startswith(DENSE_KEY_PREFIX)]
+        if not self.cocktail_search_repository.import_query_embeddings(dense):
+            backend_entries = entries
+
+        for key, value in backend_entries:
+            await self.cache_backend.set(key, value, self.ttl_seconds)
+
+        self.logger.info("Embedding cache snapshot loaded", extra={"entries": len(entries), "path": self.path})
+        return len(entries)
+
+
+def write_snapshot(path: str, model_name: str, entries: list[tuple[str, bytes]]) -> None:
+    """Write ``entries`` to ``path`` atomically (temporary file plus rename)."""
+    model = model_name.encode()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(model), len(entries)))
+        f.write(model)
+        for key, value in entries:
+            encoded_key = key.encode()
+            f.write(_ENTRY.pack(len(encoded_key), len(value)))
+            f.write(encoded_key)
+            f.write(value)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str, model_name: str) -> list[tuple[str, bytes]]:
+    """Read a snapshot, returning no entries when it was written for another model or format version."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise ValueError("Snapshot file is truncated")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, version, model_length, count = _HEADER.unpack_from(view)
+            if magic != _MAGIC:
+                raise ValueError("Not an embedding cache snapshot")
+
+            offset = _HEADER.size
+            model = view[offset : offset + model_length].decode()
+            if version != _VERSION or model != model_name:
+                return []
+
+            offset += model_length
+            entries: list[tuple[str, bytes]] = []
+            for _ in range(count):
+                key_length, value_length = _ENTRY.unpack_from(view, offset)
+                offset += _ENTRY.size
+                key = view[offset : offset + key_length].decode()
+                offset += key_length
+                value = view[offset : offset + value_length]
+                if len(value) != value_length:
+                    raise ValueError("Snapshot file is truncated")
+                offset += value_length
+                entries.append((key, value))
+
+            return entries
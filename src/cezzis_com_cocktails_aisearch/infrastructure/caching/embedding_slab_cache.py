@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EmbeddingSlabCache:
+    """Process-local LRU of dense embeddings stored in one preallocated float32 slab.
+
+    Each cached vector occupies a row of a ``(capacity, dimensions)`` float32 array
+    (about 3 KB for a 768-dim embedding, versus roughly 24 KB as a list of Python
+    floats); an ordered key -> row map provides the LRU order and evicted rows are
+    reused in place. The slab is allocated on the first ``put``, once the embedding
+    dimension is known. Vectors of any other dimension are not cached.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._slab: np.ndarray | None = None
+        self._rows: OrderedDict[str, int] = OrderedDict()
+        self._free_rows: list[int] = []
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the cached vector for ``key``.
+
+        The result is a view into the slab that stays valid only until the next ``put``;
+        convert it (e.g. ``tolist()``) before yielding to other tasks.
+        """
+        row = self._rows.get(key)
+        if row is None or self._slab is None:
+            return None
+
+        self._rows.move_to_end(key)
+        return self._slab[row]
+
+    def put(self, key: str, vector: list[float]) -> bool:
+        """Cache ``vector`` under ``key``, evicting the least recently used entry if full."""
+        if self._slab is None:
+            self._slab = np.empty((self.capacity, len(vector)), dtype=np.float32)
+            self._free_rows = list(range(self.capacity - 1, -1, -1))
+        elif len(vector) != self._slab.shape[1]:
+            return False
+
+        row = self._rows.get(key)
+        if row is None:
+            row = self._free_rows.pop() if self._free_rows else self._rows.popitem(last=False)[1]
+        self._rows[key] = row
+        self._rows.move_to_end(key)
+        self._slab[row] = vector
+        return True
+
+    def items(self) -> list[tuple[str, np.ndarray]]:
+        """Return a copy of every cached vector, least recently used first."""
+        if self._slab is None:
+            return []
+        return [(key, self._slab[row].copy()) for key, row in self._rows.items()]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the slab (zero until the first vector is cached)."""
+        return 0 if self._slab is None else self._slab.nbytes
+
+    def __len__(self) -> int:
+        return len(self._rows)
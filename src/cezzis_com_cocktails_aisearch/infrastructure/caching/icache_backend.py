@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+
+class ICacheBackend(ABC):
+    """Byte-oriented key/value cache shared by the embedding and search result caches.
+
+    Implementations must never raise for cache failures: a backend that cannot be
+    reached behaves like an empty cache so that search keeps working without it.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value stored under ``key``, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl_seconds`` when given."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        pass
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with ``prefix`` and return how many were removed."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release any connections held by the backend."""
+        pass
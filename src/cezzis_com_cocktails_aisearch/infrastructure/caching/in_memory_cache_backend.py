@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """Process-local LRU cache with per-entry TTL.
+
+    Holds at most ``max_entries`` values; the least recently used entry is evicted
+    first. Expired entries are dropped lazily when read.
+    """
+
+    def __init__(self, max_entries: int):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def items(self, prefixes: tuple[str, ...]) -> list[tuple[str, bytes]]:
+        """Return the live entries whose keys start with one of ``prefixes``, least recently used first."""
+        now = time.monotonic()
+        return [
+            (key, value)
+            for key, (expires_at, value) in self._entries.items()
+            if key.startswith(prefixes) and (expires_at is None or expires_at > now)
+        ]
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import ssl
+import time
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+
+
+class RespError(Exception):
+    """Error reply returned by a Redis-protocol server."""
+
+
+class _RespConnection:
+    """A single RESP2 connection speaking the handful of commands the cache needs."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: str | bytes | int) -> object:
+        self.writer.write(self._encode_command(args))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    @staticmethod
+    def _encode_command(args: tuple[str | bytes | int, ...]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> object:
+        line = await self.reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RespError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+
+        raise RespError(f"Unexpected RESP reply type: {kind!r}")
+
+
+class RespCacheBackend(ICacheBackend):
+    """Cache backend for any Redis-protocol (RESP2) server such as Redis, Valkey or Garnet.
+
+    Talks to the server directly over asyncio streams with a small connection pool, so no
+    client library is required. Every key is namespaced with ``key_prefix`` so several
+    services can share one server. Any connection or protocol error is logged and treated
+    as a cache miss; the broken connection is discarded and a fresh one is opened on the
+    next call. Connecting, ``AUTH``/``SELECT`` and the command share one deadline, and a
+    failed connect opens the circuit for ``_RETRY_AFTER_SECONDS``: calls in that window
+    skip the server and count as misses, so an outage does not cost every search a timeout.
+    """
+
+    _SCAN_COUNT = 500
+    _RETRY_AFTER_SECONDS = 5.0
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 6379,
+        password: str = "",
+        db: int = 0,
+        use_tls: bool = False,
+        key_prefix: str = "",
+        pool_size: int = 8,
+        timeout_seconds: float = 1.0,
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.db = db
+        self.use_tls = use_tls
+        self.key_prefix = key_prefix
+        self.timeout_seconds = timeout_seconds
+        self._idle: asyncio.Queue[_RespConnection] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(pool_size)
+        self._retry_at = 0.0
+        self.logger = logging.getLogger("resp_cache_backend")
+
+    async def get(self, key: str) -> bytes | None:
+        reply = await self._execute("GET", self.key_prefix + key)
+        return reply if isinstance(reply, bytes) else None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None) -> None:
+        if ttl_seconds:
+            await self._execute("SET", self.key_prefix + key, value, "PX", max(int(ttl_seconds * 1000), 1))
+        else:
+            await self._execute("SET", self.key_prefix + key, value)
+
+    async def delete(self, key: str) -> None:
+        await self._execute("DEL", self.key_prefix + key)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        pattern = self._escape_glob(self.key_prefix + prefix) + "*"
+        removed = 0
+        cursor = b"0"
+        while True:
+            reply = await self._execute("SCAN", cursor, "MATCH", pattern, "COUNT", self._SCAN_COUNT)
+            if not isinstance(reply, list):
+                return removed
+
+            cursor, keys = reply
+            if keys:
+                deleted = await self._execute("DEL", *keys)
+                removed += deleted if isinstance(deleted, int) else 0
+            if cursor == b"0":
+                return removed
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+    async def _execute(self, *args: str | bytes | int) -> object:
+        async with self._slots:
+            # A recent connect failure holds the circuit open; don't wait on a server that is down
+            if time.monotonic() < self._retry_at:
+                return None
+
+            connection: _RespConnection | None = None
+            connecting = False
+            try:
+                async with asyncio.timeout(self.timeout_seconds):
+                    if self._idle.empty():
+                        connecting = True
+                        connection = await self._connect()
+                        connecting = False
+                    else:
+                        connection = self._idle.get_nowait()
+                    reply = await connection.execute(*args)
+                self._idle.put_nowait(connection)
+                return reply
+            except BaseException as exc:
+                # The connection may hold a half-read reply, so never reuse it after a failure or cancellation
+                if connection is not None:
+                    connection.close()
+                if not isinstance(exc, Exception):
+                    raise
+                if connecting:
+                    self._retry_at = time.monotonic() + self._RETRY_AFTER_SECONDS
+                    self.logger.warning(
+                        "Cache backend unreachable, skipping it for %.0f seconds",
+                        self._RETRY_AFTER_SECONDS,
+                        extra={"command": args[0]},
+                        exc_info=True,
+                    )
+                else:
+                    self.logger.warning("Cache backend command failed", extra={"command": args[0]}, exc_info=True)
+                return None
+
+    async def _connect(self) -> _RespConnection:
+        ssl_context = ssl.create_default_context() if self.use_tls else None
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+        connection = _RespConnection(reader, writer)
+        try:
+            if self.password:
+                await connection.execute("AUTH", self.password)
+            if self.db:
+                await connection.execute("SELECT", self.db)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    @staticmethod
+    def _escape_glob(value: str) -> str:
+        return "".join("\\" + char if char in "*?[]\\" else char for char in value)
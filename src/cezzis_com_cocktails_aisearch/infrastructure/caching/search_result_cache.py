@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+from typing import Any
+
+from injector import inject
+from opentelemetry import metrics
+
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+
+# A ranked search result: cocktail id plus the serialised statistics it was ranked with
+RankedResult = tuple[str, dict[str, Any]]
+
+_meter = metrics.get_meter("search_result_cache")
+
+_cache_hits = _meter.create_counter(
+    "search_result_cache.hits",
+    unit="{request}",
+    description="Free text searches answered from the search result cache",
+)
+_cache_misses = _meter.create_counter(
+    "search_result_cache.misses",
+    unit="{request}",
+    description="Free text searches that ran the full search pipeline",
+)
+
+
+class SearchResultCache:
+    """TTL cache of final ranked free text search results, stored in the shared cache backend.
+
+    Entries hold only the ranked cocktail ids and their search statistics; callers
+    hydrate the full models from the in-memory catalog. Keys include the fingerprint of
+    the query dictionaries, so a dictionary reload on any replica stops serving rankings
+    built from the old synonyms and filters. ``invalidate`` drops every
+    entry and bumps ``generation`` so that a search which started before the
+    invalidation cannot write its (possibly stale) result back afterwards.
+    """
+
+    _KEY_NAMESPACE = "search:"
+
+    @inject
+    def __init__(self, cache_options: CacheOptions, cache_backend: ICacheBackend):
+        self.enabled = cache_options.search_result_cache_enabled
+        self.ttl_seconds = cache_options.search_result_cache_ttl_seconds
+        self.cache_backend = cache_backend
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger("search_result_cache")
+
+    @staticmethod
+    def make_key(
+        free_text: str | None,
+        filters: list[str] | None,
+        matches: list[str] | None,
+        match_exclusive: bool | None,
+        skip: int | None,
+        take: int | None,
+        dictionary_fingerprint: str = "",
+    ) -> str:
+        """Build a cache key from the normalised query text, the request parameters and the dictionary content."""
+        text = " ".join((free_text or "").lower().split())
+        filter_part = ",".join(sorted({f.strip().lower() for f in filters or [] if f and f.strip()}))
+        match_part = ",".join(sorted(set(matches or [])))
+        return f"{text}|f={filter_part}|m={match_part}|mx={bool(match_exclusive)}|s={skip or 0}|t={take or 10}|d={dictionary_fingerprint}"
+
+    async def get(self, key: str) -> list[RankedResult] | None:
+        """Return the cached ranked results for ``key``, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+
+        data = await self.cache_backend.get(self._backend_key(key))
+        if data is None:
+            self.misses += 1
+            _cache_misses.add(1)
+            return None
+
+        self.hits += 1
+        _cache_hits.add(1)
+        return [(cocktail_id, statistics) for cocktail_id, statistics in json.loads(data)]
+
+    async def set(self, key: str, results: list[RankedResult], generation: int) -> None:
+        """Store ranked results computed under ``generation``; ignored if the cache was invalidated since."""
+        if not self.enabled or generation != self.generation:
+            return
+
+        data = json.dumps(results, separators=(",", ":")).encode()
+        await self.cache_backend.set(self._backend_key(key), data, self.ttl_seconds)
+
+    async def invalidate(self) -> None:
+        """Drop every cached result, e.g. after the catalog changed."""
+        self.generation += 1
+        evicted = await self.cache_backend.delete_prefix(self._KEY_NAMESPACE)
+        if evicted:
+            self.logger.info("Search result cache invalidated", extra={"evicted_entries": evicted})
+
+    def _backend_key(self, key: str) -> str:
+        # Hash so arbitrarily long free text still yields a short, fixed-size backend key
+        return self._KEY_NAMESPACE + hashlib.sha256(key.encode()).hexdigest()
@@ -0,0 +1,4 @@
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.micro_batcher import MicroBatcher
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.single_flight import SingleFlight
+
+__all__ = ["MicroBatcher", "SingleFlight"]
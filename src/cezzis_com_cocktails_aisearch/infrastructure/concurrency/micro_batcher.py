@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+_TItem = TypeVar("_TItem", bound=Hashable)
+_TResult = TypeVar("_TResult")
+
+
+class MicroBatcher(Generic[_TItem, _TResult]):
+    """Coalesces concurrent single-item requests into one batched call.
+
+    The first ``submit`` opens a batch window; every ``submit`` that arrives before the
+    window closes (or until ``max_batch_size`` items are pending) joins the same batch.
+    The batch function is then invoked once with all pending items and each caller
+    receives the result at its own position. If the batch function raises, every caller
+    in that batch sees the same exception.
+
+    With ``dedupe`` enabled, a ``submit`` for an item that is already pending or in
+    flight waits on the existing request instead of adding a duplicate to the batch.
+    ``on_batch`` is called for every dispatched batch with its size and the time each
+    item spent queued, which callers use to record metrics.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[_TItem]], Awaitable[list[_TResult]]],
+        window_seconds: float,
+        max_batch_size: int,
+        dedupe: bool = False,
+        on_batch: Callable[[int, list[float]], None] | None = None,
+    ):
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be greater than 0")
+
+        self._batch_fn = batch_fn
+        self._window_seconds = max(window_seconds, 0.0)
+        self._max_batch_size = max_batch_size
+        self._dedupe = dedupe
+        self._on_batch = on_batch
+        self._pending: list[tuple[_TItem, asyncio.Future[_TResult], float]] = []
+        self._in_flight: dict[_TItem, asyncio.Future[_TResult]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: _TItem) -> _TResult:
+        """Queue an item for the next batch and wait for its result."""
+        if self._dedupe and item in self._in_flight:
+            # Shield so one cancelled waiter does not cancel the shared request for the others
+            return await asyncio.shield(self._in_flight[item])
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_TResult] = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+
+        if self._dedupe:
+            self._in_flight[item] = future
+            future.add_done_callback(lambda done: self._forget(item, done))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._flush)
+
+        if self._dedupe:
+            return await asyncio.shield(future)
+        return await future
+
+    def _forget(self, item: _TItem, future: asyncio.Future[_TResult]) -> None:
+        if self._in_flight.get(item) is future:
+            del self._in_flight[item]
+        # Mark the exception as retrieved in case every shielded waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        if self._on_batch is not None:
+            dispatched_at = time.perf_counter()
+            self._on_batch(len(batch), [dispatched_at - queued_at for _, _, queued_at in batch])
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[_TItem, asyncio.Future[_TResult], float]]) -> None:
+        try:
+            results = await self._batch_fn([item for item, _, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(batch)} items")
+        except asyncio.CancelledError:
+            for _, future, _ in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,39 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+_TKey = TypeVar("_TKey", bound=Hashable)
+_TResult = TypeVar("_TResult")
+
+
+class SingleFlight(Generic[_TKey, _TResult]):
+    """Collapses concurrent calls for the same key into a single in-flight operation.
+
+    The first caller for a key starts the operation as a task; callers that arrive while
+    it is still running await that same task instead of starting their own. Once the task
+    finishes the key is released, so the next call starts a fresh operation. Waiters are
+    shielded from one another: cancelling one caller does not cancel the shared task.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[_TKey, asyncio.Task[_TResult]] = {}
+
+    async def do(self, key: _TKey, fn: Callable[[], Awaitable[_TResult]]) -> _TResult:
+        """Run ``fn`` for ``key`` unless a call for the same key is already in flight."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task)
+
+    def in_flight_count(self) -> int:
+        """Return the number of keys with an operation currently running."""
+        return len(self._in_flight)
+
+    def _forget(self, key: _TKey, task: asyncio.Task[_TResult]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every shielded waiter was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -1,4 +1,5 @@
 import logging
+import time
 
 from injector import inject
 from langchain_huggingface import HuggingFaceEndpointEmbeddings
@@ -91,6 +92,10 @@ class CocktailVectorEmbeddingRepository(ICocktailVectorEmbeddingRepository):
         # Generate sparse embeddings for all chunks via SPLADE
         sparse_vectors = await self.splade_service.encode_batch(texts)
 
+        # Lets search replicas fold this cocktail into their cached catalogs without a full reload. Taken
+        # after inference so the refresh overlap only has to cover clock skew, not encoding time
+        indexed_at = time.time()
+
         # Build PointStruct list with named vectors (dense + sparse)
         points: list[PointStruct] = []
         for i, chunk in enumerate(chunks):
@@ -99,6 +104,7 @@ class CocktailVectorEmbeddingRepository(ICocktailVectorEmbeddingRepository):
                 "category": chunk.category,
                 "description": chunk.content,
                 "model": cocktail_model.model_dump_json(),
+                "indexed_at": indexed_at,
                 "title": cocktail_model.title.lower(),
                 "is_iba": cocktail_model.is_iba,
                 "serves": cocktail_model.serves,
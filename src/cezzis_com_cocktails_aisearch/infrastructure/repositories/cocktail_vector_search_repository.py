@@ -1,20 +1,32 @@
 import asyncio
+import hashlib
 import logging
-import math
-from collections import OrderedDict
+import time
+import uuid
+from typing import Awaitable, TypeVar
 
+import numpy as np
 from injector import inject
 from langchain_huggingface import HuggingFaceEndpointEmbeddings
-from qdrant_client import QdrantClient
+from opentelemetry import metrics, trace
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import (
+    FieldCondition,
     Filter,
     Fusion,
     FusionQuery,
+    GroupsResult,
+    PayloadSelectorInclude,
     Prefetch,
     QueryResponse,
+    Range,
+    ScoredPoint,
     SparseVector,
 )
 
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_search_statistics import (
     CocktailSearchStatistics,
@@ -22,27 +34,85 @@ from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.c
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_vector_search_result import (
     CocktailVectorSearchResult,
 )
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import CacheOptions
 from cezzis_com_cocktails_aisearch.domain.config.hugging_face_options import HuggingFaceOptions
 from cezzis_com_cocktails_aisearch.domain.config.qdrant_options import QdrantOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.cache_codecs import (
+    decode_dense,
+    decode_sparse,
+    encode_dense,
+    encode_sparse,
+)
+from cezzis_com_cocktails_aisearch.infrastructure.caching.decoded_model_cache import DecodedModelCache
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_slab_cache import EmbeddingSlabCache
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.micro_batcher import MicroBatcher
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.single_flight import SingleFlight
 from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
     ICocktailVectorSearchRepository,
 )
 from cezzis_com_cocktails_aisearch.infrastructure.services.isplade_service import ISpladeService
 
+_T = TypeVar("_T")
+
+_tracer = trace.get_tracer("cocktail_vector_search_repository")
+_meter = metrics.get_meter("cocktail_vector_search_repository")
+
+# Payload fields a search hit needs when the cocktail model itself comes from the in-memory catalog
+_HIT_PAYLOAD_FIELDS = ["metadata.cocktail_id", "metadata.keywords_search_terms"]
+_MODEL_PAYLOAD_FIELDS = ["metadata.cocktail_id", "metadata.model"]
+
+# Payload fields the catalog scroll reads from every chunk; descriptions, keywords and models stay on the server
+_CATALOG_SCAN_FIELDS = ["metadata.cocktail_id", "metadata.indexed_at"]
+
+# Payload key chunk points are grouped by when grouped search is enabled
+_GROUP_BY_FIELD = "metadata.cocktail_id"
+
+# Catalog refreshes re-read this much history before the watermark, so writes from
+# replicas with slightly skewed clocks are not skipped
+_CATALOG_WATERMARK_OVERLAP_SECONDS = 60.0
+
+
+def _point_id_order(point_id: int | str) -> tuple[int, int]:
+    """Sort key matching Qdrant's point id order: integer ids first, then UUIDs by their 128-bit value."""
+    if isinstance(point_id, int):
+        return (0, point_id)
+    return (1, uuid.UUID(str(point_id)).int)
+
+
+_embedding_batch_size = _meter.create_histogram(
+    "dense_embedding.batch_size",
+    unit="{text}",
+    description="Number of distinct query texts sent in one coalesced dense embedding request",
+)
+_embedding_queue_delay = _meter.create_histogram(
+    "dense_embedding.queue_delay",
+    unit="ms",
+    description="Time a query text waited in the batch window before its embedding request was sent",
+)
+
 
 class CocktailVectorSearchRepository(ICocktailVectorSearchRepository):
     @inject
     def __init__(
         self,
         hugging_face_options: HuggingFaceOptions,
-        qdrant_client: QdrantClient,
+        qdrant_client: AsyncQdrantClient,
         qdrant_options: QdrantOptions,
         splade_service: ISpladeService,
+        cache_backend: ICacheBackend,
+        cache_options: CacheOptions,
+        search_result_cache: SearchResultCache,
     ):
         self.hugging_face_options = hugging_face_options
         self.qdrant_client = qdrant_client
         self.qdrant_options = qdrant_options
         self.splade_service = splade_service
+        self.cache_backend = cache_backend
+        self.cache_options = cache_options
+        self.search_result_cache = search_result_cache
         self._embeddings = HuggingFaceEndpointEmbeddings(
             model=self.hugging_face_options.inference_model,
             huggingfacehub_api_token=self.hugging_face_options.api_token,
@@ -50,127 +120,348 @@ class CocktailVectorSearchRepository(ICocktailVectorSearchRepository):
         )
         self.logger = logging.getLogger("cocktail_vector_search_repository")
         self._cocktails_cache: list[CocktailSearchModel] | None = None
+        self._catalog_index: CocktailCatalogIndex | None = None
+        # Latest metadata.indexed_at folded into the cached catalog
+        self._catalog_watermark = 0.0
+        # Monotonic time after which the next refresh also scans for cocktails removed from the collection
+        self._next_removal_scan = 0.0
         self._cache_lock = asyncio.Lock()
-        self._embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
-        self._embedding_cache_max_size: int = 1024
+        # Payload model JSON is validated once per cocktail version, not once per search hit
+        self._decoded_models = DecodedModelCache(self.cache_options.decoded_model_cache_max_entries)
+        # Hot embeddings stay in-process as float32 rows, in front of the (possibly remote) cache backend
+        self._embedding_slab: EmbeddingSlabCache | None = None
+        if self.hugging_face_options.embedding_cache_max_entries > 0:
+            self._embedding_slab = EmbeddingSlabCache(self.hugging_face_options.embedding_cache_max_entries)
+        # Next to the in-process backend the slab is the only dense tier, so a vector is not held twice;
+        # a shared backend still gets every vector so other replicas and restarts can reuse it
+        self._dense_in_backend = self._embedding_slab is None or not isinstance(cache_backend, InMemoryCacheBackend)
+        self._embedding_flight: SingleFlight[str, list[float]] = SingleFlight()
+        self._embedding_batcher: MicroBatcher[str, list[float]] | None = None
+        if self.hugging_face_options.batch_window_ms > 0:
+            # Concurrent cache misses share one aembed_documents call; identical texts share one slot
+            self._embedding_batcher = MicroBatcher(
+                self._embed_documents,
+                window_seconds=self.hugging_face_options.batch_window_ms / 1000.0,
+                max_batch_size=self.hugging_face_options.batch_max_size,
+                dedupe=True,
+                on_batch=self._record_embedding_batch,
+            )
+
+    async def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self._embeddings.aembed_documents(texts)
+
+    @staticmethod
+    def _record_embedding_batch(batch_size: int, queue_delays: list[float]) -> None:
+        _embedding_batch_size.record(batch_size)
+        for delay in queue_delays:
+            _embedding_queue_delay.record(delay * 1000)
+
+    def _cache_key(self, namespace: str, cache_key: str) -> str:
+        """Build a fixed-length backend key scoped to the dense model, so a model change never serves stale vectors."""
+        digest = hashlib.sha256(f"{self.hugging_face_options.inference_model}\0{cache_key}".encode()).hexdigest()
+        return f"{namespace}:{digest}"
 
     async def _get_cached_embedding(self, text: str) -> list[float]:
         """Get embedding from cache or generate and cache it."""
         cache_key = text.strip().lower()
-        if cache_key in self._embedding_cache:
-            # Move to end (most recently used)
-            self._embedding_cache.move_to_end(cache_key)
-            self.logger.debug(f"Embedding cache hit for: {cache_key[:50]}")
-            return self._embedding_cache[cache_key]
+        backend_key = self._cache_key("emb", cache_key)
+        if self._embedding_slab is not None:
+            row = self._embedding_slab.get(backend_key)
+            if row is not None:
+                self.logger.debug(f"Embedding cache hit for: {cache_key[:50]}")
+                # The row is a view into the slab; convert to the Qdrant client's list format right away
+                return row.tolist()
+
+        if self._dense_in_backend:
+            cached = await self.cache_backend.get(backend_key)
+            if cached is not None:
+                self.logger.debug(f"Embedding cache hit for: {cache_key[:50]}")
+                embedding = decode_dense(cached)
+                if self._embedding_slab is not None:
+                    self._embedding_slab.put(backend_key, embedding)
+                return embedding
+
+        # Concurrent misses for the same key wait on the first caller's request
+        return await self._embedding_flight.do(cache_key, lambda: self._embed_and_cache(backend_key, text))
+
+    async def _embed_and_cache(self, backend_key: str, text: str) -> list[float]:
+        if self._embedding_batcher is not None:
+            embedding = await self._embedding_batcher.submit(text)
+        else:
+            embedding = await self._embeddings.aembed_query(text)
+
+        if embedding:
+            if self._embedding_slab is not None:
+                self._embedding_slab.put(backend_key, embedding)
+            if self._dense_in_backend:
+                await self.cache_backend.set(
+                    backend_key, encode_dense(embedding), self.cache_options.embedding_cache_ttl_seconds
+                )
+        return embedding
 
-        embedding = await self._embeddings.aembed_query(text)
+    def export_query_embeddings(self) -> list[tuple[str, bytes]]:
+        if self._dense_in_backend or self._embedding_slab is None:
+            return []
+        return [(key, encode_dense(row)) for key, row in self._embedding_slab.items()]
+
+    def import_query_embeddings(self, entries: list[tuple[str, bytes]]) -> bool:
+        if self._dense_in_backend or self._embedding_slab is None:
+            return False
+        for key, value in entries:
+            self._embedding_slab.put(key, decode_dense(value))
+        return True
+
+    async def _get_cached_sparse_vector(self, text: str) -> tuple[list[int], list[float]]:
+        """Get the SPLADE sparse vector from cache or encode and cache it."""
+        backend_key = self._cache_key("splade", text.strip().lower())
+        cached = await self.cache_backend.get(backend_key)
+        if cached is not None:
+            return decode_sparse(cached)
+
+        indices, values = await self.splade_service.encode(text)
+
+        # An empty vector means SPLADE failed or was unavailable; don't cache the degradation
+        if indices:
+            await self.cache_backend.set(
+                backend_key, encode_sparse(indices, values), self.cache_options.embedding_cache_ttl_seconds
+            )
+        return indices, values
 
-        # Evict oldest entry if cache is full
-        if len(self._embedding_cache) >= self._embedding_cache_max_size:
-            self._embedding_cache.popitem(last=False)
+    async def search_vectors(self, free_text: str, query_filter: Filter | None = None) -> list[CocktailSearchModel]:
+        text = free_text or ""
+        timings: dict[str, float] = {}
+
+        # The dense embedding and the SPLADE encoding are independent model calls,
+        # so start both together and only pay for the slower of the two
+        encoding_start = time.perf_counter()
+        dense_result, sparse_result = await asyncio.gather(
+            self._timed("dense_embedding", self._get_cached_embedding(text), timings),
+            self._timed("splade_encoding", self._get_cached_sparse_vector(text), timings),
+            return_exceptions=True,
+        )
+        timings["encoding_wall_ms"] = (time.perf_counter() - encoding_start) * 1000
 
-        self._embedding_cache[cache_key] = embedding
-        return embedding
+        if isinstance(dense_result, BaseException):
+            raise dense_result
 
-    async def search_vectors(self, free_text: str, query_filter: Filter | None = None) -> list[CocktailSearchModel]:
-        query_vector = await self._get_cached_embedding(free_text or "")
+        query_vector = dense_result
 
         if len(query_vector) == 0:
             raise ValueError("Failed to generate embeddings for the provided text")
 
-        # Always use hybrid search (dense + sparse via RRF)
-        search_results = await self._hybrid_search(free_text or "", query_vector, query_filter)
+        if isinstance(sparse_result, BaseException):
+            self.logger.warning("SPLADE encoding failed during hybrid search, falling back to dense-only")
+            sparse_vector: tuple[list[int], list[float]] = ([], [])
+        else:
+            sparse_vector = sparse_result
 
-        cocktails: list[CocktailSearchModel] = []
+        # Always use hybrid search (dense + sparse via RRF) when a sparse vector is available
+        search_results = await self._timed(
+            "qdrant_query", self._hybrid_search(query_vector, sparse_vector, query_filter), timings
+        )
 
         # Sort points by score descending
-        sorted_points = sorted(search_results.points, key=lambda p: getattr(p, "score", 0), reverse=True)
-        seen_ids = set()
-
-        for point in sorted_points:
-            payload = point.payload if hasattr(point, "payload") else None
-            if payload:
-                metadata = payload.get("metadata")
-                if metadata:
-                    id = metadata.get("cocktail_id")
-                    score = getattr(point, "score", 0)
-                    if id and id not in seen_ids:
-                        cocktailModel: CocktailSearchModel = CocktailSearchModel.model_validate_json(
-                            metadata.get("model")
-                        )
-                        cocktailModel.keywords_search_terms = metadata.get("keywords_search_terms", [])
-                        cocktailModel.search_statistics = CocktailSearchStatistics(
-                            total_score=score,
-                            max_score=score,
-                            avg_score=score,
-                            weighted_score=score,
-                            reranker_score=0.0,
-                            hit_count=1,
-                            hit_results=[CocktailVectorSearchResult(score=score)],
-                        )
-                        cocktails.append(cocktailModel)
-                        seen_ids.add(id)
-                    elif id:
-                        # Update existing cocktail's search statistics if duplicate ID found
-                        for existing_cocktail in cocktails:
-                            if existing_cocktail.id == id:
-                                if existing_cocktail.search_statistics is None:
-                                    existing_cocktail.search_statistics = CocktailSearchStatistics(
-                                        total_score=0.0,
-                                        max_score=0.0,
-                                        avg_score=0.0,
-                                        weighted_score=0.0,
-                                        reranker_score=0.0,
-                                        hit_count=0,
-                                        hit_results=[],
-                                    )
-                                stats = existing_cocktail.search_statistics
-                                stats.total_score += score
-                                stats.max_score = max(stats.max_score, score)
-                                stats.hit_count += 1
-                                stats.hit_results.append(CocktailVectorSearchResult(score=score))
-                                break
-
-        # Calculate final weighted scores for all cocktails
-        self._calculate_weighted_scores(cocktails)
+        sorted_points = sorted(self._result_points(search_results), key=lambda p: getattr(p, "score", 0), reverse=True)
+        hit_models = await self._timed("hydration", self._load_hit_models(sorted_points), timings)
+
+        aggregation_start = time.perf_counter()
+        cocktails = self._aggregate_hits(sorted_points, hit_models)
+        timings["aggregation_ms"] = (time.perf_counter() - aggregation_start) * 1000
+
+        self.logger.info(
+            "Vector search stage timings",
+            extra={**{name: round(value, 2) for name, value in timings.items()}, "result_count": len(cocktails)},
+        )
 
         return cocktails
 
-    def _dense_only_search(self, query_vector: list[float], query_filter: Filter | None) -> QueryResponse:
+    def _aggregate_hits(
+        self, points: list[ScoredPoint], hit_models: dict[str, CocktailSearchModel]
+    ) -> list[CocktailSearchModel]:
+        """Group chunk hits by cocktail and compute each cocktail's search statistics.
+
+        One pass over the hits assigns every cocktail a slot through a dict keyed by
+        cocktail id (cocktails keep the order of their first hit); sums, maxima, counts
+        and weighted scores are then computed over the flat score array with numpy, so
+        aggregation stays linear in the number of hits.
+        """
+        slots: dict[str, int] = {}
+        slot_models: list[CocktailSearchModel] = []
+        slot_search_terms: list[list[str]] = []
+        slot_scores: list[list[float]] = []
+        hit_slots: list[int] = []
+        hit_scores: list[float] = []
+
+        for point in points:
+            metadata = (getattr(point, "payload", None) or {}).get("metadata")
+            cocktail_id = metadata.get("cocktail_id") if metadata else None
+            hit_model = hit_models.get(cocktail_id) if cocktail_id else None
+            if hit_model is None:
+                continue
+
+            score = float(getattr(point, "score", 0))
+            slot = slots.get(cocktail_id)
+            if slot is None:
+                slot = slots[cocktail_id] = len(slot_models)
+                slot_models.append(hit_model)
+                slot_search_terms.append(metadata.get("keywords_search_terms", []))
+                slot_scores.append([])
+            slot_scores[slot].append(score)
+            hit_slots.append(slot)
+            hit_scores.append(score)
+
+        if not slot_models:
+            return []
+
+        slot_index = np.asarray(hit_slots, dtype=np.intp)
+        scores = np.asarray(hit_scores, dtype=np.float64)
+        hit_counts = np.bincount(slot_index, minlength=len(slot_models))
+        total_scores = np.bincount(slot_index, weights=scores, minlength=len(slot_models))
+        max_scores = np.full(len(slot_models), -np.inf)
+        np.maximum.at(max_scores, slot_index, scores)
+        avg_scores = total_scores / hit_counts
+        weighted_scores = self._calculate_weighted_scores(max_scores, avg_scores, hit_counts)
+
+        # Shallow copies of the shared models with this request's own search state
+        return [
+            hit_model.model_copy(
+                update={
+                    "keywords_search_terms": slot_search_terms[slot],
+                    "search_statistics": CocktailSearchStatistics(
+                        total_score=float(total_scores[slot]),
+                        max_score=float(max_scores[slot]),
+                        avg_score=float(avg_scores[slot]),
+                        weighted_score=float(weighted_scores[slot]),
+                        reranker_score=0.0,
+                        hit_count=int(hit_counts[slot]),
+                        hit_results=[CocktailVectorSearchResult(score=score) for score in slot_scores[slot]],
+                    ),
+                }
+            )
+            for slot, hit_model in enumerate(slot_models)
+        ]
+
+    async def _load_hit_models(self, points: list[ScoredPoint]) -> dict[str, CocktailSearchModel]:
+        """Resolve the shared cocktail model for every cocktail id among the search hits.
+
+        With full payloads the model JSON comes with each hit. When hits carry only the
+        cocktail id, models come from the in-memory catalog, and any cocktail the catalog
+        does not hold yet (e.g. embedded after it was loaded) is fetched in one retrieve call.
+        """
+        models: dict[str, CocktailSearchModel] = {}
+        unresolved: dict[str, int | str] = {}
+        catalog = await self.get_catalog_index() if self.qdrant_options.semantic_search_hydrate_from_catalog else None
+
+        for point in points:
+            metadata = (getattr(point, "payload", None) or {}).get("metadata")
+            cocktail_id = metadata.get("cocktail_id") if metadata else None
+            if not cocktail_id or cocktail_id in models or cocktail_id in unresolved:
+                continue
+
+            model_json = metadata.get("model")
+            if model_json:
+                models[cocktail_id] = self._decoded_models.decode(cocktail_id, model_json)
+                continue
+
+            catalog_model = catalog.get(cocktail_id) if catalog is not None else None
+            if catalog_model is not None:
+                models[cocktail_id] = catalog_model
+            else:
+                unresolved[cocktail_id] = point.id
+
+        if unresolved:
+            records = await self.qdrant_client.retrieve(
+                collection_name=self.qdrant_options.collection_name,
+                ids=list(unresolved.values()),
+                with_payload=PayloadSelectorInclude(include=_MODEL_PAYLOAD_FIELDS),
+            )
+            for record in records:
+                metadata = (record.payload or {}).get("metadata") or {}
+                cocktail_id, model_json = metadata.get("cocktail_id"), metadata.get("model")
+                if cocktail_id and model_json:
+                    models[cocktail_id] = self._decoded_models.decode(cocktail_id, model_json)
+
+            missing = unresolved.keys() - models.keys()
+            if missing:
+                self.logger.warning(
+                    "Search hits without a resolvable cocktail model were dropped",
+                    extra={"cocktail_ids": sorted(missing)},
+                )
+
+        return models
+
+    def _hit_payload_selector(self) -> bool | PayloadSelectorInclude:
+        """Full payloads, or only the fields a hit needs when models are hydrated from the catalog."""
+        if self.qdrant_options.semantic_search_hydrate_from_catalog:
+            return PayloadSelectorInclude(include=_HIT_PAYLOAD_FIELDS)
+        return True
+
+    @staticmethod
+    async def _timed(stage: str, awaitable: Awaitable[_T], timings: dict[str, float]) -> _T:
+        """Await a search stage inside its own span, recording its duration in milliseconds."""
+        start = time.perf_counter()
+        with _tracer.start_as_current_span(f"search_vectors.{stage}"):
+            try:
+                return await awaitable
+            finally:
+                timings[f"{stage}_ms"] = (time.perf_counter() - start) * 1000
+
+    async def _query(self, **kwargs) -> QueryResponse | GroupsResult:
+        """Run a Qdrant query, grouped by cocktail when a group size is configured.
+
+        In grouped mode ``limit`` counts distinct cocktails rather than chunk points:
+        Qdrant returns one group per cocktail holding its top ``group_size`` chunks.
+        """
+        group_size = self.qdrant_options.semantic_search_group_size
+        if group_size > 0:
+            return await self.qdrant_client.query_points_groups(
+                group_by=_GROUP_BY_FIELD, group_size=group_size, **kwargs
+            )
+        return await self.qdrant_client.query_points(**kwargs)
+
+    @staticmethod
+    def _result_points(search_results: QueryResponse | GroupsResult) -> list[ScoredPoint]:
+        """Flatten grouped results into their chunk hits; ungrouped results already are."""
+        if isinstance(search_results, GroupsResult):
+            return [hit for group in search_results.groups for hit in group.hits]
+        return search_results.points
+
+    async def _dense_only_search(
+        self, query_vector: list[float], query_filter: Filter | None
+    ) -> QueryResponse | GroupsResult:
         """Perform dense-only vector search using Qdrant query_points."""
-        return self.qdrant_client.query_points(
+        return await self._query(
             collection_name=self.qdrant_options.collection_name,
             limit=self.qdrant_options.semantic_search_limit,
             score_threshold=self.qdrant_options.semantic_search_score_threshold,
             query=query_vector,
             using="dense",
             query_filter=query_filter,
-            with_payload=True,
+            with_payload=self._hit_payload_selector(),
         )
 
     async def _hybrid_search(
-        self, free_text: str, query_vector: list[float], query_filter: Filter | None
-    ) -> QueryResponse:
+        self,
+        query_vector: list[float],
+        sparse_vector: tuple[list[int], list[float]],
+        query_filter: Filter | None,
+    ) -> QueryResponse | GroupsResult:
         """Perform hybrid search combining dense + sparse vectors via RRF fusion.
 
         Uses Qdrant's prefetch mechanism to run dense and sparse searches in
         parallel, then fuses results using Reciprocal Rank Fusion (RRF).
-        Falls back to dense-only search if SPLADE encoding fails.
+        Falls back to dense-only search if SPLADE produced no sparse vector.
         """
-        try:
-            sparse_indices, sparse_values = await self.splade_service.encode(free_text)
-        except Exception:
-            self.logger.warning("SPLADE encoding failed during hybrid search, falling back to dense-only")
-            return self._dense_only_search(query_vector, query_filter)
+        sparse_indices, sparse_values = sparse_vector
 
         # If SPLADE returned empty results, fall back to dense-only
         if not sparse_indices:
             self.logger.debug("SPLADE returned empty sparse vector, falling back to dense-only")
-            return self._dense_only_search(query_vector, query_filter)
+            return await self._dense_only_search(query_vector, query_filter)
 
         prefetch_limit = self.qdrant_options.semantic_search_prefetch_limit
 
-        return self.qdrant_client.query_points(
+        return await self._query(
             collection_name=self.qdrant_options.collection_name,
             prefetch=[
                 Prefetch(
@@ -191,27 +482,25 @@ class CocktailVectorSearchRepository(ICocktailVectorSearchRepository):
             ],
             query=FusionQuery(fusion=Fusion.RRF),
             limit=self.qdrant_options.semantic_search_limit,
-            with_payload=True,
+            with_payload=self._hit_payload_selector(),
         )
 
     @staticmethod
-    def _calculate_weighted_scores(cocktails: list[CocktailSearchModel]) -> None:
-        """Calculate final weighted scores for all cocktails.
+    def _calculate_weighted_scores(
+        max_scores: np.ndarray, avg_scores: np.ndarray, hit_counts: np.ndarray
+    ) -> np.ndarray:
+        """Calculate final weighted scores for all cocktails at once.
 
         Formula: max_score * 0.6 + avg_score * 0.3 + log(hit_count + 1) * 0.1
         """
-        for cocktail in cocktails:
-            if cocktail.search_statistics and cocktail.search_statistics.hit_count > 0:
-                stats = cocktail.search_statistics
-                stats.avg_score = stats.total_score / stats.hit_count
-                # Improved weighted scoring formula:
-                # - max_score (60%): strongest single-chunk match is the primary signal
-                # - avg_score (30%): rewards consistent relevance across chunks
-                # - log(hit_count) (10%): diminishing returns for breadth of matching
-                # This prevents a cocktail with 5 low-scoring chunk hits (e.g., 0.3 each)
-                # from outranking one with 2 high-scoring hits (e.g., 0.8 each)
-                hit_breadth = math.log(stats.hit_count + 1)  # log(2)=0.69, log(6)=1.79
-                stats.weighted_score = stats.max_score * 0.6 + stats.avg_score * 0.3 + hit_breadth * 0.1
+        # Improved weighted scoring formula:
+        # - max_score (60%): strongest single-chunk match is the primary signal
+        # - avg_score (30%): rewards consistent relevance across chunks
+        # - log(hit_count) (10%): diminishing returns for breadth of matching
+        # This prevents a cocktail with 5 low-scoring chunk hits (e.g., 0.3 each)
+        # from outranking one with 2 high-scoring hits (e.g., 0.8 each)
+        hit_breadth = np.log(hit_counts + 1)  # log(2)=0.69, log(6)=1.79
+        return max_scores * 0.6 + avg_scores * 0.3 + hit_breadth * 0.1
 
     async def get_all_cocktails(self) -> list[CocktailSearchModel]:
         # Return cached results if available
@@ -228,40 +517,251 @@ class CocktailVectorSearchRepository(ICocktailVectorSearchRepository):
 
             self.logger.info(msg="Retrieving all cocktails from qdrant")
 
-            cocktails_dict = {}
-            next_offset = None
-
-            while True:
-                points, next_offset = self.qdrant_client.scroll(
-                    collection_name=self.qdrant_options.collection_name,
-                    limit=100,  # Smaller batch size
-                    offset=next_offset,
-                    with_payload=True,
-                )
-
-                for point in points:
-                    payload = point.payload if hasattr(point, "payload") else None
-                    if payload:
-                        metadata = payload.get("metadata")
-                        if metadata:
-                            id = metadata.get("cocktail_id")
-                            if id and id not in cocktails_dict:
-                                cocktailModel: CocktailSearchModel = CocktailSearchModel.model_validate_json(
-                                    metadata.get("model")
-                                )
-                                cocktails_dict[id] = cocktailModel
-
-                # Break if no more results
-                if next_offset is None:
-                    break
+            cocktails_list, watermark = await self._load_catalog()
 
             # Cache the results only if non-empty, so a temporarily empty
             # collection doesn't permanently poison the cache
-            cocktails_list = list(cocktails_dict.values())
             if cocktails_list:
                 self._cocktails_cache = cocktails_list
+                self._catalog_index = CocktailCatalogIndex(cocktails_list)
+                self._catalog_watermark = watermark
+                # A full load is already current, so the first removal scan is one interval away
+                self._next_removal_scan = time.monotonic() + self.cache_options.catalog_removal_scan_interval_seconds
                 self.logger.info(f"Cached {len(cocktails_list)} cocktails")
             else:
                 self.logger.warning("No cocktails found to cache")
 
             return cocktails_list
+
+    async def _load_catalog(self) -> tuple[list[CocktailSearchModel], float]:
+        """Scroll the whole collection into one model per cocktail, plus the catalog watermark.
+
+        With ``catalog_scroll_parallelism`` above 1 the point id space is split into equal
+        slices scrolled concurrently. Chunk ids are UUIDv5s, so the slices hold roughly equal
+        numbers of points; the first slice starts unbounded so integer ids are covered too.
+        """
+        load_start = time.perf_counter()
+        parallelism = self.qdrant_options.catalog_scroll_parallelism
+        bounds: list[str | None] = [
+            None,
+            *(str(uuid.UUID(int=(i << 128) // parallelism)) for i in range(1, parallelism)),
+            None,
+        ]
+        segments = await asyncio.gather(
+            *(self._scroll_catalog_models(start=bounds[i], end=bounds[i + 1]) for i in range(parallelism))
+        )
+
+        # Segments cover consecutive id ranges, so merging them in order keeps the sequential scroll order
+        model_jsons: dict[str, str] = {}
+        watermark = 0.0
+        for segment_models, segment_watermark in segments:
+            for id, model_json in segment_models.items():
+                model_jsons.setdefault(id, model_json)
+            watermark = max(watermark, segment_watermark)
+
+        cocktails = [self._decoded_models.decode(id, model_json) for id, model_json in model_jsons.items()]
+        self.logger.info(
+            "Scrolled cocktail catalog",
+            extra={
+                "cocktail_count": len(cocktails),
+                "scroll_parallelism": parallelism,
+                "load_ms": round((time.perf_counter() - load_start) * 1000, 2),
+            },
+        )
+        return cocktails, watermark
+
+    async def get_catalog_index(self) -> CocktailCatalogIndex:
+        cocktails = await self.get_all_cocktails()
+
+        # Built alongside the catalog cache; an uncached (empty) catalog gets a throwaway index
+        if self._catalog_index is not None and self._catalog_index.cocktails is cocktails:
+            return self._catalog_index
+        return CocktailCatalogIndex(cocktails)
+
+    async def upsert_catalog_cocktail(self, cocktail: CocktailSearchModel) -> bool:
+        # Decode the JSON that was stored in the payload, so the next refresh recognises the model as unchanged.
+        # The caller changed the cocktail's vectors too and owns invalidating cached search results
+        model = self._decoded_models.decode(cocktail.id, cocktail.model_dump_json())
+        async with self._cache_lock:
+            return self._apply_catalog_changes({cocktail.id: model}, set())
+
+    async def remove_catalog_cocktail(self, cocktail_id: str) -> bool:
+        async with self._cache_lock:
+            return self._apply_catalog_changes({}, {cocktail_id})
+
+    async def refresh_catalog(self) -> bool:
+        """Fold cocktails embedded or removed since the last refresh into the cached catalog.
+
+        Only points whose ``metadata.indexed_at`` is at or after the watermark (less a small
+        overlap) are scrolled, so a refresh costs a page or two instead of a full reload and
+        picks up embeddings stored through other replicas. Every
+        ``catalog_removal_scan_interval_seconds`` the refresh also scrolls the cocktail id of
+        every chunk and drops cocktails whose vectors are gone. Cached search results are
+        invalidated when the catalog changes. Returns whether the catalog changed.
+        """
+        if self._cocktails_cache is None or self._catalog_index is None:
+            # Nothing cached yet; the first load reads the current collection anyway
+            return False
+
+        # Only cocktails cached before the scan can be taken for removed, and the id scan runs
+        # before the watermark scroll so a cocktail re-embedded meanwhile shows up in the updates
+        removals: set[str] = set()
+        if self._removal_scan_due():
+            removals = set(self._catalog_index.by_id) - await self._scan_catalog_ids()
+
+        since = self._catalog_watermark - _CATALOG_WATERMARK_OVERLAP_SECONDS
+        model_jsons, watermark = await self._scroll_catalog_models(
+            scroll_filter=Filter(must=[FieldCondition(key="metadata.indexed_at", range=Range(gte=since))])
+        )
+        updates = {id: self._decoded_models.decode(id, model_json) for id, model_json in model_jsons.items()}
+        removals -= updates.keys()
+
+        async with self._cache_lock:
+            changed = self._apply_catalog_changes(updates, removals)
+            self._catalog_watermark = max(self._catalog_watermark, watermark)
+
+        if changed:
+            self.logger.info(
+                "Refreshed cached cocktails",
+                extra={"cocktail_ids": sorted(updates), "removed_cocktail_ids": sorted(removals)},
+            )
+            await self.search_result_cache.invalidate()
+        return changed
+
+    def _removal_scan_due(self) -> bool:
+        interval = self.cache_options.catalog_removal_scan_interval_seconds
+        now = time.monotonic()
+        if interval <= 0.0 or now < self._next_removal_scan:
+            return False
+        self._next_removal_scan = now + interval
+        return True
+
+    async def _scan_catalog_ids(self) -> set[str]:
+        """Scroll the cocktail id of every chunk; models, descriptions and vectors stay on the server."""
+        cocktail_ids: set[str] = set()
+        next_offset: int | str | None = None
+        while True:
+            points, next_offset = await self.qdrant_client.scroll(
+                collection_name=self.qdrant_options.collection_name,
+                limit=self.qdrant_options.catalog_scroll_page_size,
+                offset=next_offset,
+                with_payload=PayloadSelectorInclude(include=_CATALOG_SCAN_FIELDS),
+            )
+            for point in points:
+                cocktail_id = ((point.payload or {}).get("metadata") or {}).get("cocktail_id")
+                if cocktail_id:
+                    cocktail_ids.add(cocktail_id)
+            if next_offset is None:
+                return cocktail_ids
+
+    async def _scroll_catalog_models(
+        self,
+        scroll_filter: Filter | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> tuple[dict[str, str], float]:
+        """Load cocktail model JSON keyed by cocktail id, plus the latest ``indexed_at`` seen.
+
+        Every chunk of a cocktail carries the same model, so the scroll only requests the
+        cocktail id and ``indexed_at`` of each chunk, and the model is then retrieved from
+        one chunk per cocktail. ``start`` and ``end`` restrict the scroll to the point ids in
+        ``[start, end)`` so several scrolls can split the collection between them.
+        """
+        end_order = _point_id_order(end) if end is not None else None
+        # cocktail id -> the first chunk point seen for it
+        model_points: dict[str, int | str] = {}
+        watermark = 0.0
+        next_offset: int | str | None = start
+
+        while True:
+            points, next_offset = await self.qdrant_client.scroll(
+                collection_name=self.qdrant_options.collection_name,
+                scroll_filter=scroll_filter,
+                limit=self.qdrant_options.catalog_scroll_page_size,
+                offset=next_offset,
+                with_payload=PayloadSelectorInclude(include=_CATALOG_SCAN_FIELDS),
+            )
+
+            for point in points:
+                if end_order is not None and _point_id_order(point.id) >= end_order:
+                    next_offset = None
+                    break
+                metadata = (point.payload or {}).get("metadata") or {}
+                id = metadata.get("cocktail_id")
+                if id and id not in model_points:
+                    model_points[id] = point.id
+                watermark = max(watermark, metadata.get("indexed_at") or 0.0)
+
+            if next_offset is None or (end_order is not None and _point_id_order(next_offset) >= end_order):
+                break
+
+        model_jsons: dict[str, str] = {}
+        point_ids = list(model_points.values())
+        page_size = self.qdrant_options.catalog_scroll_page_size
+        for i in range(0, len(point_ids), page_size):
+            records = await self.qdrant_client.retrieve(
+                collection_name=self.qdrant_options.collection_name,
+                ids=point_ids[i : i + page_size],
+                with_payload=PayloadSelectorInclude(include=_MODEL_PAYLOAD_FIELDS),
+            )
+            for record in records:
+                metadata = (record.payload or {}).get("metadata") or {}
+                if metadata.get("cocktail_id") and metadata.get("model"):
+                    model_jsons[metadata["cocktail_id"]] = metadata["model"]
+
+        # Keep scroll order; a cocktail whose chunk vanished between the two calls is left to the next refresh
+        return {id: model_jsons[id] for id in model_points if id in model_jsons}, watermark
+
+    async def watch_catalog(self) -> None:
+        """Refresh the cached catalog on the configured interval; runs until cancelled."""
+        interval = self.cache_options.catalog_refresh_interval_seconds
+        if interval <= 0.0:
+            return
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_catalog()
+            except Exception:
+                self.logger.warning("Failed to refresh the cached cocktail catalog", exc_info=True)
+
+    def _apply_catalog_changes(self, upserts: dict[str, CocktailSearchModel], removals: set[str]) -> bool:
+        """Swap in a new catalog list and index with the changes applied; returns whether anything changed.
+
+        Callers may still be iterating the list or index they were handed, so both are
+        replaced rather than mutated. Must be called with ``_cache_lock`` held.
+        """
+        if self._cocktails_cache is None or self._catalog_index is None:
+            return False
+
+        changed = False
+        cocktails: list[CocktailSearchModel] = []
+        for cocktail in self._cocktails_cache:
+            if cocktail.id in removals:
+                changed = True
+                continue
+            replacement = upserts.get(cocktail.id, cocktail)
+            # Compared by value: a model decoded again after leaving the decoded-model cache is a
+            # new object, and rebuilding the index for it would needlessly drop cached results
+            if replacement is not cocktail and replacement != cocktail:
+                changed = True
+            else:
+                replacement = cocktail
+            cocktails.append(replacement)
+
+        for id, model in upserts.items():
+            if id not in self._catalog_index.by_id:
+                cocktails.append(model)
+                changed = True
+
+        if not changed:
+            return False
+
+        if cocktails:
+            self._cocktails_cache = cocktails
+            self._catalog_index = CocktailCatalogIndex(cocktails)
+        else:
+            # Same rule as a load: never pin an empty catalog, reload it on the next request
+            self._cocktails_cache = None
+            self._catalog_index = None
+        return True
@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 
 from qdrant_client.http.models import Filter
 
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
 
 
@@ -10,6 +13,36 @@ class ICocktailVectorSearchRepository(ABC):
     async def search_vectors(self, free_text: str, query_filter: Filter | None = None) -> list[CocktailSearchModel]:
         pass
 
+    @abstractmethod
+    def export_query_embeddings(self) -> list[tuple[str, bytes]]:
+        """Dense query vectors held only in-process, as (cache key, float32 bytes), least recently used first."""
+        pass
+
+    @abstractmethod
+    def import_query_embeddings(self, entries: list[tuple[str, bytes]]) -> bool:
+        """Take exported dense query vectors back in-process; False when they belong in the cache backend."""
+        pass
+
     @abstractmethod
     async def get_all_cocktails(self) -> list[CocktailSearchModel]:
         pass
+
+    @abstractmethod
+    async def get_catalog_index(self) -> CocktailCatalogIndex:
+        pass
+
+    @abstractmethod
+    async def upsert_catalog_cocktail(self, cocktail: CocktailSearchModel) -> bool:
+        pass
+
+    @abstractmethod
+    async def remove_catalog_cocktail(self, cocktail_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def refresh_catalog(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def watch_catalog(self) -> None:
+        pass
@@ -1,6 +1,7 @@
+from cezzis_com_cocktails_aisearch.infrastructure.services.http_client import create_http_client
 from cezzis_com_cocktails_aisearch.infrastructure.services.ireranker_service import IRerankerService
 from cezzis_com_cocktails_aisearch.infrastructure.services.isplade_service import ISpladeService
 from cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service import RerankerService
 from cezzis_com_cocktails_aisearch.infrastructure.services.splade_service import SpladeService
 
-__all__ = ["IRerankerService", "RerankerService", "ISpladeService", "SpladeService"]
+__all__ = ["IRerankerService", "RerankerService", "ISpladeService", "SpladeService", "create_http_client"]
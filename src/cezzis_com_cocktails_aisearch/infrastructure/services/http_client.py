@@ -0,0 +1,37 @@
+import importlib.util
+import logging
+
+import httpx
+
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions
+
+_logger: logging.Logger = logging.getLogger("http_client")
+
+
+def create_http_client(options: HttpClientOptions) -> httpx.AsyncClient:
+    """Create the long-lived, pooled HTTP client shared by the TEI services.
+
+    Connections are kept alive between requests so that each search reuses an
+    already established TCP (and TLS) connection instead of handshaking per call.
+    Per-endpoint read timeouts are supplied by the services on each request.
+
+    Args:
+        options: Pool size, keep-alive and protocol settings.
+
+    Returns:
+        httpx.AsyncClient: The shared client. It must be closed on application shutdown.
+    """
+    http2 = options.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        _logger.warning("HTTP_CLIENT_HTTP2 is enabled but the 'h2' package is not installed, using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=options.max_connections,
+            max_keepalive_connections=options.max_keepalive_connections,
+            keepalive_expiry=options.keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(30.0, connect=options.connect_timeout_seconds),
+    )
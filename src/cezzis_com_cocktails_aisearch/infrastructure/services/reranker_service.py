@@ -17,8 +17,9 @@ class RerankerService(IRerankerService):
     """
 
     @inject
-    def __init__(self, reranker_options: RerankerOptions):
+    def __init__(self, reranker_options: RerankerOptions, http_client: httpx.AsyncClient):
         self.options = reranker_options
+        self.http_client = http_client
         self.logger = logging.getLogger("reranker_service")
 
     async def rerank(
@@ -99,9 +100,8 @@ class RerankerService(IRerankerService):
             "truncate": True,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = await self.http_client.post(url, json=payload, headers=headers, timeout=self.options.timeout_seconds)
+        response.raise_for_status()
 
         results = response.json()
 
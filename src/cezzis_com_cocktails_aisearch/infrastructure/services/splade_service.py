@@ -4,6 +4,8 @@ import httpx
 from injector import inject
 
 from cezzis_com_cocktails_aisearch.domain.config.splade_options import SpladeOptions
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.micro_batcher import MicroBatcher
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.single_flight import SingleFlight
 from cezzis_com_cocktails_aisearch.infrastructure.services.isplade_service import ISpladeService
 
 
@@ -13,19 +15,39 @@ class SpladeService(ISpladeService):
     Sends text to a TEI instance running a SPLADE model to produce sparse vector
     representations for hybrid search. The sparse vectors capture lexical (keyword)
     signals that complement dense semantic embeddings.
+
+    Concurrent ``encode`` calls are coalesced into a single TEI batch request over a
+    short window (``SPLADE_BATCH_WINDOW_MS`` / ``SPLADE_BATCH_MAX_SIZE``) so that bursts
+    of searches cost one round trip instead of one per query. Identical texts that are
+    already being encoded share the in-flight request rather than joining the batch again.
     """
 
     @inject
-    def __init__(self, splade_options: SpladeOptions):
+    def __init__(self, splade_options: SpladeOptions, http_client: httpx.AsyncClient):
         self.options = splade_options
+        self.http_client = http_client
         self.logger = logging.getLogger("splade_service")
+        self._flight: SingleFlight[str, tuple[list[int], list[float]]] = SingleFlight()
+        self._batcher: MicroBatcher[str, tuple[list[int], list[float]]] | None = None
+        if splade_options.batch_window_ms > 0:
+            self._batcher = MicroBatcher(
+                self._call_tei_embed_sparse,
+                window_seconds=splade_options.batch_window_ms / 1000.0,
+                max_batch_size=splade_options.batch_max_size,
+            )
 
     async def encode(self, text: str) -> tuple[list[int], list[float]]:
         """Encode text into a sparse vector using the TEI /embed_sparse endpoint.
 
         If the call fails, returns empty lists (graceful degradation).
         """
+        return await self._flight.do(text, lambda: self._encode_one(text))
+
+    async def _encode_one(self, text: str) -> tuple[list[int], list[float]]:
         try:
+            if self._batcher is not None:
+                return await self._batcher.submit(text)
+
             result = await self._call_tei_embed_sparse([text])
             if result:
                 return result[0]
@@ -66,9 +88,8 @@ class SpladeService(ISpladeService):
             "truncate": True,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
+        response = await self.http_client.post(url, json=payload, headers=headers, timeout=self.options.timeout_seconds)
+        response.raise_for_status()
 
         results = response.json()
 
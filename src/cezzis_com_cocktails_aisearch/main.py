@@ -1,17 +1,24 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from pydantic import ValidationError
+from qdrant_client import AsyncQdrantClient
 
 from cezzis_com_cocktails_aisearch.apis import (
     EmbeddingRouter,
     HealthCheckRouter,
+    QueryDictionariesRouter,
     ScalarDocsRouter,
     SemanticSearchRouter,
 )
-from cezzis_com_cocktails_aisearch.app_module import create_injector
+from cezzis_com_cocktails_aisearch.app_module import injector
 from cezzis_com_cocktails_aisearch.application.behaviors import initialize_opentelemetry
 from cezzis_com_cocktails_aisearch.application.behaviors.error_handling import (
     generic_exception_handler,
@@ -26,23 +33,62 @@ from cezzis_com_cocktails_aisearch.application.behaviors.otel.probe_telemetry_fi
     PROBE_PATHS,
     ProbeTelemetryMiddleware,
 )
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup.search_warmup import SearchWarmup
 from cezzis_com_cocktails_aisearch.domain.config.app_options import AppOptions
 from cezzis_com_cocktails_aisearch.domain.config.oauth_options import OAuthOptions
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_cache_snapshot import EmbeddingCacheSnapshot
+from cezzis_com_cocktails_aisearch.infrastructure.caching.icache_backend import ICacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.repositories.icocktail_vector_search_repository import (
+    ICocktailVectorSearchRepository,
+)
 
 initialize_opentelemetry()
-injector = create_injector()
 app_options = injector.get(AppOptions)
 oauth_options = injector.get(OAuthOptions)
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Start with the query vectors the previous process had cached, when a snapshot is configured
+    embedding_cache_snapshot = injector.get(EmbeddingCacheSnapshot)
+    await embedding_cache_snapshot.load()
+
+    # Preload the catalog and the head queries in the background; readiness stays false until it finishes
+    search_warmup = asyncio.create_task(injector.get(SearchWarmup).run())
+
+    # Pick up edits to the query keyword and synonym dictionaries without a restart
+    query_dictionary_watcher = asyncio.create_task(injector.get(QueryDictionaryStore).watch())
+
+    # Fold cocktails embedded through other replicas into the cached catalog
+    catalog_watcher = asyncio.create_task(injector.get(ICocktailVectorSearchRepository).watch_catalog())
+
+    yield
+
+    for watcher in (search_warmup, query_dictionary_watcher, catalog_watcher):
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+
+    await embedding_cache_snapshot.save()
+
+    # Close pooled connections held by the shared clients
+    await injector.get(httpx.AsyncClient).aclose()
+    await injector.get(AsyncQdrantClient).close()
+    await injector.get(ICacheBackend).close()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     responses={
         "default": {
             "model": ProblemDetails,  # This ensures the model is added to components/schemas
             "description": "All non-success responses",
             "content": {"application/problem+json": {"schema": {"$ref": "#/components/schemas/ProblemDetails"}}},
         },
-    }
+    },
 )
 
 # Ensure ProblemDetails is in the schema components
@@ -72,4 +118,5 @@ FastAPIInstrumentor.instrument_app(app, excluded_urls=",".join(PROBE_PATHS))
 app.include_router(injector.get(SemanticSearchRouter))
 app.include_router(injector.get(ScalarDocsRouter))
 app.include_router(injector.get(EmbeddingRouter))
+app.include_router(injector.get(QueryDictionariesRouter))
 app.include_router(injector.get(HealthCheckRouter))  # type: ignore
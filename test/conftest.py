@@ -1,5 +1,7 @@
 """Shared test fixtures and helpers for all unit tests."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_embedding_model import (
@@ -12,6 +14,14 @@ from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.c
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_vector_search_result import (
     CocktailVectorSearchResult,
 )
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQueryCache,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_store import (
+    QueryDictionaryStore,
+)
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
 
 
 def create_test_cocktail_model(cocktail_id="test-123", title="Test Cocktail"):
@@ -60,6 +70,57 @@ def create_test_cocktail_embedding_model(cocktail_id="test-123", title="Test Coc
     )
 
 
+def create_test_cache_options(
+    search_result_cache_enabled=False,
+    ttl_seconds=60.0,
+    decoded_model_cache_max_entries=64,
+    catalog_refresh_interval_seconds=0.0,
+    catalog_removal_scan_interval_seconds=0.0,
+):
+    """Helper function to create cache options for unit tests."""
+    options = MagicMock()
+    options.search_result_cache_enabled = search_result_cache_enabled
+    options.search_result_cache_ttl_seconds = ttl_seconds
+    options.embedding_cache_ttl_seconds = ttl_seconds
+    options.decoded_model_cache_max_entries = decoded_model_cache_max_entries
+    options.catalog_refresh_interval_seconds = catalog_refresh_interval_seconds
+    options.catalog_removal_scan_interval_seconds = catalog_removal_scan_interval_seconds
+    return options
+
+
+def create_test_search_result_cache(enabled=False, ttl_seconds=60.0, cache_backend=None):
+    """Helper function to create a SearchResultCache; disabled by default so handler tests run the full pipeline."""
+    return SearchResultCache(
+        cache_options=create_test_cache_options(search_result_cache_enabled=enabled, ttl_seconds=ttl_seconds),
+        cache_backend=cache_backend if cache_backend is not None else InMemoryCacheBackend(max_entries=64),
+    )
+
+
+def create_test_query_parsing_options(
+    dictionary_dir="", reload_interval_seconds=0.0, parsed_query_cache_max_entries=128
+):
+    """Helper function to create query parsing options for unit tests; the packaged dictionaries by default."""
+    options = MagicMock()
+    options.dictionary_dir = dictionary_dir
+    options.reload_interval_seconds = reload_interval_seconds
+    options.parsed_query_cache_max_entries = parsed_query_cache_max_entries
+    return options
+
+
+def create_test_query_dictionary_store(dictionary_dir="", reload_interval_seconds=0.0):
+    """Helper function to create a QueryDictionaryStore over the packaged (or given) dictionary files."""
+    return QueryDictionaryStore(
+        query_parsing_options=create_test_query_parsing_options(dictionary_dir, reload_interval_seconds)
+    )
+
+
+def create_test_parsed_query_cache(max_entries=128):
+    """Helper function to create a ParsedQueryCache; each handler under test gets its own."""
+    return ParsedQueryCache(
+        query_parsing_options=create_test_query_parsing_options(parsed_query_cache_max_entries=max_entries)
+    )
+
+
 @pytest.fixture
 def test_cocktail_model():
     """Fixture that provides a test CocktailModel instance."""
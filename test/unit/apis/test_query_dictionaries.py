@@ -0,0 +1,41 @@
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.apis.query_dictionaries import QueryDictionariesRouter
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.reload_query_dictionaries_command import (
+    ReloadQueryDictionariesCommand,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.query_dictionary_reload_rs import (
+    QueryDictionaryReloadRs,
+)
+
+
+class TestQueryDictionariesRouter:
+    """Test cases for QueryDictionariesRouter."""
+
+    def test_init(self):
+        """Test router initialization and the reload route."""
+        mediator = MagicMock()
+        router = QueryDictionariesRouter(mediator=mediator)
+
+        assert router.mediator == mediator
+        assert [route.path for route in router.routes] == ["/v1/admin/query-dictionaries/reload"]
+
+    @pytest.mark.anyio
+    async def test_reload_sends_command(self):
+        """Test that the reload endpoint sends a reload command and returns its result."""
+        expected = QueryDictionaryReloadRs(
+            version=2, fingerprint="abc123", reloaded=True, keyword_word_count=150, synonym_trigger_count=109
+        )
+        mediator = AsyncMock()
+        mediator.send_async = AsyncMock(return_value=expected)
+        router = QueryDictionariesRouter(mediator=mediator)
+
+        # Bypass OAuth by setting ENV=local
+        with patch.dict(os.environ, {"ENV": "local"}):
+            result = await router.reload(_rq=MagicMock())
+
+        assert result == expected
+        assert isinstance(mediator.send_async.call_args.args[0], ReloadQueryDictionariesCommand)
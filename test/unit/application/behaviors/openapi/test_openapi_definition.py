@@ -54,7 +54,10 @@ class TestOpenApiDefinition:
             client_id="test-client-id",
             domain="auth.example.com",
             audience="api://cocktails",
-            scopes={"write:embeddings": "Create and update cocktail embeddings"},
+            scopes={
+                "write:embeddings": "Create and update cocktail embeddings",
+                "write:query-dictionaries": "Reload the query intent keyword and synonym dictionaries",
+            },
             pkce="SHA-256",
         )
 
@@ -95,7 +98,10 @@ class TestOpenApiDefinition:
             client_id="test-client-id",
             domain="auth.example.com",
             audience="api://cocktails",
-            scopes={"write:embeddings": "Create and update cocktail embeddings"},
+            scopes={
+                "write:embeddings": "Create and update cocktail embeddings",
+                "write:query-dictionaries": "Reload the query intent keyword and synonym dictionaries",
+            },
             pkce=None,
         )
 
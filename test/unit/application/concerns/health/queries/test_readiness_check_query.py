@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.application.concerns.health.queries.readiness_check_query import (
+    ReadinessCheckQuery,
+    ReadinessCheckQueryHandler,
+)
+
+
+def _make_handler(qdrant_client=None, warmup_complete=True) -> ReadinessCheckQueryHandler:
+    search_warmup = MagicMock()
+    search_warmup.is_complete = warmup_complete
+    return ReadinessCheckQueryHandler(
+        qdrant_client=qdrant_client if qdrant_client is not None else MagicMock(),
+        search_warmup=search_warmup,
+    )
+
+
+class TestReadinessCheckQueryHandler:
+    """Test cases for ReadinessCheckQueryHandler."""
+
+    @pytest.mark.anyio
+    async def test_ready_when_qdrant_reachable_and_warmed_up(self):
+        """Test that the replica is ready once Qdrant answers and the warm-up has finished."""
+        result = await _make_handler().handle(ReadinessCheckQuery())
+
+        assert result.status == "healthy"
+        assert result.details == {"qdrant": "healthy", "warmup": "complete"}
+
+    @pytest.mark.anyio
+    async def test_not_ready_while_warm_up_in_progress(self):
+        """Test that readiness is held back until the startup warm-up completes."""
+        result = await _make_handler(warmup_complete=False).handle(ReadinessCheckQuery())
+
+        assert result.status == "unhealthy"
+        assert result.output == "Startup warm-up is in progress"
+        assert result.details == {"qdrant": "healthy", "warmup": "in_progress"}
+
+    @pytest.mark.anyio
+    async def test_not_ready_when_qdrant_unreachable(self):
+        """Test that an unreachable Qdrant makes the replica not ready."""
+        qdrant_client = MagicMock()
+        qdrant_client.get_collections.side_effect = RuntimeError("connection refused")
+
+        result = await _make_handler(qdrant_client=qdrant_client).handle(ReadinessCheckQuery())
+
+        assert result.status == "unhealthy"
+        assert result.output == "One or more dependencies are unreachable"
+        assert result.details["qdrant"] == "unhealthy"
@@ -1,7 +1,11 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from conftest import create_test_cocktail_embedding_model, create_test_cocktail_model
+from conftest import (
+    create_test_cocktail_embedding_model,
+    create_test_cocktail_model,
+    create_test_search_result_cache,
+)
 
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.cocktail_embedding_command import (
     CocktailEmbeddingCommand,
@@ -12,6 +16,7 @@ from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.c
     CocktailDescriptionChunk,
 )
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
 
 
 class TestCocktailEmbeddingCommand:
@@ -104,7 +109,11 @@ class TestCocktailEmbeddingCommandHandler:
         mock_repository.delete_vectors = AsyncMock()
         mock_repository.store_vectors = AsyncMock()
 
-        handler = CocktailEmbeddingCommandHandler(cocktail_vector_repository=mock_repository)
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=AsyncMock(),
+            search_result_cache=create_test_search_result_cache(),
+        )
 
         cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
         chunks = [CocktailDescriptionChunk(content="Test content", category="desc")]
@@ -123,7 +132,11 @@ class TestCocktailEmbeddingCommandHandler:
         mock_repository.delete_vectors = AsyncMock()
         mock_repository.store_vectors = AsyncMock()
 
-        handler = CocktailEmbeddingCommandHandler(cocktail_vector_repository=mock_repository)
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=AsyncMock(),
+            search_result_cache=create_test_search_result_cache(),
+        )
 
         cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
         chunks = [
@@ -156,7 +169,11 @@ class TestCocktailEmbeddingCommandHandler:
         mock_repository.delete_vectors = AsyncMock(side_effect=track_delete)
         mock_repository.store_vectors = AsyncMock(side_effect=track_store)
 
-        handler = CocktailEmbeddingCommandHandler(cocktail_vector_repository=mock_repository)
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=AsyncMock(),
+            search_result_cache=create_test_search_result_cache(),
+        )
 
         cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test")
         chunks = [CocktailDescriptionChunk(content="Test", category="desc")]
@@ -165,3 +182,94 @@ class TestCocktailEmbeddingCommandHandler:
         await handler.handle(command)
 
         assert call_order == ["delete", "store"]
+
+    @pytest.mark.anyio
+    async def test_handler_invalidates_search_result_cache(self):
+        """Test that storing a re-embedded cocktail drops cached search results."""
+        mock_repository = AsyncMock()
+        backend = InMemoryCacheBackend(max_entries=16)
+        await backend.set("emb:unrelated", b"\x00")
+        cache = create_test_search_result_cache(enabled=True, cache_backend=backend)
+        await cache.set("gin|f=|m=|mx=False|s=0|t=10", [], cache.generation)
+
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=AsyncMock(),
+            search_result_cache=cache,
+        )
+
+        cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
+        chunks = [CocktailDescriptionChunk(content="Test content", category="desc")]
+        await handler.handle(CocktailEmbeddingCommand(chunks=chunks, cocktail_embedding_model=cocktail_embedding_model))
+
+        assert await cache.get("gin|f=|m=|mx=False|s=0|t=10") is None
+        assert await backend.get("emb:unrelated") == b"\x00"
+        assert cache.generation == 1
+
+    @pytest.mark.anyio
+    async def test_handler_upserts_cocktail_into_cached_catalog(self):
+        """Test that a stored cocktail is written straight into the cached catalog."""
+        mock_repository = AsyncMock()
+        mock_search_repository = AsyncMock()
+
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=mock_search_repository,
+            search_result_cache=create_test_search_result_cache(),
+        )
+
+        cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
+        chunks = [CocktailDescriptionChunk(content="Test content", category="desc")]
+        await handler.handle(CocktailEmbeddingCommand(chunks=chunks, cocktail_embedding_model=cocktail_embedding_model))
+
+        upserted = mock_search_repository.upsert_catalog_cocktail.call_args[0][0]
+        assert upserted is mock_repository.store_vectors.call_args[1]["cocktail_model"]
+        assert upserted.id == "test-123"
+        mock_search_repository.remove_catalog_cocktail.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_handler_removes_cocktail_from_catalog_when_store_fails(self):
+        """Test that a failed store drops the cocktail whose old vectors were already deleted."""
+        mock_repository = AsyncMock()
+        mock_repository.store_vectors = AsyncMock(side_effect=RuntimeError("qdrant unavailable"))
+        mock_search_repository = AsyncMock()
+
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=mock_search_repository,
+            search_result_cache=create_test_search_result_cache(),
+        )
+
+        cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
+        chunks = [CocktailDescriptionChunk(content="Test content", category="desc")]
+        with pytest.raises(RuntimeError, match="qdrant unavailable"):
+            await handler.handle(
+                CocktailEmbeddingCommand(chunks=chunks, cocktail_embedding_model=cocktail_embedding_model)
+            )
+
+        mock_search_repository.remove_catalog_cocktail.assert_awaited_once_with("test-123")
+        mock_search_repository.upsert_catalog_cocktail.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_handler_invalidates_search_result_cache_when_store_fails(self):
+        """Test that cached rankings stop returning a cocktail whose vectors were deleted by a failed re-embed."""
+        mock_repository = AsyncMock()
+        mock_repository.store_vectors = AsyncMock(side_effect=RuntimeError("qdrant unavailable"))
+        cache = create_test_search_result_cache(enabled=True)
+        await cache.set("gin|f=|m=|mx=False|s=0|t=10", [("test-123", {})], cache.generation)
+
+        handler = CocktailEmbeddingCommandHandler(
+            cocktail_vector_repository=mock_repository,
+            cocktail_search_repository=AsyncMock(),
+            search_result_cache=cache,
+        )
+
+        cocktail_embedding_model = create_test_cocktail_embedding_model("test-123", "Test Cocktail")
+        chunks = [CocktailDescriptionChunk(content="Test content", category="desc")]
+        with pytest.raises(RuntimeError, match="qdrant unavailable"):
+            await handler.handle(
+                CocktailEmbeddingCommand(chunks=chunks, cocktail_embedding_model=cocktail_embedding_model)
+            )
+
+        assert await cache.get("gin|f=|m=|mx=False|s=0|t=10") is None
+        assert cache.generation == 1
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from conftest import create_test_query_dictionary_store
+
+from cezzis_com_cocktails_aisearch.application.behaviors.error_handling.exception_types import (
+    InternalServerErrorException,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.commands.reload_query_dictionaries_command import (
+    ReloadQueryDictionariesCommand,
+    ReloadQueryDictionariesCommandHandler,
+)
+
+
+class TestReloadQueryDictionariesCommandHandler:
+    """Test cases for ReloadQueryDictionariesCommandHandler."""
+
+    @pytest.mark.anyio
+    async def test_reports_the_version_in_use(self):
+        """Test that an unchanged reload reports the current version as not reloaded."""
+        store = create_test_query_dictionary_store()
+        handler = ReloadQueryDictionariesCommandHandler(query_dictionary_store=store)
+
+        result = await handler.handle(ReloadQueryDictionariesCommand())
+
+        assert result.version == 1
+        assert result.reloaded is False
+        assert result.fingerprint == store.current.fingerprint
+        assert result.keyword_word_count == len(store.current.intent_matcher.vocabulary)
+        assert result.synonym_trigger_count == len(store.current.synonym_index)
+
+    @pytest.mark.anyio
+    async def test_failed_reload_raises_internal_server_error(self):
+        """Test that an invalid dictionary file surfaces as a 500 naming the version still in use."""
+        store = create_test_query_dictionary_store()
+        store.reload = AsyncMock(side_effect=ValueError("bad table"))
+        handler = ReloadQueryDictionariesCommandHandler(query_dictionary_store=store)
+
+        with pytest.raises(InternalServerErrorException, match="version 1 is still in use"):
+            await handler.handle(ReloadQueryDictionariesCommand())
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+from conftest import create_test_cocktail_model
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+
+
+def _cocktail(cocktail_id, title, ingredients=()):
+    cocktail = create_test_cocktail_model(cocktail_id, title)
+    return cocktail.model_copy(update={"ingredients": [SimpleNamespace(name=name) for name in ingredients]})
+
+
+def _catalog():
+    return CocktailCatalogIndex(
+        [
+            _cocktail("3", "Mojito", ["White Rum", "Mint"]),
+            _cocktail("1", "Margarita", ["Blanco Tequila", "Lime Juice"]),
+            _cocktail("2", "Bitter Mai Tai", ["Campari", "Dark Rum"]),
+            _cocktail("4", "Mai Tai", ["Dark Rum", "Orgeat"]),
+        ]
+    )
+
+
+class TestCocktailCatalogIndex:
+    """Test cases for CocktailCatalogIndex."""
+
+    def test_lookup_by_id_and_exact_title(self):
+        """Test O(1) lookups by id and by lower-cased title."""
+        catalog = _catalog()
+
+        assert len(catalog) == 4
+        assert catalog.get("1").title == "Margarita"
+        assert catalog.get("missing") is None
+        assert [c.id for c in catalog.with_title("mai tai")] == ["4"]
+        assert catalog.with_title("daiquiri") == []
+
+    def test_sorted_by_title(self):
+        """Test that the title-ordered view is precomputed."""
+        catalog = _catalog()
+
+        assert [c.title for c in catalog.sorted_by_title] == ["Bitter Mai Tai", "Mai Tai", "Margarita", "Mojito"]
+        assert catalog.sorted_lower_titles == ["bitter mai tai", "mai tai", "margarita", "mojito"]
+
+    def test_titles_containing_returns_title_order(self):
+        """Test substring title matches come back alphabetically."""
+        catalog = _catalog()
+
+        assert [c.title for c in catalog.titles_containing("mai tai")] == ["Bitter Mai Tai", "Mai Tai"]
+
+    def test_text_matches_uses_titles_and_ingredient_index(self):
+        """Test that text matches cover titles, descriptive titles and ingredient names."""
+        catalog = _catalog()
+
+        assert [c.id for c in catalog.text_matches("rum")] == ["2", "4", "3"]
+        assert [c.id for c in catalog.text_matches("tequila")] == ["1"]
+        assert [c.id for c in catalog.text_matches("margarita description")] == ["1"]
+        assert catalog.text_matches("absinthe") == []
+
+    def test_in_title_order_dedupes_and_skips_unknown_ids(self):
+        """Test that id selections are returned once each, in title order."""
+        catalog = _catalog()
+
+        assert [c.id for c in catalog.in_title_order(["3", "1", "missing", "1"])] == ["1", "3"]
+
+    def test_ingredient_inverted_index(self):
+        """Test that ingredient names map to the cocktails using them."""
+        catalog = _catalog()
+
+        positions = catalog.by_ingredient["dark rum"]
+        assert sorted(catalog.sorted_by_title[p].id for p in positions) == ["2", "4"]
@@ -0,0 +1,10 @@
+# Unit tests for application/concerns/semantic_search/indexes/__init__.py
+import importlib
+
+
+def test_import_indexes_init():
+    module = importlib.import_module("cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes")
+
+    assert module.CocktailCatalogIndex is not None
+    assert module.TypeaheadPrefixIndex is not None
+    assert module.TrigramIndex is not None
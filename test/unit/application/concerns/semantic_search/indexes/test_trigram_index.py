@@ -0,0 +1,47 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.trigram_index import TrigramIndex
+
+_TITLES = ["bitter mai tai", "daiquiri", "mai tai", "manhattan", "margarita", "mojito", "negroni", "old fashioned"]
+
+
+class TestTrigramIndex:
+    """Test cases for TrigramIndex."""
+
+    def test_misspelled_prefixes_match(self):
+        """Test that typos in a partially typed name still find it."""
+        index = TrigramIndex(_TITLES)
+
+        assert [_TITLES[p] for p in index.search("margr", 5, 75.0)] == ["margarita"]
+        assert [_TITLES[p] for p in index.search("negorni", 5, 75.0)] == ["negroni"]
+        assert [_TITLES[p] for p in index.search("mohito", 5, 75.0)] == ["mojito"]
+
+    def test_later_words_match(self):
+        """Test that a misspelled later word in the title matches."""
+        index = TrigramIndex(_TITLES)
+
+        assert [_TITLES[p] for p in index.search("fashoined", 5, 75.0)] == ["old fashioned"]
+
+    def test_results_are_best_first_and_limited(self):
+        """Test ordering by score and the result limit."""
+        index = TrigramIndex(_TITLES)
+
+        results = [_TITLES[p] for p in index.search("mai ta", 5, 75.0)]
+        assert results[0] in ("mai tai", "bitter mai tai")
+        assert set(results) == {"mai tai", "bitter mai tai"}
+        assert len(index.search("mai ta", 1, 75.0)) == 1
+
+    def test_exclude_and_no_match(self):
+        """Test that excluded positions are skipped and unrelated text finds nothing."""
+        index = TrigramIndex(_TITLES)
+
+        assert index.search("margr", 5, 75.0, exclude={_TITLES.index("margarita")}) == []
+        assert index.search("zzzz", 5, 75.0) == []
+        assert index.search("margr", 0, 75.0) == []
+
+    def test_exclude_applies_before_candidate_cut(self):
+        """Test that more excluded prefix matches than the candidate cap still leave room for fuzzy matches."""
+        titles = [f"margarita {i}" for i in range(40)] + ["margharita royale"]
+        index = TrigramIndex(titles)
+
+        results = index.search("margarita", 5, 75.0, exclude=set(range(40)))
+
+        assert [titles[p] for p in results] == ["margharita royale"]
@@ -0,0 +1,113 @@
+import random
+
+import numpy as np
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.typeahead_prefix_index import (
+    TypeaheadPrefixIndex,
+    _AscendingRange,
+    normalize_typeahead_text,
+)
+
+
+def _index(titles):
+    titles = sorted(titles)
+    lower_titles = [t.lower() for t in titles]
+    return titles, TypeaheadPrefixIndex(lower_titles, [f"the {t} recipe" for t in lower_titles])
+
+
+class TestTypeaheadPrefixIndex:
+    """Test cases for TypeaheadPrefixIndex."""
+
+    def test_prefix_matches_in_title_order(self):
+        """Test that title prefix matches come back in title order."""
+        titles, index = _index(["Mojito", "Margarita", "Mai Tai", "Manhattan", "Negroni"])
+
+        assert [titles[p] for p in index.search("ma", 0, 10)] == ["Mai Tai", "Manhattan", "Margarita"]
+
+    def test_word_matches_follow_prefix_matches(self):
+        """Test that matches on a later word are appended after the prefix matches."""
+        titles, index = _index(["Bitter Mai Tai", "Mai Tai", "Mango Mai Tai Punch", "Mojito"])
+
+        assert [titles[p] for p in index.search("mai", 0, 10)] == ["Mai Tai", "Bitter Mai Tai", "Mango Mai Tai Punch"]
+
+    def test_word_matches_skipped_when_prefix_matches_fill_the_page(self):
+        """Test that word matches are only used when prefix matches are fewer than take."""
+        titles, index = _index(["Bitter Mai Tai", "Mai Tai", "Mai Tai Royale"])
+
+        assert [titles[p] for p in index.search("mai", 0, 2)] == ["Mai Tai", "Mai Tai Royale"]
+
+    def test_descriptive_title_is_searched(self):
+        """Test that descriptive-title prefixes and words match."""
+        titles, index = _index(["Margarita", "Mojito"])
+
+        assert [titles[p] for p in index.search("the moj", 0, 10)] == ["Mojito"]
+        assert [titles[p] for p in index.search("recipe", 0, 10)] == ["Margarita", "Mojito"]
+
+    def test_paging_and_normalisation(self):
+        """Test skip/take paging and case/whitespace-insensitive queries."""
+        titles, index = _index([f"Sour {i:02d}" for i in range(30)])
+
+        assert [titles[p] for p in index.search("  SOUR   1", 2, 3)] == ["Sour 12", "Sour 13", "Sour 14"]
+        assert index.search("absinthe", 0, 10) == []
+        assert normalize_typeahead_text("  Mai   TAI ") == "mai tai"
+
+    def test_matches_brute_force_on_random_catalog(self):
+        """Test that lookups agree with a scan over a random catalog."""
+        rng = random.Random(3)
+        words = ["mai", "tai", "sour", "smoky", "spritz", "royal", "mule"]
+        titles, index = _index([f"{' '.join(rng.sample(words, 3))} {i}" for i in range(300)])
+        lower = [t.lower() for t in titles]
+
+        for prefix in ["s", "sm", "mai t", "royal mule", "tai"]:
+            starts = [p for p, t in enumerate(lower) if t.startswith(prefix) or f"the {t} recipe".startswith(prefix)]
+            expected = starts[:10]
+            if len(starts) < 10:
+                word_hits = [
+                    p
+                    for p, t in enumerate(lower)
+                    if p not in starts
+                    and any(w.startswith(prefix) for w in _word_suffixes(t) + _word_suffixes(f"the {t} recipe"))
+                ]
+                expected = (starts + word_hits)[:10]
+            assert index.search(prefix, 0, 10) == expected
+
+
+def _word_suffixes(text):
+    tokens = text.split()
+    return [" ".join(tokens[i:]) for i in range(1, len(tokens))]
+
+
+class TestAscendingRange:
+    """Test cases for the sparse-table range helper."""
+
+    def test_yields_slice_values_in_ascending_order(self):
+        """Test that any slice is enumerated smallest first."""
+        rng = np.random.default_rng(5)
+        values = rng.integers(0, 50, size=97).astype(np.int32)
+        helper = _AscendingRange(values)
+
+        for lo, hi in [(0, 97), (5, 6), (10, 60), (96, 97), (30, 30)]:
+            assert list(helper.ascending(lo, hi)) == sorted(values[lo:hi].tolist())
+
+
+class TestTypeaheadFuzzySuggestions:
+    """Test cases for the typo-tolerant stage of TypeaheadPrefixIndex."""
+
+    def test_typos_fall_back_to_fuzzy_suggestions(self):
+        """Test that a misspelled query with no prefix matches gets fuzzy suggestions."""
+        titles, index = _index(["Margarita", "Mojito", "Negroni"])
+
+        assert [titles[p] for p in index.search("margr", 0, 10)] == ["Margarita"]
+        assert [titles[p] for p in index.search("Negorni", 0, 10)] == ["Negroni"]
+
+    def test_fuzzy_suggestions_follow_exact_prefix_matches(self):
+        """Test that fuzzy suggestions only fill the page after prefix matches."""
+        titles, index = _index(["Mojito", "Mohito Royale", "Negroni"])
+
+        assert [titles[p] for p in index.search("mohit", 0, 10)] == ["Mohito Royale", "Mojito"]
+
+    def test_short_queries_do_not_use_fuzzy_matching(self):
+        """Test that one- and two-character queries only use prefix matching."""
+        _, index = _index(["Margarita"])
+
+        assert index.search("mx", 0, 10) == []
@@ -1,9 +1,19 @@
-from unittest.mock import AsyncMock, MagicMock
+import json
+from importlib import resources
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from conftest import create_test_cocktail_model
+from conftest import (
+    create_test_cocktail_model,
+    create_test_parsed_query_cache,
+    create_test_query_dictionary_store,
+    create_test_search_result_cache,
+)
 from qdrant_client.http.models import FieldCondition, Filter, MatchAny, MatchValue, Range
 
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_model import CocktailSearchModel
 from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.models.cocktail_search_statistics import (
     CocktailSearchStatistics,
@@ -91,7 +101,9 @@ class TestFreeTextQueryHandler:
         )
 
         mock_repository.search_vectors = AsyncMock(return_value=[mock_cocktail1, mock_cocktail2])
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[mock_cocktail1, mock_cocktail2])
+        mock_repository.get_catalog_index = AsyncMock(
+            return_value=CocktailCatalogIndex([mock_cocktail1, mock_cocktail2])
+        )
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -101,6 +113,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="tequila")
@@ -157,7 +172,9 @@ class TestFreeTextQueryHandler:
 
         # Return in unsorted order
         mock_repository.search_vectors = AsyncMock(return_value=[mock_cocktail1, mock_cocktail2, mock_cocktail3])
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[mock_cocktail1, mock_cocktail2, mock_cocktail3])
+        mock_repository.get_catalog_index = AsyncMock(
+            return_value=CocktailCatalogIndex([mock_cocktail1, mock_cocktail2, mock_cocktail3])
+        )
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -167,6 +184,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="test query")
@@ -182,7 +202,7 @@ class TestFreeTextQueryHandler:
         """Test handler with empty search results."""
         mock_repository = AsyncMock()
         mock_repository.search_vectors = AsyncMock(return_value=[])
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -192,6 +212,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="nonexistent")
@@ -201,11 +224,13 @@ class TestFreeTextQueryHandler:
 
     @pytest.mark.anyio
     async def test_handler_with_empty_free_text(self):
-        """Test handler with empty free text calls get_all_cocktails."""
+        """Test handler with empty free text browses the catalog index."""
         mock_repository = AsyncMock()
         mock_cocktail1 = create_test_cocktail_model("1", "Cocktail A")
         mock_cocktail2 = create_test_cocktail_model("2", "Cocktail B")
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[mock_cocktail2, mock_cocktail1])
+        mock_repository.get_catalog_index = AsyncMock(
+            return_value=CocktailCatalogIndex([mock_cocktail2, mock_cocktail1])
+        )
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -215,13 +240,16 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text=None, skip=0, take=10)
         result = await handler.handle(query)
 
-        # Should call get_all_cocktails, not search_vectors
-        mock_repository.get_all_cocktails.assert_called_once()
+        # Should browse the catalog, not search_vectors
+        mock_repository.get_catalog_index.assert_called_once()
         mock_repository.search_vectors.assert_not_called()
 
         # Results should be sorted by title and paginated
@@ -234,7 +262,7 @@ class TestFreeTextQueryHandler:
         """Test that exact cocktail name match short-circuits semantic search."""
         mock_repository = AsyncMock()
         mock_cocktail = create_test_cocktail_model("1", "Margarita")
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[mock_cocktail])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([mock_cocktail]))
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -244,6 +272,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="Margarita")
@@ -259,7 +290,9 @@ class TestFreeTextQueryHandler:
         mock_repository = AsyncMock()
         mock_cocktail1 = create_test_cocktail_model("1", "Rum Runner")
         mock_cocktail2 = create_test_cocktail_model("2", "Mojito")
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[mock_cocktail1, mock_cocktail2])
+        mock_repository.get_catalog_index = AsyncMock(
+            return_value=CocktailCatalogIndex([mock_cocktail1, mock_cocktail2])
+        )
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -269,6 +302,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="rum")
@@ -284,7 +320,7 @@ class TestFreeTextQueryHandler:
         """Test that IBA filter is built and passed to search_vectors."""
         mock_repository = AsyncMock()
         mock_repository.search_vectors = AsyncMock(return_value=[])
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -294,6 +330,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="iba cocktail recipes")
@@ -315,7 +354,7 @@ class TestFreeTextQueryHandler:
         """Test that ingredient exclusion filter is built and passed to search_vectors."""
         mock_repository = AsyncMock()
         mock_repository.search_vectors = AsyncMock(return_value=[])
-        mock_repository.get_all_cocktails = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
 
         mock_qdrant_options = MagicMock()
         mock_reranker = AsyncMock()
@@ -325,6 +364,9 @@ class TestFreeTextQueryHandler:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
         query = FreeTextQuery(free_text="cocktails without honey")
@@ -342,6 +384,195 @@ class TestFreeTextQueryHandler:
         assert isinstance(query_filter.must_not[0].match, MatchValue)
         assert query_filter.must_not[0].match.value == "honey"
 
+    @pytest.mark.anyio
+    async def test_handler_serves_repeated_search_from_result_cache(self):
+        """Test that a repeated search is hydrated from the result cache without re-running the pipeline."""
+        mock_repository = AsyncMock()
+        cocktail = create_test_cocktail_model("1", "Margarita")
+        cocktail.search_statistics.reranker_score = 0.77
+        catalog_cocktail = create_test_cocktail_model("1", "Margarita")
+
+        mock_repository.search_vectors = AsyncMock(return_value=[cocktail])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([catalog_cocktail]))
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        cache = create_test_search_result_cache(enabled=True)
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=cache,
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
+
+        first = await handler.handle(FreeTextQuery(free_text="smoky tequila drinks"))
+        second = await handler.handle(FreeTextQuery(free_text="  Smoky  Tequila drinks "))
+
+        assert mock_repository.search_vectors.await_count == 1
+        assert mock_reranker.rerank.await_count == 1
+        assert [c.id for c in second] == [c.id for c in first] == ["1"]
+        assert second[0].search_statistics.reranker_score == 0.77
+        assert second[0] is not catalog_cocktail
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.anyio
+    async def test_handler_result_cache_key_includes_paging(self):
+        """Test that different skip/take values are cached separately."""
+        mock_repository = AsyncMock()
+        mock_repository.search_vectors = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(enabled=True),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
+
+        await handler.handle(FreeTextQuery(free_text="smoky tequila drinks", take=10))
+        await handler.handle(FreeTextQuery(free_text="smoky tequila drinks", take=20))
+
+        assert mock_repository.search_vectors.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_handler_reruns_search_when_cached_cocktail_left_catalog(self):
+        """Test that a cached ranking referencing a cocktail missing from the catalog is recomputed."""
+        mock_repository = AsyncMock()
+        cocktail = create_test_cocktail_model("1", "Margarita")
+        mock_repository.search_vectors = AsyncMock(return_value=[cocktail])
+        mock_repository.get_catalog_index = AsyncMock(
+            side_effect=[CocktailCatalogIndex([cocktail]), CocktailCatalogIndex([])]
+        )
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(enabled=True),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
+
+        await handler.handle(FreeTextQuery(free_text="smoky tequila drinks"))
+        await handler.handle(FreeTextQuery(free_text="smoky tequila drinks"))
+
+        assert mock_repository.search_vectors.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_handler_reuses_parsed_query_for_repeated_search(self):
+        """Test that a repeated query skips parsing and searches with the same filter and vector text."""
+        mock_repository = AsyncMock()
+        mock_repository.search_vectors = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        parsed_query_cache = create_test_parsed_query_cache()
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=parsed_query_cache,
+        )
+
+        await handler.handle(FreeTextQuery(free_text="top rated gin cocktails without honey"))
+        with patch.object(handler, "_build_query_filter", side_effect=AssertionError("parsed again")):
+            await handler.handle(FreeTextQuery(free_text="top rated gin cocktails without honey "))
+
+        first_call, second_call = mock_repository.search_vectors.call_args_list
+        assert second_call.kwargs == first_call.kwargs
+        assert first_call.kwargs["query_filter"].must_not[0].match.value == "honey"
+        assert parsed_query_cache.hits == 1
+        assert parsed_query_cache.misses == 1
+
+    @pytest.mark.anyio
+    async def test_handler_reparses_query_after_dictionary_reload(self, tmp_path):
+        """Test that queries parsed with a previous dictionary version are parsed again after a reload."""
+        static = resources.files("cezzis_com_cocktails_aisearch.static")
+        for file_name in ("query_intent_keywords.json", "query_synonym_expansions.json"):
+            (tmp_path / file_name).write_text(static.joinpath(file_name).read_text(encoding="utf-8"), encoding="utf-8")
+
+        mock_repository = AsyncMock()
+        mock_repository.search_vectors = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path))
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=store,
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
+
+        await handler.handle(FreeTextQuery(free_text="gin drinks in a coupe"))
+        keywords = json.loads((tmp_path / "query_intent_keywords.json").read_text(encoding="utf-8"))
+        del keywords["glassware_mapping"]["coupe"]
+        (tmp_path / "query_intent_keywords.json").write_text(json.dumps(keywords), encoding="utf-8")
+        await store.reload()
+        await handler.handle(FreeTextQuery(free_text="gin drinks in a coupe"))
+
+        first_call, second_call = mock_repository.search_vectors.call_args_list
+        assert first_call.kwargs["query_filter"] is not None
+        assert "coupe" in str(first_call.kwargs["query_filter"])
+        assert "coupe" not in str(second_call.kwargs["query_filter"])
+
+    @pytest.mark.anyio
+    async def test_handler_result_cache_misses_after_dictionary_reload(self, tmp_path):
+        """Test that rankings cached under the previous dictionaries are not served after a reload."""
+        static = resources.files("cezzis_com_cocktails_aisearch.static")
+        for file_name in ("query_intent_keywords.json", "query_synonym_expansions.json"):
+            (tmp_path / file_name).write_text(static.joinpath(file_name).read_text(encoding="utf-8"), encoding="utf-8")
+
+        mock_repository = AsyncMock()
+        mock_repository.search_vectors = AsyncMock(return_value=[])
+        mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex([]))
+
+        mock_reranker = AsyncMock()
+        mock_reranker.rerank = AsyncMock(side_effect=lambda query, cocktails, top_k=10: cocktails)
+
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path))
+        handler = FreeTextQueryHandler(
+            cocktail_vector_repository=mock_repository,
+            qdrant_opotions=MagicMock(),
+            reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(enabled=True),
+            query_dictionary_store=store,
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
+
+        await handler.handle(FreeTextQuery(free_text="gin drinks in a coupe"))
+        await handler.handle(FreeTextQuery(free_text="gin drinks in a coupe"))
+        assert mock_repository.search_vectors.await_count == 1
+
+        keywords = json.loads((tmp_path / "query_intent_keywords.json").read_text(encoding="utf-8"))
+        del keywords["glassware_mapping"]["coupe"]
+        (tmp_path / "query_intent_keywords.json").write_text(json.dumps(keywords), encoding="utf-8")
+        await store.reload()
+        await handler.handle(FreeTextQuery(free_text="gin drinks in a coupe"))
+
+        assert mock_repository.search_vectors.await_count == 2
+        assert "coupe" not in str(mock_repository.search_vectors.call_args.kwargs["query_filter"])
+
 
 class TestBuildQueryFilter:
     """Test cases for _build_query_filter."""
@@ -355,6 +586,9 @@ class TestBuildQueryFilter:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_returns_none_for_plain_query(self):
@@ -363,6 +597,15 @@ class TestBuildQueryFilter:
         result = handler._build_query_filter("delicious recipes", {})
         assert result is None
 
+    def test_uses_precomputed_intent(self):
+        """Test that a query already resolved by the intent matcher gives the same filter."""
+        handler = self._make_handler()
+        text = "refreshing bourbn cocktails in a coupe without honey"
+        dictionaries = handler.query_dictionary_store.current
+        intent = dictionaries.intent_matcher.match(text)
+
+        assert handler._build_query_filter(text, {}, dictionaries, intent) == handler._build_query_filter(text, {})
+
     def test_iba_filter(self):
         """Test IBA filter detection."""
         handler = self._make_handler()
@@ -557,6 +800,9 @@ class TestExtractExclusionTerms:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_without_pattern(self):
@@ -642,13 +888,16 @@ class TestFuzzyNameMatch:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_fuzzy_match_misspelled_margarita(self):
         """Test that 'Margerita' fuzzy-matches 'Margarita'."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_fuzzy_name_match("margerita", cocktails)
+        result = handler._find_fuzzy_name_match("margerita", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert len(result) == 1
         assert result[0].title == "Margarita"
@@ -657,7 +906,7 @@ class TestFuzzyNameMatch:
         """Test that 'Mohito' fuzzy-matches 'Mojito'."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Mojito")]
-        result = handler._find_fuzzy_name_match("mohito", cocktails)
+        result = handler._find_fuzzy_name_match("mohito", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert len(result) == 1
         assert result[0].title == "Mojito"
@@ -666,7 +915,7 @@ class TestFuzzyNameMatch:
         """Test that 'Daiquri' fuzzy-matches 'Daiquiri'."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Daiquiri")]
-        result = handler._find_fuzzy_name_match("daiquri", cocktails)
+        result = handler._find_fuzzy_name_match("daiquri", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert len(result) == 1
         assert result[0].title == "Daiquiri"
@@ -675,7 +924,7 @@ class TestFuzzyNameMatch:
         """Test that very different strings don't match."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_fuzzy_name_match("whiskey sour", cocktails)
+        result = handler._find_fuzzy_name_match("whiskey sour", CocktailCatalogIndex(cocktails))
         assert result is None
 
     def test_fuzzy_match_sorts_by_score(self):
@@ -685,10 +934,22 @@ class TestFuzzyNameMatch:
             create_test_cocktail_model("1", "Margarita"),
             create_test_cocktail_model("2", "Margherita Pizza"),
         ]
-        result = handler._find_fuzzy_name_match("margerita", cocktails)
+        result = handler._find_fuzzy_name_match("margerita", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert result[0].title == "Margarita"  # Higher fuzzy score
 
+    def test_fuzzy_match_breaks_ties_alphabetically(self):
+        """Test that equally scored fuzzy matches come back in title order regardless of catalog order."""
+        handler = self._make_handler()
+        cocktails = [
+            create_test_cocktail_model("1", "Mojito Royale"),
+            create_test_cocktail_model("2", "Gin Fizz"),
+            create_test_cocktail_model("3", "Mojito Punch"),
+        ]
+        result = handler._find_fuzzy_name_match("mojito", CocktailCatalogIndex(cocktails))
+        assert result is not None
+        assert [c.title for c in result] == ["Mojito Punch", "Mojito Royale"]
+
     def test_exact_name_match_tries_fuzzy_as_fallback(self):
         """Test that _find_exact_name_match falls back to fuzzy matching."""
         handler = self._make_handler()
@@ -696,7 +957,7 @@ class TestFuzzyNameMatch:
             create_test_cocktail_model("1", "Margarita"),
             create_test_cocktail_model("2", "Mojito"),
         ]
-        result = handler._find_exact_name_match("margerita", cocktails)
+        result = handler._find_exact_name_match("margerita", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert len(result) == 1
         assert result[0].title == "Margarita"
@@ -709,21 +970,21 @@ class TestFuzzyNameMatch:
             create_test_cocktail_model("2", "Gin Fizz"),
         ]
         # "gin cocktails" is a descriptive query, not a cocktail name lookup
-        result = handler._find_exact_name_match("gin cocktails", cocktails)
+        result = handler._find_exact_name_match("gin cocktails", CocktailCatalogIndex(cocktails))
         assert result is None
 
     def test_exact_name_match_skips_drinks_suffix(self):
         """Test that queries ending with 'drinks' skip name matching."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Vodka Drinks")]
-        result = handler._find_exact_name_match("vodka drinks", cocktails)
+        result = handler._find_exact_name_match("vodka drinks", CocktailCatalogIndex(cocktails))
         assert result is None
 
     def test_exact_name_match_strips_singular_cocktail_suffix(self):
         """Test that 'margarita cocktail' is normalized by removing singular suffix."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_exact_name_match("margarita cocktail", cocktails)
+        result = handler._find_exact_name_match("margarita cocktail", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert result[0].title == "Margarita"
 
@@ -731,7 +992,7 @@ class TestFuzzyNameMatch:
         """Test that 'champagne cocktail' (singular) still matches the actual cocktail name."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Champagne Cocktail")]
-        result = handler._find_exact_name_match("champagne cocktail", cocktails)
+        result = handler._find_exact_name_match("champagne cocktail", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert result[0].title == "Champagne Cocktail"
 
@@ -748,6 +1009,9 @@ class TestKeywordMetadataFilters:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_base_spirit_gin_filter(self):
@@ -914,6 +1178,9 @@ class TestFuzzyWordMatch:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_exact_match_short_word(self):
@@ -955,6 +1222,9 @@ class TestFuzzyKeywordInText:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_exact_keyword_found(self):
@@ -1003,6 +1273,9 @@ class TestFuzzyFilterMisspellings:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_misspelled_bourbon_triggers_spirit_filter(self):
@@ -1127,6 +1400,9 @@ class TestFuzzyExtractionMisspellings:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_misspelled_without_extracts_exclusion(self):
@@ -1154,13 +1430,16 @@ class TestFuzzySuffixStripping:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_misspelled_cocktail_suffix_stripped(self):
         """Test that 'margarita coctail' strips the misspelled suffix and matches."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_exact_name_match("margarita coctail", cocktails)
+        result = handler._find_exact_name_match("margarita coctail", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert result[0].title == "Margarita"
 
@@ -1168,7 +1447,7 @@ class TestFuzzySuffixStripping:
         """Test that 'margarita reciepe' strips the misspelled suffix and matches."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_exact_name_match("margarita reciepe", cocktails)
+        result = handler._find_exact_name_match("margarita reciepe", CocktailCatalogIndex(cocktails))
         assert result is not None
         assert result[0].title == "Margarita"
 
@@ -1176,7 +1455,7 @@ class TestFuzzySuffixStripping:
         """Test that 'coctails with' fuzzy-matches 'cocktails' prefix and skips name matching."""
         handler = self._make_handler()
         cocktails = [create_test_cocktail_model("1", "Margarita")]
-        result = handler._find_exact_name_match("coctails with gin", cocktails)
+        result = handler._find_exact_name_match("coctails with gin", CocktailCatalogIndex(cocktails))
         assert result is None
 
 
@@ -1233,35 +1512,42 @@ class TestExpandQuerySynonyms:
     """Test cases for _expand_query_synonyms."""
 
     def setup_method(self):
-        """Reset cached synonym expansions before each test to ensure fresh load."""
-        FreeTextQueryHandler._synonym_expansions = None
+        """Create a handler over the packaged query dictionaries."""
+        self.handler = FreeTextQueryHandler(
+            cocktail_vector_repository=AsyncMock(),
+            qdrant_opotions=MagicMock(),
+            reranker_service=AsyncMock(),
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
 
     def test_expands_nightcap_with_synonyms(self):
         """Test that 'nightcap' query gets expanded with relevant terms."""
-        result = FreeTextQueryHandler._expand_query_synonyms("nightcap")
+        result = self.handler._expand_query_synonyms("nightcap")
         assert result.startswith("nightcap")
         assert "warm" in result or "strong" in result or "digestif" in result
 
     def test_expands_tiki_with_tropical_terms(self):
         """Test that 'tiki' triggers cocktail family expansion."""
-        result = FreeTextQueryHandler._expand_query_synonyms("tiki")
+        result = self.handler._expand_query_synonyms("tiki")
         assert result.startswith("tiki")
         assert "tropical" in result or "rum" in result
 
     def test_expands_spirit_terms(self):
         """Test that spirit names expand with related terms."""
-        result = FreeTextQueryHandler._expand_query_synonyms("bourbon")
+        result = self.handler._expand_query_synonyms("bourbon")
         assert result.startswith("bourbon")
         assert "whiskey" in result or "old fashioned" in result
 
     def test_no_expansion_for_unknown_terms(self):
         """Test that a query with no matching triggers is returned unchanged."""
-        result = FreeTextQueryHandler._expand_query_synonyms("xyzzy foobar")
+        result = self.handler._expand_query_synonyms("xyzzy foobar")
         assert result == "xyzzy foobar"
 
     def test_does_not_duplicate_existing_words(self):
         """Test that words already in the query are not appended again."""
-        result = FreeTextQueryHandler._expand_query_synonyms("tropical rum")
+        result = self.handler._expand_query_synonyms("tropical rum")
         words = result.split()
         # Check no word appears more than once (case-insensitive)
         lower_words = [w.lower() for w in words]
@@ -1272,7 +1558,7 @@ class TestExpandQuerySynonyms:
         """Test that expansion is capped at _MAX_EXPANSION_TERMS."""
         # 'negroni' triggers multiple categories (family, spirit via 'gin') so
         # many synonyms are candidates — verify the cap is applied.
-        result = FreeTextQueryHandler._expand_query_synonyms("negroni")
+        result = self.handler._expand_query_synonyms("negroni")
         # Count how many words were added beyond the original
         original_word_count = len("negroni".split())
         total_word_count = len(result.split())
@@ -1281,17 +1567,17 @@ class TestExpandQuerySynonyms:
 
     def test_preserves_original_text(self):
         """Test that the original query text is always preserved at the start."""
-        result = FreeTextQueryHandler._expand_query_synonyms("beach party drinks")
+        result = self.handler._expand_query_synonyms("beach party drinks")
         assert result.startswith("beach party drinks")
 
     def test_empty_string_returns_empty(self):
         """Test that empty input returns empty output."""
-        result = FreeTextQueryHandler._expand_query_synonyms("")
+        result = self.handler._expand_query_synonyms("")
         assert result == ""
 
     def test_intent_expansion_brunch(self):
         """Test that 'brunch' query gets intent-based expansion."""
-        result = FreeTextQueryHandler._expand_query_synonyms("brunch")
+        result = self.handler._expand_query_synonyms("brunch")
         assert result.startswith("brunch")
         # Should include brunch-related terms
         expanded_terms = result.split()[1:]  # Skip original word
@@ -1299,19 +1585,19 @@ class TestExpandQuerySynonyms:
 
     def test_ingredient_expansion_mint(self):
         """Test that 'mint' triggers ingredient expansion."""
-        result = FreeTextQueryHandler._expand_query_synonyms("mint")
+        result = self.handler._expand_query_synonyms("mint")
         assert result.startswith("mint")
         assert "refreshing" in result or "mojito" in result or "julep" in result
 
     def test_flavor_expansion_smokey(self):
         """Test that 'smokey' triggers flavor expansion."""
-        result = FreeTextQueryHandler._expand_query_synonyms("smokey")
+        result = self.handler._expand_query_synonyms("smokey")
         assert result.startswith("smokey")
         assert "smoky" in result or "mezcal" in result or "islay" in result
 
     def test_multiple_triggers_combine(self):
         """Test that multiple matching triggers combine their expansions."""
-        result = FreeTextQueryHandler._expand_query_synonyms("summer tiki")
+        result = self.handler._expand_query_synonyms("summer tiki")
         assert result.startswith("summer tiki")
         expanded_terms = result.split()[2:]  # Skip original words
         # Both 'summer' and 'tiki' should contribute terms
@@ -1321,80 +1607,56 @@ class TestExpandQuerySynonyms:
         """Test that the expansion method returns a string starting with the original,
         confirming the reranker can use the original text separately."""
         original = "old fashioned"
-        expanded = FreeTextQueryHandler._expand_query_synonyms(original)
+        expanded = self.handler._expand_query_synonyms(original)
         assert expanded.startswith(original)
         # Expanded version should have additional terms
         assert len(expanded) > len(original)
 
 
-class TestLoadSynonymExpansions:
-    """Test cases for _load_synonym_expansions."""
-
-    def setup_method(self):
-        """Reset cached synonym expansions before each test."""
-        FreeTextQueryHandler._synonym_expansions = None
-
-    def test_loads_json_file_successfully(self):
-        """Test that the JSON file loads and contains expected categories."""
-        data = FreeTextQueryHandler._load_synonym_expansions()
-        assert isinstance(data, dict)
-        assert "intent_expansions" in data
-        assert "cocktail_family_expansions" in data
-        assert "spirit_expansions" in data
-        assert "ingredient_expansions" in data
-        assert "flavor_expansions" in data
-        assert "occasion_expansions" in data
-
-    def test_excludes_metadata_keys(self):
-        """Test that keys starting with '_' are excluded from loaded data."""
-        data = FreeTextQueryHandler._load_synonym_expansions()
-        for key in data:
-            assert not key.startswith("_"), f"Metadata key '{key}' should be excluded"
-
-    def test_caches_after_first_load(self):
-        """Test that the synonym data is cached after the first load."""
-        data1 = FreeTextQueryHandler._load_synonym_expansions()
-        data2 = FreeTextQueryHandler._load_synonym_expansions()
-        assert data1 is data2  # Same object reference = cached
-
-
 class TestExtractSearchTermWords:
     """Test cases for _extract_search_term_words."""
 
     def setup_method(self):
-        """Reset cached synonym expansions before each test."""
-        FreeTextQueryHandler._synonym_expansions = None
+        """Create a handler over the packaged query dictionaries."""
+        self.handler = FreeTextQueryHandler(
+            cocktail_vector_repository=AsyncMock(),
+            qdrant_opotions=MagicMock(),
+            reranker_service=AsyncMock(),
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
+        )
 
     def test_extracts_hangover_trigger(self):
         """Test that 'hangover' matches the intent expansion trigger."""
-        result = FreeTextQueryHandler._extract_search_term_words("hangover")
+        result = self.handler._extract_search_term_words("hangover")
         assert "hangover" in result
 
     def test_extracts_nightcap_trigger(self):
         """Test that 'nightcap' matches the intent expansion trigger."""
-        result = FreeTextQueryHandler._extract_search_term_words("nightcap")
+        result = self.handler._extract_search_term_words("nightcap")
         assert "nightcap" in result
 
     def test_no_match_for_generic_words(self):
         """Test that generic words like 'delicious' don't match any trigger."""
-        result = FreeTextQueryHandler._extract_search_term_words("delicious recipes")
+        result = self.handler._extract_search_term_words("delicious recipes")
         assert result == []
 
     def test_extracts_multi_word_trigger(self):
         """Test that multi-word triggers like 'old fashioned' extract individual words."""
-        result = FreeTextQueryHandler._extract_search_term_words("old fashioned")
+        result = self.handler._extract_search_term_words("old fashioned")
         assert "old" in result
         assert "fashioned" in result
 
     def test_no_duplicates(self):
         """Test that extracted words are not duplicated."""
-        result = FreeTextQueryHandler._extract_search_term_words("summer tiki bar")
+        result = self.handler._extract_search_term_words("summer tiki bar")
         # No word should appear more than once
         assert len(result) == len(set(result))
 
     def test_empty_string_returns_empty(self):
         """Test that empty input returns empty list."""
-        result = FreeTextQueryHandler._extract_search_term_words("")
+        result = self.handler._extract_search_term_words("")
         assert result == []
 
 
@@ -1410,6 +1672,9 @@ class TestSearchWordsFilter:
             cocktail_vector_repository=mock_repository,
             qdrant_opotions=mock_qdrant_options,
             reranker_service=mock_reranker,
+            search_result_cache=create_test_search_result_cache(),
+            query_dictionary_store=create_test_query_dictionary_store(),
+            parsed_query_cache=create_test_parsed_query_cache(),
         )
 
     def test_hangover_creates_should_filter(self):
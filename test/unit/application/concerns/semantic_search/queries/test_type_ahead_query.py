@@ -0,0 +1,68 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from conftest import create_test_cocktail_model
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.queries.type_ahead_query import (
+    TypeAheadQuery,
+    TypeAheadQueryHandler,
+)
+
+
+def _make_handler(titles):
+    mock_repository = AsyncMock()
+    cocktails = [create_test_cocktail_model(str(i), title) for i, title in enumerate(titles)]
+    mock_repository.get_catalog_index = AsyncMock(return_value=CocktailCatalogIndex(cocktails))
+    return TypeAheadQueryHandler(cocktail_vector_repository=mock_repository, qdrant_opotions=MagicMock())
+
+
+class TestTypeAheadQueryHandler:
+    """Test cases for TypeAheadQueryHandler."""
+
+    @pytest.mark.anyio
+    async def test_empty_text_returns_catalog_in_title_order(self):
+        """Test that an empty query pages through the catalog alphabetically."""
+        handler = _make_handler(["Mojito", "Daiquiri", "Margarita"])
+
+        results = await handler.handle(TypeAheadQuery(free_text="", take=2))
+
+        assert [c.title for c in results] == ["Daiquiri", "Margarita"]
+
+    @pytest.mark.anyio
+    async def test_prefix_matches_come_before_contains_matches(self):
+        """Test that prefix matches lead, followed by substring matches not already returned."""
+        handler = _make_handler(["Bitter Mai Tai", "Mai Tai", "Mango Mai Tai Punch", "Mojito"])
+
+        results = await handler.handle(TypeAheadQuery(free_text="mai"))
+
+        assert [c.title for c in results] == ["Mai Tai", "Bitter Mai Tai", "Mango Mai Tai Punch"]
+
+    @pytest.mark.anyio
+    async def test_contains_matches_skipped_when_prefix_matches_fill_page(self):
+        """Test that substring matches are only added when prefix matches do not fill the page."""
+        handler = _make_handler(["Mai Tai", "Bitter Mai Tai"])
+
+        results = await handler.handle(TypeAheadQuery(free_text="mai", take=1))
+
+        assert [c.title for c in results] == ["Mai Tai"]
+
+    @pytest.mark.anyio
+    async def test_descriptive_title_prefix_matches(self):
+        """Test that the descriptive title is also matched by prefix."""
+        handler = _make_handler(["Margarita"])
+
+        results = await handler.handle(TypeAheadQuery(free_text="margarita desc"))
+
+        assert [c.title for c in results] == ["Margarita"]
+
+    @pytest.mark.anyio
+    async def test_misspelled_query_returns_fuzzy_suggestions(self):
+        """Test that a typo such as 'negorni' still suggests the intended cocktail."""
+        handler = _make_handler(["Negroni", "Margarita", "Mojito"])
+
+        results = await handler.handle(TypeAheadQuery(free_text="negorni"))
+
+        assert [c.title for c in results] == ["Negroni"]
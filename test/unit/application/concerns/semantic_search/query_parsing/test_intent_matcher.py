@@ -0,0 +1,55 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.intent_matcher import (
+    IntentMatcher,
+)
+
+
+class TestIntentMatcher:
+    """Test cases for IntentMatcher."""
+
+    def _matcher(self) -> IntentMatcher:
+        return IntentMatcher(["gin", "rum", "bourbon", "whiskey", "top rated", "refreshing", "rocks glass"])
+
+    def test_short_words_match_exactly(self):
+        """Test that words shorter than five characters need an exact match."""
+        intent = self._matcher().match("gn and rmu cocktails")
+
+        assert intent.contains("gin") is False
+        assert intent.contains("rum") is False
+        assert self._matcher().match("gin and rum").contains_any(["gin", "rum"]) is True
+
+    def test_long_words_match_fuzzily(self):
+        """Test that misspelled long words still match their keyword."""
+        intent = self._matcher().match("bourbn or whisky, refrashing!")
+
+        assert intent.all_matches(["gin", "bourbon", "whiskey", "refreshing"]) == ["bourbon", "whiskey", "refreshing"]
+
+    def test_multi_word_keywords_need_consecutive_words(self):
+        """Test that multi-word keywords only match as a consecutive window."""
+        matcher = self._matcher()
+
+        assert matcher.match("show me top rated drinks").contains("top rated") is True
+        assert matcher.match("rated top drinks").contains("top rated") is False
+        assert matcher.match("served in a rocks glas").contains("rocks glass") is True
+
+    def test_first_match_follows_keyword_order(self):
+        """Test that first_match returns the first keyword in iteration order, not query order."""
+        intent = self._matcher().match("rum or gin")
+
+        assert intent.first_match({"gin": "gin", "rum": "rum"}) == "gin"
+        assert intent.first_match(["vodka"]) is None
+
+    def test_keywords_outside_the_vocabulary_use_the_same_rule(self):
+        """Test that keywords the matcher was not built from are still matched per word."""
+        intent = self._matcher().match("a smokey mezcal")
+
+        assert intent.contains("smoky") is True
+        assert intent.contains("mezcal") is True
+        assert intent.contains("tequila") is False
+
+    def test_matches_for_resolves_unknown_tokens(self):
+        """Test that an unknown word resolves to the vocabulary words it fuzzy-matches."""
+        matcher = self._matcher()
+
+        assert matcher.matches_for("whiskey") == {"whiskey"}
+        assert matcher.matches_for("whiskie") == {"whiskey"}
+        assert matcher.matches_for("vodka") == frozenset()
@@ -0,0 +1,70 @@
+from conftest import create_test_parsed_query_cache
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.parsed_query_cache import (
+    ParsedQuery,
+    ParsedQueryCache,
+)
+
+
+def _parsed(text: str) -> ParsedQuery:
+    return ParsedQuery(
+        query_filter=None,
+        vector_search_text=text,
+        expanded_search_text=text,
+        exclusion_terms=[],
+        rating_sort=False,
+    )
+
+
+class TestParsedQueryCache:
+    """Test cases for ParsedQueryCache."""
+
+    def test_make_key_trims_text_and_keeps_groups_and_version(self):
+        """Test that surrounding whitespace is ignored but ingredient groups and dictionary version are not."""
+        base = ParsedQueryCache.make_key("smoky mezcal", {}, 1)
+
+        assert ParsedQueryCache.make_key("  smoky mezcal ", {}, 1) == base
+        assert ParsedQueryCache.make_key("smoky mezcal", {"spirit": ["mezcal"]}, 1) != base
+        assert ParsedQueryCache.make_key("smoky mezcal", {}, 2) != base
+        assert ParsedQueryCache.make_key("Smoky Mezcal", {}, 1) != base
+
+    def test_get_returns_stored_query_and_tracks_hit_ratio(self):
+        """Test a round trip through the cache and the hit/miss counters."""
+        cache = create_test_parsed_query_cache()
+        key = ParsedQueryCache.make_key("gin", {}, 1)
+        parsed = _parsed("gin")
+
+        assert cache.get(key) is None
+        cache.set(key, parsed)
+
+        assert cache.get(key) is parsed
+        assert cache.get(key) is parsed
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.hit_ratio == 2 / 3
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that the oldest untouched entry is evicted once the cache is full."""
+        cache = create_test_parsed_query_cache(max_entries=2)
+        gin, rum, tequila = (ParsedQueryCache.make_key(text, {}, 1) for text in ("gin", "rum", "tequila"))
+
+        cache.set(gin, _parsed("gin"))
+        cache.set(rum, _parsed("rum"))
+        cache.get(gin)
+        cache.set(tequila, _parsed("tequila"))
+
+        assert len(cache) == 2
+        assert cache.get(rum) is None
+        assert cache.get(gin) is not None
+        assert cache.get(tequila) is not None
+
+    def test_disabled_cache_never_stores(self):
+        """Test that a max_entries of 0 disables the cache."""
+        cache = create_test_parsed_query_cache(max_entries=0)
+        key = ParsedQueryCache.make_key("gin", {}, 1)
+
+        cache.set(key, _parsed("gin"))
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+        assert cache.hit_ratio == 0.0
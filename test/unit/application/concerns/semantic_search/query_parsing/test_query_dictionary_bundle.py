@@ -0,0 +1,78 @@
+import json
+from importlib import resources
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    KEYWORDS_FILE_NAME,
+    SYNONYMS_FILE_NAME,
+    QueryDictionaryBundle,
+)
+
+
+def _packaged(file_name: str) -> bytes:
+    return resources.files("cezzis_com_cocktails_aisearch.static").joinpath(file_name).read_bytes()
+
+
+class TestQueryDictionaryBundle:
+    """Test cases for QueryDictionaryBundle."""
+
+    def test_loads_packaged_synonym_categories(self):
+        """Test that the packaged synonym file loads with its expected categories."""
+        bundle = QueryDictionaryBundle(_packaged(KEYWORDS_FILE_NAME), _packaged(SYNONYMS_FILE_NAME))
+
+        assert set(bundle.synonym_expansions) == {
+            "intent_expansions",
+            "cocktail_family_expansions",
+            "spirit_expansions",
+            "ingredient_expansions",
+            "flavor_expansions",
+            "occasion_expansions",
+        }
+        assert len(bundle.synonym_index) == sum(len(m) for m in bundle.synonym_expansions.values())
+
+    def test_excludes_metadata_keys(self):
+        """Test that keys starting with '_' are excluded from the synonym expansions."""
+        bundle = QueryDictionaryBundle(_packaged(KEYWORDS_FILE_NAME), _packaged(SYNONYMS_FILE_NAME))
+
+        assert not any(key.startswith("_") for key in bundle.synonym_expansions)
+
+    def test_loads_packaged_keyword_tables_and_compiles_the_matcher(self):
+        """Test that every keyword table is loaded and its words are in the intent matcher vocabulary."""
+        bundle = QueryDictionaryBundle(_packaged(KEYWORDS_FILE_NAME), _packaged(SYNONYMS_FILE_NAME), version=4)
+
+        assert bundle.version == 4
+        assert bundle.glassware_mapping["martini glass"] == "cocktailGlass"
+        assert bundle.base_spirit_mapping["whisky"] == "whiskey"
+        assert "without " in bundle.exclusion_patterns
+        assert {"martini", "glass", "without", "refreshing"} <= bundle.intent_matcher.vocabulary
+
+    def test_fingerprint_tracks_content(self):
+        """Test that the fingerprint only changes when the dictionary content does."""
+        keywords, synonyms = _packaged(KEYWORDS_FILE_NAME), _packaged(SYNONYMS_FILE_NAME)
+        changed = json.loads(synonyms)
+        changed["intent_expansions"]["hangover"] = ["brunch"]
+
+        first = QueryDictionaryBundle(keywords, synonyms, version=1)
+        second = QueryDictionaryBundle(keywords, synonyms, version=2)
+        third = QueryDictionaryBundle(keywords, json.dumps(changed).encode(), version=3)
+
+        assert first.fingerprint == second.fingerprint
+        assert first.fingerprint != third.fingerprint
+
+    @pytest.mark.parametrize(
+        ("table", "value"),
+        [("glassware_mapping", ["coupe"]), ("mood_keywords", {"cozy": "cozy"}), ("season_keywords", [1, 2])],
+    )
+    def test_rejects_malformed_keyword_tables(self, table, value):
+        """Test that a keyword table of the wrong shape fails the whole bundle."""
+        keywords = json.loads(_packaged(KEYWORDS_FILE_NAME))
+        keywords[table] = value
+
+        with pytest.raises(ValueError, match=table):
+            QueryDictionaryBundle(json.dumps(keywords).encode(), _packaged(SYNONYMS_FILE_NAME))
+
+    def test_rejects_invalid_json(self):
+        """Test that unparseable dictionary files raise instead of producing a partial bundle."""
+        with pytest.raises(ValueError):
+            QueryDictionaryBundle(b"{not json", _packaged(SYNONYMS_FILE_NAME))
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import os
+import shutil
+from importlib import resources
+
+import pytest
+from conftest import create_test_query_dictionary_store
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.query_dictionary_bundle import (
+    KEYWORDS_FILE_NAME,
+    SYNONYMS_FILE_NAME,
+)
+
+
+def _copy_packaged_dictionaries(directory) -> None:
+    static = resources.files("cezzis_com_cocktails_aisearch.static")
+    for file_name in (KEYWORDS_FILE_NAME, SYNONYMS_FILE_NAME):
+        shutil.copyfile(str(static.joinpath(file_name)), directory / file_name)
+
+
+def _edit_keywords(directory, edit) -> None:
+    path = directory / KEYWORDS_FILE_NAME
+    keywords = json.loads(path.read_text(encoding="utf-8"))
+    edit(keywords)
+    path.write_text(json.dumps(keywords), encoding="utf-8")
+    # Make sure the modification time moves even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestQueryDictionaryStore:
+    """Test cases for QueryDictionaryStore."""
+
+    def test_loads_packaged_dictionaries_by_default(self):
+        """Test that the store starts on version 1 of the packaged dictionaries."""
+        store = create_test_query_dictionary_store()
+
+        assert store.current.version == 1
+        assert store.current.glassware_mapping["coupe"] == "coupe"
+        assert store.has_changed() is False
+
+    @pytest.mark.anyio
+    async def test_reload_swaps_in_a_new_version_without_touching_the_old_one(self, tmp_path):
+        """Test copy-on-write: a bundle taken before the reload is left intact."""
+        _copy_packaged_dictionaries(tmp_path)
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path))
+        in_flight = store.current
+
+        _edit_keywords(tmp_path, lambda k: k["glassware_mapping"].update({"nick and nora": "nickAndNora"}))
+        assert store.has_changed() is True
+        reloaded = await store.reload(force=False)
+
+        assert reloaded is store.current
+        assert reloaded.version == 2
+        assert reloaded.glassware_mapping["nick and nora"] == "nickAndNora"
+        assert "nick and nora" not in in_flight.glassware_mapping
+        assert store.has_changed() is False
+
+    @pytest.mark.anyio
+    async def test_unchanged_files_keep_the_current_version(self, tmp_path):
+        """Test that reloading identical content does not bump the version."""
+        _copy_packaged_dictionaries(tmp_path)
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path))
+        current = store.current
+
+        assert await store.reload(force=False) is current
+        assert await store.reload(force=True) is current
+
+    @pytest.mark.anyio
+    async def test_invalid_files_keep_the_current_version(self, tmp_path):
+        """Test that a failed reload raises and leaves the current bundle in place."""
+        _copy_packaged_dictionaries(tmp_path)
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path))
+        current = store.current
+
+        _edit_keywords(tmp_path, lambda k: k.update({"mood_keywords": "cozy"}))
+        with pytest.raises(ValueError, match="mood_keywords"):
+            await store.reload()
+
+        assert store.current is current
+
+    @pytest.mark.anyio
+    async def test_watch_reloads_changed_files(self, tmp_path):
+        """Test that the watcher picks up an edited file on its next poll."""
+        _copy_packaged_dictionaries(tmp_path)
+        store = create_test_query_dictionary_store(dictionary_dir=str(tmp_path), reload_interval_seconds=0.01)
+        watcher = asyncio.create_task(store.watch())
+
+        _edit_keywords(tmp_path, lambda k: k["mood_keywords"].append("moody"))
+        for _ in range(200):
+            if store.current.version == 2:
+                break
+            await asyncio.sleep(0.01)
+        watcher.cancel()
+
+        assert store.current.version == 2
+        assert "moody" in store.current.mood_keywords
+
+    @pytest.mark.anyio
+    async def test_watch_is_disabled_with_zero_interval(self):
+        """Test that a zero reload interval turns the watcher into a no-op."""
+        store = create_test_query_dictionary_store(reload_interval_seconds=0.0)
+
+        await asyncio.wait_for(store.watch(), timeout=1.0)
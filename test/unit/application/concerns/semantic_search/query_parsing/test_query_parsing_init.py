@@ -0,0 +1,15 @@
+# Unit tests for application/concerns/semantic_search/query_parsing/__init__.py
+import importlib
+
+
+def test_import_query_parsing_init():
+    module = importlib.import_module("cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing")
+
+    assert module.IntentMatcher is not None
+    assert module.IntentMatch is not None
+    assert module.AhoCorasickAutomaton is not None
+    assert module.SynonymIndex is not None
+    assert module.QueryDictionaryBundle is not None
+    assert module.QueryDictionaryStore is not None
+    assert module.ParsedQuery is not None
+    assert module.ParsedQueryCache is not None
@@ -0,0 +1,55 @@
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.query_parsing.synonym_index import (
+    AhoCorasickAutomaton,
+    SynonymIndex,
+)
+
+
+class TestAhoCorasickAutomaton:
+    """Test cases for AhoCorasickAutomaton."""
+
+    def test_finds_overlapping_and_nested_patterns(self):
+        """Test that every pattern occurring as a substring is reported, including overlaps."""
+        automaton = AhoCorasickAutomaton(["he", "she", "his", "hers"])
+
+        assert automaton.find("ushers") == {0, 1, 3}
+        assert automaton.find("this") == {2}
+
+    def test_matches_plain_substring_checks(self):
+        """Test that results agree with a substring check for each pattern."""
+        patterns = ["gin", "ginger", "ginger beer", "rum", "spiced rum", "beer", "er b", "r"]
+        automaton = AhoCorasickAutomaton(patterns)
+
+        for text in ["spiced rum and ginger beer", "gin", "bitter", "", "root beer float"]:
+            assert automaton.find(text) == {i for i, pattern in enumerate(patterns) if pattern in text}
+
+    def test_no_patterns_finds_nothing(self):
+        """Test that an empty automaton never matches."""
+        assert AhoCorasickAutomaton([]).find("anything") == set()
+
+
+class TestSynonymIndex:
+    """Test cases for SynonymIndex."""
+
+    def test_matches_returns_entries_in_file_order(self):
+        """Test that matched triggers come back in category and trigger order, not query order."""
+        index = SynonymIndex(
+            {
+                "spirit_expansions": {"mezcal": ["smoky", "agave"], "gin": ["juniper"]},
+                "intent_expansions": {"nightcap": ["digestif"], "smoky": ["peated"]},
+            }
+        )
+
+        assert index.matches("smoky gin nightcap with mezcal") == [
+            ("mezcal", ["smoky", "agave"]),
+            ("gin", ["juniper"]),
+            ("nightcap", ["digestif"]),
+            ("smoky", ["peated"]),
+        ]
+        assert index.matches("vodka") == []
+
+    def test_duplicate_triggers_across_categories_each_match(self):
+        """Test that a trigger repeated in two categories yields both entries."""
+        index = SynonymIndex({"a": {"tiki": ["tropical"]}, "b": {"tiki": ["rum"]}})
+
+        assert index.matches("tiki night") == [("tiki", ["tropical"]), ("tiki", ["rum"])]
+        assert len(index) == 2
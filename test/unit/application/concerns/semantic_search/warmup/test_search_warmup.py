@@ -0,0 +1,104 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from conftest import create_test_cocktail_model
+
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.indexes.cocktail_catalog_index import (
+    CocktailCatalogIndex,
+)
+from cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup.search_warmup import SearchWarmup
+
+
+def _make_warmup(queries="", enabled=True, timeout_seconds=5.0, mediator=None, repository=None) -> SearchWarmup:
+    options = MagicMock()
+    options.enabled = enabled
+    options.queries = queries
+    options.timeout_seconds = timeout_seconds
+
+    if repository is None:
+        repository = AsyncMock()
+        repository.get_catalog_index.return_value = CocktailCatalogIndex([create_test_cocktail_model()])
+
+    return SearchWarmup(
+        mediator=mediator if mediator is not None else AsyncMock(),
+        cocktail_search_repository=repository,
+        warmup_options=options,
+    )
+
+
+class TestSearchWarmup:
+    """Test cases for SearchWarmup."""
+
+    def test_is_complete_immediately_when_disabled(self):
+        """Test that a disabled warm-up never holds readiness back."""
+        warmup = _make_warmup(enabled=False)
+
+        assert warmup.is_complete is True
+
+    def test_parses_comma_separated_head_queries(self):
+        """Test that head queries are trimmed and blank entries dropped."""
+        warmup = _make_warmup(queries=" margarita, smoky mezcal ,, gin ")
+
+        assert warmup.queries == ["margarita", "smoky mezcal", "gin"]
+
+    @pytest.mark.anyio
+    async def test_run_preloads_catalog_and_sends_head_queries(self):
+        """Test that run loads the catalog, sends each head query through the mediator and completes."""
+        mediator = AsyncMock()
+        warmup = _make_warmup(queries="margarita,smoky mezcal", mediator=mediator)
+
+        assert warmup.is_complete is False
+        await warmup.run()
+
+        assert warmup.is_complete is True
+        warmup.cocktail_search_repository.get_catalog_index.assert_awaited_once()
+        sent = [call.args[0].free_text for call in mediator.send_async.await_args_list]
+        assert sent == ["margarita", "smoky mezcal"]
+
+    @pytest.mark.anyio
+    async def test_run_does_nothing_when_disabled(self):
+        """Test that a disabled warm-up touches neither the catalog nor the mediator."""
+        mediator = AsyncMock()
+        warmup = _make_warmup(queries="margarita", enabled=False, mediator=mediator)
+
+        await warmup.run()
+
+        warmup.cocktail_search_repository.get_catalog_index.assert_not_awaited()
+        mediator.send_async.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_failed_head_query_does_not_stop_the_others(self):
+        """Test that one failing head query is logged and the rest still run."""
+        mediator = AsyncMock()
+        mediator.send_async.side_effect = [RuntimeError("embedding service down"), []]
+        warmup = _make_warmup(queries="margarita,daiquiri", mediator=mediator)
+
+        await warmup.run()
+
+        assert mediator.send_async.await_count == 2
+        assert warmup.is_complete is True
+
+    @pytest.mark.anyio
+    async def test_catalog_failure_still_completes(self):
+        """Test that a failed catalog load marks the warm-up complete so the replica serves cold."""
+        repository = AsyncMock()
+        repository.get_catalog_index.side_effect = RuntimeError("qdrant unavailable")
+        mediator = AsyncMock()
+        warmup = _make_warmup(queries="margarita", mediator=mediator, repository=repository)
+
+        await warmup.run()
+
+        assert warmup.is_complete is True
+        mediator.send_async.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_timeout_still_completes(self):
+        """Test that a warm-up exceeding its timeout gives up and completes."""
+        mediator = AsyncMock()
+        mediator.send_async.side_effect = lambda query: asyncio.sleep(10)
+        warmup = _make_warmup(queries="margarita", timeout_seconds=0.05, mediator=mediator)
+
+        await warmup.run()
+
+        assert warmup.is_complete is True
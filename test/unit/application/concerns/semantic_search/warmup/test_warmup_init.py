@@ -0,0 +1,8 @@
+# Unit tests for application/concerns/semantic_search/warmup/__init__.py
+import importlib
+
+
+def test_import_warmup_init():
+    module = importlib.import_module("cezzis_com_cocktails_aisearch.application.concerns.semantic_search.warmup")
+
+    assert module.SearchWarmup is not None
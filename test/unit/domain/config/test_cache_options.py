@@ -0,0 +1,129 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.domain.config.cache_options import (
+    CacheOptions,
+    clear_cache_options_cache,
+    get_cache_options,
+)
+
+
+class TestCacheOptions:
+    """Test cases for CacheOptions configuration."""
+
+    def test_cache_options_init_with_defaults(self):
+        """Test CacheOptions initialization with default values."""
+        with patch.dict(os.environ, {}, clear=True):
+            options = CacheOptions()
+
+            assert options.backend == "memory"
+            assert options.key_prefix == "cezzis-aisearch:"
+            assert options.memory_max_entries == 8192
+            assert options.redis_host == ""
+            assert options.redis_port == 6379
+            assert options.redis_db == 0
+            assert options.redis_use_tls is False
+            assert options.redis_pool_size == 8
+            assert options.redis_timeout_seconds == 1.0
+            assert options.embedding_cache_ttl_seconds == 86400.0
+            assert options.embedding_cache_snapshot_path == ""
+            assert options.search_result_cache_enabled is True
+            assert options.search_result_cache_ttl_seconds == 300.0
+            assert options.decoded_model_cache_max_entries == 4096
+            assert options.catalog_refresh_interval_seconds == 60.0
+            assert options.catalog_removal_scan_interval_seconds == 600.0
+
+    def test_cache_options_init_with_env_vars(self):
+        """Test CacheOptions initialization with environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "CACHE_BACKEND": "redis",
+                "CACHE_KEY_PREFIX": "test:",
+                "CACHE_REDIS_HOST": "cache.local",
+                "CACHE_REDIS_PORT": "6380",
+                "CACHE_REDIS_PASSWORD": "secret",
+                "CACHE_REDIS_DB": "2",
+                "CACHE_REDIS_USE_TLS": "true",
+                "CACHE_REDIS_POOL_SIZE": "4",
+                "CACHE_REDIS_TIMEOUT_SECONDS": "0.5",
+                "EMBEDDING_CACHE_TTL_SECONDS": "3600",
+                "EMBEDDING_CACHE_SNAPSHOT_PATH": "/data/embeddings.snap",
+                "SEARCH_RESULT_CACHE_ENABLED": "false",
+                "SEARCH_RESULT_CACHE_TTL_SECONDS": "30",
+                "DECODED_MODEL_CACHE_MAX_ENTRIES": "512",
+                "CATALOG_REFRESH_INTERVAL_SECONDS": "15",
+                "CATALOG_REMOVAL_SCAN_INTERVAL_SECONDS": "120",
+            },
+        ):
+            options = CacheOptions()
+
+            assert options.backend == "redis"
+            assert options.key_prefix == "test:"
+            assert options.redis_host == "cache.local"
+            assert options.redis_port == 6380
+            assert options.redis_password == "secret"
+            assert options.redis_db == 2
+            assert options.redis_use_tls is True
+            assert options.redis_pool_size == 4
+            assert options.redis_timeout_seconds == 0.5
+            assert options.embedding_cache_ttl_seconds == 3600.0
+            assert options.embedding_cache_snapshot_path == "/data/embeddings.snap"
+            assert options.search_result_cache_enabled is False
+            assert options.search_result_cache_ttl_seconds == 30.0
+            assert options.decoded_model_cache_max_entries == 512
+            assert options.catalog_refresh_interval_seconds == 15.0
+            assert options.catalog_removal_scan_interval_seconds == 120.0
+
+    def test_get_cache_options_singleton(self):
+        """Test that get_cache_options returns a singleton instance."""
+        clear_cache_options_cache()
+
+        with patch.dict(os.environ, {}, clear=True):
+            options1 = get_cache_options()
+            options2 = get_cache_options()
+
+            assert options1 is options2
+
+    @pytest.mark.parametrize(
+        ("env", "message"),
+        [
+            ({"CACHE_BACKEND": "memcached"}, "CACHE_BACKEND"),
+            ({"CACHE_BACKEND": "redis", "CACHE_REDIS_HOST": ""}, "CACHE_REDIS_HOST"),
+            ({"CACHE_MEMORY_MAX_ENTRIES": "0"}, "CACHE_MEMORY_MAX_ENTRIES"),
+            ({"CACHE_REDIS_POOL_SIZE": "0"}, "CACHE_REDIS_POOL_SIZE"),
+            ({"CACHE_REDIS_TIMEOUT_SECONDS": "0"}, "CACHE_REDIS_TIMEOUT_SECONDS"),
+            ({"EMBEDDING_CACHE_TTL_SECONDS": "0"}, "EMBEDDING_CACHE_TTL_SECONDS"),
+            ({"DECODED_MODEL_CACHE_MAX_ENTRIES": "0"}, "DECODED_MODEL_CACHE_MAX_ENTRIES"),
+            ({"CATALOG_REFRESH_INTERVAL_SECONDS": "-1"}, "CATALOG_REFRESH_INTERVAL_SECONDS"),
+            ({"CATALOG_REMOVAL_SCAN_INTERVAL_SECONDS": "-1"}, "CATALOG_REMOVAL_SCAN_INTERVAL_SECONDS"),
+        ],
+    )
+    def test_get_cache_options_raises_on_invalid_backend_settings(self, env, message):
+        """Test that get_cache_options raises ValueError for invalid backend settings."""
+        clear_cache_options_cache()
+
+        with patch.dict(os.environ, env):
+            with pytest.raises(ValueError, match=message):
+                get_cache_options()
+
+    def test_get_cache_options_raises_on_invalid_ttl(self):
+        """Test that get_cache_options raises ValueError for a non-positive TTL."""
+        clear_cache_options_cache()
+
+        with patch.dict(os.environ, {"SEARCH_RESULT_CACHE_TTL_SECONDS": "0"}):
+            with pytest.raises(ValueError, match="SEARCH_RESULT_CACHE_TTL_SECONDS"):
+                get_cache_options()
+
+    def test_clear_cache_options_cache(self):
+        """Test that clear_cache_options_cache resets the singleton."""
+        clear_cache_options_cache()
+
+        with patch.dict(os.environ, {}, clear=True):
+            options1 = get_cache_options()
+            clear_cache_options_cache()
+            options2 = get_cache_options()
+
+            assert options1 is not options2
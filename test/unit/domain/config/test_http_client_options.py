@@ -0,0 +1,97 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import (
+    HttpClientOptions,
+    clear_http_client_options_cache,
+    get_http_client_options,
+)
+
+
+class TestHttpClientOptions:
+    """Test cases for HttpClientOptions configuration."""
+
+    def test_http_client_options_init_with_defaults(self):
+        """Test HttpClientOptions initialization with default values."""
+        with patch.dict(os.environ, {}, clear=True):
+            options = HttpClientOptions()
+
+            assert options.max_connections == 100
+            assert options.max_keepalive_connections == 20
+            assert options.keepalive_expiry_seconds == 30.0
+            assert options.connect_timeout_seconds == 5.0
+            assert options.http2 is True
+
+    def test_http_client_options_init_with_env_vars(self):
+        """Test HttpClientOptions initialization with environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "HTTP_CLIENT_MAX_CONNECTIONS": "50",
+                "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS": "10",
+                "HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS": "60",
+                "HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS": "2.5",
+                "HTTP_CLIENT_HTTP2": "false",
+            },
+        ):
+            options = HttpClientOptions()
+
+            assert options.max_connections == 50
+            assert options.max_keepalive_connections == 10
+            assert options.keepalive_expiry_seconds == 60.0
+            assert options.connect_timeout_seconds == 2.5
+            assert options.http2 is False
+
+    def test_get_http_client_options_singleton(self):
+        """Test that get_http_client_options returns a singleton instance."""
+        clear_http_client_options_cache()
+
+        with patch.dict(os.environ, {}, clear=True):
+            options1 = get_http_client_options()
+            options2 = get_http_client_options()
+
+            assert options1 is options2
+
+    def test_get_http_client_options_raises_on_invalid_max_connections(self):
+        """Test that get_http_client_options raises ValueError for a non-positive pool size."""
+        clear_http_client_options_cache()
+
+        with patch.dict(os.environ, {"HTTP_CLIENT_MAX_CONNECTIONS": "0"}):
+            with pytest.raises(ValueError, match="HTTP_CLIENT_MAX_CONNECTIONS"):
+                get_http_client_options()
+
+    def test_get_http_client_options_raises_when_keepalive_exceeds_pool(self):
+        """Test that keep-alive connections cannot exceed the total pool size."""
+        clear_http_client_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {"HTTP_CLIENT_MAX_CONNECTIONS": "5", "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS": "10"},
+        ):
+            with pytest.raises(ValueError, match="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS"):
+                get_http_client_options()
+
+    def test_get_http_client_options_raises_on_invalid_connect_timeout(self):
+        """Test that get_http_client_options raises ValueError for a non-positive connect timeout."""
+        clear_http_client_options_cache()
+
+        with patch.dict(os.environ, {"HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS": "0"}):
+            with pytest.raises(ValueError, match="HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS"):
+                get_http_client_options()
+
+    def test_clear_http_client_options_cache(self):
+        """Test that clear_http_client_options_cache resets the singleton."""
+        clear_http_client_options_cache()
+
+        with patch.dict(os.environ, {}, clear=True):
+            options1 = get_http_client_options()
+
+        clear_http_client_options_cache()
+
+        with patch.dict(os.environ, {}, clear=True):
+            options2 = get_http_client_options()
+
+        assert options1 is not options2
+        clear_http_client_options_cache()
@@ -20,6 +20,9 @@ class TestHuggingFaceOptions:
 
             assert options.inference_model == ""
             assert options.api_token == ""
+            assert options.batch_window_ms == 2.0
+            assert options.batch_max_size == 32
+            assert options.embedding_cache_max_entries == 1024
 
     def test_huggingface_options_init_with_env_vars(self):
         """ "Test HuggingFaceOptions initialization with environment variables."""
@@ -77,3 +80,48 @@ class TestHuggingFaceOptions:
             options2 = get_huggingface_options()
             assert options2.inference_model == "model2"
             assert options1 is not options2
+
+    def test_get_huggingface_options_raises_on_negative_batch_window(self):
+        """Test that get_huggingface_options raises ValueError for a negative batch window."""
+        clear_huggingface_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {
+                "HUGGINGFACE_INFERENCE_MODEL": "test-model",
+                "HUGGINGFACE_API_TOKEN": "test-token",
+                "HUGGINGFACE_BATCH_WINDOW_MS": "-1",
+            },
+        ):
+            with pytest.raises(ValueError, match="HUGGINGFACE_BATCH_WINDOW_MS"):
+                get_huggingface_options()
+
+    def test_get_huggingface_options_raises_on_invalid_batch_max_size(self):
+        """Test that get_huggingface_options raises ValueError for a non-positive batch size."""
+        clear_huggingface_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {
+                "HUGGINGFACE_INFERENCE_MODEL": "test-model",
+                "HUGGINGFACE_API_TOKEN": "test-token",
+                "HUGGINGFACE_BATCH_MAX_SIZE": "0",
+            },
+        ):
+            with pytest.raises(ValueError, match="HUGGINGFACE_BATCH_MAX_SIZE"):
+                get_huggingface_options()
+
+    def test_get_huggingface_options_raises_on_negative_embedding_cache_size(self):
+        """Test that get_huggingface_options raises ValueError for a negative embedding cache size."""
+        clear_huggingface_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {
+                "HUGGINGFACE_INFERENCE_MODEL": "test-model",
+                "HUGGINGFACE_API_TOKEN": "test-token",
+                "HUGGINGFACE_EMBEDDING_CACHE_MAX_ENTRIES": "-1",
+            },
+        ):
+            with pytest.raises(ValueError, match="HUGGINGFACE_EMBEDDING_CACHE_MAX_ENTRIES"):
+                get_huggingface_options()
@@ -28,6 +28,10 @@ class TestQdrantOptions:
             assert options.semantic_search_prefetch_limit == 100
             assert options.semantic_search_score_threshold == 0.0
             assert options.semantic_search_total_score_threshold == 0.0
+            assert options.semantic_search_hydrate_from_catalog is True
+            assert options.semantic_search_group_size == 0
+            assert options.catalog_scroll_page_size == 1000
+            assert options.catalog_scroll_parallelism == 1
 
     def test_qdrant_options_init_with_env_vars(self):
         """Test QdrantOptions initialization with environment variables."""
@@ -44,6 +48,10 @@ class TestQdrantOptions:
                 "QDRANT_SEMANTIC_SEARCH_PREFETCH_LIMIT": "200",
                 "QDRANT_SEMANTIC_SEARCH_SCORE_THRESHOLD": "0.7",
                 "QDRANT_SEMANTIC_SEARCH_TOTAL_SCORE_THRESHOLD": "1.5",
+                "QDRANT_SEMANTIC_SEARCH_HYDRATE_FROM_CATALOG": "false",
+                "QDRANT_SEMANTIC_SEARCH_GROUP_SIZE": "3",
+                "QDRANT_CATALOG_SCROLL_PAGE_SIZE": "2000",
+                "QDRANT_CATALOG_SCROLL_PARALLELISM": "4",
             },
         ):
             options = QdrantOptions()
@@ -58,6 +66,10 @@ class TestQdrantOptions:
             assert options.semantic_search_prefetch_limit == 200
             assert options.semantic_search_score_threshold == 0.7
             assert options.semantic_search_total_score_threshold == 1.5
+            assert options.semantic_search_hydrate_from_catalog is False
+            assert options.semantic_search_group_size == 3
+            assert options.catalog_scroll_page_size == 2000
+            assert options.catalog_scroll_parallelism == 4
 
     def test_get_qdrant_options_raises_on_missing_host(self):
         """Test that get_qdrant_options raises ValueError when host is missing."""
@@ -109,6 +121,39 @@ class TestQdrantOptions:
             with pytest.raises(ValueError, match="QDRANT_SEMANTIC_SEARCH_PREFETCH_LIMIT"):
                 get_qdrant_options()
 
+    def test_get_qdrant_options_raises_on_negative_group_size(self):
+        """Test that get_qdrant_options raises ValueError for a negative group size."""
+        clear_qdrant_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {
+                "QDRANT_HOST": "localhost",
+                "QDRANT_COLLECTION_NAME": "test",
+                "QDRANT_VECTOR_SIZE": "768",
+                "QDRANT_SEMANTIC_SEARCH_GROUP_SIZE": "-1",
+            },
+        ):
+            with pytest.raises(ValueError, match="QDRANT_SEMANTIC_SEARCH_GROUP_SIZE"):
+                get_qdrant_options()
+
+    @pytest.mark.parametrize("env_var", ["QDRANT_CATALOG_SCROLL_PAGE_SIZE", "QDRANT_CATALOG_SCROLL_PARALLELISM"])
+    def test_get_qdrant_options_raises_on_invalid_catalog_scroll_settings(self, env_var):
+        """Test that get_qdrant_options raises ValueError for a non-positive catalog scroll setting."""
+        clear_qdrant_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {
+                "QDRANT_HOST": "localhost",
+                "QDRANT_COLLECTION_NAME": "test",
+                "QDRANT_VECTOR_SIZE": "768",
+                env_var: "0",
+            },
+        ):
+            with pytest.raises(ValueError, match=env_var):
+                get_qdrant_options()
+
     def test_get_qdrant_options_singleton(self):
         """Test that get_qdrant_options returns a singleton instance."""
         clear_qdrant_options_cache()
@@ -0,0 +1,67 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.domain.config.query_parsing_options import (
+    QueryParsingOptions,
+    clear_query_parsing_options_cache,
+    get_query_parsing_options,
+)
+
+
+class TestQueryParsingOptions:
+    """Test cases for QueryParsingOptions configuration."""
+
+    def test_query_parsing_options_init_with_defaults(self):
+        """Test QueryParsingOptions initialization with default values."""
+        with patch.dict(os.environ, {}, clear=True):
+            options = QueryParsingOptions()
+
+            assert options.dictionary_dir == ""
+            assert options.reload_interval_seconds == 30.0
+            assert options.parsed_query_cache_max_entries == 1024
+
+    def test_query_parsing_options_init_with_env_vars(self, tmp_path):
+        """Test QueryParsingOptions initialization with environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "QUERY_DICTIONARY_DIR": str(tmp_path),
+                "QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS": "5",
+                "PARSED_QUERY_CACHE_MAX_ENTRIES": "256",
+            },
+        ):
+            options = QueryParsingOptions()
+
+            assert options.dictionary_dir == str(tmp_path)
+            assert options.reload_interval_seconds == 5.0
+            assert options.parsed_query_cache_max_entries == 256
+
+    @pytest.mark.parametrize(
+        ("env", "message"),
+        [
+            ({"QUERY_DICTIONARY_DIR": "/does/not/exist"}, "QUERY_DICTIONARY_DIR"),
+            ({"QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS": "-1"}, "QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS"),
+            ({"PARSED_QUERY_CACHE_MAX_ENTRIES": "-1"}, "PARSED_QUERY_CACHE_MAX_ENTRIES"),
+        ],
+    )
+    def test_get_query_parsing_options_raises_on_invalid_settings(self, env, message):
+        """Test that get_query_parsing_options raises ValueError for invalid settings."""
+        clear_query_parsing_options_cache()
+
+        with patch.dict(os.environ, env):
+            with pytest.raises(ValueError, match=message):
+                get_query_parsing_options()
+
+    def test_clear_query_parsing_options_cache(self):
+        """Test that clear_query_parsing_options_cache resets the singleton."""
+        clear_query_parsing_options_cache()
+
+        with patch.dict(os.environ, {"QUERY_DICTIONARY_DIR": "", "QUERY_DICTIONARY_RELOAD_INTERVAL_SECONDS": "0"}):
+            options1 = get_query_parsing_options()
+            clear_query_parsing_options_cache()
+            options2 = get_query_parsing_options()
+
+        assert options1 is not options2
+        clear_query_parsing_options_cache()
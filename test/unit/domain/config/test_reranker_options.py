@@ -22,6 +22,7 @@ class TestRerankerOptions:
             assert options.api_key == ""
             assert options.score_threshold == 0.0
             assert options.relative_score_cutoff == 0.0
+            assert options.timeout_seconds == 30.0
 
     def test_reranker_options_init_with_env_vars(self):
         """Test RerankerOptions initialization with environment variables."""
@@ -110,3 +111,14 @@ class TestRerankerOptions:
         ):
             with pytest.raises(ValueError, match="RERANKER_RELATIVE_SCORE_CUTOFF"):
                 get_reranker_options()
+
+    def test_get_reranker_options_raises_on_invalid_timeout(self):
+        """Test that get_reranker_options raises ValueError for a non-positive timeout."""
+        clear_reranker_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {"RERANKER_ENDPOINT": "http://localhost:8990", "RERANKER_TIMEOUT_SECONDS": "-1"},
+        ):
+            with pytest.raises(ValueError, match="RERANKER_TIMEOUT_SECONDS"):
+                get_reranker_options()
@@ -20,6 +20,9 @@ class TestSpladeOptions:
 
             assert options.endpoint == ""
             assert options.api_key == ""
+            assert options.timeout_seconds == 30.0
+            assert options.batch_window_ms == 2.0
+            assert options.batch_max_size == 32
 
     def test_splade_options_init_with_env_vars(self):
         """Test SpladeOptions initialization with environment variables."""
@@ -90,3 +93,36 @@ class TestSpladeOptions:
             options2 = get_splade_options()
             assert options2.endpoint == "http://second-endpoint"
             assert options1 is not options2
+
+    def test_get_splade_options_raises_on_invalid_timeout(self):
+        """Test that get_splade_options raises ValueError for a non-positive timeout."""
+        clear_splade_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {"SPLADE_ENDPOINT": "http://localhost:8991", "SPLADE_TIMEOUT_SECONDS": "0"},
+        ):
+            with pytest.raises(ValueError, match="SPLADE_TIMEOUT_SECONDS"):
+                get_splade_options()
+
+    def test_get_splade_options_raises_on_negative_batch_window(self):
+        """Test that get_splade_options raises ValueError for a negative batch window."""
+        clear_splade_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {"SPLADE_ENDPOINT": "http://localhost:8991", "SPLADE_BATCH_WINDOW_MS": "-1"},
+        ):
+            with pytest.raises(ValueError, match="SPLADE_BATCH_WINDOW_MS"):
+                get_splade_options()
+
+    def test_get_splade_options_raises_on_invalid_batch_max_size(self):
+        """Test that get_splade_options raises ValueError for a non-positive batch size."""
+        clear_splade_options_cache()
+
+        with patch.dict(
+            os.environ,
+            {"SPLADE_ENDPOINT": "http://localhost:8991", "SPLADE_BATCH_MAX_SIZE": "0"},
+        ):
+            with pytest.raises(ValueError, match="SPLADE_BATCH_MAX_SIZE"):
+                get_splade_options()
@@ -0,0 +1,60 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.domain.config.warmup_options import (
+    WarmupOptions,
+    clear_warmup_options_cache,
+    get_warmup_options,
+)
+
+
+class TestWarmupOptions:
+    """Test cases for WarmupOptions configuration."""
+
+    def test_warmup_options_init_with_defaults(self):
+        """Test WarmupOptions initialization with default values."""
+        with patch.dict(os.environ, {}, clear=True):
+            options = WarmupOptions()
+
+            assert options.enabled is True
+            assert options.queries == ""
+            assert options.timeout_seconds == 120.0
+
+    def test_warmup_options_init_with_env_vars(self):
+        """Test WarmupOptions initialization with environment variables."""
+        with patch.dict(
+            os.environ,
+            {
+                "WARMUP_ENABLED": "false",
+                "WARMUP_QUERIES": "margarita,smoky mezcal",
+                "WARMUP_TIMEOUT_SECONDS": "30",
+            },
+        ):
+            options = WarmupOptions()
+
+            assert options.enabled is False
+            assert options.queries == "margarita,smoky mezcal"
+            assert options.timeout_seconds == 30.0
+
+    @pytest.mark.parametrize("timeout", ["0", "-5"])
+    def test_get_warmup_options_raises_on_invalid_timeout(self, timeout):
+        """Test that get_warmup_options raises ValueError for a non-positive timeout."""
+        clear_warmup_options_cache()
+
+        with patch.dict(os.environ, {"WARMUP_TIMEOUT_SECONDS": timeout}):
+            with pytest.raises(ValueError, match="WARMUP_TIMEOUT_SECONDS"):
+                get_warmup_options()
+
+    def test_clear_warmup_options_cache(self):
+        """Test that clear_warmup_options_cache resets the singleton."""
+        clear_warmup_options_cache()
+
+        with patch.dict(os.environ, {"WARMUP_TIMEOUT_SECONDS": "60"}):
+            options1 = get_warmup_options()
+            clear_warmup_options_cache()
+            options2 = get_warmup_options()
+
+        assert options1 is not options2
+        clear_warmup_options_cache()
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.cache_backend_factory import create_cache_backend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.resp_cache_backend import RespCacheBackend
+
+
+class TestCreateCacheBackend:
+    """Test cases for create_cache_backend."""
+
+    def test_memory_backend(self):
+        """Test that the memory backend is created with the configured capacity."""
+        options = MagicMock()
+        options.backend = "memory"
+        options.memory_max_entries = 16
+
+        backend = create_cache_backend(options)
+
+        assert isinstance(backend, InMemoryCacheBackend)
+        assert backend.max_entries == 16
+
+    def test_redis_backend(self):
+        """Test that the redis backend is created from the redis settings."""
+        options = MagicMock()
+        options.backend = "redis"
+        options.redis_host = "cache.local"
+        options.redis_port = 6380
+        options.redis_password = ""
+        options.redis_db = 1
+        options.redis_use_tls = False
+        options.key_prefix = "test:"
+        options.redis_pool_size = 4
+        options.redis_timeout_seconds = 0.5
+
+        backend = create_cache_backend(options)
+
+        assert isinstance(backend, RespCacheBackend)
+        assert backend.host == "cache.local"
+        assert backend.port == 6380
+        assert backend.key_prefix == "test:"
@@ -0,0 +1,39 @@
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.cache_codecs import (
+    decode_dense,
+    decode_sparse,
+    encode_dense,
+    encode_sparse,
+)
+
+
+class TestCacheCodecs:
+    """Test cases for the cache vector codecs."""
+
+    def test_dense_round_trip_uses_four_bytes_per_dimension(self):
+        """Test that dense vectors are stored as float32."""
+        vector = [0.1, -0.25, 3.5, 0.0]
+
+        data = encode_dense(vector)
+
+        assert len(data) == 16
+        assert decode_dense(data) == pytest.approx(vector)
+
+    def test_sparse_round_trip(self):
+        """Test that sparse vectors keep their indices exactly and values at float32 precision."""
+        data = encode_sparse([42, 100, 30521], [0.8, 0.5, 0.01])
+
+        assert len(data) == 4 + 3 * 4 + 3 * 4
+        indices, values = decode_sparse(data)
+        assert indices == [42, 100, 30521]
+        assert values == pytest.approx([0.8, 0.5, 0.01])
+
+    def test_empty_sparse_round_trip(self):
+        """Test that an empty sparse vector round trips."""
+        assert decode_sparse(encode_sparse([], [])) == ([], [])
+
+    def test_sparse_length_mismatch_raises(self):
+        """Test that mismatched indices and values are rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            encode_sparse([1, 2], [0.5])
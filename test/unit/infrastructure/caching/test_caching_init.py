@@ -0,0 +1,39 @@
+class TestInfrastructureCachingInit:
+    """Test cases for infrastructure/caching __init__ module."""
+
+    def test_exports_search_result_cache(self):
+        """Test that SearchResultCache is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.caching import SearchResultCache
+
+        assert SearchResultCache is not None
+
+    def test_exports_cache_backends(self):
+        """Test that the cache backend abstraction, implementations and factory are exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.caching import (
+            ICacheBackend,
+            InMemoryCacheBackend,
+            RespCacheBackend,
+            create_cache_backend,
+        )
+
+        assert issubclass(InMemoryCacheBackend, ICacheBackend)
+        assert issubclass(RespCacheBackend, ICacheBackend)
+        assert create_cache_backend is not None
+
+    def test_exports_decoded_model_cache(self):
+        """Test that DecodedModelCache is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.caching import DecodedModelCache
+
+        assert DecodedModelCache is not None
+
+    def test_exports_embedding_cache_snapshot(self):
+        """Test that EmbeddingCacheSnapshot is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.caching import EmbeddingCacheSnapshot
+
+        assert EmbeddingCacheSnapshot is not None
+
+    def test_exports_embedding_slab_cache(self):
+        """Test that EmbeddingSlabCache is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.caching import EmbeddingSlabCache
+
+        assert EmbeddingSlabCache is not None
@@ -0,0 +1,57 @@
+import pytest
+from conftest import create_test_cocktail_model
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.decoded_model_cache import DecodedModelCache
+
+
+def _model_json(cocktail_id: str, title: str) -> str:
+    return create_test_cocktail_model(cocktail_id, title).model_dump_json(by_alias=True)
+
+
+class TestDecodedModelCache:
+    """Test cases for DecodedModelCache."""
+
+    def test_rejects_non_positive_capacity(self):
+        """Test that a zero capacity is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            DecodedModelCache(0)
+
+    def test_decode_reuses_model_for_unchanged_payload(self):
+        """Test that the same payload JSON is validated once and then returned from the cache."""
+        cache = DecodedModelCache(4)
+        payload = _model_json("1", "Margarita")
+
+        first = cache.decode("1", payload)
+        second = cache.decode("1", "" + payload)
+
+        assert first is second
+        assert first.title == "Margarita"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_decode_replaces_entry_when_payload_changes(self):
+        """Test that a changed payload for the same cocktail is decoded again."""
+        cache = DecodedModelCache(4)
+        original = cache.decode("1", _model_json("1", "Margarita"))
+
+        updated = cache.decode("1", _model_json("1", "Tommy's Margarita"))
+
+        assert updated is not original
+        assert updated.title == "Tommy's Margarita"
+        assert cache.decode("1", _model_json("1", "Tommy's Margarita")) is updated
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used_cocktail(self):
+        """Test that the oldest untouched cocktail is evicted once the cache is full."""
+        cache = DecodedModelCache(2)
+        payloads = {cocktail_id: _model_json(cocktail_id, cocktail_id) for cocktail_id in ("1", "2", "3")}
+
+        cache.decode("1", payloads["1"])
+        cache.decode("2", payloads["2"])
+        cache.decode("1", payloads["1"])
+        cache.decode("3", payloads["3"])
+
+        assert len(cache) == 2
+        misses = cache.misses
+        cache.decode("2", payloads["2"])
+        assert cache.misses == misses + 1
@@ -0,0 +1,140 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_cache_snapshot import (
+    EmbeddingCacheSnapshot,
+    read_snapshot,
+    write_snapshot,
+)
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+
+
+def _create_snapshot(path, cache_backend, model="org/model-a", cocktail_search_repository=None):
+    cache_options = MagicMock()
+    cache_options.embedding_cache_snapshot_path = str(path) if path else ""
+    cache_options.embedding_cache_ttl_seconds = 60.0
+    hugging_face_options = MagicMock()
+    hugging_face_options.inference_model = model
+    if cocktail_search_repository is None:
+        # No in-process slab: dense vectors live in the backend alongside the SPLADE vectors
+        cocktail_search_repository = MagicMock()
+        cocktail_search_repository.export_query_embeddings.return_value = []
+        cocktail_search_repository.import_query_embeddings.return_value = False
+    return EmbeddingCacheSnapshot(
+        cache_options=cache_options,
+        hugging_face_options=hugging_face_options,
+        cache_backend=cache_backend,
+        cocktail_search_repository=cocktail_search_repository,
+    )
+
+
+class TestEmbeddingCacheSnapshot:
+    """Test cases for EmbeddingCacheSnapshot."""
+
+    @pytest.mark.anyio
+    async def test_save_and_load_round_trip(self, tmp_path):
+        """Test that query vectors survive a save/load cycle while other cache entries are not snapshotted."""
+        path = tmp_path / "embeddings.snap"
+        backend = InMemoryCacheBackend(max_entries=16)
+        await backend.set("emb:a", b"\x00\x01\x02\x03")
+        await backend.set("splade:b", b"\x04\x05")
+        await backend.set("search:c", b"[]")
+
+        saved = await _create_snapshot(path, backend).save()
+
+        restored = InMemoryCacheBackend(max_entries=16)
+        loaded = await _create_snapshot(path, restored).load()
+
+        assert saved == 2
+        assert loaded == 2
+        assert await restored.get("emb:a") == b"\x00\x01\x02\x03"
+        assert await restored.get("splade:b") == b"\x04\x05"
+        assert await restored.get("search:c") is None
+
+    @pytest.mark.anyio
+    async def test_dense_vectors_round_trip_through_the_repository_slab(self, tmp_path):
+        """Test that dense vectors held only in the repository's slab are saved and restored there, not the backend."""
+        path = tmp_path / "embeddings.snap"
+        backend = InMemoryCacheBackend(max_entries=16)
+        await backend.set("splade:b", b"\x04\x05")
+        repository = MagicMock()
+        repository.export_query_embeddings.return_value = [("emb:a", b"\x00\x01\x02\x03")]
+
+        saved = await _create_snapshot(path, backend, cocktail_search_repository=repository).save()
+
+        restored = InMemoryCacheBackend(max_entries=16)
+        restored_repository = MagicMock()
+        restored_repository.import_query_embeddings.return_value = True
+        loaded = await _create_snapshot(path, restored, cocktail_search_repository=restored_repository).load()
+
+        assert saved == 2
+        assert loaded == 2
+        restored_repository.import_query_embeddings.assert_called_once_with([("emb:a", b"\x00\x01\x02\x03")])
+        assert await restored.get("emb:a") is None
+        assert await restored.get("splade:b") == b"\x04\x05"
+
+    @pytest.mark.anyio
+    async def test_load_preserves_recency_order(self, tmp_path):
+        """Test that reloading keeps the most recently used entries when the new cache is smaller."""
+        path = tmp_path / "embeddings.snap"
+        backend = InMemoryCacheBackend(max_entries=16)
+        for key in ("emb:1", "emb:2", "emb:3"):
+            await backend.set(key, b"v")
+        await backend.get("emb:1")
+        await _create_snapshot(path, backend).save()
+
+        restored = InMemoryCacheBackend(max_entries=2)
+        await _create_snapshot(path, restored).load()
+
+        assert await restored.get("emb:2") is None
+        assert await restored.get("emb:3") == b"v"
+        assert await restored.get("emb:1") == b"v"
+
+    @pytest.mark.anyio
+    async def test_snapshot_for_another_model_is_ignored(self, tmp_path):
+        """Test that a snapshot written for a different embedding model is not loaded."""
+        path = tmp_path / "embeddings.snap"
+        write_snapshot(str(path), "org/model-a", [("emb:a", b"\x00")])
+
+        restored = InMemoryCacheBackend(max_entries=16)
+        loaded = await _create_snapshot(path, restored, model="org/model-b").load()
+
+        assert loaded == 0
+        assert len(restored) == 0
+
+    @pytest.mark.anyio
+    async def test_corrupt_or_missing_snapshot_is_ignored(self, tmp_path):
+        """Test that a missing, foreign or truncated file does not fail startup."""
+        backend = InMemoryCacheBackend(max_entries=16)
+
+        assert await _create_snapshot(tmp_path / "missing.snap", backend).load() == 0
+
+        foreign = tmp_path / "foreign.snap"
+        foreign.write_bytes(b"not a snapshot at all")
+        assert await _create_snapshot(foreign, backend).load() == 0
+
+        truncated = tmp_path / "truncated.snap"
+        write_snapshot(str(truncated), "org/model-a", [("emb:a", b"\x00" * 64)])
+        truncated.write_bytes(truncated.read_bytes()[:-10])
+        assert await _create_snapshot(truncated, backend).load() == 0
+        assert len(backend) == 0
+
+    @pytest.mark.anyio
+    async def test_disabled_without_path_or_with_shared_backend(self, tmp_path):
+        """Test that nothing is written without a path or for a non-memory backend."""
+        backend = InMemoryCacheBackend(max_entries=16)
+        await backend.set("emb:a", b"\x00")
+
+        assert await _create_snapshot(None, backend).save() == 0
+        assert await _create_snapshot(tmp_path / "shared.snap", MagicMock()).save() == 0
+        assert not (tmp_path / "shared.snap").exists()
+
+    def test_read_snapshot_returns_entries_in_written_order(self, tmp_path):
+        """Test the on-disk format round trip directly."""
+        path = str(tmp_path / "embeddings.snap")
+        entries = [("emb:a", b"\x01" * 12), ("splade:b", b"")]
+
+        write_snapshot(path, "org/model-a", entries)
+
+        assert read_snapshot(path, "org/model-a") == entries
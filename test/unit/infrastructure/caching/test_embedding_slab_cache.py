@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.embedding_slab_cache import EmbeddingSlabCache
+
+
+class TestEmbeddingSlabCache:
+    """Test cases for EmbeddingSlabCache."""
+
+    def test_put_and_get_round_trip_as_float32(self):
+        """Test that vectors are stored as float32 rows of one preallocated slab."""
+        cache = EmbeddingSlabCache(capacity=8)
+
+        assert cache.put("a", [0.1, 0.2, 0.3])
+
+        row = cache.get("a")
+        assert row is not None
+        assert row.dtype == np.float32
+        assert row.tolist() == pytest.approx([0.1, 0.2, 0.3])
+        assert cache.get("missing") is None
+        assert cache.nbytes == 8 * 3 * 4
+
+    def test_least_recently_used_row_is_reused(self):
+        """Test that a full slab evicts the least recently used entry and reuses its row."""
+        cache = EmbeddingSlabCache(capacity=2)
+        cache.put("a", [1.0, 1.0])
+        cache.put("b", [2.0, 2.0])
+        cache.get("a")
+
+        cache.put("c", [3.0, 3.0])
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a").tolist() == [1.0, 1.0]
+        assert cache.get("c").tolist() == [3.0, 3.0]
+        assert cache.nbytes == 2 * 2 * 4
+
+    def test_put_existing_key_overwrites_in_place(self):
+        """Test that re-caching a key updates its row without growing the cache."""
+        cache = EmbeddingSlabCache(capacity=2)
+        cache.put("a", [1.0, 1.0])
+
+        cache.put("a", [5.0, 5.0])
+
+        assert len(cache) == 1
+        assert cache.get("a").tolist() == [5.0, 5.0]
+
+    def test_vectors_of_another_dimension_are_not_cached(self):
+        """Test that the slab keeps the dimension of the first vector it stores."""
+        cache = EmbeddingSlabCache(capacity=2)
+        cache.put("a", [1.0, 1.0])
+
+        assert not cache.put("b", [1.0, 1.0, 1.0])
+        assert cache.get("b") is None
+
+    def test_items_are_copies_in_recency_order(self):
+        """Test that items lists every vector least recently used first, detached from the slab."""
+        cache = EmbeddingSlabCache(capacity=2)
+        assert cache.items() == []
+        cache.put("a", [1.0, 1.0])
+        cache.put("b", [2.0, 2.0])
+        cache.get("a")
+
+        items = cache.items()
+        cache.put("c", [3.0, 3.0])
+
+        assert [key for key, _ in items] == ["b", "a"]
+        assert [vector.tolist() for _, vector in items] == [[2.0, 2.0], [1.0, 1.0]]
+
+    def test_invalid_capacity_raises(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            EmbeddingSlabCache(capacity=0)
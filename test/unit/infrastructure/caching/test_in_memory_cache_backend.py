@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+
+
+class TestInMemoryCacheBackend:
+    """Test cases for InMemoryCacheBackend."""
+
+    @pytest.mark.anyio
+    async def test_set_and_get_round_trip(self):
+        """Test that stored bytes are returned unchanged."""
+        backend = InMemoryCacheBackend(max_entries=4)
+
+        await backend.set("k", b"value")
+
+        assert await backend.get("k") == b"value"
+        assert await backend.get("missing") is None
+
+    @pytest.mark.anyio
+    async def test_entries_expire_after_ttl(self):
+        """Test that an entry older than its TTL is treated as missing and removed."""
+        backend = InMemoryCacheBackend(max_entries=4)
+
+        with patch("cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend.time") as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            await backend.set("k", b"value", ttl_seconds=10.0)
+
+            mock_time.monotonic.return_value = 109.0
+            assert await backend.get("k") == b"value"
+
+            mock_time.monotonic.return_value = 111.0
+            assert await backend.get("k") is None
+            assert len(backend) == 0
+
+    @pytest.mark.anyio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Test that the backend stays bounded, evicting the least recently used entry."""
+        backend = InMemoryCacheBackend(max_entries=2)
+
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.get("a")
+        await backend.set("c", b"3")
+
+        assert await backend.get("a") == b"1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == b"3"
+
+    @pytest.mark.anyio
+    async def test_delete_and_delete_prefix(self):
+        """Test single-key and prefix deletion."""
+        backend = InMemoryCacheBackend(max_entries=8)
+        await backend.set("search:1", b"1")
+        await backend.set("search:2", b"2")
+        await backend.set("emb:1", b"3")
+
+        await backend.delete("emb:1")
+        removed = await backend.delete_prefix("search:")
+
+        assert removed == 2
+        assert len(backend) == 0
+
+    def test_invalid_max_entries_raises(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            InMemoryCacheBackend(max_entries=0)
@@ -0,0 +1,244 @@
+import asyncio
+import fnmatch
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.resp_cache_backend import RespCacheBackend
+
+
+class FakeRespServer:
+    """In-process Redis-protocol server supporting the commands used by RespCacheBackend."""
+
+    def __init__(self, password: str = ""):
+        self.password = password
+        self.data: dict[bytes, bytes] = {}
+        self.expiry_ms: dict[bytes, int] = {}
+        self.commands: list[list[bytes]] = []
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        authenticated = not self.password
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(args)
+
+                name = args[0].upper()
+                if name == b"AUTH":
+                    authenticated = args[1].decode() == self.password
+                    writer.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+                elif not authenticated:
+                    writer.write(b"-NOAUTH Authentication required.\r\n")
+                else:
+                    writer.write(self._dispatch(name, args[1:]))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            writer.close()
+
+    def _dispatch(self, name: bytes, args: list[bytes]) -> bytes:
+        if name == b"GET":
+            value = self.data.get(args[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if name == b"SET":
+            self.data[args[0]] = args[1]
+            if len(args) > 3 and args[2].upper() == b"PX":
+                self.expiry_ms[args[0]] = int(args[3])
+            return b"+OK\r\n"
+        if name == b"DEL":
+            removed = sum(1 for key in args if self.data.pop(key, None) is not None)
+            return b":%d\r\n" % removed
+        if name == b"SCAN":
+            pattern = args[2].decode().replace("\\", "")
+            keys = [key for key in self.data if fnmatch.fnmatchcase(key.decode(), pattern)]
+            body = b"".join(b"$%d\r\n%s\r\n" % (len(key), key) for key in keys)
+            return b"*2\r\n$1\r\n0\r\n*%d\r\n%s" % (len(keys), body)
+        if name == b"SELECT":
+            return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+class StalledServer:
+    """Accepts connections and reads commands but never replies, recording when clients hang up."""
+
+    def __init__(self):
+        self.connections = 0
+        self.closed = asyncio.Event()
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        while await reader.read(1024):
+            pass
+        self.closed.set()
+        writer.close()
+
+
+@pytest.fixture
+async def fake_server():
+    server = FakeRespServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestRespCacheBackend:
+    """Test cases for RespCacheBackend against an in-process fake RESP server."""
+
+    @pytest.mark.anyio
+    async def test_set_get_round_trip_with_prefix_and_ttl(self, fake_server):
+        """Test that values round trip and are written under the key prefix with a millisecond TTL."""
+        backend = RespCacheBackend(host="127.0.0.1", port=fake_server.port, key_prefix="svc:")
+
+        await backend.set("emb:1", b"\x00\x01binary\r\n", ttl_seconds=1.5)
+
+        assert await backend.get("emb:1") == b"\x00\x01binary\r\n"
+        assert await backend.get("emb:missing") is None
+        assert fake_server.expiry_ms[b"svc:emb:1"] == 1500
+        await backend.close()
+
+    @pytest.mark.anyio
+    async def test_connections_are_reused(self, fake_server):
+        """Test that sequential commands share one pooled connection."""
+        backend = RespCacheBackend(host="127.0.0.1", port=fake_server.port)
+
+        for i in range(5):
+            await backend.set(f"k{i}", b"v")
+            await backend.get(f"k{i}")
+
+        assert fake_server.connections == 1
+        await backend.close()
+
+    @pytest.mark.anyio
+    async def test_delete_and_delete_prefix(self, fake_server):
+        """Test that delete_prefix removes only keys under the given namespace."""
+        backend = RespCacheBackend(host="127.0.0.1", port=fake_server.port, key_prefix="svc:")
+        await backend.set("search:a", b"1")
+        await backend.set("search:b", b"2")
+        await backend.set("emb:a", b"3")
+        await backend.set("other", b"4")
+        await backend.delete("other")
+
+        removed = await backend.delete_prefix("search:")
+
+        assert removed == 2
+        assert set(fake_server.data) == {b"svc:emb:a"}
+        await backend.close()
+
+    @pytest.mark.anyio
+    async def test_authenticates_and_selects_db_on_connect(self):
+        """Test that AUTH and SELECT are sent when a password and database are configured."""
+        server = FakeRespServer(password="secret")
+        await server.start()
+        backend = RespCacheBackend(host="127.0.0.1", port=server.port, password="secret", db=2)
+
+        await backend.set("k", b"v")
+
+        assert server.commands[0] == [b"AUTH", b"secret"]
+        assert server.commands[1] == [b"SELECT", b"2"]
+        assert await backend.get("k") == b"v"
+        await backend.close()
+        await server.stop()
+
+    @pytest.mark.anyio
+    async def test_unreachable_server_behaves_like_empty_cache(self):
+        """Test that connection failures are swallowed and reported as misses."""
+        server = FakeRespServer()
+        await server.start()
+        port = server.port
+        await server.stop()
+
+        backend = RespCacheBackend(host="127.0.0.1", port=port, timeout_seconds=0.5)
+
+        await backend.set("k", b"v")
+        assert await backend.get("k") is None
+        assert await backend.delete_prefix("search:") == 0
+
+    @pytest.mark.anyio
+    async def test_error_reply_is_treated_as_miss(self):
+        """Test that a server error reply does not raise."""
+        server = FakeRespServer(password="secret")
+        await server.start()
+        backend = RespCacheBackend(host="127.0.0.1", port=server.port, password="wrong")
+
+        assert await backend.get("k") is None
+        await server.stop()
+
+    @pytest.mark.anyio
+    async def test_stalled_auth_times_out_and_frees_the_pool_slot(self):
+        """Test that a server stalling during AUTH is bounded by the deadline and does not exhaust the pool."""
+        server = StalledServer()
+        await server.start()
+        backend = RespCacheBackend(
+            host="127.0.0.1", port=server.port, password="secret", pool_size=1, timeout_seconds=0.1
+        )
+
+        assert await asyncio.wait_for(backend.get("k"), timeout=2) is None
+        backend._retry_at = 0.0
+        assert await asyncio.wait_for(backend.get("k"), timeout=2) is None
+
+        assert server.connections == 2
+        await server.stop()
+
+    @pytest.mark.anyio
+    async def test_cancelled_command_closes_its_connection(self):
+        """Test that cancelling an in-flight command closes the connection instead of leaking it."""
+        server = StalledServer()
+        await server.start()
+        backend = RespCacheBackend(host="127.0.0.1", port=server.port, timeout_seconds=5.0)
+
+        task = asyncio.create_task(backend.get("k"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.wait_for(server.closed.wait(), timeout=2)
+        assert backend._idle.empty()
+        await server.stop()
+
+    @pytest.mark.anyio
+    async def test_connect_failure_skips_the_backend_until_retry(self):
+        """Test that after a failed connect, calls are misses without another connect attempt until the window ends."""
+        backend = RespCacheBackend(host="127.0.0.1", port=6379)
+        attempts = 0
+
+        async def refuse():
+            nonlocal attempts
+            attempts += 1
+            raise ConnectionRefusedError()
+
+        backend._connect = refuse
+
+        assert await backend.get("k") is None
+        await backend.set("k", b"v")
+        assert await backend.get("k") is None
+        assert attempts == 1
+
+        backend._retry_at = 0.0
+        assert await backend.get("k") is None
+        assert attempts == 2
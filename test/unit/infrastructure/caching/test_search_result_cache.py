@@ -0,0 +1,86 @@
+import pytest
+from conftest import create_test_search_result_cache
+
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
+from cezzis_com_cocktails_aisearch.infrastructure.caching.search_result_cache import SearchResultCache
+
+
+def _stats(score: float) -> dict:
+    return {"total_score": score, "weighted_score": score}
+
+
+class TestSearchResultCache:
+    """Test cases for SearchResultCache."""
+
+    def test_make_key_normalises_text_and_filter_order(self):
+        """Test that whitespace, case and filter order do not change the key."""
+        key1 = SearchResultCache.make_key("  Smoky   Mezcal ", ["glass-coupe", "spirit-mezcal"], [], False, 0, 10)
+        key2 = SearchResultCache.make_key("smoky mezcal", ["Spirit-Mezcal", "glass-coupe"], None, None, None, None)
+
+        assert key1 == key2
+
+    def test_make_key_distinguishes_paging_and_filters(self):
+        """Test that skip, take and filters all take part in the key."""
+        base = SearchResultCache.make_key("gin", [], [], False, 0, 10)
+
+        assert SearchResultCache.make_key("gin", [], [], False, 10, 10) != base
+        assert SearchResultCache.make_key("gin", [], [], False, 0, 20) != base
+        assert SearchResultCache.make_key("gin", ["glass-coupe"], [], False, 0, 10) != base
+        assert SearchResultCache.make_key("gin", [], ["negroni"], False, 0, 10) != base
+
+    def test_make_key_includes_dictionary_fingerprint(self):
+        """Test that results parsed with different query dictionaries are cached separately."""
+        key1 = SearchResultCache.make_key("gin in a coupe", [], [], False, 0, 10, "aaaaaaaaaaaa")
+        key2 = SearchResultCache.make_key("gin in a coupe", [], [], False, 0, 10, "bbbbbbbbbbbb")
+
+        assert key1 != key2
+
+    @pytest.mark.anyio
+    async def test_get_returns_stored_results_and_counts_hits(self):
+        """Test a round trip through the cache and the hit/miss counters."""
+        cache = create_test_search_result_cache(enabled=True)
+
+        assert await cache.get("k") is None
+        await cache.set("k", [("1", _stats(0.9)), ("2", _stats(0.5))], cache.generation)
+        results = await cache.get("k")
+
+        assert results == [("1", _stats(0.9)), ("2", _stats(0.5))]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.anyio
+    async def test_set_uses_ttl_and_hashed_namespaced_key(self):
+        """Test that entries are written under a fixed-length search: key with the configured TTL."""
+        backend = InMemoryCacheBackend(max_entries=16)
+        cache = create_test_search_result_cache(enabled=True, ttl_seconds=30.0, cache_backend=backend)
+
+        await cache.set("a very long query " * 50, [], cache.generation)
+
+        (key,) = list(backend._entries)
+        assert key.startswith("search:")
+        assert len(key) == len("search:") + 64
+        assert backend._entries[key][0] is not None
+
+    @pytest.mark.anyio
+    async def test_invalidate_clears_and_rejects_stale_writes(self):
+        """Test that invalidate drops entries and ignores results computed before it."""
+        cache = create_test_search_result_cache(enabled=True)
+        await cache.set("a", [], cache.generation)
+        started_generation = cache.generation
+
+        await cache.invalidate()
+        await cache.set("b", [], started_generation)
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") is None
+
+    @pytest.mark.anyio
+    async def test_disabled_cache_never_stores(self):
+        """Test that a disabled cache is a no-op."""
+        backend = InMemoryCacheBackend(max_entries=16)
+        cache = create_test_search_result_cache(enabled=False, cache_backend=backend)
+
+        await cache.set("k", [], cache.generation)
+
+        assert await cache.get("k") is None
+        assert len(backend) == 0
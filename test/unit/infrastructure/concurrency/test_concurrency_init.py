@@ -0,0 +1,14 @@
+class TestInfrastructureConcurrencyInit:
+    """Test cases for infrastructure/concurrency __init__ module."""
+
+    def test_exports_micro_batcher(self):
+        """Test that MicroBatcher is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.concurrency import MicroBatcher
+
+        assert MicroBatcher is not None
+
+    def test_exports_single_flight(self):
+        """Test that SingleFlight is exported."""
+        from cezzis_com_cocktails_aisearch.infrastructure.concurrency import SingleFlight
+
+        assert SingleFlight is not None
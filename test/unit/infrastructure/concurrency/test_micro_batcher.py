@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_submits_share_one_batch(self):
+        """Test that submits inside the window are sent as a single batch, results fanned out in order."""
+        calls: list[list[str]] = []
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            calls.append(items)
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.005, max_batch_size=10)
+
+        results = await asyncio.gather(*(batcher.submit(item) for item in ["a", "b", "c"]))
+
+        assert calls == [["a", "b", "c"]]
+        assert results == ["A", "B", "C"]
+
+    @pytest.mark.anyio
+    async def test_full_batch_flushes_before_window(self):
+        """Test that reaching max_batch_size dispatches immediately and splits the burst."""
+        calls: list[list[int]] = []
+
+        async def batch_fn(items: list[int]) -> list[int]:
+            calls.append(items)
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(batch_fn, window_seconds=10.0, max_batch_size=2)
+
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1.0)
+
+        assert calls == [[0, 1], [2, 3]]
+        assert results == [0, 2, 4, 6]
+
+    @pytest.mark.anyio
+    async def test_batch_exception_propagates_to_every_caller(self):
+        """Test that a failing batch function raises in each waiting caller."""
+
+        async def batch_fn(_items: list[str]) -> list[str]:
+            raise RuntimeError("boom")
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=10)
+
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.anyio
+    async def test_result_count_mismatch_raises(self):
+        """Test that a batch function returning the wrong number of results fails the batch."""
+
+        async def batch_fn(_items: list[str]) -> list[str]:
+            return []
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=10)
+
+        with pytest.raises(ValueError, match="0 results for 1 items"):
+            await batcher.submit("a")
+
+    @pytest.mark.anyio
+    async def test_cancelled_caller_does_not_break_batch(self):
+        """Test that cancelling one waiter still delivers results to the others."""
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            await asyncio.sleep(0.01)
+            return items
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=10)
+
+        cancelled = asyncio.ensure_future(batcher.submit("a"))
+        kept = asyncio.ensure_future(batcher.submit("b"))
+        await asyncio.sleep(0.005)
+        cancelled.cancel()
+
+        assert await kept == "b"
+
+    def test_invalid_max_batch_size_raises(self):
+        """Test that a non-positive max_batch_size is rejected."""
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            return items
+
+        with pytest.raises(ValueError, match="max_batch_size"):
+            MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=0)
+
+    @pytest.mark.anyio
+    async def test_dedupe_collapses_identical_in_flight_items(self):
+        """Test that identical items pending or in flight share a single batch slot."""
+        calls: list[list[str]] = []
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            calls.append(items)
+            await asyncio.sleep(0.01)
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=10, dedupe=True)
+
+        first = asyncio.ensure_future(batcher.submit("a"))
+        await asyncio.sleep(0.005)  # "a" is now in flight
+        results = await asyncio.gather(first, batcher.submit("a"), batcher.submit("b"), batcher.submit("b"))
+
+        assert calls == [["a"], ["b"]]
+        assert results == ["A", "A", "B", "B"]
+
+    @pytest.mark.anyio
+    async def test_dedupe_cancelled_waiter_does_not_cancel_shared_request(self):
+        """Test that cancelling one of two deduplicated waiters leaves the other with a result."""
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            await asyncio.sleep(0.01)
+            return items
+
+        batcher = MicroBatcher(batch_fn, window_seconds=0.001, max_batch_size=10, dedupe=True)
+
+        cancelled = asyncio.ensure_future(batcher.submit("a"))
+        kept = asyncio.ensure_future(batcher.submit("a"))
+        await asyncio.sleep(0.005)
+        cancelled.cancel()
+
+        assert await kept == "a"
+
+    @pytest.mark.anyio
+    async def test_on_batch_reports_size_and_queue_delays(self):
+        """Test that on_batch receives the batch size and one queue delay per item."""
+        reported: list[tuple[int, list[float]]] = []
+
+        async def batch_fn(items: list[str]) -> list[str]:
+            return items
+
+        batcher = MicroBatcher(
+            batch_fn,
+            window_seconds=0.005,
+            max_batch_size=10,
+            on_batch=lambda size, delays: reported.append((size, delays)),
+        )
+
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+        assert len(reported) == 1
+        size, delays = reported[0]
+        assert size == 2
+        assert len(delays) == 2
+        assert all(delay >= 0.0 for delay in delays)
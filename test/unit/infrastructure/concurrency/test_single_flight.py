@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from cezzis_com_cocktails_aisearch.infrastructure.concurrency.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_calls_for_same_key_share_one_operation(self):
+        """Test that later callers await the first caller's operation."""
+        calls = 0
+
+        async def fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        results = await asyncio.gather(*(flight.do("margarita", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert results == ["value"] * 5
+        assert flight.in_flight_count() == 0
+
+    @pytest.mark.anyio
+    async def test_different_keys_run_independently(self):
+        """Test that operations for different keys are not collapsed."""
+        calls: list[str] = []
+
+        def fetch_for(key: str):
+            async def fetch() -> str:
+                calls.append(key)
+                return key
+
+            return fetch
+
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        results = await asyncio.gather(flight.do("a", fetch_for("a")), flight.do("b", fetch_for("b")))
+
+        assert sorted(calls) == ["a", "b"]
+        assert results == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_key_is_released_after_completion(self):
+        """Test that a call after the first one finished starts a new operation."""
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        flight: SingleFlight[str, int] = SingleFlight()
+
+        assert await flight.do("k", fetch) == 1
+        await asyncio.sleep(0)
+        assert await flight.do("k", fetch) == 2
+
+    @pytest.mark.anyio
+    async def test_exception_propagates_to_every_waiter(self):
+        """Test that a failing operation raises in each concurrent caller."""
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.005)
+            raise RuntimeError("boom")
+
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        results = await asyncio.gather(flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.anyio
+    async def test_cancelled_first_caller_does_not_cancel_shared_operation(self):
+        """Test that cancelling the caller that started the operation leaves later waiters unaffected."""
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.01)
+            return "value"
+
+        flight: SingleFlight[str, str] = SingleFlight()
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
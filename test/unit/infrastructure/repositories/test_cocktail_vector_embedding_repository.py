@@ -156,6 +156,49 @@ class TestCocktailVectorEmbeddingRepository:
         assert "keywords_mood" in metadata
         assert "keywords_search_terms" in metadata
         assert "keywords_search_words" in metadata
+        assert isinstance(metadata["indexed_at"], float)
+        assert points[1].payload["metadata"]["indexed_at"] == metadata["indexed_at"]
+
+    @pytest.mark.anyio
+    async def test_store_vectors_stamps_indexed_at_after_inference(self):
+        """Test that indexed_at is taken once both encoders have finished, not before inference starts."""
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_client = MagicMock()
+        clock = MagicMock(return_value=100.0)
+
+        async def encode_batch(texts):
+            clock.return_value = 200.0
+            return [([10], [0.9])]
+
+        mock_splade = self._make_splade_service()
+        mock_splade.encode_batch = AsyncMock(side_effect=encode_batch)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_embedding_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_documents = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorEmbeddingRepository(
+                hugging_face_options=MagicMock(),
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=mock_splade,
+            )
+
+        cocktail_model = create_test_cocktail_model("cocktail-123", "Test Cocktail")
+        chunks = [CocktailDescriptionChunk(content="Description 1", category="desc")]
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_embedding_repository.time"
+        ) as mock_time:
+            mock_time.time = clock
+            await repo.store_vectors("cocktail-123", chunks, cocktail_model)
+
+        points = mock_qdrant_client.upsert.call_args[1]["points"]
+        assert points[0].payload["metadata"]["indexed_at"] == 200.0
 
     @pytest.mark.anyio
     async def test_store_vectors_raises_on_empty_dense_embeddings(self):
@@ -1,8 +1,13 @@
+import asyncio
 import math
+import uuid
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from conftest import create_test_cache_options, create_test_cocktail_model, create_test_search_result_cache
 
+from cezzis_com_cocktails_aisearch.infrastructure.caching.in_memory_cache_backend import InMemoryCacheBackend
 from cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository import (
     CocktailVectorSearchRepository,
 )
@@ -18,15 +23,36 @@ class TestCocktailVectorSearchRepository:
         mock.encode_batch = AsyncMock(return_value=[([42, 100], [0.8, 0.5])])
         return mock
 
+    @staticmethod
+    def _serve_retrieve_from_scroll(mock_qdrant_client):
+        """Answer retrieve calls with the points the mocked scroll has returned, matched by point id."""
+        scroll = mock_qdrant_client.scroll
+        served = {}
+
+        async def scroll_and_record(*args, **kwargs):
+            points, next_offset = await scroll(*args, **kwargs)
+            served.update((id(point), point) for point in points)
+            return points, next_offset
+
+        async def retrieve(collection_name, ids, with_payload):
+            return [point for point in served.values() if point.id in ids]
+
+        mock_qdrant_client.scroll = AsyncMock(side_effect=scroll_and_record)
+        mock_qdrant_client.retrieve = AsyncMock(side_effect=retrieve)
+
     @pytest.mark.anyio
     async def test_search_vectors_success(self):
         """Test successful vector search."""
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -58,7 +84,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = [mock_point]
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -72,6 +98,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             result = await repo.search_vectors("tequila cocktails")
@@ -90,6 +119,145 @@ class TestCocktailVectorSearchRepository:
         assert call_kwargs["query"] == FusionQuery(fusion=Fusion.RRF)
         assert len(call_kwargs["prefetch"]) == 2
 
+    @pytest.mark.anyio
+    async def test_search_vectors_reuses_decoded_models_across_searches(self):
+        """Test that an unchanged payload is validated once and each search gets its own copy and statistics."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_options = MagicMock()
+
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_options.semantic_search_limit = 30
+        mock_qdrant_options.semantic_search_prefetch_limit = 100
+        mock_qdrant_options.semantic_search_score_threshold = 0.5
+
+        cocktail_json = create_test_cocktail_model("cocktail-123", "Margarita").model_dump_json(by_alias=True)
+
+        def point(score):
+            mock_point = MagicMock()
+            mock_point.score = score
+            mock_point.payload = {"metadata": {"cocktail_id": "cocktail-123", "model": cocktail_json}}
+            return mock_point
+
+        first_results, second_results = MagicMock(), MagicMock()
+        first_results.points = [point(0.9), point(0.7)]
+        second_results.points = [point(0.4)]
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.query_points = AsyncMock(side_effect=[first_results, second_results])
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            first = await repo.search_vectors("tequila cocktails")
+            second = await repo.search_vectors("margarita")
+
+        assert repo._decoded_models.misses == 1
+        assert repo._decoded_models.hits == 1
+        assert first[0] is not second[0]
+        assert first[0].title == second[0].title == "Margarita"
+        assert first[0].search_statistics.hit_count == 2
+        assert first[0].search_statistics.max_score == 0.9
+        assert second[0].search_statistics.hit_count == 1
+        assert second[0].search_statistics.max_score == 0.4
+
+    @pytest.mark.anyio
+    async def test_search_vectors_hydrates_id_only_hits_from_catalog(self):
+        """Test that hits carrying only ids are hydrated from the catalog, fetching cocktails it does not hold."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = True
+        mock_qdrant_options.semantic_search_group_size = 0
+        mock_qdrant_options.catalog_scroll_page_size = 1000
+        mock_qdrant_options.catalog_scroll_parallelism = 1
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_options.semantic_search_limit = 30
+        mock_qdrant_options.semantic_search_prefetch_limit = 100
+        mock_qdrant_options.semantic_search_score_threshold = 0.5
+
+        def model_json(cocktail_id, title):
+            return create_test_cocktail_model(cocktail_id, title).model_dump_json(by_alias=True)
+
+        catalog_point = MagicMock()
+        catalog_point.payload = {"metadata": {"cocktail_id": "1", "model": model_json("1", "Margarita")}}
+
+        def hit(point_id, cocktail_id, score):
+            point = MagicMock()
+            point.id = point_id
+            point.score = score
+            point.payload = {"metadata": {"cocktail_id": cocktail_id, "keywords_search_terms": ["brunch"]}}
+            return point
+
+        search_results = MagicMock()
+        search_results.points = [hit("p1", "1", 0.9), hit("p2", "2", 0.8), hit("p3", "1", 0.7), hit("p4", "3", 0.6)]
+        fetched = MagicMock()
+        fetched.payload = {"metadata": {"cocktail_id": "2", "model": model_json("2", "Mojito")}}
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(return_value=([catalog_point], None))
+        mock_qdrant_client.query_points = AsyncMock(return_value=search_results)
+        mock_qdrant_client.retrieve = AsyncMock(side_effect=[[catalog_point], [fetched]])
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            catalog = await repo.get_catalog_index()
+            catalog_statistics = catalog.get("1").search_statistics.model_dump()
+            result = await repo.search_vectors("tequila cocktails")
+
+        from qdrant_client.http.models import PayloadSelectorInclude
+
+        with_payload = mock_qdrant_client.query_points.call_args[1]["with_payload"]
+        assert isinstance(with_payload, PayloadSelectorInclude)
+        assert "metadata.model" not in with_payload.include
+        retrieve_kwargs = mock_qdrant_client.retrieve.call_args[1]
+        assert retrieve_kwargs["ids"] == ["p2", "p4"]
+        assert "metadata.model" in retrieve_kwargs["with_payload"].include
+
+        assert [(c.id, c.title) for c in result] == [("1", "Margarita"), ("2", "Mojito")]
+        assert result[0] is not catalog.get("1")
+        assert result[0].search_statistics.hit_count == 2
+        assert result[0].keywords_search_terms == ["brunch"]
+        assert catalog.get("1").search_statistics.model_dump() == catalog_statistics
+
     @pytest.mark.anyio
     async def test_search_vectors_with_filter(self):
         """Test that query_filter is passed through to Qdrant."""
@@ -98,9 +266,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -108,7 +280,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         test_filter = Filter(must=[FieldCondition(key="metadata.is_iba", match=MatchValue(value=True))])
 
@@ -124,6 +296,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("iba cocktails", query_filter=test_filter)
@@ -139,9 +314,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -172,7 +351,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = [mock_point1, mock_point2]
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -186,6 +365,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             result = await repo.search_vectors("tequila")
@@ -206,9 +388,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -237,7 +423,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = mock_points
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -251,6 +437,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             result = await repo.search_vectors("test query")
@@ -272,9 +461,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -299,7 +492,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = [mock_point]
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -313,6 +506,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             result = await repo.search_vectors("test")
@@ -322,15 +518,46 @@ class TestCocktailVectorSearchRepository:
         expected_weighted = 0.85 * 0.6 + 0.85 * 0.3 + math.log(2) * 0.1
         assert stats.weighted_score == pytest.approx(expected_weighted, rel=1e-6)
 
+    def test_aggregate_hits_groups_interleaved_duplicates(self):
+        """Test that interleaved chunk hits are grouped per cocktail in first-hit order with vectorised statistics."""
+        repo = CocktailVectorSearchRepository.__new__(CocktailVectorSearchRepository)
+        models = {
+            "a": create_test_cocktail_model("a", "Aviation"),
+            "b": create_test_cocktail_model("b", "Bramble"),
+            "c": create_test_cocktail_model("c", "Clover Club"),
+        }
+
+        def hit(cocktail_id, score):
+            return MagicMock(score=score, payload={"metadata": {"cocktail_id": cocktail_id}})
+
+        points = [hit("b", 0.9), hit("a", 0.8), hit("b", 0.6), hit("missing", 0.5), hit("a", 0.4), hit("b", 0.3)]
+        result = repo._aggregate_hits(points, models)
+
+        assert [c.id for c in result] == ["b", "a"]
+        b_stats, a_stats = result[0].search_statistics, result[1].search_statistics
+        assert b_stats.hit_count == 3
+        assert b_stats.total_score == pytest.approx(1.8)
+        assert b_stats.max_score == 0.9
+        assert b_stats.avg_score == pytest.approx(0.6)
+        assert [r.score for r in b_stats.hit_results] == [0.9, 0.6, 0.3]
+        assert b_stats.weighted_score == pytest.approx(0.9 * 0.6 + 0.6 * 0.3 + math.log(4) * 0.1)
+        assert a_stats.hit_count == 2
+        assert a_stats.weighted_score == pytest.approx(0.8 * 0.6 + 0.6 * 0.3 + math.log(3) * 0.1)
+        assert models["b"].search_statistics is not b_stats
+
     @pytest.mark.anyio
     async def test_embedding_cache_hit(self):
         """Test that repeated queries use cached embeddings instead of calling the API."""
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -338,7 +565,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -352,6 +579,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             # First call should generate embedding
@@ -372,9 +602,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -382,7 +616,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -396,6 +630,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("Tequila Cocktails")
@@ -409,9 +646,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 0  # backend only, no in-process slab
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -419,7 +660,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         with patch(
             "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
@@ -433,24 +674,141 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=6),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
-            # Set a small cache size for testing
-            repo._embedding_cache_max_size = 3
-
-            # Fill cache with 3 entries
+            # Fill the backend: each query caches its dense and its sparse vector
             await repo.search_vectors("query 1")
             await repo.search_vectors("query 2")
             await repo.search_vectors("query 3")
             assert mock_embeddings.aembed_query.call_count == 3
-            assert len(repo._embedding_cache) == 3
 
-            # Add a 4th should evict the oldest ("query 1")
+            # A 4th query evicts the least recently used entries ("query 1")
             await repo.search_vectors("query 4")
             assert mock_embeddings.aembed_query.call_count == 4
-            assert len(repo._embedding_cache) == 3
-            assert "query 1" not in repo._embedding_cache
-            assert "query 4" in repo._embedding_cache
+
+            await repo.search_vectors("query 4")
+            assert mock_embeddings.aembed_query.call_count == 4
+
+            await repo.search_vectors("query 1")
+            assert mock_embeddings.aembed_query.call_count == 5
+
+    @pytest.mark.anyio
+    async def test_embedding_slab_serves_hits_without_the_backend(self):
+        """Test that hot embeddings are answered from the in-process float32 slab before the cache backend."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 4
+
+        cache_backend = InMemoryCacheBackend(max_entries=1024)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=MagicMock(),
+                qdrant_options=MagicMock(),
+                splade_service=self._make_splade_service(),
+                cache_backend=cache_backend,
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            await repo._get_cached_embedding("margarita")
+
+            with patch.object(cache_backend, "get", AsyncMock()) as backend_get:
+                embedding = await repo._get_cached_embedding("Margarita")
+
+            backend_get.assert_not_called()
+            assert isinstance(embedding, list)
+            assert embedding == pytest.approx([0.1, 0.2, 0.3])
+            assert repo._embedding_slab is not None
+            assert repo._embedding_slab.nbytes == 4 * 3 * 4
+
+    def _make_embedding_repository(self, cache_backend, embedding_cache_max_entries=4):
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = embedding_cache_max_entries
+        return CocktailVectorSearchRepository(
+            hugging_face_options=mock_hf_options,
+            qdrant_client=MagicMock(),
+            qdrant_options=MagicMock(),
+            splade_service=self._make_splade_service(),
+            cache_backend=cache_backend,
+            cache_options=create_test_cache_options(),
+            search_result_cache=create_test_search_result_cache(),
+        )
+
+    @pytest.mark.anyio
+    async def test_embedding_slab_is_the_only_dense_tier_with_memory_backend(self):
+        """Test that with the in-process backend an embedding is held once, in the slab, and not in the backend."""
+        cache_backend = InMemoryCacheBackend(max_entries=1024)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+            repo = self._make_embedding_repository(cache_backend)
+
+            await repo._get_cached_embedding("margarita")
+            assert await repo._get_cached_embedding("Margarita") == pytest.approx([0.1, 0.2, 0.3])
+
+        assert mock_embeddings.aembed_query.await_count == 1
+        assert cache_backend.items(("emb:",)) == []
+        assert len(repo._embedding_slab) == 1
+
+    @pytest.mark.anyio
+    async def test_embedding_is_written_through_to_a_shared_backend(self):
+        """Test that a shared backend still receives every embedding, so other replicas can reuse it."""
+        cache_backend = AsyncMock()
+        cache_backend.get = AsyncMock(return_value=None)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+            repo = self._make_embedding_repository(cache_backend)
+
+            await repo._get_cached_embedding("margarita")
+
+        cache_backend.set.assert_awaited_once()
+        assert cache_backend.set.await_args.args[0] == repo._cache_key("emb", "margarita")
+        assert repo.export_query_embeddings() == []
+
+    @pytest.mark.anyio
+    async def test_query_embeddings_export_and_import_through_the_slab(self):
+        """Test that slab-only embeddings can be exported and restored into another repository's slab."""
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+            repo = self._make_embedding_repository(InMemoryCacheBackend(max_entries=16))
+            await repo._get_cached_embedding("margarita")
+            exported = repo.export_query_embeddings()
+
+            restored = self._make_embedding_repository(InMemoryCacheBackend(max_entries=16))
+            assert restored.import_query_embeddings(exported) is True
+            assert await restored._get_cached_embedding("margarita") == pytest.approx([0.1, 0.2, 0.3])
+
+        assert [key for key, _ in exported] == [repo._cache_key("emb", "margarita")]
+        assert mock_embeddings.aembed_query.await_count == 1
 
     @pytest.mark.anyio
     async def test_search_vectors_hybrid_uses_prefetch_rrf(self):
@@ -460,9 +818,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -487,7 +849,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = [mock_point]
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         mock_splade = self._make_splade_service()
         mock_splade.encode = AsyncMock(return_value=([42, 100], [0.8, 0.5]))
@@ -504,6 +866,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             result = await repo.search_vectors("tequila cocktails")
@@ -533,15 +898,90 @@ class TestCocktailVectorSearchRepository:
         # Verify SPLADE was called with the query text
         mock_splade.encode.assert_called_once_with("tequila cocktails")
 
+    @pytest.mark.anyio
+    async def test_search_vectors_grouped_mode_returns_one_group_per_cocktail(self):
+        """Test that a group size switches to query_points_groups on cocktail id with limit counting cocktails."""
+        from qdrant_client.http.models import GroupsResult, PointGroup, ScoredPoint
+
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 2
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_options.semantic_search_limit = 2
+        mock_qdrant_options.semantic_search_prefetch_limit = 100
+        mock_qdrant_options.semantic_search_score_threshold = 0.0
+
+        def hit(point_id, cocktail_id, score):
+            model = create_test_cocktail_model(cocktail_id, title=f"Cocktail {cocktail_id}").model_dump_json(
+                by_alias=True
+            )
+            return ScoredPoint(
+                id=point_id,
+                version=1,
+                score=score,
+                payload={"metadata": {"cocktail_id": cocktail_id, "model": model}},
+            )
+
+        grouped_results = GroupsResult(
+            groups=[
+                PointGroup(id="1", hits=[hit(1, "1", 0.9), hit(2, "1", 0.7)]),
+                PointGroup(id="2", hits=[hit(3, "2", 0.8)]),
+            ]
+        )
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.query_points = AsyncMock()
+        mock_qdrant_client.query_points_groups = AsyncMock(return_value=grouped_results)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            result = await repo.search_vectors("tequila cocktails")
+
+        mock_qdrant_client.query_points.assert_not_called()
+        call_kwargs = mock_qdrant_client.query_points_groups.call_args[1]
+        assert call_kwargs["group_by"] == "metadata.cocktail_id"
+        assert call_kwargs["group_size"] == 2
+        assert call_kwargs["limit"] == 2
+
+        assert [c.id for c in result] == ["1", "2"]
+        assert result[0].search_statistics.hit_count == 2
+        assert result[0].search_statistics.max_score == pytest.approx(0.9)
+        assert result[1].search_statistics.hit_count == 1
+
     @pytest.mark.anyio
     async def test_search_vectors_hybrid_fallback_on_splade_failure(self):
         """Test that hybrid search falls back to dense-only when SPLADE fails."""
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -549,7 +989,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         mock_splade = self._make_splade_service()
         mock_splade.encode = AsyncMock(side_effect=Exception("SPLADE down"))
@@ -566,6 +1006,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("tequila cocktails")
@@ -581,9 +1024,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -591,7 +1038,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         mock_splade = self._make_splade_service()
         mock_splade.encode = AsyncMock(return_value=([], []))
@@ -608,6 +1055,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("tequila cocktails")
@@ -624,9 +1074,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 30
         mock_qdrant_options.semantic_search_prefetch_limit = 100
@@ -634,7 +1088,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         test_filter = Filter(must=[FieldCondition(key="metadata.is_iba", match=MatchValue(value=True))])
 
@@ -653,6 +1107,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("iba cocktails", query_filter=test_filter)
@@ -673,9 +1130,13 @@ class TestCocktailVectorSearchRepository:
         mock_hf_options = MagicMock()
         mock_hf_options.inference_model = "test-model"
         mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
 
         mock_qdrant_client = MagicMock()
         mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
         mock_qdrant_options.collection_name = "test-collection"
         mock_qdrant_options.semantic_search_limit = 40
         mock_qdrant_options.semantic_search_prefetch_limit = 150
@@ -683,7 +1144,7 @@ class TestCocktailVectorSearchRepository:
 
         mock_search_results = MagicMock()
         mock_search_results.points = []
-        mock_qdrant_client.query_points = MagicMock(return_value=mock_search_results)
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
 
         mock_splade = self._make_splade_service()
         mock_splade.encode = AsyncMock(return_value=([10, 20], [0.9, 0.4]))
@@ -700,6 +1161,9 @@ class TestCocktailVectorSearchRepository:
                 qdrant_client=mock_qdrant_client,
                 qdrant_options=mock_qdrant_options,
                 splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
             )
 
             await repo.search_vectors("cocktails with berries")
@@ -712,3 +1176,677 @@ class TestCocktailVectorSearchRepository:
 
         # RRF fusion output should use the smaller semantic_search_limit
         assert call_kwargs["limit"] == 40
+
+    @pytest.mark.anyio
+    async def test_get_all_cocktails_awaits_async_scroll_pages(self):
+        """Test that get_all_cocktails pages through the async client and de-duplicates by cocktail id."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
+        mock_qdrant_options.catalog_scroll_page_size = 1000
+        mock_qdrant_options.catalog_scroll_parallelism = 1
+        mock_qdrant_options.collection_name = "test-collection"
+
+        def make_point(cocktail_id: str, title: str):
+            point = MagicMock()
+            point.payload = {
+                "metadata": {
+                    "cocktail_id": cocktail_id,
+                    "model": f"""{{
+                        "id": "{cocktail_id}",
+                        "title": "{title}",
+                        "descriptiveTitle": "{title} Desc",
+                        "rating": 4.0,
+                        "ingredients": [],
+                        "isIba": false,
+                        "serves": 1,
+                        "prepTimeMinutes": 5,
+                        "searchTiles": [],
+                        "glassware": []
+                    }}""",
+                }
+            }
+            return point
+
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                ([make_point("1", "Margarita"), make_point("1", "Margarita")], "next-page"),
+                ([make_point("2", "Mojito")], None),
+            ]
+        )
+
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ):
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            result = await repo.get_all_cocktails()
+            cached = await repo.get_all_cocktails()
+
+        assert [c.id for c in result] == ["1", "2"]
+        assert cached is result
+        assert mock_qdrant_client.scroll.await_count == 2
+        assert mock_qdrant_client.scroll.call_args_list[1][1]["offset"] == "next-page"
+
+    @pytest.mark.anyio
+    async def test_get_catalog_index_is_built_once_per_catalog_load(self):
+        """Test that the catalog index is built with the cached catalog and reused until it is reloaded."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        point = MagicMock()
+        point.payload = {
+            "metadata": {
+                "cocktail_id": "1",
+                "model": create_test_cocktail_model("1", "Margarita").model_dump_json(by_alias=True),
+            }
+        }
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.catalog_scroll_page_size = 1000
+        mock_qdrant_options.catalog_scroll_parallelism = 1
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(return_value=([point], None))
+
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ):
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            catalog = await repo.get_catalog_index()
+            again = await repo.get_catalog_index()
+
+        assert again is catalog
+        assert catalog.cocktails is await repo.get_all_cocktails()
+        assert catalog.get("1").title == "Margarita"
+        assert mock_qdrant_client.scroll.await_count == 1
+
+    def _make_catalog_repository(
+        self, mock_qdrant_client, cache_options=None, catalog_scroll_parallelism=1, search_result_cache=None
+    ):
+        """Create a repository for exercising the cached catalog only."""
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_options.catalog_scroll_page_size = 1000
+        mock_qdrant_options.catalog_scroll_parallelism = catalog_scroll_parallelism
+
+        mock_hf_options = MagicMock()
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 0
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ):
+            return CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=cache_options or create_test_cache_options(),
+                search_result_cache=search_result_cache or create_test_search_result_cache(),
+            )
+
+    @staticmethod
+    def _catalog_point(cocktail_id, title, indexed_at=None):
+        metadata = {
+            "cocktail_id": cocktail_id,
+            "model": create_test_cocktail_model(cocktail_id, title).model_dump_json(),
+        }
+        if indexed_at is not None:
+            metadata["indexed_at"] = indexed_at
+        point = MagicMock()
+        point.payload = {"metadata": metadata}
+        return point
+
+    @staticmethod
+    def _paged_scroll(points):
+        """Serve ``points`` (sorted by UUID) the way Qdrant's scroll pages through a collection."""
+
+        async def scroll(collection_name, scroll_filter, limit, offset, with_payload):
+            start = 0
+            if offset is not None:
+                start = next(
+                    (i for i, p in enumerate(points) if uuid.UUID(p.id).int >= uuid.UUID(offset).int), len(points)
+                )
+            end = start + limit
+            return points[start:end], points[end].id if end < len(points) else None
+
+        return AsyncMock(side_effect=scroll)
+
+    @pytest.mark.anyio
+    async def test_get_all_cocktails_scrolls_projected_payload_in_large_pages(self):
+        """Test that the catalog scroll reads only cocktail ids in large pages, then fetches one model per cocktail."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            return_value=([self._catalog_point("1", "Margarita"), self._catalog_point("1", "Margarita")], None)
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        repo = self._make_catalog_repository(mock_qdrant_client)
+
+        await repo.get_all_cocktails()
+
+        call_kwargs = mock_qdrant_client.scroll.call_args[1]
+        assert call_kwargs["limit"] == 1000
+        assert call_kwargs["offset"] is None
+        assert set(call_kwargs["with_payload"].include) == {"metadata.cocktail_id", "metadata.indexed_at"}
+        retrieve_kwargs = mock_qdrant_client.retrieve.call_args[1]
+        assert len(retrieve_kwargs["ids"]) == 1
+        assert set(retrieve_kwargs["with_payload"].include) == {"metadata.cocktail_id", "metadata.model"}
+
+    @pytest.mark.anyio
+    async def test_parallel_catalog_scroll_matches_sequential_scroll(self):
+        """Test that scrolling id ranges in parallel loads the same catalog, in the same order, as one scroll."""
+        chunk_ids = sorted(
+            (str(uuid.uuid5(uuid.NAMESPACE_URL, f"chunk-{i}")) for i in range(60)), key=lambda p: uuid.UUID(p).int
+        )
+        models = {f"c{i}": create_test_cocktail_model(f"c{i}", f"Cocktail {i}").model_dump_json() for i in range(15)}
+        points = [
+            SimpleNamespace(
+                id=chunk_id, payload={"metadata": {"cocktail_id": f"c{i // 4}", "model": models[f"c{i // 4}"]}}
+            )
+            for i, chunk_id in enumerate(chunk_ids)
+        ]
+
+        loaded = {}
+        for parallelism in (1, 4):
+            mock_qdrant_client = MagicMock()
+            mock_qdrant_client.scroll = self._paged_scroll(points)
+            self._serve_retrieve_from_scroll(mock_qdrant_client)
+            repo = self._make_catalog_repository(mock_qdrant_client, catalog_scroll_parallelism=parallelism)
+            repo.qdrant_options.catalog_scroll_page_size = 7
+            loaded[parallelism] = [c.id for c in await repo.get_all_cocktails()]
+            offsets = [call[1]["offset"] for call in mock_qdrant_client.scroll.call_args_list]
+
+        assert loaded[1] == [f"c{i}" for i in range(15)]
+        assert loaded[4] == loaded[1]
+        assert {str(uuid.UUID(int=(i << 128) // 4)) for i in (1, 2, 3)} <= set(offsets)
+
+    @pytest.mark.anyio
+    async def test_upsert_catalog_cocktail_swaps_in_new_catalog(self):
+        """Test that an upsert replaces or appends the cocktail in a new list and index, leaving the old ones intact."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            return_value=([self._catalog_point("1", "Margarita"), self._catalog_point("2", "Mojito")], None)
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        search_result_cache = AsyncMock()
+        repo = self._make_catalog_repository(mock_qdrant_client, search_result_cache=search_result_cache)
+
+        before = await repo.get_catalog_index()
+        assert await repo.upsert_catalog_cocktail(create_test_cocktail_model("1", "Tommy's Margarita")) is True
+        assert await repo.upsert_catalog_cocktail(create_test_cocktail_model("3", "Paloma")) is True
+        assert await repo.upsert_catalog_cocktail(create_test_cocktail_model("3", "Paloma")) is False
+        after = await repo.get_catalog_index()
+
+        assert [c.title for c in after.cocktails] == ["Tommy's Margarita", "Mojito", "Paloma"]
+        assert after.cocktails is await repo.get_all_cocktails()
+        assert after.get("3").title == "Paloma"
+        assert [c.title for c in before.cocktails] == ["Margarita", "Mojito"]
+        assert before.get("1").title == "Margarita"
+        assert mock_qdrant_client.scroll.await_count == 1
+        # The embedding command handler owns invalidation for the vectors it just stored
+        search_result_cache.invalidate.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_remove_catalog_cocktail_drops_it_and_never_pins_an_empty_catalog(self):
+        """Test that removing cocktails updates the catalog and removing the last one forces a reload."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            return_value=([self._catalog_point("1", "Margarita"), self._catalog_point("2", "Mojito")], None)
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        repo = self._make_catalog_repository(mock_qdrant_client)
+        await repo.get_all_cocktails()
+
+        assert await repo.remove_catalog_cocktail("1") is True
+        assert await repo.remove_catalog_cocktail("1") is False
+        assert [c.id for c in await repo.get_all_cocktails()] == ["2"]
+
+        await repo.remove_catalog_cocktail("2")
+        await repo.get_all_cocktails()
+        assert mock_qdrant_client.scroll.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_upsert_before_catalog_load_is_ignored(self):
+        """Test that changes before the first load are left to that load."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(return_value=([self._catalog_point("1", "Margarita")], None))
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        repo = self._make_catalog_repository(mock_qdrant_client)
+
+        await repo.upsert_catalog_cocktail(create_test_cocktail_model("2", "Mojito"))
+
+        assert [c.id for c in await repo.get_all_cocktails()] == ["1"]
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_scrolls_from_watermark(self):
+        """Test that a refresh only scrolls points indexed since the watermark and advances it."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                ([self._catalog_point("1", "Margarita", 1000.0), self._catalog_point("2", "Mojito")], None),
+                (
+                    [self._catalog_point("2", "Royal Mojito", 1500.0), self._catalog_point("4", "Daiquiri", 1600.0)],
+                    None,
+                ),
+                ([self._catalog_point("4", "Daiquiri", 1600.0)], None),
+            ]
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        repo = self._make_catalog_repository(mock_qdrant_client)
+        loaded = await repo.get_catalog_index()
+
+        assert await repo.refresh_catalog() is True
+        first_filter = mock_qdrant_client.scroll.call_args[1]["scroll_filter"].must[0]
+        assert first_filter.key == "metadata.indexed_at"
+        assert first_filter.range.gte == pytest.approx(1000.0 - 60.0)
+
+        refreshed = await repo.get_catalog_index()
+        assert refreshed is not loaded
+        assert [c.id for c in refreshed.cocktails] == ["1", "2", "4"]
+        assert refreshed.get("2").title == "Royal Mojito"
+        assert loaded.get("2").title == "Mojito"
+
+        # Re-reading unchanged points within the overlap window leaves the catalog alone
+        assert await repo.refresh_catalog() is False
+        assert mock_qdrant_client.scroll.call_args[1]["scroll_filter"].must[0].range.gte == pytest.approx(1540.0)
+        assert await repo.get_catalog_index() is refreshed
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_invalidates_search_results_only_on_change(self):
+        """Test that cached rankings are dropped when a refresh changes the catalog, and kept otherwise."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                ([self._catalog_point("1", "Margarita", 1000.0)], None),
+                ([self._catalog_point("2", "Mojito", 1500.0)], None),
+                ([self._catalog_point("2", "Mojito", 1500.0)], None),
+            ]
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        search_result_cache = AsyncMock()
+        repo = self._make_catalog_repository(mock_qdrant_client, search_result_cache=search_result_cache)
+        await repo.get_all_cocktails()
+
+        assert await repo.refresh_catalog() is True
+        search_result_cache.invalidate.assert_awaited_once()
+
+        assert await repo.refresh_catalog() is False
+        search_result_cache.invalidate.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_ignores_unchanged_models_decoded_again(self):
+        """Test that a model evicted from the decoded-model cache and decoded again is not taken for a change."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                ([self._catalog_point("1", "Margarita", 1000.0), self._catalog_point("2", "Mojito", 1000.0)], None),
+                ([self._catalog_point("1", "Margarita", 1000.0)], None),
+            ]
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        search_result_cache = AsyncMock()
+        repo = self._make_catalog_repository(
+            mock_qdrant_client,
+            cache_options=create_test_cache_options(decoded_model_cache_max_entries=1),
+            search_result_cache=search_result_cache,
+        )
+        loaded = await repo.get_catalog_index()
+
+        assert await repo.refresh_catalog() is False
+        assert await repo.get_catalog_index() is loaded
+        search_result_cache.invalidate.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_removal_scan_drops_cocktails_without_vectors(self):
+        """Test that the periodic id-only scan removes cocktails whose vectors were deleted elsewhere."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                (
+                    [
+                        self._catalog_point("1", "Margarita", 1000.0),
+                        self._catalog_point("2", "Mojito", 1000.0),
+                        self._catalog_point("3", "Paloma", 1000.0),
+                    ],
+                    None,
+                ),
+                # Id-only scan: "2" has no chunks left, "3" was deleted and is being re-embedded
+                ([self._catalog_point("1", "Margarita", 1000.0)], None),
+                # Watermark scroll: "3" was stored again after the id scan
+                ([self._catalog_point("3", "Paloma", 1700.0)], None),
+            ]
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        search_result_cache = AsyncMock()
+        repo = self._make_catalog_repository(
+            mock_qdrant_client,
+            create_test_cache_options(catalog_removal_scan_interval_seconds=0.001),
+            search_result_cache=search_result_cache,
+        )
+        await repo.get_all_cocktails()
+        await asyncio.sleep(0.01)
+
+        assert await repo.refresh_catalog() is True
+
+        scan_call = mock_qdrant_client.scroll.call_args_list[1].kwargs
+        assert "scroll_filter" not in scan_call
+        assert scan_call["with_payload"].include == ["metadata.cocktail_id", "metadata.indexed_at"]
+        assert [c.id for c in await repo.get_all_cocktails()] == ["1", "3"]
+        search_result_cache.invalidate.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_removal_scan_waits_for_its_interval(self):
+        """Test that refreshes between removal scans only scroll from the watermark."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock(
+            side_effect=[
+                ([self._catalog_point("1", "Margarita", 1000.0)], None),
+                ([], None),
+            ]
+        )
+        self._serve_retrieve_from_scroll(mock_qdrant_client)
+        repo = self._make_catalog_repository(
+            mock_qdrant_client, create_test_cache_options(catalog_removal_scan_interval_seconds=600.0)
+        )
+        await repo.get_all_cocktails()
+
+        assert await repo.refresh_catalog() is False
+        assert mock_qdrant_client.scroll.await_count == 2
+        assert mock_qdrant_client.scroll.call_args.kwargs["scroll_filter"] is not None
+
+    @pytest.mark.anyio
+    async def test_refresh_catalog_skips_until_catalog_is_loaded(self):
+        """Test that a refresh before the first load does not touch Qdrant."""
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.scroll = AsyncMock()
+        repo = self._make_catalog_repository(mock_qdrant_client)
+
+        assert await repo.refresh_catalog() is False
+        mock_qdrant_client.scroll.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_watch_catalog_returns_when_disabled(self):
+        """Test that a zero refresh interval disables the background refresh."""
+        repo = self._make_catalog_repository(
+            MagicMock(), create_test_cache_options(catalog_refresh_interval_seconds=0.0)
+        )
+
+        await asyncio.wait_for(repo.watch_catalog(), timeout=1.0)
+
+    @pytest.mark.anyio
+    async def test_search_vectors_runs_dense_and_splade_encoding_concurrently(self):
+        """Test that the SPLADE encoding starts without waiting for the dense embedding to finish."""
+        import asyncio
+
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
+        mock_qdrant_options.collection_name = "test-collection"
+        mock_qdrant_options.semantic_search_limit = 30
+        mock_qdrant_options.semantic_search_prefetch_limit = 100
+
+        mock_search_results = MagicMock()
+        mock_search_results.points = []
+        mock_qdrant_client.query_points = AsyncMock(return_value=mock_search_results)
+
+        splade_started = asyncio.Event()
+
+        async def dense_embedding(_text):
+            # Only completes once SPLADE is already in flight; a sequential
+            # implementation would time out here
+            await asyncio.wait_for(splade_started.wait(), timeout=1.0)
+            return [0.1, 0.2, 0.3]
+
+        async def splade_encode(_text):
+            splade_started.set()
+            return ([42], [0.8])
+
+        mock_splade = self._make_splade_service()
+        mock_splade.encode = AsyncMock(side_effect=splade_encode)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(side_effect=dense_embedding)
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=mock_splade,
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            await repo.search_vectors("tequila cocktails")
+
+        call_kwargs = mock_qdrant_client.query_points.call_args[1]
+        assert len(call_kwargs["prefetch"]) == 2
+
+    @pytest.mark.anyio
+    async def test_search_vectors_raises_when_dense_embedding_fails(self):
+        """Test that a dense embedding failure propagates even though SPLADE succeeded."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_client.query_points = AsyncMock()
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(side_effect=RuntimeError("TEI down"))
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=MagicMock(),
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            with pytest.raises(RuntimeError, match="TEI down"):
+                await repo.search_vectors("tequila cocktails")
+
+        mock_qdrant_client.query_points.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_concurrent_embedding_misses_are_batched_and_deduplicated(self):
+        """Test that concurrent cache misses share one aembed_documents call with duplicates collapsed."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 5.0
+        mock_hf_options.batch_max_size = 32
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        mock_qdrant_client = MagicMock()
+        mock_qdrant_options = MagicMock()
+        mock_qdrant_options.semantic_search_hydrate_from_catalog = False
+        mock_qdrant_options.semantic_search_group_size = 0
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_documents = AsyncMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=mock_qdrant_client,
+                qdrant_options=mock_qdrant_options,
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            results = await asyncio.gather(
+                repo._get_cached_embedding("margarita"),
+                repo._get_cached_embedding("margarita"),
+                repo._get_cached_embedding("mojito"),
+            )
+
+            mock_embeddings.aembed_documents.assert_awaited_once_with(["margarita", "mojito"])
+            mock_embeddings.aembed_query.assert_not_called()
+            assert results == [[0.1, 0.2], [0.1, 0.2], [0.3, 0.4]]
+
+    @pytest.mark.anyio
+    async def test_concurrent_embedding_misses_for_same_query_share_one_request(self):
+        """Test that concurrent cache misses for the same normalised query call the endpoint once."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.api_token = "test-token"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+
+            async def aembed_query(_text):
+                await asyncio.sleep(0.005)
+                return [0.1, 0.2, 0.3]
+
+            mock_embeddings.aembed_query = AsyncMock(side_effect=aembed_query)
+            mock_hf_class.return_value = mock_embeddings
+
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=MagicMock(),
+                qdrant_options=MagicMock(),
+                splade_service=self._make_splade_service(),
+                cache_backend=InMemoryCacheBackend(max_entries=1024),
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            results = await asyncio.gather(
+                repo._get_cached_embedding("Margarita"),
+                repo._get_cached_embedding("margarita"),
+                repo._get_cached_embedding(" margarita "),
+            )
+
+            assert mock_embeddings.aembed_query.await_count == 1
+            assert results == [[0.1, 0.2, 0.3]] * 3
+            assert await repo._get_cached_embedding("MARGARITA") == pytest.approx([0.1, 0.2, 0.3])
+            assert mock_embeddings.aembed_query.await_count == 1
+
+    @pytest.mark.anyio
+    async def test_embedding_and_sparse_vectors_are_cached_as_compact_bytes(self):
+        """Test that the backend holds float32 dense bytes and packed sparse bytes, keyed per model."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 0  # backend only, no in-process slab
+        backend = InMemoryCacheBackend(max_entries=16)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ) as mock_hf_class:
+            mock_embeddings = AsyncMock()
+            mock_embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2, 0.3])
+            mock_hf_class.return_value = mock_embeddings
+
+            mock_splade = self._make_splade_service()
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=MagicMock(),
+                qdrant_options=MagicMock(),
+                splade_service=mock_splade,
+                cache_backend=backend,
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            await repo._get_cached_embedding("negroni")
+            await repo._get_cached_sparse_vector("negroni")
+
+            dense_bytes = await backend.get(repo._cache_key("emb", "negroni"))
+            sparse_bytes = await backend.get(repo._cache_key("splade", "negroni"))
+            assert dense_bytes is not None and len(dense_bytes) == 3 * 4
+            assert sparse_bytes is not None and len(sparse_bytes) == 4 + 2 * 4 + 2 * 4
+
+            indices, values = await repo._get_cached_sparse_vector("Negroni")
+            assert indices == [42, 100]
+            assert values == pytest.approx([0.8, 0.5])
+            assert mock_splade.encode.await_count == 1
+
+            mock_hf_options.inference_model = "other-model"
+            assert await backend.get(repo._cache_key("emb", "negroni")) is None
+
+    @pytest.mark.anyio
+    async def test_empty_sparse_vector_is_not_cached(self):
+        """Test that a degraded (empty) SPLADE result is not cached."""
+        mock_hf_options = MagicMock()
+        mock_hf_options.inference_model = "test-model"
+        mock_hf_options.batch_window_ms = 0.0
+        mock_hf_options.embedding_cache_max_entries = 1024
+        backend = InMemoryCacheBackend(max_entries=16)
+
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.repositories.cocktail_vector_search_repository.HuggingFaceEndpointEmbeddings"
+        ):
+            mock_splade = MagicMock()
+            mock_splade.encode = AsyncMock(return_value=([], []))
+            repo = CocktailVectorSearchRepository(
+                hugging_face_options=mock_hf_options,
+                qdrant_client=MagicMock(),
+                qdrant_options=MagicMock(),
+                splade_service=mock_splade,
+                cache_backend=backend,
+                cache_options=create_test_cache_options(),
+                search_result_cache=create_test_search_result_cache(),
+            )
+
+            assert await repo._get_cached_sparse_vector("negroni") == ([], [])
+            assert len(backend) == 0
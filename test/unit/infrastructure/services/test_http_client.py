@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from cezzis_com_cocktails_aisearch.domain.config.http_client_options import HttpClientOptions
+from cezzis_com_cocktails_aisearch.infrastructure.services.http_client import create_http_client
+
+
+class TestCreateHttpClient:
+    """Test cases for create_http_client."""
+
+    def _make_options(self, **overrides) -> HttpClientOptions:
+        values = {
+            "max_connections": 50,
+            "max_keepalive_connections": 10,
+            "keepalive_expiry_seconds": 15.0,
+            "connect_timeout_seconds": 2.0,
+            "http2": False,
+        }
+        values.update(overrides)
+        return HttpClientOptions.model_construct(**values)
+
+    @pytest.mark.anyio
+    async def test_creates_pooled_client_from_options(self):
+        """Test that pool limits, keep-alive and connect timeout come from the options."""
+        client = create_http_client(self._make_options())
+
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+            assert client.timeout.connect == 2.0
+            pool = client._transport._pool  # type: ignore[attr-defined]
+            assert pool._max_connections == 50
+            assert pool._max_keepalive_connections == 10
+            assert pool._keepalive_expiry == 15.0
+        finally:
+            await client.aclose()
+
+    @pytest.mark.anyio
+    async def test_enables_http2_when_h2_is_installed(self):
+        """Test that HTTP/2 is negotiated when enabled and the h2 package is available."""
+        client = create_http_client(self._make_options(http2=True))
+
+        try:
+            assert client._transport._pool._http2 is True  # type: ignore[attr-defined]
+        finally:
+            await client.aclose()
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_http1_when_h2_is_missing(self):
+        """Test that a missing h2 package disables HTTP/2 instead of failing startup."""
+        with patch(
+            "cezzis_com_cocktails_aisearch.infrastructure.services.http_client.importlib.util.find_spec",
+            return_value=None,
+        ):
+            client = create_http_client(self._make_options(http2=True))
+
+        try:
+            assert client._transport._pool._http2 is False  # type: ignore[attr-defined]
+        finally:
+            await client.aclose()
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -49,13 +49,15 @@ class TestRerankerService:
         options.api_key = api_key
         options.score_threshold = score_threshold
         options.relative_score_cutoff = relative_score_cutoff
+        options.timeout_seconds = 7.5
         return options
 
     @pytest.mark.anyio
     async def test_rerank_empty_list_returns_empty(self):
         """Test that empty cocktail list returns empty."""
         options = self._make_options()
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         result = await service.rerank(query="tequila", cocktails=[])
 
@@ -65,7 +67,8 @@ class TestRerankerService:
     async def test_rerank_success_reorders_by_score(self):
         """Test that reranker reorders cocktails by cross-encoder score."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [
             create_test_cocktail_model("1", "Low Relevance"),
@@ -83,16 +86,9 @@ class TestRerankerService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="tequila cocktails", cocktails=cocktails)
+        result = await service.rerank(query="tequila cocktails", cocktails=cocktails)
 
         assert len(result) == 3
         assert result[0].title == "High Relevance"
@@ -103,7 +99,8 @@ class TestRerankerService:
     async def test_rerank_applies_score_threshold(self):
         """Test that reranker filters out cocktails below score threshold."""
         options = self._make_options(endpoint="http://localhost:8990", score_threshold=0.5)
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [
             create_test_cocktail_model("1", "Good Match"),
@@ -117,16 +114,9 @@ class TestRerankerService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="refreshing", cocktails=cocktails)
+        result = await service.rerank(query="refreshing", cocktails=cocktails)
 
         assert len(result) == 1
         assert result[0].title == "Good Match"
@@ -135,7 +125,8 @@ class TestRerankerService:
     async def test_rerank_applies_top_k(self):
         """Test that reranker limits results to top_k."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [create_test_cocktail_model(str(i), f"Cocktail {i}") for i in range(5)]
 
@@ -143,16 +134,9 @@ class TestRerankerService:
         mock_response.json.return_value = [{"index": i, "score": 0.9 - i * 0.1} for i in range(5)]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="cocktail", cocktails=cocktails, top_k=2)
+        result = await service.rerank(query="cocktail", cocktails=cocktails, top_k=2)
 
         assert len(result) == 2
 
@@ -160,7 +144,8 @@ class TestRerankerService:
     async def test_rerank_sets_reranker_score_on_statistics(self):
         """Test that reranker updates search_statistics.reranker_score."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktail = create_test_cocktail_model("1", "Margarita")
 
@@ -168,16 +153,9 @@ class TestRerankerService:
         mock_response.json.return_value = [{"index": 0, "score": 0.88}]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="tequila", cocktails=[cocktail])
+        result = await service.rerank(query="tequila", cocktails=[cocktail])
 
         assert len(result) == 1
         assert result[0].search_statistics.reranker_score == 0.88
@@ -186,22 +164,16 @@ class TestRerankerService:
     async def test_rerank_graceful_degradation_on_http_error(self):
         """Test that reranker returns original list on HTTP error."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [create_test_cocktail_model("1", "Margarita")]
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=httpx.HTTPStatusError("Server Error", request=MagicMock(), response=MagicMock())
-            )
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(
+            side_effect=httpx.HTTPStatusError("Server Error", request=MagicMock(), response=MagicMock())
+        )
 
-            result = await service.rerank(query="tequila", cocktails=cocktails)
+        result = await service.rerank(query="tequila", cocktails=cocktails)
 
         # Should return original list, not raise
         assert result == cocktails
@@ -210,20 +182,14 @@ class TestRerankerService:
     async def test_rerank_graceful_degradation_on_connection_error(self):
         """Test that reranker returns original list when TEI is unreachable."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [create_test_cocktail_model("1", "Margarita")]
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
 
-            result = await service.rerank(query="tequila", cocktails=cocktails)
+        result = await service.rerank(query="tequila", cocktails=cocktails)
 
         assert result == cocktails
 
@@ -231,7 +197,8 @@ class TestRerankerService:
     async def test_rerank_sends_correct_payload(self):
         """Test that reranker sends correct payload to TEI."""
         options = self._make_options(endpoint="http://localhost:8990", api_key="test-key")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [create_test_cocktail_model("1", "Margarita")]
 
@@ -239,32 +206,27 @@ class TestRerankerService:
         mock_response.json.return_value = [{"index": 0, "score": 0.9}]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            await service.rerank(query="tequila lime", cocktails=cocktails)
-
-            # Verify the POST call
-            call_args = mock_client.post.call_args
-            assert call_args[0][0] == "http://localhost:8990/rerank"  # URL
-            payload = call_args[1]["json"]
-            assert payload["query"] == "tequila lime"
-            assert payload["truncate"] is True
-            assert len(payload["texts"]) == 1
-            headers = call_args[1]["headers"]
-            assert headers["Authorization"] == "Bearer test-key"
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        await service.rerank(query="tequila lime", cocktails=cocktails)
+
+        # Verify the POST call
+        call_args = mock_client.post.call_args
+        assert call_args[0][0] == "http://localhost:8990/rerank"  # URL
+        payload = call_args[1]["json"]
+        assert payload["query"] == "tequila lime"
+        assert payload["truncate"] is True
+        assert len(payload["texts"]) == 1
+        headers = call_args[1]["headers"]
+        assert headers["Authorization"] == "Bearer test-key"
+        assert call_args[1]["timeout"] == 7.5
 
     @pytest.mark.anyio
     async def test_rerank_mismatched_results_returns_original(self):
         """Test that reranker returns original list when result count doesn't match."""
         options = self._make_options(endpoint="http://localhost:8990")
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [create_test_cocktail_model("1", "Margarita"), create_test_cocktail_model("2", "Mojito")]
 
@@ -273,16 +235,9 @@ class TestRerankerService:
         mock_response.json.return_value = [{"index": 0, "score": 0.9}]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="tequila", cocktails=cocktails)
+        result = await service.rerank(query="tequila", cocktails=cocktails)
 
         assert result == cocktails
 
@@ -290,7 +245,8 @@ class TestRerankerService:
     async def test_rerank_applies_relative_score_cutoff(self):
         """Test that relative score cutoff drops results below a fraction of the top score."""
         options = self._make_options(endpoint="http://localhost:8990", relative_score_cutoff=0.05)
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [
             create_test_cocktail_model("1", "Michelada"),
@@ -313,16 +269,9 @@ class TestRerankerService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="cocktails with salt", cocktails=cocktails)
+        result = await service.rerank(query="cocktails with salt", cocktails=cocktails)
 
         assert len(result) == 2
         assert result[0].title == "Michelada"
@@ -332,7 +281,8 @@ class TestRerankerService:
     async def test_rerank_relative_cutoff_zero_disables(self):
         """Test that relative_score_cutoff=0.0 does not filter any results."""
         options = self._make_options(endpoint="http://localhost:8990", relative_score_cutoff=0.0)
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [
             create_test_cocktail_model("1", "High"),
@@ -346,16 +296,9 @@ class TestRerankerService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="test", cocktails=cocktails)
+        result = await service.rerank(query="test", cocktails=cocktails)
 
         assert len(result) == 2
 
@@ -367,7 +310,8 @@ class TestRerankerService:
             score_threshold=0.03,
             relative_score_cutoff=0.1,
         )
-        service = RerankerService(reranker_options=options)
+        mock_client = AsyncMock()
+        service = RerankerService(reranker_options=options, http_client=mock_client)
 
         cocktails = [
             create_test_cocktail_model("1", "Top"),
@@ -386,16 +330,9 @@ class TestRerankerService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.reranker_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.rerank(query="test", cocktails=cocktails)
+        result = await service.rerank(query="test", cocktails=cocktails)
 
         assert len(result) == 1
         assert result[0].title == "Top"
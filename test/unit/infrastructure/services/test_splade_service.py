@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
@@ -9,17 +10,21 @@ from cezzis_com_cocktails_aisearch.infrastructure.services.splade_service import
 class TestSpladeService:
     """Test cases for SpladeService."""
 
-    def _make_options(self, endpoint="http://localhost:8991", api_key=""):
+    def _make_options(self, endpoint="http://localhost:8991", api_key="", batch_window_ms=0.0):
         options = MagicMock()
         options.endpoint = endpoint
         options.api_key = api_key
+        options.timeout_seconds = 12.5
+        options.batch_window_ms = batch_window_ms
+        options.batch_max_size = 32
         return options
 
     @pytest.mark.anyio
     async def test_encode_success(self):
         """Test successful SPLADE encoding returns sparse vector."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -32,16 +37,9 @@ class TestSpladeService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            indices, values = await service.encode("cocktails with gin")
+        indices, values = await service.encode("cocktails with gin")
 
         assert indices == [42, 100, 7]
         assert values == [0.8, 0.5, 0.3]
@@ -50,73 +48,56 @@ class TestSpladeService:
     async def test_encode_sends_correct_payload(self):
         """Test that encode sends correct payload to TEI."""
         options = self._make_options(endpoint="http://localhost:8991", api_key="test-key")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.json.return_value = [[{"index": 1, "value": 0.5}]]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
-
-            await service.encode("tequila lime")
-
-            call_args = mock_client.post.call_args
-            assert call_args[0][0] == "http://localhost:8991/embed_sparse"
-            payload = call_args[1]["json"]
-            assert payload["inputs"] == ["tequila lime"]
-            assert payload["truncate"] is True
-            headers = call_args[1]["headers"]
-            assert headers["Authorization"] == "Bearer test-key"
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        await service.encode("tequila lime")
+
+        call_args = mock_client.post.call_args
+        assert call_args[0][0] == "http://localhost:8991/embed_sparse"
+        payload = call_args[1]["json"]
+        assert payload["inputs"] == ["tequila lime"]
+        assert payload["truncate"] is True
+        headers = call_args[1]["headers"]
+        assert headers["Authorization"] == "Bearer test-key"
+        assert call_args[1]["timeout"] == 12.5
 
     @pytest.mark.anyio
     async def test_encode_no_api_key_omits_auth_header(self):
         """Test that encode omits Authorization header when no API key."""
         options = self._make_options(endpoint="http://localhost:8991", api_key="")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.json.return_value = [[{"index": 1, "value": 0.5}]]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            await service.encode("test")
+        await service.encode("test")
 
-            headers = mock_client.post.call_args[1]["headers"]
-            assert "Authorization" not in headers
+        headers = mock_client.post.call_args[1]["headers"]
+        assert "Authorization" not in headers
 
     @pytest.mark.anyio
     async def test_encode_graceful_degradation_on_http_error(self):
         """Test that encode returns empty on HTTP error."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(
-                side_effect=httpx.HTTPStatusError("Server Error", request=MagicMock(), response=MagicMock())
-            )
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(
+            side_effect=httpx.HTTPStatusError("Server Error", request=MagicMock(), response=MagicMock())
+        )
 
-            indices, values = await service.encode("test")
+        indices, values = await service.encode("test")
 
         assert indices == []
         assert values == []
@@ -125,18 +106,12 @@ class TestSpladeService:
     async def test_encode_graceful_degradation_on_connection_error(self):
         """Test that encode returns empty when TEI is unreachable."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
 
-            indices, values = await service.encode("test")
+        indices, values = await service.encode("test")
 
         assert indices == []
         assert values == []
@@ -145,7 +120,8 @@ class TestSpladeService:
     async def test_encode_batch_empty_input(self):
         """Test that empty input returns empty list."""
         options = self._make_options()
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         result = await service.encode_batch([])
         assert result == []
@@ -154,7 +130,8 @@ class TestSpladeService:
     async def test_encode_batch_success(self):
         """Test successful batch SPLADE encoding."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.json.return_value = [
@@ -163,16 +140,9 @@ class TestSpladeService:
         ]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            result = await service.encode_batch(["gin cocktail", "vodka cocktail"])
+        result = await service.encode_batch(["gin cocktail", "vodka cocktail"])
 
         assert len(result) == 2
         assert result[0] == ([10, 20], [0.9, 0.4])
@@ -182,18 +152,12 @@ class TestSpladeService:
     async def test_encode_batch_graceful_degradation_on_error(self):
         """Test that batch encode returns empty on error."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
 
-            result = await service.encode_batch(["text 1", "text 2"])
+        result = await service.encode_batch(["text 1", "text 2"])
 
         assert len(result) == 2
         assert result[0] == ([], [])
@@ -203,46 +167,89 @@ class TestSpladeService:
     async def test_encode_strips_trailing_slash_from_endpoint(self):
         """Test that trailing slash is stripped from endpoint URL."""
         options = self._make_options(endpoint="http://localhost:8991/")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.json.return_value = [[{"index": 1, "value": 0.5}]]
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            await service.encode("test")
+        await service.encode("test")
 
-            url = mock_client.post.call_args[0][0]
-            assert url == "http://localhost:8991/embed_sparse"
+        url = mock_client.post.call_args[0][0]
+        assert url == "http://localhost:8991/embed_sparse"
 
     @pytest.mark.anyio
     async def test_encode_empty_tei_response(self):
         """Test that empty TEI response returns empty sparse vector."""
         options = self._make_options(endpoint="http://localhost:8991")
-        service = SpladeService(splade_options=options)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
 
         mock_response = MagicMock()
         mock_response.json.return_value = []
         mock_response.raise_for_status = MagicMock()
 
-        with patch(
-            "cezzis_com_cocktails_aisearch.infrastructure.services.splade_service.httpx.AsyncClient"
-        ) as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=False)
-            mock_client_cls.return_value = mock_client
+        mock_client.post = AsyncMock(return_value=mock_response)
 
-            indices, values = await service.encode("test")
+        indices, values = await service.encode("test")
 
         assert indices == []
         assert values == []
+
+    @pytest.mark.anyio
+    async def test_encode_coalesces_concurrent_calls_into_one_batch(self):
+        """Test that concurrent encode calls inside the batch window share one TEI request."""
+        options = self._make_options(batch_window_ms=5.0)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
+
+        async def post(_url, json, **_kwargs):
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            response.json.return_value = [[{"index": i, "value": 1.0}] for i, _ in enumerate(json["inputs"])]
+            return response
+
+        mock_client.post = AsyncMock(side_effect=post)
+
+        results = await asyncio.gather(service.encode("gin"), service.encode("rum"), service.encode("mezcal"))
+
+        assert mock_client.post.await_count == 1
+        assert mock_client.post.call_args[1]["json"]["inputs"] == ["gin", "rum", "mezcal"]
+        assert results == [([0], [1.0]), ([1], [1.0]), ([2], [1.0])]
+
+    @pytest.mark.anyio
+    async def test_encode_batched_failure_degrades_every_caller(self):
+        """Test that a failed coalesced batch returns empty vectors to each waiting caller."""
+        options = self._make_options(batch_window_ms=5.0)
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
+        mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+
+        results = await asyncio.gather(service.encode("gin"), service.encode("rum"))
+
+        assert mock_client.post.await_count == 1
+        assert results == [([], []), ([], [])]
+
+    @pytest.mark.anyio
+    async def test_concurrent_encodes_of_same_text_share_one_request(self):
+        """Test that concurrent encodes of an identical text are served by a single TEI call."""
+        options = self._make_options()
+        mock_client = AsyncMock()
+        service = SpladeService(splade_options=options, http_client=mock_client)
+
+        async def post(_url, json, **_kwargs):
+            await asyncio.sleep(0.005)
+            response = MagicMock()
+            response.raise_for_status = MagicMock()
+            response.json.return_value = [[{"index": 42, "value": 0.8}]]
+            return response
+
+        mock_client.post = AsyncMock(side_effect=post)
+
+        results = await asyncio.gather(*(service.encode("margarita") for _ in range(4)))
+
+        assert mock_client.post.await_count == 1
+        assert results == [([42], [0.8])] * 4